@@ -21,10 +21,15 @@ load_dotenv()
 
 from app.models.base_model import Base  # noqa: E402
 from app.models.log_model import Log  # noqa: E402, F401
+from app.models.movie_community_stats_model import MovieCommunityStats  # noqa: E402, F401
 from app.models.movie_model import Movie  # noqa: E402, F401
 from app.models.movie_rating_model import MovieRating  # noqa: E402, F401
+from app.models.notification_actor_model import NotificationActor  # noqa: E402, F401
+from app.models.notification_archive_model import NotificationArchive  # noqa: E402, F401
 from app.models.notification_model import Notification  # noqa: E402, F401
 from app.models.user_follow_model import UserFollow  # noqa: E402, F401
+from app.models.user_follow_stats_model import UserFollowStats  # noqa: E402, F401
+from app.models.user_follow_suggestion_model import UserFollowSuggestion  # noqa: E402, F401
 from app.models.user_model import User  # noqa: E402, F401
 
 config = context.config
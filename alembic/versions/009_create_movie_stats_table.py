@@ -0,0 +1,87 @@
+"""create movie_community_stats table
+
+Revision ID: 009_create_movie_stats_table
+Revises: 008_add_locale_to_users
+Create Date: 2026-08-03 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "009_create_movie_stats_table"
+down_revision: str | Sequence[str] | None = "008_add_locale_to_users"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+RATING_VALUES = range(1, 11)
+
+
+def _counter(name: str) -> sa.Column:
+    return sa.Column(name, sa.Integer(), nullable=False, server_default=sa.text("0"))
+
+
+def upgrade() -> None:
+    """Create per-movie community counters and backfill them from existing rows."""
+
+    op.create_table(
+        "movie_community_stats",
+        sa.Column(
+            "movie_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("movies.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("tmdb_id", sa.Integer(), nullable=False),
+        _counter("log_count"),
+        _counter("watcher_count"),
+        _counter("rating_count"),
+        sa.Column("rating_sum", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+        *(_counter(f"rating_{rating}_count") for rating in RATING_VALUES),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.UniqueConstraint("tmdb_id", name="uq_movie_community_stats_tmdb_id"),
+    )
+
+    histogram_columns = ", ".join(f"rating_{rating}_count" for rating in RATING_VALUES)
+    histogram_values = ", ".join(f"COALESCE(r.rating_{rating}_count, 0)" for rating in RATING_VALUES)
+    histogram_aggregates = ", ".join(
+        f"count(*) FILTER (WHERE rating = {rating}) AS rating_{rating}_count" for rating in RATING_VALUES
+    )
+    op.execute(
+        f"""
+        INSERT INTO movie_community_stats (
+            movie_id, tmdb_id, log_count, watcher_count, rating_count, rating_sum, {histogram_columns}
+        )
+        SELECT
+            m.id,
+            m.tmdb_id,
+            COALESCE(l.log_count, 0),
+            COALESCE(l.watcher_count, 0),
+            COALESCE(r.rating_count, 0),
+            COALESCE(r.rating_sum, 0),
+            {histogram_values}
+        FROM movies m
+        LEFT JOIN (
+            SELECT movie_id, count(*) AS log_count, count(DISTINCT user_id) AS watcher_count
+            FROM logs
+            WHERE deleted IS FALSE
+            GROUP BY movie_id
+        ) l ON l.movie_id = m.id
+        LEFT JOIN (
+            SELECT movie_id, count(*) AS rating_count, sum(rating) AS rating_sum, {histogram_aggregates}
+            FROM movie_ratings
+            WHERE deleted IS FALSE AND rating IS NOT NULL
+            GROUP BY movie_id
+        ) r ON r.movie_id = m.id
+        """  # noqa: S608 - interpolated fragments are built from the fixed rating range
+    )
+
+
+def downgrade() -> None:
+    """Drop per-movie community counters."""
+
+    op.drop_table("movie_community_stats")
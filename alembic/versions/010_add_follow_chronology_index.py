@@ -0,0 +1,31 @@
+"""add followed-user chronology index to user_follows
+
+Revision ID: 010_add_follow_chronology_index
+Revises: 009_create_movie_stats_table
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "010_add_follow_chronology_index"
+down_revision: str | Sequence[str] | None = "009_create_movie_stats_table"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index a user's followers in follow order for keyset batches."""
+
+    op.create_index(
+        "ix_user_follows_followed_chronology",
+        "user_follows",
+        ["followed_id", "created_at", "follower_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the followed-user chronology index."""
+
+    op.drop_index("ix_user_follows_followed_chronology", table_name="user_follows")
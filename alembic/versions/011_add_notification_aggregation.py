@@ -0,0 +1,55 @@
+"""add time-windowed aggregation columns to notifications
+
+Revision ID: 011_add_notification_aggregation
+Revises: 010_add_follow_chronology_index
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "011_add_notification_aggregation"
+down_revision: str | Sequence[str] | None = "010_add_follow_chronology_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Let one unread row absorb repeated events of the same kind within a window."""
+
+    op.add_column("notifications", sa.Column("aggregation_key", sa.Text(), nullable=True))
+    op.add_column(
+        "notifications",
+        sa.Column("actor_count", sa.Integer(), nullable=False, server_default=sa.text("1")),
+    )
+    op.add_column(
+        "notifications",
+        sa.Column(
+            "sample_actor_ids",
+            postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+            nullable=False,
+            server_default=sa.text("'{}'"),
+        ),
+    )
+    op.create_check_constraint("ck_notifications_actor_count_positive", "notifications", "actor_count >= 1")
+    op.create_index(
+        "uq_notifications_open_aggregation_key",
+        "notifications",
+        ["recipient_id", "aggregation_key"],
+        unique=True,
+        postgresql_where=sa.text("deleted IS FALSE AND read_at IS NULL AND aggregation_key IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop notification aggregation columns."""
+
+    op.drop_index("uq_notifications_open_aggregation_key", table_name="notifications")
+    op.drop_constraint("ck_notifications_actor_count_positive", "notifications", type_="check")
+    op.drop_column("notifications", "sample_actor_ids")
+    op.drop_column("notifications", "actor_count")
+    op.drop_column("notifications", "aggregation_key")
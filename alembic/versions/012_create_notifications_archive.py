@@ -0,0 +1,86 @@
+"""create notifications_archive and retention indexes
+
+Revision ID: 012_create_notifications_archive
+Revises: 011_add_notification_aggregation
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "012_create_notifications_archive"
+down_revision: str | Sequence[str] | None = "011_add_notification_aggregation"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the archive table and the indexes the retention job walks."""
+
+    op.create_table(
+        "notifications_archive",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "recipient_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "actor_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("type", sa.Text(), nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("deduplication_key", sa.Text(), nullable=True),
+        sa.Column("read_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("deleted", sa.Boolean(), nullable=False, server_default=sa.text("FALSE")),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("aggregation_key", sa.Text(), nullable=True),
+        sa.Column("actor_count", sa.Integer(), nullable=False, server_default=sa.text("1")),
+        sa.Column(
+            "sample_actor_ids",
+            postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+            nullable=False,
+            server_default=sa.text("'{}'"),
+        ),
+    )
+    op.create_index(
+        "ix_notifications_archive_recipient_chronology",
+        "notifications_archive",
+        ["recipient_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_notifications_archivable",
+        "notifications",
+        ["created_at"],
+        postgresql_where=sa.text("deleted IS FALSE AND read_at IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_notifications_soft_deleted",
+        "notifications",
+        ["id"],
+        postgresql_where=sa.text("deleted IS TRUE"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the archive table and retention indexes.
+
+    Archived rows are discarded; move them back into ``notifications`` first
+    if they must be kept.
+    """
+
+    op.drop_index("ix_notifications_soft_deleted", table_name="notifications")
+    op.drop_index("ix_notifications_archivable", table_name="notifications")
+    op.drop_index("ix_notifications_archive_recipient_chronology", table_name="notifications_archive")
+    op.drop_table("notifications_archive")
@@ -0,0 +1,71 @@
+"""create user_follow_stats table and follower-side chronology index
+
+Revision ID: 013_create_user_follow_stats
+Revises: 012_create_notifications_archive
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "013_create_user_follow_stats"
+down_revision: str | Sequence[str] | None = "012_create_notifications_archive"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create per-user follow counters, backfill them, and index outgoing follows by time."""
+
+    op.create_table(
+        "user_follow_stats",
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("follower_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("following_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.CheckConstraint("follower_count >= 0", name="ck_user_follow_stats_follower_count_non_negative"),
+        sa.CheckConstraint("following_count >= 0", name="ck_user_follow_stats_following_count_non_negative"),
+    )
+    op.create_index(
+        "ix_user_follows_follower_chronology",
+        "user_follows",
+        ["follower_id", "created_at", "followed_id"],
+    )
+
+    op.execute(
+        """
+        INSERT INTO user_follow_stats (user_id, follower_count, following_count)
+        SELECT u.id, COALESCE(followers.count, 0), COALESCE(following.count, 0)
+        FROM users u
+        LEFT JOIN (
+            SELECT f.followed_id AS user_id, count(*) AS count
+            FROM user_follows f
+            JOIN users follower ON follower.id = f.follower_id AND follower.deleted IS FALSE
+            GROUP BY f.followed_id
+        ) followers ON followers.user_id = u.id
+        LEFT JOIN (
+            SELECT f.follower_id AS user_id, count(*) AS count
+            FROM user_follows f
+            JOIN users followed ON followed.id = f.followed_id AND followed.deleted IS FALSE
+            GROUP BY f.follower_id
+        ) following ON following.user_id = u.id
+        WHERE u.deleted IS FALSE AND (followers.count IS NOT NULL OR following.count IS NOT NULL)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop per-user follow counters and the follower-side chronology index."""
+
+    op.drop_index("ix_user_follows_follower_chronology", table_name="user_follows")
+    op.drop_table("user_follow_stats")
@@ -0,0 +1,33 @@
+"""add per-author creation chronology index to logs
+
+Revision ID: 014_add_log_feed_index
+Revises: 013_create_user_follow_stats
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "014_add_log_feed_index"
+down_revision: str | Sequence[str] | None = "013_create_user_follow_stats"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index each author's logs newest first for feed rebuilds and pulled-author pages."""
+
+    op.create_index(
+        "ix_logs_user_created_at",
+        "logs",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Drop the per-author creation chronology index."""
+
+    op.drop_index("ix_logs_user_created_at", table_name="logs")
@@ -0,0 +1,52 @@
+"""create user_follow_suggestions table
+
+Revision ID: 015_create_follow_suggestions
+Revises: 014_add_log_feed_index
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "015_create_follow_suggestions"
+down_revision: str | Sequence[str] | None = "014_add_log_feed_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create ranked follow suggestions keyed by user and rank; the job fills them."""
+
+    op.create_table(
+        "user_follow_suggestions",
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("rank", sa.SmallInteger(), primary_key=True, nullable=False),
+        sa.Column(
+            "suggested_user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("mutual_count", sa.Integer(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint("rank >= 1", name="ck_user_follow_suggestions_rank_positive"),
+        sa.CheckConstraint("mutual_count >= 1", name="ck_user_follow_suggestions_mutual_count_positive"),
+    )
+    op.create_index("ix_user_follow_suggestions_computed_at", "user_follow_suggestions", ["computed_at"])
+
+
+def downgrade() -> None:
+    """Drop precomputed follow suggestions."""
+
+    op.drop_index("ix_user_follow_suggestions_computed_at", table_name="user_follow_suggestions")
+    op.drop_table("user_follow_suggestions")
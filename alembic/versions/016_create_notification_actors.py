@@ -0,0 +1,59 @@
+"""create notification_actors table
+
+Revision ID: 016_create_notification_actors
+Revises: 015_create_follow_suggestions
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "016_create_notification_actors"
+down_revision: str | Sequence[str] | None = "015_create_follow_suggestions"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Record the distinct actors of aggregated notifications and seed them from the stored samples."""
+
+    op.create_table(
+        "notification_actors",
+        sa.Column(
+            "notification_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("notifications.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column(
+            "actor_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+    )
+    # Open aggregates only know their sample; actors evicted from it before
+    # this migration may still be counted once more.
+    op.execute(
+        """
+        INSERT INTO notification_actors (notification_id, actor_id)
+        SELECT n.id, sample.actor_id
+        FROM notifications n
+        CROSS JOIN LATERAL unnest(n.sample_actor_ids) AS sample(actor_id)
+        JOIN users u ON u.id = sample.actor_id
+        WHERE n.aggregation_key IS NOT NULL AND n.deleted IS FALSE AND n.read_at IS NULL
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the aggregated notification actors."""
+
+    op.drop_table("notification_actors")
@@ -4,9 +4,9 @@ from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from slowapi.errors import RateLimitExceeded
 
 import app.controllers.auth_controller as auth_controller
+import app.controllers.feed_controller as feed_controller
 import app.controllers.log_controller as log_controller
 import app.controllers.movie_controller as movie_controller
 import app.controllers.movie_rating_controller as movie_rating_controller
@@ -21,30 +21,38 @@ from app.db.postgres import close_postgres_engine, init_postgres_engine
 from app.middleware.csrf_middleware import CSRFMiddleware
 from app.middleware.rate_limit_session_middleware import RateLimitSessionMiddleware
 from app.services.cache_service import CacheService
+from app.services.notification_stream_service import NotificationStreamHub
+from app.services.password_service import PasswordService
 from app.services.tmdb_service import TMDBService
 from app.utils.exceptions_utils import AppException
-from app.utils.rate_limit_utils import rate_limit_exceeded_handler
+from app.utils.rate_limit_utils import RateLimitExceeded, rate_limit_exceeded_handler
 from app.utils.validation_error_utils import sanitize_validation_errors
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     init_postgres_engine()
+    PasswordService.calibrate()
+    PasswordService.start_stats_log()
     CacheService.initialize(get_redis_config())
     cache = CacheService.get_instance()
     if not await cache.health_check():
         raise RuntimeError("Redis is not reachable — cannot start the application")
+    await cache.load_scripts()
+    limiter.start_sync()
     try:
         yield
     finally:
+        await limiter.aclose()
+        await NotificationStreamHub.aclose_all()
         await CacheService.aclose_all()
         await TMDBService.aclose_all()
+        PasswordService.shutdown()
         await close_postgres_engine()
 
 
 app = FastAPI(title="Cinelog API", lifespan=lifespan)
 
-app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
 app.add_middleware(RateLimitSessionMiddleware)
@@ -92,6 +100,7 @@ app.include_router(user_controller.router, prefix="/v1/users", tags=["Users"])
 app.include_router(movie_rating_controller.router, prefix="/v1/movie-ratings", tags=["Movie Ratings"])
 app.include_router(stats_controller.router, prefix="/v1/stats", tags=["Stats"])
 app.include_router(notification_controller.router, prefix="/v1/notifications", tags=["Notifications"])
+app.include_router(feed_controller.router, prefix="/v1/feed", tags=["Feed"])
 
 
 def create_app():
@@ -1,4 +1,4 @@
-from limits import parse
+from app.utils.rate_limit_utils import parse_rate_limit
 
 LOGIN_ACCOUNT_RATE_LIMIT_SCOPE = "auth:login:account"
 REGISTER_VERIFICATION_ACCOUNT_RATE_LIMIT_SCOPE = (  # nosec B105
@@ -11,7 +11,7 @@ RESET_PASSWORD_ACCOUNT_RATE_LIMIT_SCOPE = (  # nosec B105
     "auth:reset-password:account"
 )
 
-LOGIN_FAILED_ACCOUNT_LIMIT_ITEM = parse("5/15minute")
-REGISTER_VERIFICATION_ACCOUNT_LIMIT_ITEM = parse("5/30minute")
-FORGOT_PASSWORD_ACCOUNT_LIMIT_ITEM = parse("5/30minute")
-RESET_PASSWORD_ACCOUNT_LIMIT_ITEM = parse("10/hour")
+LOGIN_FAILED_ACCOUNT_LIMIT_ITEM = parse_rate_limit("5/15minute")
+REGISTER_VERIFICATION_ACCOUNT_LIMIT_ITEM = parse_rate_limit("5/30minute")
+FORGOT_PASSWORD_ACCOUNT_LIMIT_ITEM = parse_rate_limit("5/30minute")
+RESET_PASSWORD_ACCOUNT_LIMIT_ITEM = parse_rate_limit("10/hour")
@@ -0,0 +1,33 @@
+import os
+from typing import TypedDict
+
+
+class SMTPConfig(TypedDict):
+    server: str
+    port: int
+    user: str | None
+    password: str | None
+    from_email: str
+    use_ssl: bool
+
+
+def get_smtp_config() -> SMTPConfig | None:
+    """
+    Returns SMTP configuration from environment variables.
+
+    ``None`` means SMTP is not configured: the API logs emails to the console
+    instead of queueing them, and the outbox worker refuses to start.
+    """
+    server = os.getenv("SMTP_SERVER")
+    if not server:
+        return None
+
+    port = int(os.getenv("SMTP_PORT", "587"))
+    return {
+        "server": server,
+        "port": port,
+        "user": os.getenv("SMTP_USER") or None,
+        "password": os.getenv("SMTP_PASSWORD") or None,
+        "from_email": os.getenv("SMTP_FROM_EMAIL", "noreply@cinelog.app"),
+        "use_ssl": os.getenv("SMTP_USE_SSL", "false").lower() == "true" or port == 465,
+    }
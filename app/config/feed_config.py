@@ -0,0 +1,20 @@
+"""Feed-domain configuration.
+
+Owns the home feed cursor scope and the follower threshold that splits
+authors between fan-out on write and fan-out on read. As with the other
+domain scopes, the raw prefix is private so a feed cursor is always signed
+together with the viewer whose feed it pages through.
+"""
+
+import os
+from uuid import UUID
+
+_FEED_CURSOR_PREFIX = "feed.home"
+
+FEED_FANOUT_MAX_FOLLOWERS = int(os.getenv("FEED_FANOUT_MAX_FOLLOWERS", "1000"))
+
+
+def feed_cursor_scope(user_id: UUID) -> str:
+    """Return the viewer-bound signing scope for home feed cursors."""
+
+    return f"{_FEED_CURSOR_PREFIX}:{user_id}"
@@ -0,0 +1,24 @@
+"""Follow-domain configuration.
+
+Owns the follower and following list cursor scopes. As with the notification
+scopes, the raw prefixes are private so a cursor is always signed together
+with the user whose list it pages through, and a followers cursor cannot be
+replayed against a following list.
+"""
+
+from uuid import UUID
+
+_FOLLOWERS_CURSOR_PREFIX = "follows.followers"
+_FOLLOWING_CURSOR_PREFIX = "follows.following"
+
+
+def followers_cursor_scope(user_id: UUID) -> str:
+    """Return the user-bound signing scope for follower list cursors."""
+
+    return f"{_FOLLOWERS_CURSOR_PREFIX}:{user_id}"
+
+
+def following_cursor_scope(user_id: UUID) -> str:
+    """Return the user-bound signing scope for following list cursors."""
+
+    return f"{_FOLLOWING_CURSOR_PREFIX}:{user_id}"
@@ -1,16 +1,24 @@
 """Notification-domain configuration.
 
-Owns the notification cursor scope so the reusable pagination configuration in
+Owns the notification cursor scopes so the reusable pagination configuration in
 ``app/config/cursor_pagination_config.py`` stays free of per-domain constants.
 
-The raw prefix is deliberately private: a scope is only ever obtained through
-``notification_list_cursor_scope()``, so an inbox cursor cannot accidentally be
-signed without its recipient binding.
+The raw prefixes are deliberately private: a scope is only ever obtained through
+``notification_list_cursor_scope()`` or ``notification_stream_cursor_scope()``,
+so a cursor cannot accidentally be signed without its recipient binding.
+
+It also holds the write-time aggregation settings shared by the repository and
+its tests.
 """
 
+import os
 from uuid import UUID
 
 _NOTIFICATION_LIST_CURSOR_PREFIX = "notifications.list"
+_NOTIFICATION_STREAM_CURSOR_PREFIX = "notifications.stream"
+
+NOTIFICATION_AGGREGATION_WINDOW_SECONDS = int(os.getenv("NOTIFICATION_AGGREGATION_WINDOW_SECONDS", "3600"))
+NOTIFICATION_AGGREGATION_SAMPLE_SIZE = 3
 
 
 def notification_list_cursor_scope(recipient_id: UUID) -> str:
@@ -22,3 +30,13 @@ def notification_list_cursor_scope(recipient_id: UUID) -> str:
     """
 
     return f"{_NOTIFICATION_LIST_CURSOR_PREFIX}:{recipient_id}"
+
+
+def notification_stream_cursor_scope(recipient_id: UUID) -> str:
+    """Return the recipient-bound signing scope for stream event IDs.
+
+    Stream IDs seek forward from the last delivered notification, so they use
+    a separate scope and cannot be replayed as inbox pagination cursors.
+    """
+
+    return f"{_NOTIFICATION_STREAM_CURSOR_PREFIX}:{recipient_id}"
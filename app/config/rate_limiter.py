@@ -8,18 +8,12 @@ but ``app/__init__.py`` also imports the controllers.
 Import from here in controllers::
 
     from app.config.rate_limiter import limiter
-"""
 
-from slowapi import Limiter
+Buckets live in Redis through the shared ``CacheService`` client, which is
+initialised in the application lifespan before any request is served.
+"""
 
-from app.config.redis import get_redis_config
+from app.services.rate_limit_engine import AsyncLimiter
 from app.utils.rate_limit_utils import get_rate_limit_key
 
-_redis_config = get_redis_config()
-
-limiter = Limiter(
-    key_func=get_rate_limit_key,
-    storage_uri=_redis_config["url"],
-    headers_enabled=True,
-    retry_after="delta-seconds",
-)
+limiter = AsyncLimiter(key_func=get_rate_limit_key)
@@ -10,6 +10,8 @@ from app.dependencies.auth_dependency import auth_dependency
 from app.dependencies.service_dependency import (
     get_auth_rate_limit_service,
     get_auth_service,
+    get_session_service,
+    get_user_service,
 )
 from app.schemas.auth_schemas import (
     CsrfTokenResponse,
@@ -28,14 +30,20 @@ from app.schemas.auth_schemas import (
 )
 from app.services.auth_rate_limit_service import AuthRateLimitService
 from app.services.auth_service import AuthService
+from app.services.session_service import SessionService
 from app.services.token_service import TokenService
+from app.services.user_service import UserService
 from app.utils.auth_utils import (
+    ACCESS_TOKEN_COOKIE,
+    REFRESH_TOKEN_COOKIE,
+    SESSION_ID_CLAIM,
     clear_auth_cookies,
     set_auth_cookies,
     set_csrf_cookie,
 )
 from app.utils.error_codes_utils import ErrorCodes
 from app.utils.exceptions_utils import AppException
+from app.utils.id_utils import is_valid_uuid
 from app.utils.rate_limit_utils import (
     get_ip_rate_limit_key,
     get_session_rate_limit_key,
@@ -58,8 +66,8 @@ async def send_register_verification_code(
     """
     Send a verification code before user registration.
     """
-    auth_rate_limit_service.enforce_register_verification_limit(request_body.email)
-    auth_rate_limit_service.record_register_verification_attempt(request_body.email)
+    await auth_rate_limit_service.enforce_register_verification_limit(request_body.email)
+    await auth_rate_limit_service.record_register_verification_attempt(request_body.email)
 
     await auth_service.send_registration_verification_code(request_body.email)
     return RegisterSendCodeResponse(message="If the email can be registered, a verification code has been sent.")
@@ -90,23 +98,25 @@ async def login(
     request_body: LoginRequest,
     auth_service: AuthService = Depends(get_auth_service),
     auth_rate_limit_service: AuthRateLimitService = Depends(get_auth_rate_limit_service),
+    session_service: SessionService = Depends(get_session_service),
 ) -> LoginResponse:
     """
     Handle user login with email and password.
     """
-    auth_rate_limit_service.enforce_login_failure_limit(request_body.email)
+    await auth_rate_limit_service.enforce_login_failure_limit(request_body.email)
 
     try:
         user = await auth_service.login(email=request_body.email, password=request_body.password)
     except AppException as exc:
         if exc.error == ErrorCodes.INVALID_CREDENTIALS:
-            auth_rate_limit_service.register_login_failure(request_body.email)
+            await auth_rate_limit_service.register_login_failure(request_body.email)
         raise
 
-    # Set Cookies
-    set_auth_cookies(response, str(user.id))
+    # Register the session, then set cookies carrying its ID
+    session_id = await session_service.create_session(user.id)
+    set_auth_cookies(response, str(user.id), session_id, locale=user.locale)
     try:
-        auth_rate_limit_service.clear_login_failures(request_body.email)
+        await auth_rate_limit_service.clear_login_failures(request_body.email)
     except Exception:
         logger.warning(
             "Failed to clear login failure bucket after successful auth",
@@ -127,10 +137,33 @@ async def login(
 
 
 @router.post("/logout", response_model=LogoutResponse)
-async def logout(response: Response) -> LogoutResponse:
+async def logout(
+    request: Request,
+    response: Response,
+    session_service: SessionService = Depends(get_session_service),
+) -> LogoutResponse:
     """
-    Clear authentication cookies.
+    Revoke the current session and clear authentication cookies.
     """
+    # The access cookie lapses after a few idle minutes; the refresh cookie names the same session for days
+    for cookie in (ACCESS_TOKEN_COOKIE, REFRESH_TOKEN_COOKIE):
+        token = request.cookies.get(cookie)
+        if not token:
+            continue
+        try:
+            # An expired token still names the session its refresh token belongs to
+            payload = TokenService.decode_token(token, verify_expiry=False)
+        except jwt.InvalidTokenError:
+            continue
+        user_id = payload.get("sub")
+        session_id = payload.get(SESSION_ID_CLAIM)
+        if isinstance(user_id, str) and is_valid_uuid(user_id) and isinstance(session_id, str):
+            try:
+                await session_service.revoke_session(UUID(user_id), session_id)
+            except Exception:
+                logger.warning("Failed to revoke session on logout", exc_info=True)
+            break
+
     clear_auth_cookies(response)
     return LogoutResponse(message="Logged out successfully")
 
@@ -140,7 +173,12 @@ async def logout(response: Response) -> LogoutResponse:
     response_model=RefreshResponse,
     responses={401: {"description": "Invalid, expired, or missing refresh token"}},
 )
-async def refresh_token(request: Request, response: Response) -> RefreshResponse | JSONResponse:
+async def refresh_token(
+    request: Request,
+    response: Response,
+    user_service: UserService = Depends(get_user_service),
+    session_service: SessionService = Depends(get_session_service),
+) -> RefreshResponse | JSONResponse:
     """
     Refresh access token using refresh token cookie.
     """
@@ -150,7 +188,7 @@ async def refresh_token(request: Request, response: Response) -> RefreshResponse
         clear_auth_cookies(err_response)
         return err_response
 
-    token = request.cookies.get("refresh_token")
+    token = request.cookies.get(REFRESH_TOKEN_COOKIE)
     if not token:
         return clear_cookies_response("Refresh token missing")
 
@@ -160,11 +198,26 @@ async def refresh_token(request: Request, response: Response) -> RefreshResponse
             return clear_cookies_response("Invalid token type")
 
         user_id = payload.get("sub")
-        if not user_id:
+        session_id = payload.get(SESSION_ID_CLAIM)
+        issued_at = payload.get("iat")
+        # Tokens from before sessions existed (or with a stale non-UUID subject) cannot be tied to a session
+        if (
+            not isinstance(user_id, str)
+            or not is_valid_uuid(user_id)
+            or not isinstance(session_id, str)
+            or not isinstance(issued_at, int | float)
+        ):
             return clear_cookies_response("Invalid token payload")
 
-        # Rotate tokens (create new ones)
-        set_auth_cookies(response, user_id)
+        user_uuid = UUID(user_id)
+        if not await session_service.refresh_session(user_uuid, session_id, float(issued_at)):
+            return clear_cookies_response("Session revoked")
+
+        # Re-read the locale so a preference changed on another device reaches this session's access token
+        locale = await user_service.get_locale(user_uuid)
+
+        # Rotate tokens (create new ones) within the same session
+        set_auth_cookies(response, user_id, session_id, locale=locale)
         csrf_token = set_csrf_cookie(response)
 
         return RefreshResponse(message="Token refreshed", csrf_token=csrf_token)
@@ -188,12 +241,12 @@ async def forgot_password(
     """
     Initiate password recovery. Sends reset code via email.
     """
-    auth_rate_limit_service.enforce_forgot_password_limit(request_body.email)
+    await auth_rate_limit_service.enforce_forgot_password_limit(request_body.email)
     # This bucket is intentionally charged before the service call so repeated
     # requests for a known email cannot bypass the per-account forgot-password
     # cap. The trade-off is a small denial-of-service window for that address
     # (5/30minute) if an attacker spends the bucket first.
-    auth_rate_limit_service.register_forgot_password_attempt(request_body.email)
+    await auth_rate_limit_service.register_forgot_password_attempt(request_body.email)
 
     await auth_service.forgot_password(request_body.email)
     return ForgotPasswordResponse(message="If the email exists, a reset code has been sent.")
@@ -212,7 +265,7 @@ async def reset_password(
     """
     Complete password recovery with reset code.
     """
-    auth_rate_limit_service.enforce_reset_password_limit(request_body.email)
+    await auth_rate_limit_service.enforce_reset_password_limit(request_body.email)
 
     try:
         await auth_service.reset_password(
@@ -222,7 +275,7 @@ async def reset_password(
         )
     except AppException as exc:
         if exc.error == ErrorCodes.INVALID_CREDENTIALS:
-            auth_rate_limit_service.register_reset_password_attempt(request_body.email)
+            await auth_rate_limit_service.register_reset_password_attempt(request_body.email)
         raise
     return ResetPasswordResponse(message="Password reset successfully")
 
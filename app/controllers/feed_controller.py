@@ -0,0 +1,28 @@
+"""Authenticated home feed endpoint."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from app.config.rate_limiter import limiter
+from app.dependencies.auth_dependency import auth_dependency
+from app.dependencies.service_dependency import get_feed_service
+from app.schemas.feed_schemas import FeedRequest, FeedResponse
+from app.services.feed_service import FeedService
+
+router = APIRouter()
+
+
+@router.get("", response_model=FeedResponse)
+@limiter.limit("60/minute", hybrid=True)
+async def get_feed(
+    request: Request,
+    response: Response,
+    feed_request: Annotated[FeedRequest, Query()],
+    user_id: UUID = Depends(auth_dependency),
+    feed_service: FeedService = Depends(get_feed_service),
+) -> FeedResponse:
+    """Page through recent logs by the users the authenticated user follows, newest first."""
+
+    return await feed_service.get_feed(user_id, feed_request)
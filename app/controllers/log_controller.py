@@ -18,7 +18,7 @@ router = APIRouter()
 
 
 @router.post("/", response_model=LogCreateResponse, status_code=201)
-@limiter.limit("20/minute")
+@limiter.limit("20/minute", hybrid=True)
 async def create_log(
     request: Request,
     response: Response,
@@ -58,7 +58,7 @@ async def update_log(
     status_code=status.HTTP_204_NO_CONTENT,
     response_class=Response,
 )
-@limiter.limit("20/minute")
+@limiter.limit("20/minute", hybrid=True)
 async def delete_log(
     request: Request,
     response: Response,
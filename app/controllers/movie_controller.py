@@ -1,9 +1,19 @@
-from fastapi import APIRouter, Depends, Request, Response
+import asyncio
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from app.config.rate_limiter import limiter
+from app.dependencies.auth_dependency import auth_dependency
 from app.dependencies.locale_dependency import locale_dependency
-from app.schemas.tmdb_schemas import TMDBMovieDetails, TMDBMovieSearchResult
+from app.dependencies.service_dependency import get_follow_service, get_movie_stats_service, get_trending_service
+from app.schemas.movie_schemas import MovieDetailsResponse, MovieFriendsResponse, TrendingMoviesResponse
+from app.schemas.tmdb_schemas import TMDBMovieSearchResult
+from app.services.follow_service import FollowService
+from app.services.movie_stats_service import MovieStatsService
 from app.services.tmdb_service import TMDBService
+from app.services.trending_service import TrendingService
+from app.types import TrendingWindow
 
 router = APIRouter()
 
@@ -11,7 +21,7 @@ tmdb_service = TMDBService.get_instance()
 
 
 @router.get("/search")
-@limiter.limit("20/minute")
+@limiter.limit("20/minute", hybrid=True)
 async def search_movies(
     request: Request,
     response: Response,
@@ -24,12 +34,48 @@ async def search_movies(
     return await tmdb_service.search_movie(query=query, locale=locale)
 
 
+@router.get("/trending")
+@limiter.limit("60/minute", hybrid=True)
+async def get_trending_movies(
+    request: Request,
+    response: Response,
+    user_id: UUID = Depends(auth_dependency),
+    window: TrendingWindow = TrendingWindow.LAST_24_HOURS,
+    limit: int = Query(20, ge=1, le=50),
+    trending_service: TrendingService = Depends(get_trending_service),
+) -> TrendingMoviesResponse:
+    """
+    Get the most-logged movies platform-wide over the last 24 hours or 7 days.
+    """
+    return await trending_service.get_trending_movies(window=window, limit=limit)
+
+
 @router.get("/{tmdb_id}")
 async def get_movie_details(
     tmdb_id: int,
     locale: str = Depends(locale_dependency),
-) -> TMDBMovieDetails:
+    movie_stats_service: MovieStatsService = Depends(get_movie_stats_service),
+) -> MovieDetailsResponse:
+    """
+    Get full movie details from TMDB by movie ID, with Cinelog community stats.
+    """
+    details, community_stats = await asyncio.gather(
+        tmdb_service.get_movie_details(tmdb_id=tmdb_id, locale=locale),
+        movie_stats_service.get_movie_stats(tmdb_id),
+    )
+    return MovieDetailsResponse(**details.model_dump(), community_stats=community_stats)
+
+
+@router.get("/{tmdb_id}/friends")
+@limiter.limit("60/minute", hybrid=True)
+async def get_movie_friends(
+    tmdb_id: int,
+    request: Request,
+    response: Response,
+    user_id: UUID = Depends(auth_dependency),
+    follow_service: FollowService = Depends(get_follow_service),
+) -> MovieFriendsResponse:
     """
-    Get full movie details from TMDB by movie ID.
+    List the public users the authenticated user follows who logged or rated the movie.
     """
-    return await tmdb_service.get_movie_details(tmdb_id=tmdb_id, locale=locale)
+    return await follow_service.get_movie_friends(requester_id=user_id, tmdb_id=tmdb_id)
@@ -3,16 +3,19 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from app.config.rate_limiter import limiter
 from app.dependencies.auth_dependency import auth_dependency
 from app.dependencies.service_dependency import get_notification_service
 from app.schemas.notification_schemas import (
+    MAX_CURSOR_LENGTH,
     MarkAllNotificationsReadResponse,
     NotificationBaseResponse,
     NotificationListRequest,
     NotificationListResponse,
+    NotificationUnreadCountResponse,
 )
 from app.services.notification_service import NotificationService
 
@@ -20,7 +23,7 @@ router = APIRouter()
 
 
 @router.get("", response_model=NotificationListResponse[NotificationBaseResponse])
-@limiter.limit("60/minute")
+@limiter.limit("60/minute", hybrid=True)
 async def list_notifications(
     request: Request,
     response: Response,
@@ -33,12 +36,44 @@ async def list_notifications(
     return await notification_service.list_notifications(user_id, list_request)
 
 
+@router.get("/unread-count", response_model=NotificationUnreadCountResponse)
+@limiter.limit("120/minute", hybrid=True)
+async def get_unread_notification_count(
+    request: Request,
+    response: Response,
+    user_id: UUID = Depends(auth_dependency),
+    notification_service: NotificationService = Depends(get_notification_service),
+) -> NotificationUnreadCountResponse:
+    """Return the authenticated recipient's unread badge count, served from Redis when warm."""
+
+    return await notification_service.get_unread_count(user_id)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+@limiter.limit("10/minute")
+async def stream_notifications(
+    request: Request,
+    response: Response,
+    last_event_id: Annotated[str | None, Header(alias="Last-Event-ID", max_length=MAX_CURSOR_LENGTH)] = None,
+    user_id: UUID = Depends(auth_dependency),
+    notification_service: NotificationService = Depends(get_notification_service),
+) -> StreamingResponse:
+    """Push new notifications and unread-count changes as Server-Sent Events."""
+
+    frames = await notification_service.open_notification_stream(user_id, last_event_id)
+    return StreamingResponse(
+        frames,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.patch(
     "/{notification_id}/read",
     response_model=NotificationBaseResponse,
     status_code=status.HTTP_200_OK,
 )
-@limiter.limit("60/minute")
+@limiter.limit("60/minute", hybrid=True)
 async def mark_notification_read(
     request: Request,
     response: Response,
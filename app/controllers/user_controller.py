@@ -1,13 +1,25 @@
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
 from app.config.rate_limiter import limiter
 from app.dependencies.auth_dependency import auth_dependency
-from app.dependencies.service_dependency import get_follow_service, get_user_service
+from app.dependencies.service_dependency import (
+    get_follow_service,
+    get_follow_suggestion_service,
+    get_session_service,
+    get_user_service,
+)
 from app.schemas.user_schemas import (
     ChangePasswordRequest,
     ChangePasswordResponse,
+    FollowListRequest,
+    FollowListResponse,
+    FollowSuggestionsRequest,
+    FollowSuggestionsResponse,
+    RelationshipsRequest,
+    RelationshipsResponse,
     UpdateLocaleRequest,
     UpdateLocaleResponse,
     UpdateProfileRequest,
@@ -15,7 +27,10 @@ from app.schemas.user_schemas import (
     UserResponse,
 )
 from app.services.follow_service import FollowService
+from app.services.follow_suggestion_service import FollowSuggestionService
+from app.services.session_service import SessionService
 from app.services.user_service import UserService
+from app.utils.auth_utils import set_access_token_cookie, set_auth_cookies
 
 router = APIRouter()
 
@@ -29,6 +44,20 @@ async def get_user_info(
     return await user_service.get_user_info(user_id)
 
 
+@router.get("/suggestions", response_model=FollowSuggestionsResponse)
+@limiter.limit("60/minute", hybrid=True)
+async def get_follow_suggestions(
+    request: Request,
+    response: Response,
+    suggestions_request: Annotated[FollowSuggestionsRequest, Query()],
+    user_id: UUID = Depends(auth_dependency),
+    follow_suggestion_service: FollowSuggestionService = Depends(get_follow_suggestion_service),
+) -> FollowSuggestionsResponse:
+    """List public users followed by people the authenticated user follows, from the last suggestions run."""
+
+    return await follow_suggestion_service.get_suggestions(user_id=user_id, request=suggestions_request)
+
+
 @router.get("/{handle}/profile", response_model=UserProfileResponse)
 async def get_public_profile(
     handle: str,
@@ -39,12 +68,56 @@ async def get_public_profile(
     return await user_service.get_visible_profile(handle=handle, requester_id=user_id)
 
 
+@router.get("/{handle}/followers", response_model=FollowListResponse)
+@limiter.limit("60/minute", hybrid=True)
+async def list_followers(
+    handle: str,
+    request: Request,
+    response: Response,
+    list_request: Annotated[FollowListRequest, Query()],
+    user_id: UUID = Depends(auth_dependency),
+    follow_service: FollowService = Depends(get_follow_service),
+) -> FollowListResponse:
+    """List the active users following a profile, most recent first."""
+
+    return await follow_service.list_followers(handle=handle, requester_id=user_id, request=list_request)
+
+
+@router.get("/{handle}/following", response_model=FollowListResponse)
+@limiter.limit("60/minute", hybrid=True)
+async def list_following(
+    handle: str,
+    request: Request,
+    response: Response,
+    list_request: Annotated[FollowListRequest, Query()],
+    user_id: UUID = Depends(auth_dependency),
+    follow_service: FollowService = Depends(get_follow_service),
+) -> FollowListResponse:
+    """List the active users a profile follows, most recent first."""
+
+    return await follow_service.list_following(handle=handle, requester_id=user_id, request=list_request)
+
+
+@router.post("/relationships", response_model=RelationshipsResponse)
+@limiter.limit("120/minute", hybrid=True)
+async def get_relationships(
+    relationships_request: RelationshipsRequest,
+    request: Request,
+    response: Response,
+    user_id: UUID = Depends(auth_dependency),
+    follow_service: FollowService = Depends(get_follow_service),
+) -> RelationshipsResponse:
+    """Resolve whether the authenticated user follows each of up to 100 users, by ID or handle."""
+
+    return await follow_service.get_relationships(requester_id=user_id, request=relationships_request)
+
+
 @router.put(
     "/{handle}/follow",
     status_code=status.HTTP_204_NO_CONTENT,
     response_class=Response,
 )
-@limiter.limit("60/minute")
+@limiter.limit("60/minute", hybrid=True)
 async def follow_user(
     handle: str,
     request: Request,
@@ -62,7 +135,7 @@ async def follow_user(
     status_code=status.HTTP_204_NO_CONTENT,
     response_class=Response,
 )
-@limiter.limit("60/minute")
+@limiter.limit("60/minute", hybrid=True)
 async def unfollow_user(
     handle: str,
     request: Request,
@@ -89,21 +162,31 @@ async def update_profile(
 async def update_locale(
     request_body: UpdateLocaleRequest,
     request: Request,
+    response: Response,
     user_id: UUID = Depends(auth_dependency),
     user_service: UserService = Depends(get_user_service),
 ) -> UpdateLocaleResponse:
-    return await user_service.update_locale(user_id, request_body.locale)
+    result = await user_service.update_locale(user_id, request_body.locale)
+    # Reissue the access token so its locale claim matches the new preference immediately.
+    set_access_token_cookie(response, str(user_id), request.state.session_id, locale=result.locale)
+    return result
 
 
 @router.put("/settings/password", response_model=ChangePasswordResponse)
 async def change_password(
     request_body: ChangePasswordRequest,
     request: Request,
+    response: Response,
     user_id: UUID = Depends(auth_dependency),
     user_service: UserService = Depends(get_user_service),
+    session_service: SessionService = Depends(get_session_service),
 ) -> ChangePasswordResponse:
-    return await user_service.change_password(
+    result = await user_service.change_password(
         user_id=user_id,
         current_password=request_body.current_password,
         new_password=request_body.new_password,
     )
+    # Changing the password revoked every session, this one included; keep this device signed in with a new one.
+    session_id = await session_service.create_session(user_id)
+    set_auth_cookies(response, str(user_id), session_id, locale=request.state.token_locale)
+    return result
@@ -1,29 +1,25 @@
 from uuid import UUID
 
-from fastapi import HTTPException, Request
+from fastapi import Depends, HTTPException, Request
 
-from app.services.token_service import TokenService
-from app.utils.auth_utils import ACCESS_TOKEN_COOKIE
+from app.dependencies.service_dependency import get_session_service
+from app.services.session_service import SessionService
+from app.services.token_service import TokenService, VerifiedAccessToken, access_token_cache
+from app.utils.auth_utils import ACCESS_TOKEN_COOKIE, ACCESS_TOKEN_LOCALE_CLAIM, SESSION_ID_CLAIM
 from app.utils.id_utils import is_valid_uuid
 
 
-def auth_dependency(request: Request) -> UUID:
-    """
-    Auth dependency check if the user is authenticated via local JWT cookie.
-    Returns the user_id (sub) from the token.
-    """
-    token = request.cookies.get(ACCESS_TOKEN_COOKIE)
-
-    if not token:
-        raise HTTPException(status_code=401, detail="Unauthorized")
-
+def _verify_access_token(token: str) -> VerifiedAccessToken:
     try:
         payload = TokenService.decode_token(token)
         if payload.get("type") != "access":
             raise HTTPException(status_code=401, detail="Invalid token type")
 
         user_id = payload.get("sub")
-        if not user_id:
+        session_id = payload.get(SESSION_ID_CLAIM)
+        issued_at = payload.get("iat")
+        # Tokens issued before sessions existed carry neither claim and cannot be revoked.
+        if not user_id or not isinstance(session_id, str) or not isinstance(issued_at, int | float):
             raise HTTPException(status_code=401, detail="Invalid token payload")
 
         # User IDs are UUIDs. A non-UUID ``sub`` is a stale pre-cutover
@@ -31,11 +27,47 @@ def auth_dependency(request: Request) -> UUID:
         if not is_valid_uuid(user_id):
             raise HTTPException(status_code=401, detail="Unauthorized")
 
-        request.state.user_id = user_id
-
-        return UUID(user_id)
-
+        verified = VerifiedAccessToken(
+            user_id=UUID(user_id),
+            subject=user_id,
+            session_id=session_id,
+            issued_at=float(issued_at),
+            locale=payload.get(ACCESS_TOKEN_LOCALE_CLAIM),
+            expires_at=float(payload["exp"]),
+        )
     except HTTPException:
         raise
     except Exception:
         raise HTTPException(status_code=401, detail="Unauthorized") from None
+
+    access_token_cache.put(token, verified)
+    return verified
+
+
+async def auth_dependency(
+    request: Request,
+    session_service: SessionService = Depends(get_session_service),
+) -> UUID:
+    """
+    Auth dependency check if the user is authenticated via local JWT cookie.
+    Returns the user_id (sub) from the token.
+
+    Verified tokens are kept in a per-worker LRU until they expire, so a client
+    repeating the same token skips signature verification and claim parsing.
+    The session revocation check is answered from a short-lived local cache.
+    """
+    token = request.cookies.get(ACCESS_TOKEN_COOKIE)
+
+    if not token:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    verified = access_token_cache.get(token) or _verify_access_token(token)
+
+    if await session_service.is_revoked(verified.user_id, verified.session_id, verified.issued_at):
+        raise HTTPException(status_code=401, detail="Session revoked")
+
+    request.state.user_id = verified.subject
+    request.state.session_id = verified.session_id
+    request.state.token_locale = verified.locale
+
+    return verified.user_id
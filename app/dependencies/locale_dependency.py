@@ -7,7 +7,7 @@ from fastapi import Depends, Request
 from app.dependencies.auth_dependency import auth_dependency
 from app.dependencies.service_dependency import get_user_service
 from app.services.user_service import UserService
-from app.types import DEFAULT_LOCALE
+from app.types import DEFAULT_LOCALE, LOCALE_CHOICES
 from app.utils.locale_utils import select_supported_locale
 
 
@@ -16,11 +16,16 @@ async def locale_dependency(
     user_id: UUID = Depends(auth_dependency),
     user_service: UserService = Depends(get_user_service),
 ) -> str:
-    """Resolve locale from the request header, account preference, or default."""
+    """Resolve locale from the request header, access-token claim, account preference, or default."""
 
     header_locale = select_supported_locale(request.headers.get("accept-language"))
     if header_locale is not None:
         return header_locale
 
+    # Set by auth_dependency from the signed access token; absent on tokens issued before the claim existed.
+    token_locale = getattr(request.state, "token_locale", None)
+    if isinstance(token_locale, str) and token_locale in LOCALE_CHOICES:
+        return token_locale
+
     locale = await user_service.get_locale(user_id)
     return locale if locale is not None else DEFAULT_LOCALE
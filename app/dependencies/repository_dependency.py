@@ -2,14 +2,20 @@
 
 from functools import lru_cache
 
+from app.repository.feed_repository import FeedRepository
+from app.repository.feed_repository_protocol import FeedRepositoryProtocol
 from app.repository.follow_repository import FollowRepository
 from app.repository.follow_repository_protocol import FollowRepositoryProtocol
+from app.repository.follow_suggestion_repository import FollowSuggestionRepository
+from app.repository.follow_suggestion_repository_protocol import FollowSuggestionRepositoryProtocol
 from app.repository.log_repository import LogRepository
 from app.repository.log_repository_protocol import LogRepositoryProtocol
 from app.repository.movie_rating_repository import MovieRatingRepository
 from app.repository.movie_rating_repository_protocol import MovieRatingRepositoryProtocol
 from app.repository.movie_repository import MovieRepository
 from app.repository.movie_repository_protocol import MovieRepositoryProtocol
+from app.repository.movie_stats_repository import MovieStatsRepository
+from app.repository.movie_stats_repository_protocol import MovieStatsRepositoryProtocol
 from app.repository.notification_repository import NotificationRepository
 from app.repository.notification_repository_protocol import NotificationRepositoryProtocol
 from app.repository.stats_repository import StatsRepository
@@ -65,3 +71,24 @@ def get_stats_repository() -> StatsRepositoryProtocol:
     """Return the PostgreSQL cross-table stats read repository."""
 
     return StatsRepository()
+
+
+@lru_cache
+def get_movie_stats_repository() -> MovieStatsRepositoryProtocol:
+    """Return the PostgreSQL community movie-stats repository."""
+
+    return MovieStatsRepository()
+
+
+@lru_cache
+def get_feed_repository() -> FeedRepositoryProtocol:
+    """Return the PostgreSQL home feed repository."""
+
+    return FeedRepository()
+
+
+@lru_cache
+def get_follow_suggestion_repository() -> FollowSuggestionRepositoryProtocol:
+    """Return the PostgreSQL follow suggestion repository."""
+
+    return FollowSuggestionRepository()
@@ -9,23 +9,32 @@ Tests can swap a whole service through
 from functools import lru_cache
 
 from app.dependencies.repository_dependency import (
+    get_feed_repository,
     get_follow_repository,
+    get_follow_suggestion_repository,
     get_log_repository,
     get_movie_rating_repository,
     get_movie_repository,
+    get_movie_stats_repository,
     get_notification_repository,
     get_stats_repository,
     get_user_repository,
 )
 from app.repository.log_cache_repository import LogCacheRepository
+from app.repository.user_cache_repository import UserCacheRepository
 from app.services.auth_rate_limit_service import AuthRateLimitService
 from app.services.auth_service import AuthService
+from app.services.feed_service import FeedService
 from app.services.follow_service import FollowService
+from app.services.follow_suggestion_service import FollowSuggestionService
 from app.services.log_service import LogService
 from app.services.movie_rating_service import MovieRatingService
 from app.services.movie_service import MovieService
+from app.services.movie_stats_service import MovieStatsService
 from app.services.notification_service import NotificationService
+from app.services.session_service import SessionService
 from app.services.stats_service import StatsService
+from app.services.trending_service import TrendingService
 from app.services.user_service import UserService
 
 
@@ -33,9 +42,13 @@ def _get_runtime_log_repository():
     return LogCacheRepository(get_log_repository())
 
 
+def _get_runtime_user_repository():
+    return UserCacheRepository(get_user_repository(), session_service=get_session_service())
+
+
 @lru_cache
 def get_auth_service() -> AuthService:
-    return AuthService(get_user_repository())
+    return AuthService(_get_runtime_user_repository())
 
 
 @lru_cache
@@ -43,22 +56,39 @@ def get_auth_rate_limit_service() -> AuthRateLimitService:
     return AuthRateLimitService()
 
 
+@lru_cache
+def get_session_service() -> SessionService:
+    return SessionService()
+
+
+@lru_cache
+def get_feed_service() -> FeedService:
+    return FeedService(feed_repository=get_feed_repository())
+
+
 @lru_cache
 def get_user_service() -> UserService:
     return UserService(
-        user_repository=get_user_repository(),
+        user_repository=_get_runtime_user_repository(),
         follow_repository=get_follow_repository(),
+        feed_service=get_feed_service(),
     )
 
 
 @lru_cache
 def get_follow_service() -> FollowService:
     return FollowService(
-        user_repository=get_user_repository(),
+        user_repository=_get_runtime_user_repository(),
         follow_repository=get_follow_repository(),
+        feed_service=get_feed_service(),
     )
 
 
+@lru_cache
+def get_follow_suggestion_service() -> FollowSuggestionService:
+    return FollowSuggestionService(follow_suggestion_repository=get_follow_suggestion_repository())
+
+
 @lru_cache
 def get_movie_service() -> MovieService:
     return MovieService(get_movie_repository())
@@ -72,6 +102,20 @@ def get_movie_rating_service() -> MovieRatingService:
     )
 
 
+@lru_cache
+def get_movie_stats_service() -> MovieStatsService:
+    return MovieStatsService(
+        movie_stats_repository=get_movie_stats_repository(),
+    )
+
+
+@lru_cache
+def get_trending_service() -> TrendingService:
+    return TrendingService(
+        movie_repository=get_movie_repository(),
+    )
+
+
 @lru_cache
 def get_log_service() -> LogService:
     return LogService(
@@ -79,7 +123,8 @@ def get_log_service() -> LogService:
         movie_service=get_movie_service(),
         movie_repository=get_movie_repository(),
         movie_rating_repository=get_movie_rating_repository(),
-        user_repository=get_user_repository(),
+        user_repository=_get_runtime_user_repository(),
+        feed_service=get_feed_service(),
     )
 
 
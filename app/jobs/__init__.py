@@ -0,0 +1 @@
+"""Scheduled maintenance jobs runnable with ``python -m app.jobs.<name>``."""
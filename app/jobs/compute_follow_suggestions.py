@@ -0,0 +1,55 @@
+"""Recompute friends-of-friends follow suggestions for every user.
+
+Run periodically (for example nightly from cron) with::
+
+    python -m app.jobs.compute_follow_suggestions --top-k 50 --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import logging
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.db.postgres import close_postgres_engine, init_postgres_engine  # noqa: E402
+from app.repository.follow_suggestion_repository_protocol import FollowSuggestionsRunResult  # noqa: E402
+from app.services.follow_suggestion_service import FOLLOW_SUGGESTIONS_TOP_K, FollowSuggestionService  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+async def run(top_k: int, batch_size: int) -> FollowSuggestionsRunResult:
+    init_postgres_engine()
+    try:
+        result = await FollowSuggestionService().compute_suggestions(top_k=top_k, batch_size=batch_size)
+    finally:
+        await close_postgres_engine()
+
+    logger.info(
+        "Follow suggestions: users=%d written=%d stale_deleted=%d",
+        result.users_scored,
+        result.suggestions_written,
+        result.stale_rows_deleted,
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--top-k", type=int, default=FOLLOW_SUGGESTIONS_TOP_K, help="Suggestions stored per user")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Edges streamed per fetch and users written per transaction",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    asyncio.run(run(args.top_k, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
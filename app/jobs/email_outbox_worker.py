@@ -0,0 +1,130 @@
+"""Deliver queued outbound emails over a reused SMTP connection.
+
+Run as a long-lived worker process with::
+
+    python -m app.jobs.email_outbox_worker --batch-size 50
+
+Pass ``--once`` to drain the outbox and exit instead of waiting for more emails.
+Several workers may run side by side; each needs a distinct ``--consumer`` name,
+which defaults to the host name and process ID.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.config.email_config import get_smtp_config  # noqa: E402
+from app.config.redis import get_redis_config  # noqa: E402
+from app.services.cache_service import CacheService  # noqa: E402
+from app.services.email_outbox import EmailOutbox, OutboxEntry  # noqa: E402
+from app.services.email_templates import render_email  # noqa: E402
+from app.services.smtp_sender import SMTPSender, is_permanent_failure  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+MAX_ATTEMPTS = 6
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 3600
+POLL_BLOCK_MS = 5000
+RECLAIM_IDLE_MS = 5 * 60 * 1000
+
+
+def retry_delay_seconds(attempt: int) -> int:
+    """Exponential backoff after the ``attempt``-th failure: 30s, 60s, 120s, ... capped at an hour."""
+
+    return min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * int(2 ** (attempt - 1)))
+
+
+async def process_batch(
+    outbox: EmailOutbox,
+    sender: SMTPSender,
+    consumer: str,
+    batch_size: int,
+    block_ms: int = POLL_BLOCK_MS,
+) -> bool:
+    """Send at most one batch, returning ``False`` when the outbox stayed empty."""
+
+    await outbox.promote_due_retries(batch_size)
+    entries = await outbox.read_batch(consumer, batch_size, block_ms, RECLAIM_IDLE_MS)
+    if not entries:
+        return False
+
+    now = time.time()
+    finished: list[str] = []
+    live: list[OutboxEntry] = []
+    for entry in entries:
+        if entry.email.expires_at <= now:
+            logger.warning("Dropping expired email id=%s template=%s", entry.email.message_id, entry.email.template)
+            finished.append(entry.entry_id)
+        else:
+            live.append(entry)
+
+    rendered = [render_email(entry.email.to_email, entry.email.template, entry.email.params) for entry in live]
+    results = await asyncio.to_thread(sender.send_batch, rendered) if rendered else []
+
+    for entry, error in zip(live, results, strict=True):
+        email = entry.email
+        if error is None:
+            finished.append(entry.entry_id)
+            continue
+        delay = retry_delay_seconds(email.attempt)
+        if is_permanent_failure(error) or email.attempt >= MAX_ATTEMPTS or time.time() + delay >= email.expires_at:
+            logger.error(
+                "Dropping email id=%s template=%s after %d attempts: %s",
+                email.message_id,
+                email.template,
+                email.attempt,
+                error,
+            )
+            finished.append(entry.entry_id)
+        else:
+            logger.warning("Email id=%s failed (%s); retrying in %ds", email.message_id, error, delay)
+            await outbox.schedule_retry(entry, delay)
+    await outbox.ack(finished)
+
+    logger.info("Sent %d of %d emails", results.count(None), len(entries))
+    return True
+
+
+async def run(batch_size: int, once: bool, consumer: str) -> None:
+    smtp_config = get_smtp_config()
+    if smtp_config is None:
+        raise RuntimeError("SMTP_SERVER is not configured; the email outbox worker has nothing to send through.")
+
+    CacheService.initialize(get_redis_config())
+    sender = SMTPSender(smtp_config)
+    try:
+        outbox = EmailOutbox()
+        await outbox.ensure_group()
+        while await process_batch(outbox, sender, consumer, batch_size) or not once:
+            pass
+    finally:
+        sender.close()
+        await CacheService.aclose_all()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Emails read and sent per batch")
+    parser.add_argument(
+        "--consumer",
+        default=f"{socket.gethostname()}-{os.getpid()}",
+        help="Consumer name within the outbox consumer group",
+    )
+    parser.add_argument("--once", action="store_true", help="Exit once the outbox is empty")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    asyncio.run(run(args.batch_size, args.once, args.consumer))
+
+
+if __name__ == "__main__":
+    main()
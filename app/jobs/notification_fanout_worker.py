@@ -0,0 +1,94 @@
+"""Consume queued follower notification fan-outs and write them in batches.
+
+Run as a long-lived worker process with::
+
+    python -m app.jobs.notification_fanout_worker --batch-size 1000
+
+Pass ``--once`` to drain the queue and exit instead of waiting for more jobs.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.config.redis import get_redis_config  # noqa: E402
+from app.db.postgres import close_postgres_engine, init_postgres_engine  # noqa: E402
+from app.services.cache_service import CacheService  # noqa: E402
+from app.services.notification_fanout_queue import NotificationFanOutJob, NotificationFanOutQueue  # noqa: E402
+from app.services.notification_service import NOTIFICATION_FANOUT_BATCH_SIZE, NotificationService  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 3
+POLL_TIMEOUT_SECONDS = 5
+
+
+async def process_next(
+    service: NotificationService,
+    queue: NotificationFanOutQueue,
+    batch_size: int,
+    timeout: int = POLL_TIMEOUT_SECONDS,
+) -> bool:
+    """Handle at most one queued job, returning ``False`` when the queue stayed empty."""
+
+    job = await queue.dequeue(timeout)
+    if job is None:
+        return False
+
+    data = job.data
+    try:
+        result = await service.fan_out_to_followers(data, batch_size=batch_size)
+    except Exception:
+        if job.attempt >= MAX_ATTEMPTS:
+            logger.exception(
+                "Dropping fan-out for actor_id=%s key=%s after %d attempts",
+                data.actor_id,
+                data.deduplication_key,
+                job.attempt,
+            )
+        else:
+            logger.exception("Fan-out failed for actor_id=%s key=%s; requeueing", data.actor_id, data.deduplication_key)
+            await queue.enqueue(NotificationFanOutJob(data=data, attempt=job.attempt + 1))
+        return True
+
+    logger.info(
+        "Fanned out key=%s for actor_id=%s: batches=%d created=%d",
+        data.deduplication_key,
+        data.actor_id,
+        result.batches,
+        result.created_count,
+    )
+    return True
+
+
+async def run(batch_size: int, once: bool) -> None:
+    init_postgres_engine()
+    CacheService.initialize(get_redis_config())
+    try:
+        service = NotificationService()
+        queue = NotificationFanOutQueue()
+        while await process_next(service, queue, batch_size) or not once:
+            pass
+    finally:
+        await CacheService.aclose_all()
+        await close_postgres_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument(
+        "--batch-size", type=int, default=NOTIFICATION_FANOUT_BATCH_SIZE, help="Followers notified per transaction"
+    )
+    parser.add_argument("--once", action="store_true", help="Exit once the queue is empty")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    asyncio.run(run(args.batch_size, args.once))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Archive old read notifications and purge soft-deleted ones.
+
+Run periodically (for example nightly from cron) with::
+
+    python -m app.jobs.notification_retention --batch-size 1000 --archive-after-days 90
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import timedelta
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.config.redis import get_redis_config  # noqa: E402
+from app.db.postgres import close_postgres_engine, init_postgres_engine  # noqa: E402
+from app.repository.notification_repository_protocol import NotificationRetentionResult  # noqa: E402
+from app.services.cache_service import CacheService  # noqa: E402
+from app.services.notification_service import NOTIFICATION_ARCHIVE_AFTER_DAYS, NotificationService  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+async def run(batch_size: int, archive_after_days: int) -> NotificationRetentionResult:
+    init_postgres_engine()
+    CacheService.initialize(get_redis_config())
+    try:
+        result = await NotificationService().apply_retention(
+            archive_after=timedelta(days=archive_after_days),
+            batch_size=batch_size,
+        )
+    finally:
+        await CacheService.aclose_all()
+        await close_postgres_engine()
+
+    logger.info(
+        "Notification retention: archived=%d purged=%d",
+        result.archived_count,
+        result.purged_count,
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows moved or purged per transaction")
+    parser.add_argument(
+        "--archive-after-days",
+        type=int,
+        default=NOTIFICATION_ARCHIVE_AFTER_DAYS,
+        help="Archive read notifications older than this many days",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    asyncio.run(run(args.batch_size, args.archive_after_days))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Rebuild the user existence filter from the active users.
+
+Builds the Bloom filter consulted by email and handle lookups, and drops the
+entries of deleted users that a Bloom filter cannot remove. Run once after
+deploying, after restoring Redis from a snapshot, and then periodically (for
+example nightly from cron) with::
+
+    python -m app.jobs.rebuild_user_existence_filter --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import logging
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.config.redis import get_redis_config  # noqa: E402
+from app.db.postgres import close_postgres_engine, init_postgres_engine  # noqa: E402
+from app.repository.user_repository import UserRepository  # noqa: E402
+from app.services.cache_service import CacheService  # noqa: E402
+from app.services.user_existence_filter import UserExistenceFilter  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+async def run(batch_size: int, settle_seconds: float) -> int:
+    init_postgres_engine()
+    CacheService.initialize(get_redis_config())
+    try:
+        return await UserExistenceFilter().rebuild(
+            UserRepository().stream_active_identifiers(batch_size=batch_size),
+            settle_seconds=settle_seconds,
+        )
+    finally:
+        await CacheService.aclose_all()
+        await close_postgres_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--batch-size", type=int, default=1000, help="Users read per database round trip")
+    parser.add_argument(
+        "--settle-seconds",
+        type=float,
+        default=10.0,
+        help="Wait before reading users, so registrations in flight when the rebuild starts are committed",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    asyncio.run(run(args.batch_size, args.settle_seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Recompute community movie stats from logs and ratings and repair drift.
+
+Run periodically (for example nightly from cron) with::
+
+    python -m app.jobs.reconcile_movie_stats --batch-size 500
+"""
+
+import argparse
+import asyncio
+import logging
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.config.redis import get_redis_config  # noqa: E402
+from app.db.postgres import close_postgres_engine, init_postgres_engine  # noqa: E402
+from app.repository.movie_stats_repository_protocol import MovieStatsReconcileResult  # noqa: E402
+from app.services.cache_service import CacheService  # noqa: E402
+from app.services.movie_stats_service import MovieStatsService  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+async def run(batch_size: int) -> MovieStatsReconcileResult:
+    init_postgres_engine()
+    CacheService.initialize(get_redis_config())
+    try:
+        result = await MovieStatsService().reconcile_movie_stats(batch_size=batch_size)
+    finally:
+        await CacheService.aclose_all()
+        await close_postgres_engine()
+
+    logger.info(
+        "Reconciled movie stats: scanned=%d corrected=%d",
+        result.movies_scanned,
+        result.rows_corrected,
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--batch-size", type=int, default=500, help="Movies recomputed per transaction")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    asyncio.run(run(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
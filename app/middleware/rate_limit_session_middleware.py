@@ -1,11 +1,11 @@
 """Validate and issue anonymous rate-limit session cookies on public auth routes."""
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config.public_routes import PUBLIC_AUTH_PATHS
 from app.services.rate_limit_cache_service import RateLimitCacheService
+from app.utils.asgi_utils import get_cookies, set_scope_state
 from app.utils.auth_utils import (
     RATE_LIMIT_SESSION_COOKIE,
     generate_rate_limit_session_id,
@@ -14,34 +14,37 @@ from app.utils.auth_utils import (
 from app.utils.rate_limit_utils import RATE_LIMIT_SESSION_STATE
 
 
-class RateLimitSessionMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
-        self._rate_limit_cache = RateLimitCacheService()
+def _build_session_cookie_header(session_id: str) -> tuple[bytes, bytes]:
+    # Render through the shared cookie helper so the attributes match every other response.
+    response = Response()
+    set_rate_limit_session_id(response, session_id)
+    return next(header for header in response.raw_headers if header[0] == b"set-cookie")
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if request.url.path not in PUBLIC_AUTH_PATHS:
-            return await call_next(request)
 
-        session_id = request.cookies.get(RATE_LIMIT_SESSION_COOKIE)
-        has_valid_session = False
-        issued_session_id: str | None = None
+class RateLimitSessionMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._rate_limit_cache = RateLimitCacheService()
 
-        if session_id:
-            session_data = await self._rate_limit_cache.get_session(session_id)
-            if session_data is not None:
-                setattr(request.state, RATE_LIMIT_SESSION_STATE, session_id)
-                await self._rate_limit_cache.upsert_session(session_id)
-                has_valid_session = True
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in PUBLIC_AUTH_PATHS:
+            await self.app(scope, receive, send)
+            return
 
-        if not has_valid_session:
-            issued_session_id = generate_rate_limit_session_id()
-            setattr(request.state, RATE_LIMIT_SESSION_STATE, issued_session_id)
-            await self._rate_limit_cache.upsert_session(issued_session_id)
+        session_id = get_cookies(scope).get(RATE_LIMIT_SESSION_COOKIE)
+        if session_id and await self._rate_limit_cache.refresh_session(session_id):
+            set_scope_state(scope, RATE_LIMIT_SESSION_STATE, session_id)
+            await self.app(scope, receive, send)
+            return
 
-        response = await call_next(request)
+        issued_session_id = generate_rate_limit_session_id()
+        set_scope_state(scope, RATE_LIMIT_SESSION_STATE, issued_session_id)
+        await self._rate_limit_cache.upsert_session(issued_session_id)
+        session_cookie_header = _build_session_cookie_header(issued_session_id)
 
-        if issued_session_id is not None:
-            set_rate_limit_session_id(response, issued_session_id)
+        async def send_with_session_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), session_cookie_header]
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_session_cookie)
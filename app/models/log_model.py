@@ -61,4 +61,5 @@ class Log(BaseEntity):
         Index("ix_logs_user_movie", "user_id", "movie_id"),
         Index("ix_logs_tmdb_date_watched", "tmdb_id", text("date_watched DESC")),
         Index("ix_logs_user_watched_where_created_at", "user_id", "watched_where", "created_at"),
+        Index("ix_logs_user_created_at", "user_id", text("created_at DESC"), text("id DESC")),
     )
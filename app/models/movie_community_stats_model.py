@@ -0,0 +1,66 @@
+"""PostgreSQL model for incrementally maintained per-movie community counters."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base_model import Base
+
+RATING_VALUES: tuple[int, ...] = tuple(range(1, 11))
+
+
+def rating_histogram_column(rating: int) -> str:
+    """Return the histogram column name holding the count for one rating value."""
+
+    if rating not in RATING_VALUES:
+        raise ValueError(f"rating must be between {RATING_VALUES[0]} and {RATING_VALUES[-1]}")
+    return f"rating_{rating}_count"
+
+
+def _counter_column() -> Mapped[int]:
+    return mapped_column(Integer, nullable=False, server_default=text("0"), default=0)
+
+
+class MovieCommunityStats(Base):
+    """Aggregate log and rating counters for one movie, maintained on every write."""
+
+    __tablename__ = "movie_community_stats"
+
+    movie_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("movies.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    tmdb_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    log_count: Mapped[int] = _counter_column()
+    watcher_count: Mapped[int] = _counter_column()
+    rating_count: Mapped[int] = _counter_column()
+    rating_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"), default=0)
+    rating_1_count: Mapped[int] = _counter_column()
+    rating_2_count: Mapped[int] = _counter_column()
+    rating_3_count: Mapped[int] = _counter_column()
+    rating_4_count: Mapped[int] = _counter_column()
+    rating_5_count: Mapped[int] = _counter_column()
+    rating_6_count: Mapped[int] = _counter_column()
+    rating_7_count: Mapped[int] = _counter_column()
+    rating_8_count: Mapped[int] = _counter_column()
+    rating_9_count: Mapped[int] = _counter_column()
+    rating_10_count: Mapped[int] = _counter_column()
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+    )
+
+    __table_args__ = (UniqueConstraint("tmdb_id", name="uq_movie_community_stats_tmdb_id"),)
+
+    @property
+    def rating_histogram(self) -> list[int]:
+        """Return the rating counts ordered from rating 1 to rating 10."""
+
+        return [getattr(self, rating_histogram_column(rating)) for rating in RATING_VALUES]
@@ -0,0 +1,32 @@
+"""PostgreSQL model for the distinct actors folded into an aggregated notification."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base_model import Base
+
+
+class NotificationActor(Base):
+    """One actor of an aggregated notification, so ``actor_count`` counts each actor once.
+
+    Rows go with their notification when it is archived or purged; only the
+    open aggregate still receives events.
+    """
+
+    __tablename__ = "notification_actors"
+
+    notification_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("notifications.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    actor_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
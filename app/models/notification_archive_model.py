@@ -0,0 +1,59 @@
+"""PostgreSQL model for read notifications moved out of the hot inbox table."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Text, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base_model import BaseEntity
+
+
+class NotificationArchive(BaseEntity):
+    """Archived notification rows with the same columns as ``notifications``.
+
+    Rows arrive here from the retention job already read and active, so the
+    table needs none of the partial indexes that keep ``notifications`` small;
+    one chronology index serves inbox pages that seek past the archive cutoff.
+    Listing reads these rows back as ``Notification`` entities.
+    """
+
+    __tablename__ = "notifications_archive"
+
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    recipient_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    actor_id: Mapped[UUID | None] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    type: Mapped[str] = mapped_column(Text, nullable=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    deduplication_key: Mapped[str | None] = mapped_column(Text, nullable=True)
+    read_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    aggregation_key: Mapped[str | None] = mapped_column(Text, nullable=True)
+    actor_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"), default=1)
+    sample_actor_ids: Mapped[list[UUID]] = mapped_column(
+        ARRAY(PGUUID(as_uuid=True)),
+        nullable=False,
+        server_default=text("'{}'"),
+        default=list,
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_notifications_archive_recipient_chronology",
+            "recipient_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+    )
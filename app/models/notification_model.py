@@ -5,9 +5,10 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Text, text
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Integer, Text, any_, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, foreign, mapped_column, relationship, remote
 
 from app.models.base_model import BaseEntity
 from app.models.user_model import User
@@ -39,8 +40,22 @@ class Notification(BaseEntity):
     body: Mapped[str] = mapped_column(Text, nullable=False)
     deduplication_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     read_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    aggregation_key: Mapped[str | None] = mapped_column(Text, nullable=True)
+    actor_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"), default=1)
+    sample_actor_ids: Mapped[list[UUID]] = mapped_column(
+        ARRAY(PGUUID(as_uuid=True)),
+        nullable=False,
+        server_default=text("'{}'"),
+        default=list,
+    )
 
     actor: Mapped[User | None] = relationship(foreign_keys=[actor_id], lazy="raise")
+    sample_actors: Mapped[list[User]] = relationship(
+        primaryjoin=lambda: remote(User.id) == any_(foreign(Notification.sample_actor_ids)),
+        viewonly=True,
+        uselist=True,
+        lazy="raise",
+    )
 
     _notification_type_sql = ", ".join(f"'{notification_type.value}'" for notification_type in NotificationType)
 
@@ -49,6 +64,7 @@ class Notification(BaseEntity):
             f"type IN ({_notification_type_sql})",
             name="ck_notifications_type",
         ),
+        CheckConstraint("actor_count >= 1", name="ck_notifications_actor_count_positive"),
         Index(
             "ix_notifications_recipient_chronology",
             "recipient_id",
@@ -70,4 +86,21 @@ class Notification(BaseEntity):
             unique=True,
             postgresql_where=text("deleted IS FALSE AND deduplication_key IS NOT NULL"),
         ),
+        Index(
+            "ix_notifications_archivable",
+            "created_at",
+            postgresql_where=text("deleted IS FALSE AND read_at IS NOT NULL"),
+        ),
+        Index(
+            "ix_notifications_soft_deleted",
+            "id",
+            postgresql_where=text("deleted IS TRUE"),
+        ),
+        Index(
+            "uq_notifications_open_aggregation_key",
+            "recipient_id",
+            "aggregation_key",
+            unique=True,
+            postgresql_where=text("deleted IS FALSE AND read_at IS NULL AND aggregation_key IS NOT NULL"),
+        ),
     )
@@ -36,4 +36,6 @@ class UserFollow(Base):
     __table_args__ = (
         CheckConstraint("follower_id <> followed_id", name="ck_user_follows_not_self"),
         Index("ix_user_follows_followed_id", "followed_id"),
+        Index("ix_user_follows_followed_chronology", "followed_id", "created_at", "follower_id"),
+        Index("ix_user_follows_follower_chronology", "follower_id", "created_at", "followed_id"),
     )
@@ -0,0 +1,36 @@
+"""PostgreSQL model for per-user follower and following counters."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Integer, text
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base_model import Base
+
+
+class UserFollowStats(Base):
+    """Active follow-edge counts for one user, maintained on every follow write."""
+
+    __tablename__ = "user_follow_stats"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    follower_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"), default=0)
+    following_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"), default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+    )
+
+    __table_args__ = (
+        CheckConstraint("follower_count >= 0", name="ck_user_follow_stats_follower_count_non_negative"),
+        CheckConstraint("following_count >= 0", name="ck_user_follow_stats_following_count_non_negative"),
+    )
@@ -0,0 +1,38 @@
+"""PostgreSQL model for precomputed follow suggestions."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Integer, SmallInteger
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base_model import Base
+
+
+class UserFollowSuggestion(Base):
+    """One ranked friends-of-friends suggestion, rewritten by the suggestions job."""
+
+    __tablename__ = "user_follow_suggestions"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    rank: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    suggested_user_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    mutual_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        CheckConstraint("rank >= 1", name="ck_user_follow_suggestions_rank_positive"),
+        CheckConstraint("mutual_count >= 1", name="ck_user_follow_suggestions_mutual_count_positive"),
+        Index("ix_user_follow_suggestions_computed_at", "computed_at"),
+    )
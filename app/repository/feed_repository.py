@@ -0,0 +1,131 @@
+"""PostgreSQL reads behind the home feed.
+
+Timelines themselves live in Redis; this repository answers the questions
+the feed cannot answer from a timeline: who receives an author's new log,
+what a missing timeline should contain, which logs by high-follower authors
+are pulled at read time, and the rows a page of log ids hydrates to.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Select, and_, func, or_, select
+
+from app.models.log_model import Log
+from app.models.movie_model import Movie
+from app.models.user_follow_model import UserFollow
+from app.models.user_follow_stats_model import UserFollowStats
+from app.models.user_model import User
+from app.repository.feed_repository_protocol import FeedAudience, FeedEntry, FeedLog
+from app.repository.repository_base import RepositoryBase
+from app.types import TimestampUUIDCursor
+
+_follower_count = func.coalesce(UserFollowStats.follower_count, 0)
+
+
+def _followed_public_logs(user_id: UUID) -> Select[tuple[UUID, datetime]]:
+    """Select active logs by the active public authors ``user_id`` follows."""
+
+    return (
+        select(Log.id, Log.created_at)
+        .join(UserFollow, and_(UserFollow.followed_id == Log.user_id, UserFollow.follower_id == user_id))
+        .join(User, User.id == Log.user_id)
+        .outerjoin(UserFollowStats, UserFollowStats.user_id == Log.user_id)
+        .where(Log.active(), User.active(), User.profile_visibility == "public")
+    )
+
+
+class FeedRepository(RepositoryBase):
+    """Resolve feed audiences, timeline contents and hydrated feed logs."""
+
+    async def get_audience(self, author_id: UUID, max_followers: int) -> FeedAudience:
+        """Read the author's visibility and stored follower count, then their followers when under the threshold."""
+
+        async with self._session_provider() as session:
+            author = (
+                await session.execute(
+                    select(User.profile_visibility, _follower_count)
+                    .outerjoin(UserFollowStats, UserFollowStats.user_id == User.id)
+                    .where(User.id == author_id, User.active())
+                )
+            ).one_or_none()
+            if author is None:
+                return FeedAudience(is_public=False, follower_ids=())
+
+            visibility, follower_count = author
+            if follower_count > max_followers:
+                return FeedAudience(is_public=visibility == "public", follower_ids=None)
+
+            follower_ids = (
+                (
+                    await session.execute(
+                        select(UserFollow.follower_id)
+                        .join(User, User.id == UserFollow.follower_id)
+                        .where(UserFollow.followed_id == author_id, User.active())
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            return FeedAudience(is_public=visibility == "public", follower_ids=follower_ids)
+
+    async def list_timeline_entries(self, user_id: UUID, *, max_followers: int, limit: int) -> Sequence[FeedEntry]:
+        """Read the newest pushed-author logs through ``ix_logs_user_created_at``."""
+
+        statement = (
+            _followed_public_logs(user_id)
+            .where(_follower_count <= max_followers)
+            .order_by(Log.created_at.desc(), Log.id.desc())
+            .limit(limit)
+        )
+        async with self._session_provider() as session:
+            rows = (await session.execute(statement)).all()
+            return [FeedEntry(log_id=log_id, created_at=created_at) for log_id, created_at in rows]
+
+    async def list_pulled_entries(
+        self,
+        user_id: UUID,
+        *,
+        min_followers: int,
+        limit: int,
+        cursor: TimestampUUIDCursor | None,
+    ) -> Sequence[FeedEntry]:
+        """Seek backwards through pulled-author logs on ``(created_at, id)``."""
+
+        statement = _followed_public_logs(user_id).where(_follower_count > min_followers)
+        if cursor is not None:
+            statement = statement.where(
+                or_(
+                    Log.created_at < cursor.timestamp,
+                    and_(Log.created_at == cursor.timestamp, Log.id < cursor.id),
+                )
+            )
+        statement = statement.order_by(Log.created_at.desc(), Log.id.desc()).limit(limit)
+
+        async with self._session_provider() as session:
+            rows = (await session.execute(statement)).all()
+            return [FeedEntry(log_id=log_id, created_at=created_at) for log_id, created_at in rows]
+
+    async def get_feed_logs(self, log_ids: Sequence[UUID]) -> Sequence[FeedLog]:
+        """Hydrate a page of log ids; deleted logs and hidden authors are dropped, order is not kept."""
+
+        if not log_ids:
+            return []
+
+        statement = (
+            select(Log, Movie, User)
+            .join(Movie, Movie.id == Log.movie_id)
+            .join(User, User.id == Log.user_id)
+            .where(
+                Log.id.in_(log_ids),
+                Log.active(),
+                User.active(),
+                User.profile_visibility == "public",
+            )
+        )
+        async with self._session_provider() as session:
+            rows = (await session.execute(statement)).all()
+            return [FeedLog(log=log, movie=movie, author=author) for log, movie, author in rows]
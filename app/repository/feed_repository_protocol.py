@@ -0,0 +1,64 @@
+"""Protocol and read results for home feed persistence."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+from app.models.log_model import Log
+from app.models.movie_model import Movie
+from app.models.user_model import User
+from app.types import TimestampUUIDCursor
+
+
+@dataclass(frozen=True)
+class FeedEntry:
+    """One log reference in a feed, ordered by ``(created_at, log_id)``."""
+
+    log_id: UUID
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class FeedAudience:
+    """Who should see an author's new logs.
+
+    ``follower_ids`` is ``None`` when the author has more followers than the
+    fan-out threshold; their logs are read at request time instead.
+    """
+
+    is_public: bool
+    follower_ids: Sequence[UUID] | None
+
+
+@dataclass(frozen=True)
+class FeedLog:
+    """A hydrated feed log with its movie and author."""
+
+    log: Log
+    movie: Movie
+    author: User
+
+
+class FeedRepositoryProtocol(Protocol):
+    """Read operations behind the home feed."""
+
+    async def get_audience(self, author_id: UUID, max_followers: int) -> FeedAudience:
+        """Return an author's visibility and active follower ids, or ``None`` ids above ``max_followers``."""
+
+    async def list_timeline_entries(self, user_id: UUID, *, max_followers: int, limit: int) -> Sequence[FeedEntry]:
+        """List the newest logs by followed public authors at or under ``max_followers``."""
+
+    async def list_pulled_entries(
+        self,
+        user_id: UUID,
+        *,
+        min_followers: int,
+        limit: int,
+        cursor: TimestampUUIDCursor | None,
+    ) -> Sequence[FeedEntry]:
+        """List logs before ``cursor`` by followed public authors with more than ``min_followers``."""
+
+    async def get_feed_logs(self, log_ids: Sequence[UUID]) -> Sequence[FeedLog]:
+        """Load active logs by active public authors, with their movies, in one query."""
@@ -1,17 +1,102 @@
-"""PostgreSQL repository for accepted directional user follows."""
+"""PostgreSQL repository for accepted directional user follows.
+
+Follower and following counts live in ``user_follow_stats`` and are adjusted
+in the same transaction as the edge write that changes them, so a profile
+view reads two integers instead of counting edges. Counts only include edges
+whose other end is an active user; ``record_user_deactivated`` removes a
+soft-deleted user's edges from everyone else's counts.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import and_, delete, func, or_, select, update
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.orm import aliased
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, aliased
 
+from app.models.log_model import Log
+from app.models.movie_rating_model import MovieRating
 from app.models.user_follow_model import UserFollow
+from app.models.user_follow_stats_model import UserFollowStats
 from app.models.user_model import User
-from app.repository.follow_repository_protocol import FollowSummary
+from app.repository.follow_repository_protocol import (
+    FollowListItem,
+    FollowPage,
+    FollowSummary,
+    FriendMovieActivity,
+    FriendMovieActivityPage,
+)
 from app.repository.repository_base import RepositoryBase
+from app.types import TimestampUUIDCursor
+
+
+async def _adjust_follow_counts(session: AsyncSession, deltas: Sequence[tuple[UUID, str, int]]) -> None:
+    """Add signed ``(user_id, column, delta)`` adjustments, creating counter rows on first write.
+
+    Rows are touched in user-id order so two transactions adjusting the same
+    pair of users, such as a mutual follow, lock them in the same order.
+    """
+
+    table = UserFollowStats.__table__
+    for user_id, column, delta in sorted(deltas):
+        statement = (
+            insert(UserFollowStats)
+            .values(user_id=user_id, **{column: max(delta, 0)})
+            .on_conflict_do_update(
+                index_elements=[UserFollowStats.user_id],
+                set_={column: func.greatest(table.c[column] + delta, 0), "updated_at": func.now()},
+            )
+        )
+        await session.execute(statement)
+
+
+async def _edge_count_deltas(
+    session: AsyncSession,
+    follower_id: UUID,
+    followed_id: UUID,
+    delta: int,
+) -> list[tuple[UUID, str, int]]:
+    """Return the counter changes for one edge, skipping sides whose other end is inactive."""
+
+    active_ids = set(
+        (await session.execute(select(User.id).where(User.id.in_([follower_id, followed_id]), User.active())))
+        .scalars()
+        .all()
+    )
+    deltas = []
+    if follower_id in active_ids:
+        deltas.append((followed_id, "follower_count", delta))
+    if followed_id in active_ids:
+        deltas.append((follower_id, "following_count", delta))
+    return deltas
+
+
+async def record_user_deactivated(session: AsyncSession, user_id: UUID) -> None:
+    """Remove a user's edges from the counts of everyone they follow or who follows them.
+
+    Runs in the caller's session so the counters commit atomically with the
+    soft delete. The user's own counter row is left as it was.
+    """
+
+    await session.execute(
+        update(UserFollowStats)
+        .where(
+            UserFollowStats.user_id == UserFollow.followed_id,
+            UserFollow.follower_id == user_id,
+        )
+        .values(follower_count=func.greatest(UserFollowStats.follower_count - 1, 0), updated_at=func.now())
+    )
+    await session.execute(
+        update(UserFollowStats)
+        .where(
+            UserFollowStats.user_id == UserFollow.follower_id,
+            UserFollow.followed_id == user_id,
+        )
+        .values(following_count=func.greatest(UserFollowStats.following_count - 1, 0), updated_at=func.now())
+    )
 
 
 class FollowRepository(RepositoryBase):
@@ -25,19 +110,26 @@ class FollowRepository(RepositoryBase):
                 insert(UserFollow)
                 .values(follower_id=follower_id, followed_id=followed_id)
                 .on_conflict_do_nothing(index_elements=[UserFollow.follower_id, UserFollow.followed_id])
+                .returning(UserFollow.follower_id)
             )
-            await session.execute(statement)
+            if (await session.execute(statement)).scalar_one_or_none() is not None:
+                await _adjust_follow_counts(session, await _edge_count_deltas(session, follower_id, followed_id, 1))
             await session.commit()
 
     async def delete_follow(self, follower_id: UUID, followed_id: UUID) -> None:
         """Idempotently delete a follow edge."""
 
         async with self._session_provider() as session:
-            statement = delete(UserFollow).where(
-                UserFollow.follower_id == follower_id,
-                UserFollow.followed_id == followed_id,
+            statement = (
+                delete(UserFollow)
+                .where(
+                    UserFollow.follower_id == follower_id,
+                    UserFollow.followed_id == followed_id,
+                )
+                .returning(UserFollow.follower_id)
             )
-            await session.execute(statement)
+            if (await session.execute(statement)).scalar_one_or_none() is not None:
+                await _adjust_follow_counts(session, await _edge_count_deltas(session, follower_id, followed_id, -1))
             await session.commit()
 
     async def is_following(self, follower_id: UUID, followed_id: UUID) -> bool:
@@ -61,33 +153,84 @@ class FollowRepository(RepositoryBase):
             result = await session.execute(statement)
             return result.scalar_one_or_none() is not None
 
-    async def get_follow_summary(self, user_id: UUID, requester_id: UUID) -> FollowSummary:
-        """Aggregate active edges for a profile in one database round trip."""
+    async def list_following_ids(self, user_id: UUID) -> Sequence[UUID]:
+        """Return the IDs of every user ``user_id`` follows, read from the composite primary key."""
 
-        active_follower = aliased(User)
-        active_followed = aliased(User)
-        active_requester = aliased(User)
+        async with self._session_provider() as session:
+            statement = select(UserFollow.followed_id).where(UserFollow.follower_id == user_id)
+            return (await session.execute(statement)).scalars().all()
 
-        follower_count = (
-            select(func.count())
-            .select_from(UserFollow)
-            .join(active_follower, active_follower.id == UserFollow.follower_id)
-            .where(
-                UserFollow.followed_id == user_id,
-                active_follower.active(),
+    async def list_friend_movie_activity(self, user_id: UUID, tmdb_id: int, *, limit: int) -> FriendMovieActivityPage:
+        """Join the user's follow edges to one movie's logs and ratings in a single statement.
+
+        Logs are probed through ``ix_logs_tmdb_date_watched`` and ratings
+        through ``uq_movie_ratings_user_tmdb``, both restricted to followed
+        IDs from the edge primary key, so the cost follows the movie's
+        activity among friends rather than the size of either table.
+        """
+
+        followed_ids = select(UserFollow.followed_id).where(UserFollow.follower_id == user_id)
+        watched = (
+            select(
+                Log.user_id.label("user_id"),
+                func.max(Log.date_watched).label("last_watched_at"),
+                func.count().label("log_count"),
             )
-            .scalar_subquery()
+            .where(Log.tmdb_id == tmdb_id, Log.user_id.in_(followed_ids), Log.active())
+            .group_by(Log.user_id)
+            .subquery()
         )
-        following_count = (
-            select(func.count())
-            .select_from(UserFollow)
-            .join(active_followed, active_followed.id == UserFollow.followed_id)
-            .where(
-                UserFollow.follower_id == user_id,
-                active_followed.active(),
+        rated = (
+            select(MovieRating.user_id.label("user_id"), MovieRating.rating.label("rating"))
+            .where(MovieRating.tmdb_id == tmdb_id, MovieRating.user_id.in_(followed_ids), MovieRating.active())
+            .subquery()
+        )
+        activity = (
+            select(
+                func.coalesce(watched.c.user_id, rated.c.user_id).label("user_id"),
+                watched.c.last_watched_at,
+                func.coalesce(watched.c.log_count, 0).label("log_count"),
+                rated.c.rating,
             )
-            .scalar_subquery()
+            .select_from(watched.join(rated, rated.c.user_id == watched.c.user_id, full=True))
+            .subquery()
         )
+        statement = (
+            select(
+                User,
+                activity.c.last_watched_at,
+                activity.c.log_count,
+                activity.c.rating,
+                func.count().over().label("total_count"),
+            )
+            .join(activity, activity.c.user_id == User.id)
+            .where(User.active(), User.profile_visibility == "public")
+            .order_by(activity.c.last_watched_at.desc().nulls_last(), User.handle)
+            .limit(limit)
+        )
+
+        async with self._session_provider() as session:
+            rows = (await session.execute(statement)).all()
+            return FriendMovieActivityPage(
+                items=[
+                    FriendMovieActivity(
+                        user=row.User,
+                        last_watched_at=row.last_watched_at,
+                        log_count=row.log_count,
+                        rating=row.rating,
+                    )
+                    for row in rows
+                ],
+                total_count=rows[0].total_count if rows else 0,
+            )
+
+    async def get_follow_summary(self, user_id: UUID, requester_id: UUID) -> FollowSummary:
+        """Read a profile's stored counts and the requester's edge in one database round trip."""
+
+        active_requester = aliased(User)
+
+        follower_count = select(UserFollowStats.follower_count).where(UserFollowStats.user_id == user_id)
+        following_count = select(UserFollowStats.following_count).where(UserFollowStats.user_id == user_id)
         requester_follows = (
             select(UserFollow.follower_id)
             .join(active_requester, active_requester.id == UserFollow.follower_id)
@@ -101,8 +244,8 @@ class FollowRepository(RepositoryBase):
 
         async with self._session_provider() as session:
             statement = select(
-                follower_count.label("follower_count"),
-                following_count.label("following_count"),
+                func.coalesce(follower_count.scalar_subquery(), 0).label("follower_count"),
+                func.coalesce(following_count.scalar_subquery(), 0).label("following_count"),
                 requester_follows.label("is_following"),
             )
             row = (await session.execute(statement)).one()
@@ -111,3 +254,54 @@ class FollowRepository(RepositoryBase):
                 following_count=row.following_count,
                 is_following=bool(row.is_following),
             )
+
+    async def list_followers(
+        self,
+        user_id: UUID,
+        *,
+        limit: int,
+        cursor: TimestampUUIDCursor | None,
+    ) -> FollowPage:
+        """Seek backwards through ``ix_user_follows_followed_chronology`` for the user's followers."""
+
+        return await self._list_edges(UserFollow.followed_id, UserFollow.follower_id, user_id, limit, cursor)
+
+    async def list_following(
+        self,
+        user_id: UUID,
+        *,
+        limit: int,
+        cursor: TimestampUUIDCursor | None,
+    ) -> FollowPage:
+        """Seek backwards through ``ix_user_follows_follower_chronology`` for the users followed."""
+
+        return await self._list_edges(UserFollow.follower_id, UserFollow.followed_id, user_id, limit, cursor)
+
+    async def _list_edges(
+        self,
+        owner_column: InstrumentedAttribute[UUID],
+        other_column: InstrumentedAttribute[UUID],
+        user_id: UUID,
+        limit: int,
+        cursor: TimestampUUIDCursor | None,
+    ) -> FollowPage:
+        """List edges newest first on ``(created_at, other user id)``; the cursor ``id`` is the other user."""
+
+        statement = (
+            select(User, UserFollow.created_at)
+            .join(User, User.id == other_column)
+            .where(owner_column == user_id, User.active())
+        )
+        if cursor is not None:
+            statement = statement.where(
+                or_(
+                    UserFollow.created_at < cursor.timestamp,
+                    and_(UserFollow.created_at == cursor.timestamp, other_column < cursor.id),
+                )
+            )
+        statement = statement.order_by(UserFollow.created_at.desc(), other_column.desc()).limit(limit + 1)
+
+        async with self._session_provider() as session:
+            rows = (await session.execute(statement)).all()
+            items = [FollowListItem(user=user, followed_at=created_at) for user, created_at in rows]
+            return FollowPage(items=items[:limit], has_more=len(items) > limit)
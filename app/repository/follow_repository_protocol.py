@@ -1,9 +1,14 @@
-"""Protocol and read result for user-follow persistence."""
+"""Protocol and read results for user-follow persistence."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
+from app.models.user_model import User
+from app.types import TimestampUUIDCursor
+
 
 @dataclass(frozen=True)
 class FollowSummary:
@@ -14,6 +19,40 @@ class FollowSummary:
     is_following: bool
 
 
+@dataclass(frozen=True)
+class FollowListItem:
+    """The active user on the other end of one edge and when the edge was created."""
+
+    user: User
+    followed_at: datetime
+
+
+@dataclass(frozen=True)
+class FollowPage:
+    """One seek-paginated slice of a follower or following list."""
+
+    items: Sequence[FollowListItem]
+    has_more: bool
+
+
+@dataclass(frozen=True)
+class FriendMovieActivity:
+    """A followed user's logs and rating for one movie."""
+
+    user: User
+    last_watched_at: datetime | None
+    log_count: int
+    rating: int | None
+
+
+@dataclass(frozen=True)
+class FriendMovieActivityPage:
+    """The most recent followed users' activity for one movie and how many there are in total."""
+
+    items: Sequence[FriendMovieActivity]
+    total_count: int
+
+
 class FollowRepositoryProtocol(Protocol):
     """Persistence operations for accepted directional follows."""
 
@@ -26,5 +65,29 @@ class FollowRepositoryProtocol(Protocol):
     async def is_following(self, follower_id: UUID, followed_id: UUID) -> bool:
         """Return whether both active users have the requested edge."""
 
+    async def list_following_ids(self, user_id: UUID) -> Sequence[UUID]:
+        """Return the IDs of all users ``user_id`` follows, active or not."""
+
+    async def list_friend_movie_activity(self, user_id: UUID, tmdb_id: int, *, limit: int) -> FriendMovieActivityPage:
+        """List active public users ``user_id`` follows who logged or rated a movie, most recently watched first."""
+
     async def get_follow_summary(self, user_id: UUID, requester_id: UUID) -> FollowSummary:
         """Return active follower/following counts and requester-relative state."""
+
+    async def list_followers(
+        self,
+        user_id: UUID,
+        *,
+        limit: int,
+        cursor: TimestampUUIDCursor | None,
+    ) -> FollowPage:
+        """List active users following ``user_id``, most recent follow first."""
+
+    async def list_following(
+        self,
+        user_id: UUID,
+        *,
+        limit: int,
+        cursor: TimestampUUIDCursor | None,
+    ) -> FollowPage:
+        """List active users ``user_id`` follows, most recent follow first."""
@@ -0,0 +1,112 @@
+"""PostgreSQL repository for offline friends-of-friends follow suggestions.
+
+The suggestions job reads the whole active follow graph once per run and
+writes each user's top suggestions as ranked rows. Requests only read those
+rows by primary key, re-checking the few facts that can change between runs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import cast
+from uuid import UUID
+
+from sqlalchemy import CursorResult, delete, insert, select
+
+from app.models.user_follow_model import UserFollow
+from app.models.user_follow_suggestion_model import UserFollowSuggestion
+from app.models.user_model import User
+from app.repository.follow_suggestion_repository_protocol import FollowSuggestionItem, ScoredSuggestion
+from app.repository.repository_base import RepositoryBase
+from app.utils.follow_graph_utils import FollowGraph, FollowGraphBuilder
+
+
+class FollowSuggestionRepository(RepositoryBase):
+    """Load the follow graph and store and serve ranked follow suggestions."""
+
+    async def load_follow_graph(self, *, batch_size: int) -> FollowGraph:
+        """Read active users, then stream ``user_follows`` in primary-key order into a CSR builder."""
+
+        async with self._session_provider() as session:
+            users = (
+                await session.execute(
+                    select(User.id, User.profile_visibility == "public").where(User.active()).order_by(User.id)
+                )
+            ).tuples()
+            builder = FollowGraphBuilder(users)
+
+            edges = await session.stream(
+                select(UserFollow.follower_id, UserFollow.followed_id)
+                .order_by(UserFollow.follower_id, UserFollow.followed_id)
+                .execution_options(yield_per=batch_size)
+            )
+            async for partition in edges.partitions():
+                builder.add_edges(row._tuple() for row in partition)
+            return builder.build()
+
+    async def replace_suggestions(
+        self,
+        suggestions: Mapping[UUID, Sequence[ScoredSuggestion]],
+        computed_at: datetime,
+    ) -> int:
+        """Delete and reinsert the listed users' rows so readers never see a half-written list."""
+
+        if not suggestions:
+            return 0
+        rows = [
+            {
+                "user_id": user_id,
+                "rank": rank,
+                "suggested_user_id": suggestion.suggested_user_id,
+                "mutual_count": suggestion.mutual_count,
+                "computed_at": computed_at,
+            }
+            for user_id, ranked in suggestions.items()
+            for rank, suggestion in enumerate(ranked, start=1)
+        ]
+        async with self._session_provider() as session:
+            await session.execute(
+                delete(UserFollowSuggestion).where(UserFollowSuggestion.user_id.in_(list(suggestions)))
+            )
+            if rows:
+                await session.execute(insert(UserFollowSuggestion), rows)
+            await session.commit()
+        return len(rows)
+
+    async def delete_suggestions_computed_before(self, computed_at: datetime) -> int:
+        """Delete rows older than a run through ``ix_user_follow_suggestions_computed_at``."""
+
+        async with self._session_provider() as session:
+            result = cast(
+                "CursorResult[tuple[object, ...]]",
+                await session.execute(
+                    delete(UserFollowSuggestion).where(UserFollowSuggestion.computed_at < computed_at)
+                ),
+            )
+            await session.commit()
+            return result.rowcount
+
+    async def list_suggestions(self, user_id: UUID, *, limit: int) -> Sequence[FollowSuggestionItem]:
+        """Read ranked rows by primary key, dropping users deactivated, hidden, or followed since the run."""
+
+        already_followed = (
+            select(UserFollow.follower_id)
+            .where(UserFollow.follower_id == user_id, UserFollow.followed_id == UserFollowSuggestion.suggested_user_id)
+            .exists()
+        )
+        statement = (
+            select(User, UserFollowSuggestion.mutual_count)
+            .join(User, User.id == UserFollowSuggestion.suggested_user_id)
+            .where(
+                UserFollowSuggestion.user_id == user_id,
+                User.active(),
+                User.profile_visibility == "public",
+                ~already_followed,
+            )
+            .order_by(UserFollowSuggestion.rank)
+            .limit(limit)
+        )
+        async with self._session_provider() as session:
+            rows = (await session.execute(statement)).all()
+            return [FollowSuggestionItem(user=user, mutual_count=mutual_count) for user, mutual_count in rows]
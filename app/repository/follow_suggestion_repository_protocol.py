@@ -0,0 +1,55 @@
+"""Protocol and read results for precomputed follow suggestions."""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+from app.models.user_model import User
+from app.utils.follow_graph_utils import FollowGraph
+
+
+@dataclass(frozen=True)
+class ScoredSuggestion:
+    """A suggested user and how many followed users follow them."""
+
+    suggested_user_id: UUID
+    mutual_count: int
+
+
+@dataclass(frozen=True)
+class FollowSuggestionItem:
+    """A stored suggestion hydrated with the suggested user."""
+
+    user: User
+    mutual_count: int
+
+
+@dataclass(frozen=True)
+class FollowSuggestionsRunResult:
+    """Outcome of one suggestions job run."""
+
+    users_scored: int
+    suggestions_written: int
+    stale_rows_deleted: int
+
+
+class FollowSuggestionRepositoryProtocol(Protocol):
+    """Load the follow graph, store ranked suggestions, and read them back."""
+
+    async def load_follow_graph(self, *, batch_size: int) -> FollowGraph:
+        """Load active users and their follow edges into a CSR graph, streaming edges in batches."""
+
+    async def replace_suggestions(
+        self,
+        suggestions: Mapping[UUID, Sequence[ScoredSuggestion]],
+        computed_at: datetime,
+    ) -> int:
+        """Replace each listed user's suggestions with the given ranked ones in one transaction."""
+
+    async def delete_suggestions_computed_before(self, computed_at: datetime) -> int:
+        """Delete suggestions left over from earlier runs for users not rewritten since ``computed_at``."""
+
+    async def list_suggestions(self, user_id: UUID, *, limit: int) -> Sequence[FollowSuggestionItem]:
+        """List stored suggestions by rank that are still active, public, and not yet followed."""
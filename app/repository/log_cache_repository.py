@@ -57,11 +57,11 @@ class LogCacheRepository:
         user_part = str(user_id) if user_id is not None else "all"
         return f"cinelog:logs:movie:{movie_id}:user:{user_part}"
 
-    def build_user_logs_pattern(self, user_id: UUID) -> str:
-        return f"cinelog:logs:user:{user_id}:*"
+    def build_user_logs_index_key(self, user_id: UUID) -> str:
+        return f"cinelog:logs:user:{user_id}:keys"
 
-    def build_movie_logs_pattern(self, movie_id: UUID) -> str:
-        return f"cinelog:logs:movie:{movie_id}:*"
+    def build_movie_logs_index_key(self, movie_id: UUID) -> str:
+        return f"cinelog:logs:movie:{movie_id}:keys"
 
     def _serialize_log(self, log: Log) -> dict[str, Any]:
         return CachedLog.model_validate(log).model_dump(mode="json")
@@ -113,42 +113,29 @@ class LogCacheRepository:
         except Exception:
             logger.exception("Log cache write failed for key=%s", key)
 
-    async def _set_logs(self, key: str, logs: list[Log]) -> None:
+    async def _set_logs(self, key: str, index_key: str, logs: list[Log]) -> None:
         try:
-            await self._cache.set(key, self._serialize_logs(logs), ttl=LOG_CACHE_TTL)
+            await self._cache.set_indexed(key, self._serialize_logs(logs), index_key, LOG_CACHE_TTL)
             logger.debug("Log cache set for key=%s", key)
         except Exception:
             logger.exception("Log cache write failed for key=%s", key)
 
-    async def _delete_key(self, key: str) -> None:
+    async def _invalidate(self, keys: list[str], index_keys: list[str]) -> None:
         try:
-            await self._cache.delete(key)
-            logger.debug("Log cache deleted for key=%s", key)
+            await self._cache.delete_indexed(keys, index_keys)
+            logger.debug("Log cache invalidated for keys=%s indexes=%s", keys, index_keys)
         except Exception:
-            logger.exception("Log cache delete failed for key=%s", key)
+            logger.exception("Log cache invalidation failed for keys=%s indexes=%s", keys, index_keys)
 
-    async def _invalidate_pattern(self, pattern: str) -> None:
-        try:
-            await self._cache.invalidate_pattern(pattern)
-            logger.debug("Log cache invalidated for pattern=%s", pattern)
-        except Exception:
-            logger.exception("Log cache invalidation failed for pattern=%s", pattern)
-
-    async def _invalidate_user_logs(self, user_id: UUID) -> None:
-        await self._invalidate_pattern(self.build_user_logs_pattern(user_id))
-
-    async def _invalidate_movie_logs(self, movie_id: UUID) -> None:
-        await self._invalidate_pattern(self.build_movie_logs_pattern(movie_id))
+    def _list_index_keys(self, log: Log) -> list[str]:
+        return [self.build_user_logs_index_key(log.user_id), self.build_movie_logs_index_key(log.movie_id)]
 
     async def _invalidate_log(self, log: Log) -> None:
-        await self._delete_key(self.build_log_key(log.id, log.user_id))
-        await self._invalidate_user_logs(log.user_id)
-        await self._invalidate_movie_logs(log.movie_id)
+        await self._invalidate([self.build_log_key(log.id, log.user_id)], self._list_index_keys(log))
 
     async def create_log(self, user_id: UUID, create_log_request: LogCreateRequest) -> Log:
         log = await self.repository.create_log(user_id, create_log_request)
-        await self._invalidate_user_logs(log.user_id)
-        await self._invalidate_movie_logs(log.movie_id)
+        await self._invalidate([], self._list_index_keys(log))
         return log
 
     async def find_log_by_id(self, log_id: UUID, user_id: UUID) -> Log | None:
@@ -203,7 +190,7 @@ class LogCacheRepository:
             sort_order=sort_order,
         )
         logs = list(logs)
-        await self._set_logs(key, logs)
+        await self._set_logs(key, self.build_user_logs_index_key(user_id), logs)
         return logs
 
     async def find_logs_by_movie_id(
@@ -218,7 +205,7 @@ class LogCacheRepository:
 
         logs = await self.repository.find_logs_by_movie_id(movie_id, user_id)
         logs = list(logs)
-        await self._set_logs(key, logs)
+        await self._set_logs(key, self.build_movie_logs_index_key(movie_id), logs)
         return logs
 
     async def delete_log(self, log_id: UUID, user_id: UUID) -> Log | None:
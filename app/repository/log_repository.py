@@ -9,6 +9,7 @@ from uuid import UUID
 from sqlalchemy import ColumnElement, select
 
 from app.models.log_model import Log
+from app.repository.movie_stats_repository import record_log_created, record_log_deleted
 from app.repository.repository_base import RepositoryBase
 from app.schemas.log_schemas import LogCreateRequest, LogUpdateRequest
 from app.utils.datetime_utils import date_end_utc, date_start_utc, to_utc_datetime
@@ -18,7 +19,7 @@ class LogRepository(RepositoryBase):
     """Repository class for PostgreSQL log operations."""
 
     async def create_log(self, user_id: UUID, create_log_request: LogCreateRequest) -> Log:
-        """Create a new viewing log in PostgreSQL."""
+        """Create a new viewing log and count it in the movie's community stats."""
 
         if create_log_request.movie_id is None:
             raise ValueError("movie_id is required")
@@ -34,6 +35,8 @@ class LogRepository(RepositoryBase):
                 watched_where=create_log_request.watched_where,
             )
             session.add(log)
+            await session.flush()
+            await record_log_created(session, log)
             await session.commit()
             await session.refresh(log)
             return log
@@ -139,7 +142,7 @@ class LogRepository(RepositoryBase):
             return list(result.scalars().all())
 
     async def delete_log(self, log_id: UUID, user_id: UUID) -> Log | None:
-        """Hard-delete an active log owned by the given user."""
+        """Hard-delete an active log owned by the given user and uncount it from community stats."""
 
         async with self._session_provider() as session:
             statement = select(Log).where(
@@ -153,5 +156,7 @@ class LogRepository(RepositoryBase):
                 return None
 
             await session.delete(log)
+            await session.flush()
+            await record_log_deleted(session, log)
             await session.commit()
             return log
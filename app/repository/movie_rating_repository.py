@@ -5,10 +5,11 @@ from __future__ import annotations
 from collections.abc import Iterable, Sequence
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Boolean, func, literal_column, select
 from sqlalchemy.dialects.postgresql import insert
 
 from app.models.movie_rating_model import MovieRating
+from app.repository.movie_stats_repository import record_rating_changed, refresh_movie_community_stats
 from app.repository.repository_base import RepositoryBase
 
 
@@ -55,9 +56,22 @@ class MovieRatingRepository(RepositoryBase):
         comment: str | None,
         tmdb_id: int,
     ) -> MovieRating:
-        """Insert or update a movie rating using PostgreSQL native upsert."""
+        """Insert or update a movie rating and move its contribution in the community stats.
+
+        The existing row, including a soft-deleted one, is locked before the
+        upsert so its previous rating is known exactly. If another request
+        inserted the first rating in between, the movie's counters are
+        recomputed instead.
+        """
 
         async with self._session_provider() as session:
+            previous_statement = (
+                select(MovieRating.movie_id, MovieRating.rating, MovieRating.deleted)
+                .where(MovieRating.user_id == user_id, MovieRating.tmdb_id == tmdb_id)
+                .with_for_update()
+            )
+            previous = (await session.execute(previous_statement)).one_or_none()
+
             statement = (
                 insert(MovieRating)
                 .values(
@@ -78,10 +92,23 @@ class MovieRatingRepository(RepositoryBase):
                         "deleted_at": None,
                     },
                 )
-                .returning(MovieRating.id)
+                .returning(MovieRating.id, literal_column("xmax = 0", Boolean).label("inserted"))
             )
             result = await session.execute(statement)
-            rating_id = result.scalar_one()
+            rating_id, inserted = result.one()
+
+            if previous is None and not inserted:
+                await refresh_movie_community_stats(session, [movie_id])
+            else:
+                active_previous = previous if previous is not None and not previous.deleted else None
+                await record_rating_changed(
+                    session,
+                    tmdb_id=tmdb_id,
+                    previous_movie_id=active_previous.movie_id if active_previous is not None else None,
+                    previous_rating=active_previous.rating if active_previous is not None else None,
+                    movie_id=movie_id,
+                    rating=rating,
+                )
             await session.commit()
 
             rating_record = await session.get(MovieRating, rating_id)
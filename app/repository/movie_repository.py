@@ -121,3 +121,18 @@ class MovieRepository(RepositoryBase):
             )
             result = await session.execute(statement)
             return list(result.scalars().all())
+
+    async def find_movies_by_tmdb_ids(self, tmdb_ids: Iterable[int]) -> list[Movie]:
+        """Find active movies by TMDB ID set."""
+
+        tmdb_ids = list(tmdb_ids)
+        if not tmdb_ids:
+            return []
+
+        async with self._session_provider() as session:
+            statement = select(Movie).where(
+                Movie.tmdb_id.in_(tmdb_ids),
+                Movie.active(),
+            )
+            result = await session.execute(statement)
+            return list(result.scalars().all())
@@ -28,3 +28,6 @@ class MovieRepositoryProtocol(Protocol[IdType, MovieType]):
 
     async def find_movies_by_ids(self, movie_ids: Iterable[IdType]) -> Sequence[MovieType]:
         """Find multiple movies by a set of unique identifiers."""
+
+    async def find_movies_by_tmdb_ids(self, tmdb_ids: Iterable[int]) -> Sequence[MovieType]:
+        """Find multiple movies by a set of TMDB IDs."""
@@ -0,0 +1,270 @@
+"""PostgreSQL community movie-stats counters and their reconciliation.
+
+The module-level ``record_*`` helpers run inside the caller's session so the
+counter update commits atomically with the log or rating write that caused it.
+Each helper upserts the movie's counter row first, which takes its row lock and
+serializes concurrent writers for the same movie before any "does this user
+still have another log" check runs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from uuid import UUID
+
+from sqlalchemy import distinct, exists, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.log_model import Log
+from app.models.movie_community_stats_model import (
+    RATING_VALUES,
+    MovieCommunityStats,
+    rating_histogram_column,
+)
+from app.models.movie_model import Movie
+from app.models.movie_rating_model import MovieRating
+from app.repository.movie_stats_repository_protocol import MovieStatsReconcileResult
+from app.repository.repository_base import RepositoryBase
+
+HISTOGRAM_COLUMNS: tuple[str, ...] = tuple(rating_histogram_column(rating) for rating in RATING_VALUES)
+COUNTER_COLUMNS: tuple[str, ...] = (
+    "log_count",
+    "watcher_count",
+    "rating_count",
+    "rating_sum",
+    *HISTOGRAM_COLUMNS,
+)
+
+
+async def _apply_counter_deltas(
+    session: AsyncSession,
+    *,
+    movie_id: UUID,
+    tmdb_id: int,
+    deltas: Mapping[str, int],
+) -> None:
+    """Add signed deltas to a movie's counters, creating the row on first write."""
+
+    deltas = {column: delta for column, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    table = MovieCommunityStats.__table__
+    statement = (
+        insert(MovieCommunityStats)
+        .values(
+            movie_id=movie_id,
+            tmdb_id=tmdb_id,
+            **{column: max(delta, 0) for column, delta in deltas.items()},
+        )
+        .on_conflict_do_update(
+            index_elements=[MovieCommunityStats.movie_id],
+            set_={
+                **{column: func.greatest(table.c[column] + delta, 0) for column, delta in deltas.items()},
+                "updated_at": func.now(),
+            },
+        )
+    )
+    await session.execute(statement)
+
+
+async def _user_has_active_log(
+    session: AsyncSession,
+    *,
+    user_id: UUID,
+    movie_id: UUID,
+    exclude_log_id: UUID | None = None,
+) -> bool:
+    criteria = [Log.user_id == user_id, Log.movie_id == movie_id, Log.active()]
+    if exclude_log_id is not None:
+        criteria.append(Log.id != exclude_log_id)
+    return bool(await session.scalar(select(exists().where(*criteria))))
+
+
+async def record_log_created(session: AsyncSession, log: Log) -> None:
+    """Count a newly flushed log and, if it is the user's first for the movie, a new watcher."""
+
+    await _apply_counter_deltas(session, movie_id=log.movie_id, tmdb_id=log.tmdb_id, deltas={"log_count": 1})
+    if not await _user_has_active_log(session, user_id=log.user_id, movie_id=log.movie_id, exclude_log_id=log.id):
+        await _apply_counter_deltas(
+            session,
+            movie_id=log.movie_id,
+            tmdb_id=log.tmdb_id,
+            deltas={"watcher_count": 1},
+        )
+
+
+async def record_log_deleted(session: AsyncSession, log: Log) -> None:
+    """Uncount a deleted log and, if it was the user's last for the movie, its watcher."""
+
+    await _apply_counter_deltas(session, movie_id=log.movie_id, tmdb_id=log.tmdb_id, deltas={"log_count": -1})
+    if not await _user_has_active_log(session, user_id=log.user_id, movie_id=log.movie_id):
+        await _apply_counter_deltas(
+            session,
+            movie_id=log.movie_id,
+            tmdb_id=log.tmdb_id,
+            deltas={"watcher_count": -1},
+        )
+
+
+def _rating_deltas(rating: int | None, sign: int) -> dict[str, int]:
+    if rating is None:
+        return {}
+    return {
+        "rating_count": sign,
+        "rating_sum": sign * rating,
+        rating_histogram_column(rating): sign,
+    }
+
+
+async def record_rating_changed(
+    session: AsyncSession,
+    *,
+    tmdb_id: int,
+    previous_movie_id: UUID | None,
+    previous_rating: int | None,
+    movie_id: UUID,
+    rating: int | None,
+) -> None:
+    """Move one user's rating contribution from its previous value to the new one."""
+
+    if previous_movie_id == movie_id and previous_rating == rating:
+        return
+
+    if previous_movie_id is not None and previous_movie_id != movie_id:
+        await _apply_counter_deltas(
+            session,
+            movie_id=previous_movie_id,
+            tmdb_id=tmdb_id,
+            deltas=_rating_deltas(previous_rating, -1),
+        )
+        previous_rating = None
+
+    deltas = _rating_deltas(rating, 1)
+    for column, delta in _rating_deltas(previous_rating, -1).items():
+        deltas[column] = deltas.get(column, 0) + delta
+    await _apply_counter_deltas(session, movie_id=movie_id, tmdb_id=tmdb_id, deltas=deltas)
+
+
+async def refresh_movie_community_stats(session: AsyncSession, movie_ids: Sequence[UUID]) -> list[int]:
+    """Recompute counters for ``movie_ids`` from source rows and return the TMDB IDs that changed.
+
+    Existing counter rows are locked first so that writers already holding them
+    commit before the aggregates are read, and writers arriving later apply
+    their deltas on top of the recomputed values.
+    """
+
+    if not movie_ids:
+        return []
+
+    await session.execute(
+        select(MovieCommunityStats.movie_id)
+        .where(MovieCommunityStats.movie_id.in_(movie_ids))
+        .order_by(MovieCommunityStats.movie_id)
+        .with_for_update()
+    )
+
+    log_totals = (
+        select(
+            Log.movie_id.label("movie_id"),
+            func.count().label("log_count"),
+            func.count(distinct(Log.user_id)).label("watcher_count"),
+        )
+        .where(Log.movie_id.in_(movie_ids), Log.active())
+        .group_by(Log.movie_id)
+        .subquery("log_totals")
+    )
+    rating_totals = (
+        select(
+            MovieRating.movie_id.label("movie_id"),
+            func.count().label("rating_count"),
+            func.sum(MovieRating.rating).label("rating_sum"),
+            *(
+                func.count().filter(MovieRating.rating == rating).label(rating_histogram_column(rating))
+                for rating in RATING_VALUES
+            ),
+        )
+        .where(
+            MovieRating.movie_id.in_(movie_ids),
+            MovieRating.active(),
+            MovieRating.rating.is_not(None),
+        )
+        .group_by(MovieRating.movie_id)
+        .subquery("rating_totals")
+    )
+
+    source = (
+        select(
+            Movie.id,
+            Movie.tmdb_id,
+            func.coalesce(log_totals.c.log_count, 0),
+            func.coalesce(log_totals.c.watcher_count, 0),
+            func.coalesce(rating_totals.c.rating_count, 0),
+            func.coalesce(rating_totals.c.rating_sum, 0),
+            *(func.coalesce(rating_totals.c[column], 0) for column in HISTOGRAM_COLUMNS),
+        )
+        .select_from(Movie)
+        .outerjoin(log_totals, log_totals.c.movie_id == Movie.id)
+        .outerjoin(rating_totals, rating_totals.c.movie_id == Movie.id)
+        .where(Movie.id.in_(movie_ids))
+    )
+
+    table = MovieCommunityStats.__table__
+    insert_statement = insert(MovieCommunityStats).from_select(["movie_id", "tmdb_id", *COUNTER_COLUMNS], source)
+    statement = insert_statement.on_conflict_do_update(
+        index_elements=[MovieCommunityStats.movie_id],
+        set_={
+            **{column: insert_statement.excluded[column] for column in COUNTER_COLUMNS},
+            "updated_at": func.now(),
+        },
+        where=or_(*(table.c[column].is_distinct_from(insert_statement.excluded[column]) for column in COUNTER_COLUMNS)),
+    ).returning(MovieCommunityStats.tmdb_id)
+
+    result = await session.execute(statement)
+    return list(result.scalars().all())
+
+
+class MovieStatsRepository(RepositoryBase):
+    """Read community counters and reconcile them against logs and ratings."""
+
+    async def find_movie_stats_by_tmdb_id(self, tmdb_id: int) -> MovieCommunityStats | None:
+        """Find the community counters for a TMDB movie."""
+
+        async with self._session_provider() as session:
+            statement = select(MovieCommunityStats).where(MovieCommunityStats.tmdb_id == tmdb_id)
+            result = await session.execute(statement)
+            return result.scalar_one_or_none()
+
+    async def reconcile_movie_stats(self, batch_size: int = 500) -> MovieStatsReconcileResult:
+        """Walk movies by ID in batches, committing each batch's repairs separately."""
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        movies_scanned = 0
+        corrected_tmdb_ids: list[int] = []
+        last_movie_id: UUID | None = None
+
+        while True:
+            async with self._session_provider() as session:
+                statement = select(Movie.id).order_by(Movie.id).limit(batch_size)
+                if last_movie_id is not None:
+                    statement = statement.where(Movie.id > last_movie_id)
+                movie_ids = list((await session.execute(statement)).scalars().all())
+                if not movie_ids:
+                    break
+
+                corrected_tmdb_ids.extend(await refresh_movie_community_stats(session, movie_ids))
+                await session.commit()
+
+            movies_scanned += len(movie_ids)
+            last_movie_id = movie_ids[-1]
+            if len(movie_ids) < batch_size:
+                break
+
+        return MovieStatsReconcileResult(
+            movies_scanned=movies_scanned,
+            rows_corrected=len(corrected_tmdb_ids),
+            corrected_tmdb_ids=corrected_tmdb_ids,
+        )
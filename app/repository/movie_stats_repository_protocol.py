@@ -0,0 +1,25 @@
+"""Protocol and result types for per-movie community counters."""
+
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from app.models.movie_community_stats_model import MovieCommunityStats
+
+
+@dataclass(frozen=True)
+class MovieStatsReconcileResult:
+    """Outcome of recomputing community counters from logs and ratings."""
+
+    movies_scanned: int
+    rows_corrected: int
+    corrected_tmdb_ids: list[int] = field(default_factory=list)
+
+
+class MovieStatsRepositoryProtocol(Protocol):
+    """Read and reconciliation operations for community movie counters."""
+
+    async def find_movie_stats_by_tmdb_id(self, tmdb_id: int) -> MovieCommunityStats | None:
+        """Return the counters for a movie, or ``None`` when nobody has logged or rated it."""
+
+    async def reconcile_movie_stats(self, batch_size: int = 500) -> MovieStatsReconcileResult:
+        """Recompute every movie's counters in batches and repair any drift."""
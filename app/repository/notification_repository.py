@@ -2,24 +2,116 @@
 
 from __future__ import annotations
 
-from typing import cast
+from datetime import timedelta
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import CursorResult, and_, func, or_, select, update
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    ColumnElement,
+    CursorResult,
+    Select,
+    Text,
+    and_,
+    delete,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    true,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy import cast as sql_cast
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import InstrumentedAttribute, aliased, contains_eager, selectinload
+from sqlalchemy.sql.elements import KeyedColumnElement
 
+from app.config.notification_config import (
+    NOTIFICATION_AGGREGATION_SAMPLE_SIZE,
+    NOTIFICATION_AGGREGATION_WINDOW_SECONDS,
+)
+from app.models.notification_actor_model import NotificationActor
+from app.models.notification_archive_model import NotificationArchive
 from app.models.notification_model import Notification
+from app.models.user_follow_model import UserFollow
+from app.models.user_model import User
 from app.repository.notification_repository_protocol import (
     MarkAllNotificationsReadResult,
+    MarkNotificationReadResult,
     NotificationCreateResult,
+    NotificationFanOutBatch,
     NotificationPage,
 )
 from app.repository.repository_base import RepositoryBase
-from app.schemas.notification_schemas import NotificationCreateData
+from app.schemas.notification_schemas import NotificationCreateData, NotificationFanOutData
 from app.types import TimestampUUIDCursor
 
+_ACTOR_LOADERS = (selectinload(Notification.actor), selectinload(Notification.sample_actors))
+
+
+def _notification_columns(entity: type[Notification] | type[NotificationArchive]) -> list[KeyedColumnElement[Any]]:
+    """Return ``entity``'s columns in ``notifications`` column order."""
+
+    return [entity.__table__.c[column.key] for column in Notification.__table__.c]
+
+
+def _page_query(
+    entity: type[Notification] | type[NotificationArchive],
+    recipient_id: UUID,
+    cursor: TimestampUUIDCursor | None,
+    limit: int,
+    *,
+    unread_only: bool = False,
+) -> Select[Any]:
+    """Select one newest-first page of a recipient's active rows from the hot or archive table.
+
+    Archive columns are selected under the ``notifications`` column names in
+    the same order, so both branches can be unioned and loaded as ``Notification``.
+    """
+
+    statement = select(*_notification_columns(entity)).where(
+        entity.recipient_id == recipient_id,
+        entity.deleted.is_(False),
+    )
+    if unread_only:
+        statement = statement.where(entity.read_at.is_(None))
+    if cursor is not None:
+        statement = statement.where(
+            or_(
+                entity.created_at < cursor.timestamp,
+                and_(entity.created_at == cursor.timestamp, entity.id < cursor.id),
+            )
+        )
+    return statement.order_by(entity.created_at.desc(), entity.id.desc()).limit(limit + 1)
+
+
+def _unread_criteria(recipient_id: UUID) -> tuple[ColumnElement[bool], ...]:
+    """Match a recipient's active unread rows, as covered by the partial unread index."""
+
+    return (
+        Notification.recipient_id == recipient_id,
+        Notification.active(),
+        Notification.read_at.is_(None),
+    )
+
+
+def _actor_summary_columns(user: type[User]) -> tuple[InstrumentedAttribute[Any], ...]:
+    """User columns a notification response needs, for ``load_only`` on joined actors."""
+
+    return (user.handle, user.first_name, user.last_name, user.deleted)
+
+
+def _edge_position(cursor: TimestampUUIDCursor) -> ColumnElement[Any]:
+    """Bind a fan-out cursor as a ``(created_at, follower_id)`` row value."""
+
+    return tuple_(literal(cursor.timestamp), literal(cursor.id, PGUUID(as_uuid=True)))
+
 
 class NotificationRepository(RepositoryBase):
     """Recipient-scoped notification persistence."""
@@ -32,7 +124,7 @@ class NotificationRepository(RepositoryBase):
     ) -> Notification | None:
         statement = (
             select(Notification)
-            .options(selectinload(Notification.actor))
+            .options(*_ACTOR_LOADERS)
             .where(Notification.id == notification_id, Notification.active())
         )
         if recipient_id is not None:
@@ -40,9 +132,34 @@ class NotificationRepository(RepositoryBase):
         result = await session.execute(statement)
         return result.scalar_one_or_none()
 
+    async def _find_archived(
+        self,
+        session: AsyncSession,
+        notification_id: UUID,
+        recipient_id: UUID,
+    ) -> Notification | None:
+        archived = aliased(
+            Notification,
+            select(*_notification_columns(NotificationArchive))
+            .where(
+                NotificationArchive.id == notification_id,
+                NotificationArchive.recipient_id == recipient_id,
+                NotificationArchive.active(),
+            )
+            .subquery(),
+            adapt_on_names=True,
+        )
+        result = await session.execute(
+            select(archived).options(selectinload(archived.actor), selectinload(archived.sample_actors))
+        )
+        return result.scalar_one_or_none()
+
     async def create_notification(self, data: NotificationCreateData) -> NotificationCreateResult:
         """Insert a notification once per active recipient/deduplication key."""
 
+        if data.aggregation_key is not None:
+            return await self._upsert_aggregate(data)
+
         async with self._session_provider() as session:
             # Timestamps come from PostgreSQL rather than the base entity's Python
             # default so seek pagination stays consistently ordered across API instances.
@@ -90,6 +207,174 @@ class NotificationRepository(RepositoryBase):
             await session.commit()
             return NotificationCreateResult(notification=notification, created=created)
 
+    async def _upsert_aggregate(self, data: NotificationCreateData) -> NotificationCreateResult:
+        """Insert an aggregate row or fold the event into the recipient's open one, and count its actor.
+
+        The stored key appends the PostgreSQL-clock window number to the
+        producer's key, so ``uq_notifications_open_aggregation_key`` admits one
+        unread aggregate per key and window. Reading the row frees the slot and
+        the next event starts a new aggregate. Actors are recorded in
+        ``notification_actors`` in the same transaction, and the count only
+        grows when an actor is new to the aggregate, so repeats such as
+        follow/unfollow/follow are counted once however many others acted since.
+        The upsert locks the aggregate row, so concurrent events for it take
+        turns.
+        """
+
+        window = sql_cast(
+            func.floor(func.extract("epoch", func.now()) / NOTIFICATION_AGGREGATION_WINDOW_SECONDS),
+            BigInteger,
+        )
+        actor_ids_type = ARRAY(PGUUID(as_uuid=True))
+        values = insert(Notification).values(
+            recipient_id=data.recipient_id,
+            actor_id=data.actor_id,
+            type=data.type.value,
+            title=data.title,
+            body=data.body,
+            aggregation_key=literal(f"{data.aggregation_key}:", Text) + sql_cast(window, Text),
+            actor_count=1,
+            sample_actor_ids=literal([data.actor_id], actor_ids_type),
+            created_at=func.now(),
+            updated_at=func.now(),
+        )
+        excluded_actor = values.excluded.actor_id
+        sample_actor_ids = func.array_prepend(
+            excluded_actor,
+            func.array_remove(Notification.sample_actor_ids, excluded_actor),
+            type_=actor_ids_type,
+        )
+        statement = values.on_conflict_do_update(
+            index_elements=[Notification.recipient_id, Notification.aggregation_key],
+            index_where=and_(
+                Notification.deleted.is_(False),
+                Notification.read_at.is_(None),
+                Notification.aggregation_key.is_not(None),
+            ),
+            set_={
+                "actor_id": excluded_actor,
+                "title": values.excluded.title,
+                "body": values.excluded.body,
+                "sample_actor_ids": sample_actor_ids[1:NOTIFICATION_AGGREGATION_SAMPLE_SIZE],
+                "updated_at": func.now(),
+            },
+        ).returning(Notification.id, literal_column("xmax = 0", Boolean))
+
+        async with self._session_provider() as session:
+            notification_id, inserted = (await session.execute(statement)).one()
+            new_actor = (
+                insert(NotificationActor)
+                .values(notification_id=notification_id, actor_id=data.actor_id)
+                .on_conflict_do_nothing()
+                .returning(NotificationActor.notification_id)
+            )
+            if inserted:
+                await session.execute(new_actor)
+            else:
+                new_actor_cte = new_actor.cte("new_actor")
+                await session.execute(
+                    update(Notification)
+                    .where(Notification.id.in_(select(new_actor_cte.c.notification_id)))
+                    # The upsert above already stamped updated_at.
+                    .values(actor_count=Notification.actor_count + 1, updated_at=Notification.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+            notification = await self._find_by_id(session, notification_id)
+            if notification is None:
+                raise RuntimeError("Notification aggregate could not be reloaded")
+
+            await session.commit()
+            return NotificationCreateResult(notification=notification, created=inserted, aggregated=not inserted)
+
+    async def create_follower_notifications_batch(
+        self,
+        data: NotificationFanOutData,
+        *,
+        after: TimestampUUIDCursor | None,
+        limit: int,
+    ) -> NotificationFanOutBatch:
+        """Insert one notification per follower in the next keyset batch with a single ``INSERT ... SELECT``.
+
+        The batch is the next ``limit`` follow edges of the actor ordered by
+        ``(created_at, follower_id)``, read from ``ix_user_follows_followed_chronology``.
+        ``after`` carries the last edge of the previous batch (``timestamp`` is the
+        follow time and ``id`` the follower). Followers that already hold an active
+        row for the deduplication key are skipped by the partial unique index.
+        """
+
+        edge_key = tuple_(UserFollow.created_at, UserFollow.follower_id)
+        edge_criteria = [UserFollow.followed_id == data.actor_id]
+        if after is not None:
+            edge_criteria.append(edge_key > _edge_position(after))
+
+        async with self._session_provider() as session:
+            boundary = (
+                await session.execute(
+                    select(UserFollow.created_at, UserFollow.follower_id)
+                    .where(*edge_criteria)
+                    .order_by(UserFollow.created_at, UserFollow.follower_id)
+                    .offset(limit - 1)
+                    .limit(1)
+                )
+            ).one_or_none()
+            next_cursor = None
+            if boundary is not None:
+                next_cursor = TimestampUUIDCursor(timestamp=boundary.created_at, id=boundary.follower_id)
+                edge_criteria.append(edge_key <= _edge_position(next_cursor))
+
+            recipients = (
+                select(
+                    UserFollow.follower_id,
+                    literal(data.actor_id, PGUUID(as_uuid=True)),
+                    literal(data.type.value, Text),
+                    literal(data.title, Text),
+                    literal(data.body, Text),
+                    literal(data.deduplication_key, Text),
+                    func.now(),
+                    func.now(),
+                )
+                .join(User, User.id == UserFollow.follower_id)
+                .where(*edge_criteria, User.active())
+            )
+            statement = (
+                insert(Notification)
+                .from_select(
+                    [
+                        "recipient_id",
+                        "actor_id",
+                        "type",
+                        "title",
+                        "body",
+                        "deduplication_key",
+                        "created_at",
+                        "updated_at",
+                    ],
+                    recipients,
+                )
+                .on_conflict_do_nothing(
+                    index_elements=[Notification.recipient_id, Notification.deduplication_key],
+                    index_where=and_(
+                        Notification.deleted.is_(False),
+                        Notification.deduplication_key.is_not(None),
+                    ),
+                )
+                .returning(Notification.id)
+            )
+            inserted_ids = list((await session.execute(statement)).scalars().all())
+
+            notifications: list[Notification] = []
+            if inserted_ids:
+                result = await session.execute(
+                    select(Notification)
+                    .options(*_ACTOR_LOADERS)
+                    .where(Notification.id.in_(inserted_ids))
+                    .order_by(Notification.recipient_id)
+                )
+                notifications = list(result.scalars().all())
+
+            await session.commit()
+            return NotificationFanOutBatch(notifications=notifications, next_cursor=next_cursor)
+
     async def list_notifications(
         self,
         recipient_id: UUID,
@@ -97,56 +382,105 @@ class NotificationRepository(RepositoryBase):
         unread_only: bool,
         limit: int,
         cursor: TimestampUUIDCursor | None,
+        count_unread: bool = False,
+    ) -> NotificationPage:
+        """List active notifications newest first with stable seek pagination in one statement.
+
+        Actors and sample actors are joined in with only their summary columns
+        rather than loaded by follow-up queries. With ``count_unread`` the
+        recipient's unread count is computed by the same statement.
+        """
+
+        hot = _page_query(Notification, recipient_id, cursor, limit, unread_only=unread_only)
+        if unread_only:
+            # Only read rows are ever archived, so the unread view stays on the hot table.
+            pages = hot.subquery()
+        else:
+            # Each branch seeks its own chronology index with the same cursor and
+            # limit, so the archive adds one bounded index scan however large it is.
+            pages = union_all(hot, _page_query(NotificationArchive, recipient_id, cursor, limit)).subquery()
+        # Trim to the page before joining users, so the sample-actor join fans
+        # out at most ``limit + 1`` rows and LIMIT never splits a notification.
+        rows = select(*pages.c).order_by(pages.c.created_at.desc(), pages.c.id.desc()).limit(limit + 1).subquery()
+        page = aliased(Notification, rows)
+        actor = aliased(User)
+        sample_actor = aliased(User)
+
+        statement = select(page)
+        if count_unread:
+            # Driving the page from the one-row count keeps the count when the page is empty.
+            unread = select(func.count().label("unread_count")).where(*_unread_criteria(recipient_id)).subquery()
+            statement = select(unread.c.unread_count, page).select_from(unread).outerjoin(rows, true())
+        statement = (
+            statement.outerjoin(page.actor.of_type(actor))
+            .outerjoin(page.sample_actors.of_type(sample_actor))
+            .options(
+                contains_eager(page.actor.of_type(actor)).load_only(*_actor_summary_columns(actor)),
+                contains_eager(page.sample_actors.of_type(sample_actor)).load_only(
+                    *_actor_summary_columns(sample_actor)
+                ),
+            )
+            .order_by(page.created_at.desc(), page.id.desc())
+        )
+
+        async with self._session_provider() as session:
+            result = (await session.execute(statement)).unique()
+            if count_unread:
+                fetched_rows = result.all()
+                unread_count = fetched_rows[0].unread_count
+                fetched = [row[1] for row in fetched_rows if row[1] is not None]
+            else:
+                unread_count = None
+                fetched = list(result.scalars().all())
+            return NotificationPage(items=fetched[:limit], has_more=len(fetched) > limit, unread_count=unread_count)
+
+    async def list_notifications_after(
+        self,
+        recipient_id: UUID,
+        *,
+        cursor: TimestampUUIDCursor,
+        limit: int,
     ) -> NotificationPage:
-        """List active notifications newest first with stable seek pagination."""
+        """List active notifications newer than ``cursor`` in ascending seek order."""
 
         async with self._session_provider() as session:
             statement = (
                 select(Notification)
-                .options(selectinload(Notification.actor))
-                .where(Notification.recipient_id == recipient_id, Notification.active())
-            )
-            if unread_only:
-                statement = statement.where(Notification.read_at.is_(None))
-            if cursor is not None:
-                statement = statement.where(
+                .options(*_ACTOR_LOADERS)
+                .where(
+                    Notification.recipient_id == recipient_id,
+                    Notification.active(),
                     or_(
-                        Notification.created_at < cursor.timestamp,
+                        Notification.created_at > cursor.timestamp,
                         and_(
                             Notification.created_at == cursor.timestamp,
-                            Notification.id < cursor.id,
+                            Notification.id > cursor.id,
                         ),
-                    )
+                    ),
                 )
-
-            result = await session.execute(
-                statement.order_by(Notification.created_at.desc(), Notification.id.desc()).limit(limit + 1)
+                .order_by(Notification.created_at.asc(), Notification.id.asc())
+                .limit(limit + 1)
             )
+            result = await session.execute(statement)
             fetched = list(result.scalars().all())
-            items = fetched[:limit]
+            return NotificationPage(items=fetched[:limit], has_more=len(fetched) > limit)
 
-            unread_result = await session.execute(
-                select(func.count(Notification.id)).where(
-                    Notification.recipient_id == recipient_id,
-                    Notification.active(),
-                    Notification.read_at.is_(None),
-                )
-            )
-            return NotificationPage(
-                items=items,
-                has_more=len(fetched) > limit,
-                unread_count=unread_result.scalar_one(),
-            )
+    async def count_unread_notifications(self, recipient_id: UUID) -> int:
+        """Count active unread rows using the partial unread index."""
+
+        async with self._session_provider() as session:
+            result = await session.execute(select(func.count(Notification.id)).where(*_unread_criteria(recipient_id)))
+            return result.scalar_one()
 
     async def mark_notification_read(
         self,
         notification_id: UUID,
         recipient_id: UUID,
-    ) -> Notification | None:
+    ) -> MarkNotificationReadResult:
         """Set the database-owned read timestamp once for an owned active row."""
 
         async with self._session_provider() as session:
-            await session.execute(
+            update_result = await session.execute(
                 update(Notification)
                 .where(
                     Notification.id == notification_id,
@@ -157,12 +491,15 @@ class NotificationRepository(RepositoryBase):
                 .values(read_at=func.now(), updated_at=func.now())
                 .execution_options(synchronize_session=False)
             )
+            cursor_result = cast("CursorResult[tuple[object, ...]]", update_result)
             notification = await self._find_by_id(session, notification_id, recipient_id)
+            if notification is None:
+                notification = await self._find_archived(session, notification_id, recipient_id)
             await session.commit()
-            return notification
+            return MarkNotificationReadResult(notification=notification, updated=cursor_result.rowcount > 0)
 
     async def mark_all_notifications_read(self, recipient_id: UUID) -> MarkAllNotificationsReadResult:
-        """Mark active unread rows with one transaction timestamp and recount."""
+        """Mark active unread rows with one transaction timestamp."""
 
         async with self._session_provider() as session:
             update_result = await session.execute(
@@ -176,16 +513,57 @@ class NotificationRepository(RepositoryBase):
                 .execution_options(synchronize_session=False)
             )
             cursor_result = cast("CursorResult[tuple[object, ...]]", update_result)
-            unread_result = await session.execute(
-                select(func.count(Notification.id)).where(
-                    Notification.recipient_id == recipient_id,
-                    Notification.active(),
-                    Notification.read_at.is_(None),
-                )
+            result = MarkAllNotificationsReadResult(updated_count=cursor_result.rowcount)
+            await session.commit()
+            return result
+
+    async def archive_read_notifications(self, *, older_than: timedelta, limit: int) -> int:
+        """Move up to ``limit`` of the oldest read rows past ``older_than`` into the archive.
+
+        Delete and insert run as one statement, so a row is never in both
+        tables or neither. Rows locked by a concurrent write are skipped and
+        picked up by a later batch.
+        """
+
+        candidates = (
+            select(Notification.id)
+            .where(
+                Notification.active(),
+                Notification.read_at.is_not(None),
+                Notification.created_at < func.now() - older_than,
             )
-            result = MarkAllNotificationsReadResult(
-                updated_count=cursor_result.rowcount,
-                unread_count=unread_result.scalar_one(),
+            .order_by(Notification.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        moved = (
+            delete(Notification)
+            .where(Notification.id.in_(candidates.scalar_subquery()))
+            .returning(*Notification.__table__.c)
+            .cte("moved")
+        )
+        column_names = [column.key for column in Notification.__table__.c]
+        statement = (
+            insert(NotificationArchive)
+            .from_select(column_names, select(*(moved.c[name] for name in column_names)))
+            .add_cte(moved)
+        )
+
+        async with self._session_provider() as session:
+            result = cast("CursorResult[tuple[object, ...]]", await session.execute(statement))
+            await session.commit()
+            return result.rowcount
+
+    async def purge_deleted_notifications(self, *, limit: int) -> int:
+        """Hard-delete up to ``limit`` soft-deleted rows from the hot table."""
+
+        candidates = (
+            select(Notification.id).where(Notification.deleted.is_(True)).limit(limit).with_for_update(skip_locked=True)
+        )
+        async with self._session_provider() as session:
+            result = cast(
+                "CursorResult[tuple[object, ...]]",
+                await session.execute(delete(Notification).where(Notification.id.in_(candidates.scalar_subquery()))),
             )
             await session.commit()
-            return result
+            return result.rowcount
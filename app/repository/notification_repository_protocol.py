@@ -2,29 +2,46 @@
 
 from collections.abc import Sequence
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import Protocol
 from uuid import UUID
 
 from app.models.notification_model import Notification
-from app.schemas.notification_schemas import NotificationCreateData
+from app.schemas.notification_schemas import NotificationCreateData, NotificationFanOutData
 from app.types import TimestampUUIDCursor
 
 
 @dataclass(frozen=True)
 class NotificationCreateResult:
-    """Idempotent notification creation result."""
+    """Idempotent notification creation result.
+
+    ``aggregated`` is true when an open aggregate row absorbed the event
+    instead of a new row being inserted.
+    """
 
     notification: Notification
     created: bool
+    aggregated: bool = False
 
 
 @dataclass(frozen=True)
 class NotificationPage:
-    """Repository page plus recipient-wide unread metadata."""
+    """One seek-paginated slice of a recipient's inbox.
+
+    ``unread_count`` is only set when the listing was asked to count unread rows.
+    """
 
     items: Sequence[Notification]
     has_more: bool
-    unread_count: int
+    unread_count: int | None = None
+
+
+@dataclass(frozen=True)
+class MarkNotificationReadResult:
+    """Single read-state persistence result."""
+
+    notification: Notification | None
+    updated: bool
 
 
 @dataclass(frozen=True)
@@ -32,14 +49,46 @@ class MarkAllNotificationsReadResult:
     """Bulk read-state persistence result."""
 
     updated_count: int
-    unread_count: int
+
+
+@dataclass(frozen=True)
+class NotificationFanOutBatch:
+    """Notifications inserted for one keyset batch of followers."""
+
+    notifications: Sequence[Notification]
+    next_cursor: TimestampUUIDCursor | None
+
+
+@dataclass(frozen=True)
+class NotificationFanOutResult:
+    """Outcome of fanning one notification out to every follower."""
+
+    batches: int
+    created_count: int
+
+
+@dataclass(frozen=True)
+class NotificationRetentionResult:
+    """Rows moved to the archive and soft-deleted rows purged by one retention run."""
+
+    archived_count: int
+    purged_count: int
 
 
 class NotificationRepositoryProtocol(Protocol):
     """Notification repository operations used by services and future producers."""
 
     async def create_notification(self, data: NotificationCreateData) -> NotificationCreateResult:
-        """Create once per active recipient/event key, returning an existing duplicate."""
+        """Create once per active recipient/event key, or fold the event into an open aggregate."""
+
+    async def create_follower_notifications_batch(
+        self,
+        data: NotificationFanOutData,
+        *,
+        after: TimestampUUIDCursor | None,
+        limit: int,
+    ) -> NotificationFanOutBatch:
+        """Notify the next ``limit`` followers of the actor, skipping ones that already have the key."""
 
     async def list_notifications(
         self,
@@ -48,15 +97,34 @@ class NotificationRepositoryProtocol(Protocol):
         unread_only: bool,
         limit: int,
         cursor: TimestampUUIDCursor | None,
+        count_unread: bool = False,
     ) -> NotificationPage:
-        """List a stable active page and count all recipient unread rows."""
+        """List a stable active page, including archived rows, optionally counting unread rows in the same query."""
+
+    async def list_notifications_after(
+        self,
+        recipient_id: UUID,
+        *,
+        cursor: TimestampUUIDCursor,
+        limit: int,
+    ) -> NotificationPage:
+        """List active notifications newer than ``cursor``, oldest first, for stream replay."""
+
+    async def count_unread_notifications(self, recipient_id: UUID) -> int:
+        """Count every active unread notification for the recipient."""
 
     async def mark_notification_read(
         self,
         notification_id: UUID,
         recipient_id: UUID,
-    ) -> Notification | None:
-        """Idempotently mark one owned active notification read."""
+    ) -> MarkNotificationReadResult:
+        """Idempotently mark one owned active notification read, reporting whether it transitioned."""
 
     async def mark_all_notifications_read(self, recipient_id: UUID) -> MarkAllNotificationsReadResult:
         """Mark all currently active unread recipient notifications read."""
+
+    async def archive_read_notifications(self, *, older_than: timedelta, limit: int) -> int:
+        """Move one batch of old read rows to the archive and return how many moved."""
+
+    async def purge_deleted_notifications(self, *, limit: int) -> int:
+        """Hard-delete one batch of soft-deleted rows and return how many were removed."""
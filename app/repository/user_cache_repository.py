@@ -0,0 +1,186 @@
+import logging
+import os
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from app.models.user_model import User
+from app.repository.user_repository import UserRepository
+from app.repository.user_repository_protocol import UserRepositoryProtocol
+from app.schemas.cache_schemas import CachedUser
+from app.schemas.user_schemas import UserCreateRequest
+from app.services.cache_service import CacheService
+from app.services.session_service import SessionService
+from app.services.user_existence_filter import UserExistenceFilter
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "3600"))
+
+
+class UserCacheRepository:
+    """Redis-backed decorator for user lookups by ID and handle.
+
+    Email and handle lookups first ask the user existence filter, so names that
+    were never registered are answered without querying PostgreSQL.
+
+    Password changes and account deletions also revoke every session of the
+    user, so other devices are signed out.
+    """
+
+    def __init__(
+        self,
+        repository: UserRepositoryProtocol | None = None,
+        session_service: SessionService | None = None,
+        existence_filter: UserExistenceFilter | None = None,
+    ):
+        self.repository = repository or UserRepository()
+        self.session_service = session_service or SessionService()
+        self.existence_filter = existence_filter or UserExistenceFilter()
+
+    @property
+    def _cache(self) -> CacheService:
+        return CacheService.get_instance()
+
+    def build_user_id_key(self, user_id: UUID) -> str:
+        return f"cinelog:users:id:{user_id}"
+
+    def build_user_handle_key(self, handle: str) -> str:
+        return f"cinelog:users:handle:{handle.lower()}"
+
+    def _serialize_user(self, user: User) -> dict[str, Any]:
+        return CachedUser.model_validate(user).model_dump(mode="json")
+
+    def _deserialize_user(self, data: dict[str, Any]) -> User:
+        # Detached instance for read-only use; never attach it to a session.
+        return User(**CachedUser.model_validate(data).model_dump())
+
+    async def _get_user(self, key: str) -> User | None:
+        try:
+            data = await self._cache.get(key)
+            if data is None:
+                logger.debug("User cache miss for key=%s", key)
+                return None
+            if not isinstance(data, dict):
+                logger.warning("Invalid user cache payload for key=%s", key)
+                return None
+            logger.debug("User cache hit for key=%s", key)
+            return self._deserialize_user(data)
+        except Exception:
+            logger.exception("User cache read failed for key=%s", key)
+            return None
+
+    async def _set_user(self, key: str, user: User) -> None:
+        try:
+            await self._cache.set(key, self._serialize_user(user), ttl=USER_CACHE_TTL)
+            logger.debug("User cache set for key=%s", key)
+        except Exception:
+            logger.exception("User cache write failed for key=%s", key)
+
+    async def _invalidate_user(self, user_id: UUID, handle: str | None) -> None:
+        keys = [self.build_user_id_key(user_id)]
+        if handle is not None:
+            keys.append(self.build_user_handle_key(handle))
+        try:
+            await self._cache.delete_many(keys)
+            logger.debug("User cache invalidated for user_id=%s", user_id)
+        except Exception:
+            logger.exception("User cache invalidation failed for user_id=%s", user_id)
+
+    async def create_user(self, request: UserCreateRequest) -> User:
+        # Misses are never cached, so a new user needs no invalidation. The
+        # existence filter learns the user before the insert: a failed insert
+        # then leaves a false positive rather than a user the filter denies.
+        await self.existence_filter.add(request.email, request.handle)
+        return await self.repository.create_user(request)
+
+    async def find_user_by_email(self, email: str) -> User | None:
+        if not await self.existence_filter.might_contain_email(email):
+            return None
+        return await self.repository.find_user_by_email(email)
+
+    async def find_user_by_handle(self, handle: str) -> User | None:
+        key = self.build_user_handle_key(handle)
+        cached = await self._get_user(key)
+        if cached is not None:
+            return cached
+        if not await self.existence_filter.might_contain_handle(handle):
+            return None
+
+        user = await self.repository.find_user_by_handle(handle)
+        if user is not None:
+            await self._set_user(key, user)
+        return user
+
+    async def find_user_by_email_or_handle(self, email_or_handle: str) -> User | None:
+        return await self.repository.find_user_by_email_or_handle(email_or_handle)
+
+    async def find_user_by_id(self, user_id: UUID) -> User | None:
+        key = self.build_user_id_key(user_id)
+        cached = await self._get_user(key)
+        if cached is not None:
+            return cached
+
+        user = await self.repository.find_user_by_id(user_id)
+        if user is not None:
+            await self._set_user(key, user)
+        return user
+
+    async def find_users_by_ids_or_handles(self, user_ids: Sequence[UUID], handles: Sequence[str]) -> Sequence[User]:
+        return await self.repository.find_users_by_ids_or_handles(user_ids, handles)
+
+    async def delete_user(self, user_id: UUID) -> bool:
+        # Read the handle from PostgreSQL first: the cached entry may already have expired.
+        user = await self.repository.find_user_by_id(user_id)
+        deleted = await self.repository.delete_user(user_id)
+        if deleted:
+            await self._invalidate_user(user_id, user.handle if user is not None else None)
+            await self.session_service.revoke_all_sessions(user_id)
+        return deleted
+
+    async def delete_user_oblivion(self, user_id: UUID) -> bool:
+        # Oblivion rewrites the handle, so the original one must be captured before the update.
+        # A Bloom filter cannot forget the old email and handle; the next filter rebuild drops them.
+        user = await self.repository.find_user_by_id(user_id)
+        deleted = await self.repository.delete_user_oblivion(user_id)
+        if deleted:
+            await self._invalidate_user(user_id, user.handle if user is not None else None)
+            await self.session_service.revoke_all_sessions(user_id)
+        return deleted
+
+    async def find_password_hash(self, user_id: UUID) -> str | None:
+        # Cached users carry no password hash, so credential checks always read PostgreSQL.
+        return await self.repository.find_password_hash(user_id)
+
+    async def update_password(self, user: User, new_password_hash: str) -> User:
+        updated_user = await self.repository.update_password(user, new_password_hash)
+        await self._invalidate_user(updated_user.id, updated_user.handle)
+        # Unlike cache invalidation this is not fail-open: a caller must not
+        # report success while stolen sessions stay signed in.
+        await self.session_service.revoke_all_sessions(updated_user.id)
+        return updated_user
+
+    async def rehash_password(self, user: User, current_password_hash: str, new_password_hash: str) -> bool:
+        rehashed = await self.repository.rehash_password(user, current_password_hash, new_password_hash)
+        if rehashed:
+            await self._invalidate_user(user.id, user.handle)
+        return rehashed
+
+    async def set_reset_password_code(self, user: User, code: str, expires_at: datetime) -> User:
+        return await self.repository.set_reset_password_code(user, code, expires_at)
+
+    async def clear_reset_password_code(self, user: User) -> User:
+        return await self.repository.clear_reset_password_code(user)
+
+    async def update_user_profile(self, user_id: UUID, update_data: dict[str, Any]) -> User | None:
+        user = await self.repository.update_user_profile(user_id, update_data)
+        if user is not None:
+            await self._invalidate_user(user.id, user.handle)
+        return user
+
+    async def update_user_locale(self, user_id: UUID, locale: str) -> User | None:
+        user = await self.repository.update_user_locale(user_id, locale)
+        if user is not None:
+            await self._invalidate_user(user.id, user.handle)
+        return user
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Sequence
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import CursorResult, func, or_, select, update
 
 from app.models.user_model import User
+from app.repository.follow_repository import record_user_deactivated
 from app.repository.repository_base import RepositoryBase
 from app.schemas.user_schemas import UserCreateRequest
 from app.types import DEFAULT_LOCALE
@@ -97,6 +99,33 @@ class UserRepository(RepositoryBase):
             result = await session.execute(statement)
             return result.scalar_one_or_none()
 
+    async def find_users_by_ids_or_handles(self, user_ids: Sequence[UUID], handles: Sequence[str]) -> Sequence[User]:
+        """Find active users matching any of the UUIDs or case-insensitive handles in one query."""
+
+        if not user_ids and not handles:
+            return []
+
+        async with self._session_provider() as session:
+            statement = select(User).where(
+                or_(
+                    User.id.in_(user_ids),
+                    func.lower(User.handle).in_([handle.lower() for handle in handles]),
+                ),
+                User.active(),
+            )
+            result = await session.execute(statement)
+            return result.scalars().all()
+
+    async def stream_active_identifiers(self, *, batch_size: int) -> AsyncIterator[Sequence[tuple[str, str]]]:
+        """Yield the ``(email, handle)`` pairs of active users in batches of up to ``batch_size``."""
+
+        async with self._session_provider() as session:
+            rows = await session.stream(
+                select(User.email, User.handle).where(User.active()).execution_options(yield_per=batch_size)
+            )
+            async for partition in rows.partitions():
+                yield [row._tuple() for row in partition]
+
     async def delete_user(self, user_id: UUID) -> bool:
         """Soft-delete an active user by UUID."""
 
@@ -113,6 +142,7 @@ class UserRepository(RepositoryBase):
             user.deleted = True
             user.deleted_at = datetime.now(UTC)
             user.updated_at = datetime.now(UTC)
+            await record_user_deactivated(session, user_id)
             await session.commit()
             return True
 
@@ -142,9 +172,21 @@ class UserRepository(RepositoryBase):
             user.deleted = True
             user.deleted_at = datetime.now(UTC)
             user.updated_at = datetime.now(UTC)
+            await record_user_deactivated(session, user_id)
             await session.commit()
             return True
 
+    async def find_password_hash(self, user_id: UUID) -> str | None:
+        """Read the password hash of an active user by UUID."""
+
+        async with self._session_provider() as session:
+            statement = select(User.password_hash).where(
+                User.id == user_id,
+                User.active(),
+            )
+            result = await session.execute(statement)
+            return result.scalar_one_or_none()
+
     async def update_password(self, user: User, password_hash: str) -> User:
         """Update password hash for the active user row."""
 
@@ -159,6 +201,24 @@ class UserRepository(RepositoryBase):
             await session.refresh(persisted_user)
             return persisted_user
 
+    async def rehash_password(self, user: User, current_password_hash: str, new_password_hash: str) -> bool:
+        """Swap in an upgraded hash unless the password changed since the current hash was verified."""
+
+        async with self._session_provider() as session:
+            statement = (
+                update(User)
+                .where(
+                    User.id == user.id,
+                    User.password_hash == current_password_hash,
+                    User.active(),
+                )
+                # A cost upgrade is not an account change, so keep updated_at as it was.
+                .values(password_hash=new_password_hash, updated_at=User.updated_at)
+            )
+            result = cast(CursorResult, await session.execute(statement))
+            await session.commit()
+            return result.rowcount == 1
+
     async def set_reset_password_code(
         self,
         user: User,
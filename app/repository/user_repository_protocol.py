@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any, Protocol, TypeVar
 
@@ -25,15 +26,26 @@ class UserRepositoryProtocol(Protocol[IdType, UserType]):
     async def find_user_by_id(self, user_id: IdType) -> UserType | None:
         """Find a user by ID."""
 
+    async def find_users_by_ids_or_handles(
+        self, user_ids: Sequence[IdType], handles: Sequence[str]
+    ) -> Sequence[UserType]:
+        """Find active users matching any of the IDs or handles."""
+
     async def delete_user(self, user_id: IdType) -> bool:
         """Delete a user logically by ID."""
 
     async def delete_user_oblivion(self, user_id: IdType) -> bool:
         """Obscure all the user information and delete the user logically."""
 
+    async def find_password_hash(self, user_id: IdType) -> str | None:
+        """Read an active user's password hash, never from a cache."""
+
     async def update_password(self, user: UserType, new_password_hash: str) -> UserType:
         """Update a user's password hash."""
 
+    async def rehash_password(self, user: UserType, current_password_hash: str, new_password_hash: str) -> bool:
+        """Replace a user's password hash only if it still equals the current one."""
+
     async def set_reset_password_code(self, user: UserType, code: str, expires_at: datetime) -> UserType:
         """Set reset password code and expiration for a user."""
 
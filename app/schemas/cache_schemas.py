@@ -1,10 +1,12 @@
 """Pydantic models for Redis cache payloads."""
 
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
 
+from app.schemas.movie_schemas import MovieFriendsResponse
+
 
 class CachedLog(BaseModel):
     """JSON-serializable mirror of ``Log`` columns for Redis payloads."""
@@ -23,3 +25,35 @@ class CachedLog(BaseModel):
     deleted_at: datetime | None
     created_at: datetime
     updated_at: datetime
+
+
+class CachedUser(BaseModel):
+    """JSON-serializable mirror of ``User`` columns for Redis payloads.
+
+    The password hash and password-reset metadata are deliberately omitted so
+    credential material never leaves PostgreSQL.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    email: str
+    handle: str
+    first_name: str
+    last_name: str
+    bio: str | None
+    profile_visibility: str
+    locale: str
+    date_of_birth: date | None
+    deleted: bool
+    deleted_at: datetime | None
+    created_at: datetime
+    updated_at: datetime
+
+
+class CachedMovieFriends(BaseModel):
+    """A cached friends-activity response and the invalidation versions it was read under."""
+
+    movie_version: str | None
+    user_version: str | None
+    response: MovieFriendsResponse
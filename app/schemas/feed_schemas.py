@@ -0,0 +1,40 @@
+from datetime import date, datetime
+from uuid import UUID
+
+from pydantic import ConfigDict, Field
+
+from app.schemas.base_schemas import BaseSchema
+from app.schemas.movie_schemas import MovieResponse
+from app.schemas.notification_schemas import MAX_CURSOR_LENGTH
+
+
+class FeedRequest(BaseSchema):
+    """Validated home feed query parameters."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    limit: int = Field(default=20, ge=1, le=100, description="Maximum number of logs to return")
+    cursor: str | None = Field(default=None, max_length=MAX_CURSOR_LENGTH, description="Opaque next-page cursor")
+
+
+class FeedAuthor(BaseSchema):
+    handle: str = Field(..., description="Author's unique handle")
+    first_name: str = Field(..., description="Author's first name")
+    last_name: str = Field(..., description="Author's last name")
+
+
+class FeedItem(BaseSchema):
+    id: UUID = Field(..., description="Unique identifier of the log entry")
+    author: FeedAuthor = Field(..., description="User who logged the movie")
+    movie: MovieResponse = Field(..., description="Details of the movie")
+    tmdb_id: int = Field(..., description="TMDB ID of the movie")
+    date_watched: date = Field(..., description="Date when the movie was watched")
+    viewing_notes: str | None = Field(None, description="Optional notes about this viewing")
+    poster_path: str | None = Field(None, description="Path to the movie poster image")
+    watched_where: str | None = Field(None, description="Where the movie was watched")
+    created_at: datetime = Field(..., description="When the log was created")
+
+
+class FeedResponse(BaseSchema):
+    items: list[FeedItem] = Field(..., description="Logs by followed users, newest first")
+    next_cursor: str | None = Field(None, description="Cursor for the next page, or null on the last page")
@@ -4,6 +4,8 @@ from uuid import UUID
 from pydantic import Field
 
 from app.schemas.base_schemas import BaseSchema
+from app.schemas.tmdb_schemas import TMDBMovieDetails
+from app.types import TrendingWindow
 
 
 class MovieCreateRequest(BaseSchema):
@@ -27,3 +29,51 @@ class MovieResponse(BaseSchema):
     original_language: str | None = Field(None, description="Original language code")
     created_at: datetime | None = Field(None, description="Creation date of the movie")
     updated_at: datetime | None = Field(None, description="Last update date of the movie")
+
+
+class MovieStats(BaseSchema):
+    log_count: int = Field(default=0, ge=0, description="Number of viewing logs recorded for the movie")
+    watcher_count: int = Field(default=0, ge=0, description="Number of distinct users who logged the movie")
+    rating_count: int = Field(default=0, ge=0, description="Number of users who rated the movie")
+    rating_average: float | None = Field(default=None, description="Average community rating from 1 to 10")
+    rating_histogram: list[int] = Field(
+        default_factory=lambda: [0] * 10,
+        min_length=10,
+        max_length=10,
+        description="Rating counts ordered from rating 1 to rating 10",
+    )
+
+
+class MovieDetailsResponse(TMDBMovieDetails):
+    community_stats: MovieStats = Field(..., description="Cinelog community watch and rating aggregates for the movie")
+
+
+class TrendingMovieItem(BaseSchema):
+    tmdb_id: int = Field(..., description="TMDB ID of the movie")
+    log_count: int = Field(..., ge=0, description="Viewing logs created for the movie within the window")
+    movie: MovieResponse = Field(..., description="Movie details from the Cinelog catalogue")
+
+
+class TrendingMoviesResponse(BaseSchema):
+    window: TrendingWindow = Field(..., description="Sliding window the counts cover")
+    movies: list[TrendingMovieItem] = Field(..., description="Most-logged movies, highest count first")
+
+
+MAX_MOVIE_FRIENDS = 50
+
+
+class MovieFriend(BaseSchema):
+    handle: str = Field(..., description="Followed user's unique handle")
+    first_name: str = Field(..., description="Followed user's first name")
+    last_name: str = Field(..., description="Followed user's last name")
+    last_watched_at: datetime | None = Field(None, description="Most recent watch date among their logs of the movie")
+    log_count: int = Field(..., ge=0, description="Number of times they logged the movie")
+    rating: int | None = Field(None, description="Their rating from 1 to 10, if they rated the movie")
+
+
+class MovieFriendsResponse(BaseSchema):
+    friends: list[MovieFriend] = Field(
+        ...,
+        description=f"Up to {MAX_MOVIE_FRIENDS} followed users who logged or rated the movie, latest watch first",
+    )
+    total_count: int = Field(..., ge=0, description="Number of followed users who logged or rated the movie")
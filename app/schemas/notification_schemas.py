@@ -1,9 +1,10 @@
 """Notification request, response, and internal persistence schemas."""
 
 from datetime import datetime
+from typing import Self
 from uuid import UUID
 
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, model_validator
 
 from app.schemas.base_schemas import BaseSchema
 from app.types import NotificationAction, NotificationType
@@ -33,6 +34,8 @@ class NotificationBaseResponse(StrictNotificationSchema):
     title: str
     body: str
     actor: BasicUserSummary | None
+    actor_count: int
+    sample_actors: list[BasicUserSummary]
     available_actions: list[NotificationAction]
     read_at: datetime | None
     created_at: datetime
@@ -53,6 +56,12 @@ class MarkAllNotificationsReadResponse(StrictNotificationSchema):
     unread_count: int
 
 
+class NotificationUnreadCountResponse(StrictNotificationSchema):
+    """Recipient-wide unread badge count."""
+
+    unread_count: int
+
+
 class NotificationListRequest(StrictNotificationSchema):
     """Validated notification list query parameters."""
 
@@ -61,8 +70,27 @@ class NotificationListRequest(StrictNotificationSchema):
     cursor: str | None = Field(default=None, max_length=MAX_CURSOR_LENGTH)
 
 
+class NotificationFanOutData(StrictNotificationSchema):
+    """Internal typed input for one notification per active follower of the actor.
+
+    The deduplication key is required so a retried or resumed fan-out never
+    notifies the same follower twice.
+    """
+
+    actor_id: UUID
+    type: NotificationType
+    title: str
+    body: str
+    deduplication_key: str = Field(min_length=1)
+
+
 class NotificationCreateData(StrictNotificationSchema):
-    """Internal typed input for notification persistence."""
+    """Internal typed input for notification persistence.
+
+    An ``aggregation_key`` folds events that share it into one unread row per
+    time window instead of inserting one row each; it needs an actor and cannot
+    be combined with a deduplication key.
+    """
 
     recipient_id: UUID
     actor_id: UUID | None = None
@@ -70,3 +98,14 @@ class NotificationCreateData(StrictNotificationSchema):
     title: str
     body: str
     deduplication_key: str | None = None
+    aggregation_key: str | None = Field(default=None, min_length=1)
+
+    @model_validator(mode="after")
+    def validate_aggregation(self) -> Self:
+        if self.aggregation_key is None:
+            return self
+        if self.actor_id is None:
+            raise ValueError("aggregation_key requires actor_id")
+        if self.deduplication_key is not None:
+            raise ValueError("aggregation_key cannot be combined with deduplication_key")
+        return self
@@ -1,8 +1,11 @@
-from datetime import date
+from datetime import date, datetime
+from typing import Self
+from uuid import UUID
 
-from pydantic import EmailStr, Field
+from pydantic import ConfigDict, EmailStr, Field, model_validator
 
 from app.schemas.base_schemas import BaseSchema
+from app.schemas.notification_schemas import MAX_CURSOR_LENGTH
 from app.types import (
     BioStr,
     HandleStr,
@@ -88,6 +91,82 @@ class UserProfileResponse(BaseSchema):
     )
 
 
+class FollowListRequest(BaseSchema):
+    """Validated follower/following list query parameters."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    limit: int = Field(default=20, ge=1, le=100, description="Maximum number of users to return")
+    cursor: str | None = Field(default=None, max_length=MAX_CURSOR_LENGTH, description="Opaque next-page cursor")
+
+
+class FollowUserSummary(BaseSchema):
+    handle: str = Field(..., description="User's unique handle")
+    first_name: str = Field(..., description="User's first name")
+    last_name: str = Field(..., description="User's last name")
+    followed_at: datetime = Field(..., description="When the follow relationship was created")
+
+
+class FollowListResponse(BaseSchema):
+    items: list[FollowUserSummary] = Field(..., description="Users ordered by most recent follow first")
+    next_cursor: str | None = Field(None, description="Cursor for the next page, or null on the last page")
+
+
+MAX_RELATIONSHIP_LOOKUP = 100
+
+
+class RelationshipsRequest(BaseSchema):
+    """Users to resolve relationship state for, by ID, by handle, or both."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    user_ids: list[UUID] = Field(default_factory=list, description="User IDs to look up")
+    handles: list[HandleStr] = Field(default_factory=list, description="User handles to look up")
+
+    @model_validator(mode="after")
+    def validate_lookup_size(self) -> Self:
+        total = len(self.user_ids) + len(self.handles)
+        if total == 0:
+            raise ValueError("userIds or handles must not be empty")
+        if total > MAX_RELATIONSHIP_LOOKUP:
+            raise ValueError(f"At most {MAX_RELATIONSHIP_LOOKUP} users can be looked up at once")
+        return self
+
+
+class UserRelationship(BaseSchema):
+    user_id: UUID = Field(..., description="Resolved user's ID")
+    handle: str = Field(..., description="Resolved user's handle")
+    is_following: bool = Field(..., description="Whether the requester follows this user")
+
+
+class RelationshipsResponse(BaseSchema):
+    relationships: list[UserRelationship] = Field(
+        ..., description="One entry per active user found, in request order; unknown users are omitted"
+    )
+
+
+MAX_FOLLOW_SUGGESTIONS = 20
+
+
+class FollowSuggestionsRequest(BaseSchema):
+    """Validated follow suggestion query parameters."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    limit: int = Field(default=10, ge=1, le=MAX_FOLLOW_SUGGESTIONS, description="Maximum number of users to return")
+
+
+class FollowSuggestion(BaseSchema):
+    handle: str = Field(..., description="Suggested user's unique handle")
+    first_name: str = Field(..., description="Suggested user's first name")
+    last_name: str = Field(..., description="Suggested user's last name")
+    mutual_count: int = Field(..., ge=1, description="Number of users the requester follows who follow this user")
+
+
+class FollowSuggestionsResponse(BaseSchema):
+    suggestions: list[FollowSuggestion] = Field(..., description="Suggested users, best match first")
+
+
 class ChangePasswordRequest(BaseSchema):
     current_password: str = Field(..., min_length=8, max_length=128, description="Current password")
     new_password: str = Field(..., min_length=8, max_length=128, description="New password")
@@ -3,9 +3,6 @@ import os
 from hashlib import sha256
 from typing import cast
 
-from limits.limits import RateLimitItem
-from limits.strategies import RateLimiter
-
 from app.config.auth_rate_limit_config import (
     FORGOT_PASSWORD_ACCOUNT_LIMIT_ITEM,
     FORGOT_PASSWORD_ACCOUNT_RATE_LIMIT_SCOPE,
@@ -17,9 +14,11 @@ from app.config.auth_rate_limit_config import (
     RESET_PASSWORD_ACCOUNT_RATE_LIMIT_SCOPE,
 )
 from app.config.rate_limiter import limiter
+from app.services.rate_limit_engine import AsyncLimiter
 from app.utils.auth_utils import normalize_email_identifier
 from app.utils.error_codes_utils import ErrorCodes
 from app.utils.exceptions_utils import AppException
+from app.utils.rate_limit_utils import RateLimitItem
 
 _RATE_LIMIT_HMAC_SECRET = os.getenv("RATE_LIMIT_HMAC_SECRET")
 if not _RATE_LIMIT_HMAC_SECRET:
@@ -28,21 +27,17 @@ if not _RATE_LIMIT_HMAC_SECRET:
 
 class AuthRateLimitService:
     @property
-    def _limiter(self) -> RateLimiter:
-        return limiter.limiter
-
-    def _hit_limit(self, limit_item, scope: str, key: str) -> bool:
-        return cast(bool, self._limiter.hit(limit_item, key, scope))
+    def _limiter(self) -> AsyncLimiter:
+        return limiter
 
-    def _clear_limit(self, limit_item, scope: str, key: str) -> None:
-        if scope:
-            self._limiter.clear(limit_item, key, scope)
-            return
+    async def _hit_limit(self, limit_item: RateLimitItem, scope: str, key: str) -> bool:
+        return await self._limiter.hit(limit_item, scope, key)
 
-        self._limiter.storage.clear(key)
+    async def _clear_limit(self, limit_item: RateLimitItem, scope: str, key: str) -> None:
+        await self._limiter.clear(limit_item, scope, key)
 
-    def _test_limit(self, limit_item: RateLimitItem, scope: str, key: str) -> bool:
-        return self._limiter.test(limit_item, key, scope)
+    async def _test_limit(self, limit_item: RateLimitItem, scope: str, key: str) -> bool:
+        return await self._limiter.test(limit_item, scope, key)
 
     @staticmethod
     def _hash_identifier(identifier: str) -> str:
@@ -58,86 +53,86 @@ class AuthRateLimitService:
         normalized_email = normalize_email_identifier(email)
         return f"identifier:{cls._hash_identifier(normalized_email)}"
 
-    def _enforce_account_limit(
+    async def _enforce_account_limit(
         self,
         email: str,
         limit_item: RateLimitItem,
         scope: str,
     ) -> None:
         account_key = self.build_account_key(email)
-        allowed = self._test_limit(limit_item, scope, account_key)
+        allowed = await self._test_limit(limit_item, scope, account_key)
         if not allowed:
             raise AppException(ErrorCodes.RATE_LIMIT_EXCEEDED)
 
-    def _register_account_attempt(
+    async def _register_account_attempt(
         self,
         email: str,
         limit_item: RateLimitItem,
         scope: str,
     ) -> None:
         account_key = self.build_account_key(email)
-        allowed = self._hit_limit(limit_item, scope, account_key)
+        allowed = await self._hit_limit(limit_item, scope, account_key)
         if not allowed:
             raise AppException(ErrorCodes.RATE_LIMIT_EXCEEDED)
 
-    def enforce_login_failure_limit(self, email: str) -> None:
-        self._enforce_account_limit(
+    async def enforce_login_failure_limit(self, email: str) -> None:
+        await self._enforce_account_limit(
             email,
             LOGIN_FAILED_ACCOUNT_LIMIT_ITEM,
             LOGIN_ACCOUNT_RATE_LIMIT_SCOPE,
         )
 
-    def register_login_failure(self, email: str) -> None:
-        self._register_account_attempt(
+    async def register_login_failure(self, email: str) -> None:
+        await self._register_account_attempt(
             email,
             LOGIN_FAILED_ACCOUNT_LIMIT_ITEM,
             LOGIN_ACCOUNT_RATE_LIMIT_SCOPE,
         )
 
-    def clear_login_failures(self, email: str) -> None:
-        self._clear_limit(
+    async def clear_login_failures(self, email: str) -> None:
+        await self._clear_limit(
             LOGIN_FAILED_ACCOUNT_LIMIT_ITEM,
             LOGIN_ACCOUNT_RATE_LIMIT_SCOPE,
             self.build_account_key(email),
         )
 
-    def enforce_register_verification_limit(self, email: str) -> None:
-        self._enforce_account_limit(
+    async def enforce_register_verification_limit(self, email: str) -> None:
+        await self._enforce_account_limit(
             email,
             REGISTER_VERIFICATION_ACCOUNT_LIMIT_ITEM,
             REGISTER_VERIFICATION_ACCOUNT_RATE_LIMIT_SCOPE,
         )
 
-    def record_register_verification_attempt(self, email: str) -> None:
-        self._register_account_attempt(
+    async def record_register_verification_attempt(self, email: str) -> None:
+        await self._register_account_attempt(
             email,
             REGISTER_VERIFICATION_ACCOUNT_LIMIT_ITEM,
             REGISTER_VERIFICATION_ACCOUNT_RATE_LIMIT_SCOPE,
         )
 
-    def enforce_forgot_password_limit(self, email: str) -> None:
-        self._enforce_account_limit(
+    async def enforce_forgot_password_limit(self, email: str) -> None:
+        await self._enforce_account_limit(
             email,
             FORGOT_PASSWORD_ACCOUNT_LIMIT_ITEM,
             FORGOT_PASSWORD_ACCOUNT_RATE_LIMIT_SCOPE,
         )
 
-    def register_forgot_password_attempt(self, email: str) -> None:
-        self._register_account_attempt(
+    async def register_forgot_password_attempt(self, email: str) -> None:
+        await self._register_account_attempt(
             email,
             FORGOT_PASSWORD_ACCOUNT_LIMIT_ITEM,
             FORGOT_PASSWORD_ACCOUNT_RATE_LIMIT_SCOPE,
         )
 
-    def enforce_reset_password_limit(self, email: str) -> None:
-        self._enforce_account_limit(
+    async def enforce_reset_password_limit(self, email: str) -> None:
+        await self._enforce_account_limit(
             email,
             RESET_PASSWORD_ACCOUNT_LIMIT_ITEM,
             RESET_PASSWORD_ACCOUNT_RATE_LIMIT_SCOPE,
         )
 
-    def register_reset_password_attempt(self, email: str) -> None:
-        self._register_account_attempt(
+    async def register_reset_password_attempt(self, email: str) -> None:
+        await self._register_account_attempt(
             email,
             RESET_PASSWORD_ACCOUNT_LIMIT_ITEM,
             RESET_PASSWORD_ACCOUNT_RATE_LIMIT_SCOPE,
@@ -1,3 +1,5 @@
+import asyncio
+import logging
 import secrets
 from datetime import UTC, datetime, timedelta
 
@@ -14,6 +16,8 @@ from app.utils.auth_utils import normalize_email_identifier
 from app.utils.error_codes_utils import ErrorCodes
 from app.utils.exceptions_utils import AppException
 
+logger = logging.getLogger(__name__)
+
 
 class AuthService:
     user_repository: UserRepositoryProtocol
@@ -29,6 +33,7 @@ class AuthService:
         self.user_repository = user_repository
         self.email_service = email_service or EmailService()
         self.registration_verification_service = registration_verification_service or RegistrationVerificationService()
+        self._background_tasks: set[asyncio.Task[None]] = set()
 
     async def send_registration_verification_code(self, email: str) -> None:
         """
@@ -37,11 +42,11 @@ class AuthService:
         email_lowercase = normalize_email_identifier(email)
         existing_user_by_email = await self.user_repository.find_user_by_email(email_lowercase)
         if existing_user_by_email:
-            self.email_service.send_registration_existing_account_email(email_lowercase)
+            await self.email_service.send_registration_existing_account_email(email_lowercase)
             return
 
         verification_code = await self.registration_verification_service.issue_code(email_lowercase)
-        self.email_service.send_registration_verification_email(email_lowercase, verification_code)
+        await self.email_service.send_registration_verification_email(email_lowercase, verification_code)
 
     async def register(self, request: RegisterRequest) -> RegisterResponse:
         """
@@ -61,7 +66,7 @@ class AuthService:
             raise AppException(ErrorCodes.HANDLE_ALREADY_TAKEN)
 
         # Hash password
-        hashed_password = PasswordService.get_password_hash(request.password.strip())
+        hashed_password = await PasswordService.get_password_hash(request.password.strip())
 
         # Create user
         try:
@@ -116,11 +121,33 @@ class AuthService:
             # Given the plan, let's Raise a clear error.
             raise AppException(ErrorCodes.INVALID_CREDENTIALS)
 
-        if not PasswordService.verify_password(password, user.password_hash):
+        if not await PasswordService.verify_password(password, user.password_hash):
             raise AppException(ErrorCodes.INVALID_CREDENTIALS)
 
+        if PasswordService.needs_rehash(user.password_hash):
+            self._schedule_rehash(user, password)
+
         return user
 
+    def _schedule_rehash(self, user, password: str) -> None:
+        """Upgrade an outdated bcrypt cost in the background so login latency is unaffected."""
+
+        task = asyncio.create_task(self._rehash_password(user, user.password_hash, password))
+        # Hold a reference until the task finishes; the event loop only keeps weak ones.
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _rehash_password(self, user, current_password_hash: str, password: str) -> None:
+        try:
+            new_password_hash = await PasswordService.get_password_hash(password)
+            rehashed = await self.user_repository.rehash_password(user, current_password_hash, new_password_hash)
+        except Exception:
+            logger.exception("Password rehash failed for user_id=%s", user.id)
+            return
+
+        if not rehashed:
+            logger.info("Password rehash skipped for user_id=%s: hash changed since login", user.id)
+
     async def forgot_password(self, email: str):
         """
         Generate reset code and send email (mocked).
@@ -138,8 +165,8 @@ class AuthService:
 
         await self.user_repository.set_reset_password_code(user, reset_code, expires_at)
 
-        # Send email via EmailService
-        self.email_service.send_reset_password_email(email_lowercase, reset_code)
+        # Queue the email; the outbox worker delivers it
+        await self.email_service.send_reset_password_email(email_lowercase, reset_code)
 
     async def reset_password(self, email: str, code: str, new_password: str):
         """
@@ -159,7 +186,7 @@ class AuthService:
         if user.reset_password_expires.replace(tzinfo=UTC) < datetime.now(UTC):
             raise AppException(ErrorCodes.INVALID_CREDENTIALS)  # Expired
 
-        hashed_password = PasswordService.get_password_hash(new_password.strip())
+        hashed_password = await PasswordService.get_password_hash(new_password.strip())
         await self.user_repository.update_password(user, hashed_password)
         await self.user_repository.clear_reset_password_code(user)
 
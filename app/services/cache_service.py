@@ -1,11 +1,16 @@
 import asyncio
+import hashlib
 import json
 import logging
-from collections.abc import Awaitable
+import time
+from collections.abc import Awaitable, Mapping
+from dataclasses import dataclass, field
 from threading import Lock
 from typing import Any, cast
 
 import redis.asyncio as aioredis
+from redis.asyncio.client import PubSub
+from redis.exceptions import NoScriptError, ResponseError
 
 from app.config.redis import RedisConfig
 
@@ -13,6 +18,293 @@ logger = logging.getLogger(__name__)
 
 CacheValue = dict[str, Any] | list[Any]
 HashValue = str | int
+StreamEntry = tuple[str, dict[str, str]]
+
+
+@dataclass(frozen=True)
+class LuaScript:
+    """A server-side script run with EVALSHA; the SHA1 is computed locally, matching Redis' script cache key."""
+
+    source: str
+    sha: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "sha", hashlib.sha1(self.source.encode(), usedforsecurity=False).hexdigest())
+
+
+# Every script CacheService runs, loaded into Redis at startup by ``load_scripts``.
+LUA_SCRIPTS: list[LuaScript] = []
+
+
+def register_script(source: str) -> LuaScript:
+    script = LuaScript(source)
+    LUA_SCRIPTS.append(script)
+    return script
+
+
+# Adjusts a counter only while it is cached, clamping at zero, so a missing key
+# stays missing until the owner rebuilds it from the source of truth.
+INCRBY_IF_EXISTS_SCRIPT = register_script(
+    """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return false
+end
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if value < 0 then
+    redis.call('SET', KEYS[1], 0, 'KEEPTTL')
+    return 0
+end
+return value
+"""
+)
+
+# Adds a member to a sorted set only while the set is cached, then trims it to
+# the newest ARGV[3] members. Rank 0 holds the set's zero-score marker, which
+# is kept so a trimmed set still reads as built.
+ZADD_CAPPED_IF_EXISTS_SCRIPT = register_script(
+    """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+redis.call('ZREMRANGEBYRANK', KEYS[1], 1, -(tonumber(ARGV[3]) + 1))
+return 1
+"""
+)
+
+# Reads members newest first from ARGV[1] down to (exclusive) ARGV[2]. The
+# LIMIT is widened by the number of members tied at ARGV[1] so the caller can
+# drop ties it has already seen and still fill a page.
+ZREVRANGEBYSCORE_IF_EXISTS_SCRIPT = register_script(
+    """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return false
+end
+local count = tonumber(ARGV[3])
+if ARGV[1] ~= '+inf' then
+    count = count + redis.call('ZCOUNT', KEYS[1], ARGV[1], ARGV[1])
+end
+return redis.call('ZREVRANGEBYSCORE', KEYS[1], ARGV[1], '(' .. ARGV[2], 'WITHSCORES', 'LIMIT', 0, count)
+"""
+)
+
+# Adds a member to a set only while the set is cached, so a missing set stays
+# missing until its owner rebuilds it in full.
+SADD_IF_EXISTS_SCRIPT = register_script(
+    """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return false
+end
+return redis.call('SADD', KEYS[1], ARGV[1])
+"""
+)
+
+# Checks several members against a cached set, telling a missing set apart
+# from one that contains none of them.
+SMISMEMBER_IF_EXISTS_SCRIPT = register_script(
+    """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return false
+end
+return redis.call('SMISMEMBER', KEYS[1], unpack(ARGV))
+"""
+)
+
+
+# Generic cell rate algorithm over several buckets at once. Each key holds its
+# bucket's theoretical arrival time (TAT) in microseconds of Redis server time.
+# ARGV[1] is 1 to charge the buckets or 0 to only test them; ARGV[2i] and
+# ARGV[2i+1] are the emission interval (microseconds) and burst of KEYS[i].
+# Buckets are charged only when all of them allow the request. Returns
+# {allowed, remaining, reset_after_us, retry_after_us} for each key.
+GCRA_ACQUIRE_SCRIPT = register_script(
+    """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000000 + tonumber(time[2])
+local results = {}
+local new_tats = {}
+local all_allowed = true
+for i, key in ipairs(KEYS) do
+    local interval = tonumber(ARGV[2 * i])
+    local capacity = interval * tonumber(ARGV[2 * i + 1])
+    local tat = math.max(tonumber(redis.call('GET', key)) or now, now)
+    local new_tat = tat + interval
+    if new_tat - now <= capacity then
+        new_tats[i] = new_tat
+        results[i] = {1, math.floor((capacity - (new_tat - now)) / interval), new_tat - now, 0}
+    else
+        all_allowed = false
+        results[i] = {0, 0, tat - now, new_tat - now - capacity}
+    end
+end
+if ARGV[1] == '1' and all_allowed then
+    for i, key in ipairs(KEYS) do
+        local ttl_ms = math.max(1, math.ceil((new_tats[i] - now) / 1000))
+        redis.call('SET', key, string.format('%.0f', new_tats[i]), 'PX', ttl_ms)
+    end
+end
+return results
+"""
+)
+
+
+# Adds requests a worker already admitted from its local copy of GCRA buckets
+# and reports how far each bucket's TAT is ahead of now, so the worker can
+# adopt the shared state. ARGV[2i-1] and ARGV[2i] are the request count and
+# emission interval (microseconds) of KEYS[i]. Counts are applied without a
+# limit check: the requests were already served, and any overshoot only
+# delays the bucket's recovery.
+GCRA_SYNC_SCRIPT = register_script(
+    """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000000 + tonumber(time[2])
+local results = {}
+for i, key in ipairs(KEYS) do
+    local count = tonumber(ARGV[2 * i - 1])
+    local tat = math.max(tonumber(redis.call('GET', key)) or now, now)
+    if count > 0 then
+        tat = tat + count * tonumber(ARGV[2 * i])
+        redis.call('SET', key, string.format('%.0f', tat), 'PX', math.max(1, math.ceil((tat - now) / 1000)))
+    end
+    results[i] = tat - now
+end
+return results
+"""
+)
+
+
+# Moves delayed entries whose due time (their score) has passed from the sorted
+# set KEYS[1] onto the stream KEYS[2] in one step, so a crashed caller can
+# neither lose nor duplicate them. ARGV holds now, the maximum number of
+# entries to move, the stream field that carries each member, and the
+# approximate stream length cap. Returns how many entries were moved.
+PROMOTE_DUE_TO_STREAM_SCRIPT = register_script(
+    """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+for _, member in ipairs(due) do
+    redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[4], '*', ARGV[3], member)
+    redis.call('ZREM', KEYS[1], member)
+end
+return #due
+"""
+)
+
+
+# Checks a candidate against the code hash stored in hash KEYS[1] and counts a
+# failed attempt in the same step, so concurrent guesses cannot all pass the
+# limit check on one attempt count. ARGV[1] is the candidate hash and ARGV[2]
+# the attempt limit. Plain equality is fine: both sides are HMACs, so the
+# comparison time says nothing about the code.
+CHECK_CODE_ATTEMPT_SCRIPT = register_script(
+    """
+local fields = redis.call('HMGET', KEYS[1], 'code_hash', 'attempts')
+local attempts = tonumber(fields[2] or '0')
+if not fields[1] or fields[1] == '' or not attempts then
+    return 'missing'
+end
+local limit = tonumber(ARGV[2])
+if attempts >= limit then
+    return 'exceeded'
+end
+if fields[1] == ARGV[1] then
+    return 'match'
+end
+if redis.call('HINCRBY', KEYS[1], 'attempts', 1) >= limit then
+    return 'exceeded'
+end
+return 'mismatch'
+"""
+)
+
+# Caches KEYS[1] and records it in the index set KEYS[2], so a whole family of
+# keys can later be deleted by name instead of by scanning the keyspace. ARGV
+# holds the value and the TTL in seconds; the index lives as long as its
+# newest member.
+SET_INDEXED_SCRIPT = register_script(
+    """
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+redis.call('SADD', KEYS[2], KEYS[1])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return 1
+"""
+)
+
+# Deletes the first ARGV[1] keys outright; every further key is an index set
+# whose recorded members are deleted along with it. Members are not declared
+# in KEYS, which standalone Redis allows. Returns how many keys were deleted.
+DELETE_INDEXED_SCRIPT = register_script(
+    """
+local plain = tonumber(ARGV[1])
+local deleted = 0
+for i, key in ipairs(KEYS) do
+    if i > plain then
+        local members = redis.call('SMEMBERS', key)
+        for first = 1, #members, 1000 do
+            deleted = deleted + redis.call('DEL', unpack(members, first, math.min(first + 999, #members)))
+        end
+    end
+    deleted = deleted + redis.call('DEL', key)
+end
+return deleted
+"""
+)
+
+
+# Revokes one session: deletes its record KEYS[1] and marks session ARGV[1] as
+# revoked until ARGV[2] in the per-user hash KEYS[2]. Marks that expired by
+# ARGV[3] are dropped on the way, so the hash only holds sessions whose access
+# tokens can still be presented. The ``before`` field is the revoke-all
+# watermark and is kept as is. ARGV[4] is the hash TTL in seconds.
+REVOKE_SESSION_SCRIPT = register_script(
+    """
+redis.call('DEL', KEYS[1])
+local fields = redis.call('HGETALL', KEYS[2])
+local now = tonumber(ARGV[3])
+for i = 1, #fields, 2 do
+    if fields[i] ~= 'before' and tonumber(fields[i + 1]) <= now then
+        redis.call('HDEL', KEYS[2], fields[i])
+    end
+end
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+redis.call('EXPIRE', KEYS[2], ARGV[4])
+return 1
+"""
+)
+
+
+# Bloom filter membership over the bitmap KEYS[1]: 1 when every bit offset in
+# ARGV is set, 0 as soon as one is clear. A missing bitmap returns nil rather
+# than 0, since a filter that was never built must not report misses.
+BLOOM_CHECK_SCRIPT = register_script(
+    """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return false
+end
+for _, offset in ipairs(ARGV) do
+    if redis.call('GETBIT', KEYS[1], offset) == 0 then
+        return 0
+    end
+end
+return 1
+"""
+)
+
+# Sets the bit offsets in ARGV on each bitmap in KEYS that exists, so adding to
+# a filter never creates a partial one. Returns how many bitmaps were written.
+BLOOM_ADD_SCRIPT = register_script(
+    """
+local written = 0
+for _, key in ipairs(KEYS) do
+    if redis.call('EXISTS', key) == 1 then
+        for _, offset in ipairs(ARGV) do
+            redis.call('SETBIT', key, offset, 1)
+        end
+        written = written + 1
+    end
+end
+return written
+"""
+)
 
 
 class CacheService:
@@ -39,6 +331,37 @@ class CacheService:
                 raise RuntimeError("CacheService not initialized. Call initialize() first.")
             return cls._singleton
 
+    async def load_scripts(self) -> None:
+        """Load every registered script so the first EVALSHA of each does not miss."""
+
+        async with self._client.pipeline(transaction=False) as pipe:
+            for script in LUA_SCRIPTS:
+                pipe.script_load(script.source)
+            await pipe.execute()
+
+    async def _run_script(self, script: LuaScript, numkeys: int, *keys_and_args: Any) -> Any:
+        """EVALSHA ``script``, loading it first when Redis lost its script cache (restart, failover, flush)."""
+
+        try:
+            return await cast("Awaitable[Any]", self._client.evalsha(script.sha, numkeys, *keys_and_args))
+        except NoScriptError:
+            await self._client.script_load(script.source)
+            return await cast("Awaitable[Any]", self._client.evalsha(script.sha, numkeys, *keys_and_args))
+
+    async def _run_script_many(self, script: LuaScript, calls: list[tuple[Any, ...]]) -> list[Any]:
+        """Pipeline one EVALSHA per ``(numkeys, *keys_and_args)`` call; calls that missed the script cache are rerun."""
+
+        async with self._client.pipeline(transaction=False) as pipe:
+            for call in calls:
+                pipe.evalsha(script.sha, *call)
+            results = await pipe.execute(raise_on_error=False)
+        for index, result in enumerate(results):
+            if isinstance(result, NoScriptError):
+                results[index] = await self._run_script(script, *calls[index])
+            elif isinstance(result, Exception):
+                raise result
+        return list(results)
+
     async def get(self, key: str) -> CacheValue | None:
         data = await self._client.get(key)
         if data is None:
@@ -46,15 +369,169 @@ class CacheService:
         result: CacheValue = json.loads(data)
         return result
 
+    async def get_and_expire(self, key: str, ttl: int) -> CacheValue | None:
+        """Read a JSON value and reset its TTL in the same round trip (GETEX)."""
+
+        data = await self._client.getex(key, ex=ttl)
+        if data is None:
+            return None
+        result: CacheValue = json.loads(data)
+        return result
+
     async def set(self, key: str, value: CacheValue, ttl: int | None = None) -> bool:
         serialized = json.dumps(value)
         await self._client.set(key, serialized, ex=ttl or self._default_ttl)
         return True
 
+    async def get_str_many(self, keys: list[str]) -> list[str | None]:
+        """Read several raw string values in one ``MGET`` round trip."""
+
+        if not keys:
+            return []
+        values = await self._client.mget(keys)
+        return [None if value is None else str(value) for value in values]
+
+    async def set_str(self, key: str, value: str, ttl: int) -> None:
+        await self._client.set(key, value, ex=ttl)
+
+    async def get_int(self, key: str) -> int | None:
+        data = await self._client.get(key)
+        if data is None:
+            return None
+        return int(data)
+
+    async def set_int_if_absent(self, key: str, value: int, ttl: int) -> bool:
+        return bool(await self._client.set(key, value, ex=ttl, nx=True))
+
+    async def incrby_if_exists(self, key: str, amount: int) -> int | None:
+        """Add ``amount`` to an existing integer key without creating it; negative results clamp to zero."""
+
+        result = await cast("Awaitable[int | None]", self._run_script(INCRBY_IF_EXISTS_SCRIPT, 1, key, amount))
+        return None if result is None else int(result)
+
+    async def incrby_if_exists_many(self, keys: list[str], amount: int) -> list[int | None]:
+        """Run ``incrby_if_exists`` for several keys in one pipelined round trip."""
+
+        if not keys:
+            return []
+        results = await self._run_script_many(INCRBY_IF_EXISTS_SCRIPT, [(1, key, amount) for key in keys])
+        return [None if result is None else int(result) for result in results]
+
+    async def rpush(self, key: str, value: str) -> int:
+        return int(await cast("Awaitable[int]", self._client.rpush(key, value)))
+
+    async def blpop(self, key: str, timeout: int) -> str | None:
+        """Pop the head of a list, waiting up to ``timeout`` seconds for one to arrive."""
+
+        result = await cast("Awaitable[list[str] | None]", self._client.blpop([key], timeout=timeout))
+        return None if result is None else str(result[1])
+
+    async def xadd(
+        self, key: str, fields: Mapping[str, str], max_length: int, max_age_seconds: float | None = None
+    ) -> str:
+        """Append an entry to a stream, trimming it to roughly ``max_length`` entries.
+
+        With ``max_age_seconds``, entries added longer ago than that are trimmed
+        in the same round trip.
+        """
+
+        entry: dict[Any, Any] = dict(fields)
+        if max_age_seconds is None:
+            return str(await self._client.xadd(key, entry, maxlen=max_length, approximate=True))
+
+        min_id = str(int((time.time() - max_age_seconds) * 1000))
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.xadd(key, entry, maxlen=max_length, approximate=True)
+            pipe.xtrim(key, minid=min_id, approximate=False)
+            entry_id, _ = await pipe.execute()
+        return str(entry_id)
+
+    async def ensure_stream_group(self, key: str, group: str) -> None:
+        """Create consumer group ``group`` (and the stream itself) unless it already exists."""
+
+        try:
+            await self._client.xgroup_create(key, group, id="0", mkstream=True)
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    async def xreadgroup(
+        self, key: str, group: str, consumer: str, count: int, block_ms: int | None
+    ) -> list[StreamEntry]:
+        """Read entries never delivered to the group, waiting up to ``block_ms`` when there are none."""
+
+        response = await self._client.xreadgroup(group, consumer, {key: ">"}, count=count, block=block_ms)
+        if not response:
+            return []
+        return [(str(entry_id), dict(fields)) for entry_id, fields in response[0][1]]
+
+    async def xautoclaim(self, key: str, group: str, consumer: str, min_idle_ms: int, count: int) -> list[StreamEntry]:
+        """Take over entries another consumer read but left unacknowledged for ``min_idle_ms``."""
+
+        response = await self._client.xautoclaim(key, group, consumer, min_idle_ms, start_id="0-0", count=count)
+        return [(str(entry_id), dict(fields)) for entry_id, fields in response[1] if fields is not None]
+
+    async def xack_and_delete(self, key: str, group: str, entry_ids: list[str]) -> None:
+        if not entry_ids:
+            return
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.xack(key, group, *entry_ids)
+            pipe.xdel(key, *entry_ids)
+            await pipe.execute()
+
+    async def defer_stream_entry(
+        self, key: str, group: str, entry_id: str, delay_key: str, member: str, due_at: float, ttl: int
+    ) -> None:
+        """Acknowledge a stream entry and park ``member`` in sorted set ``delay_key`` until ``due_at``.
+
+        ``delay_key`` expires ``ttl`` seconds after its last write.
+        """
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.zadd(delay_key, {member: due_at})
+            pipe.expire(delay_key, ttl)
+            pipe.xack(key, group, entry_id)
+            pipe.xdel(key, entry_id)
+            await pipe.execute()
+
+    async def promote_due_to_stream(
+        self, delay_key: str, key: str, field: str, now: float, limit: int, max_length: int
+    ) -> int:
+        """Move members of ``delay_key`` scored at or before ``now`` onto stream ``key``."""
+
+        return int(
+            await cast(
+                "Awaitable[int]",
+                self._run_script(PROMOTE_DUE_TO_STREAM_SCRIPT, 2, delay_key, key, now, limit, field, max_length),
+            )
+        )
+
     async def delete(self, key: str) -> bool:
         result = int(await self._client.delete(key))
         return result > 0
 
+    async def set_indexed(self, key: str, value: CacheValue, index_key: str, ttl: int) -> None:
+        """Cache ``value`` under ``key`` and record the key in set ``index_key`` for ``delete_indexed``."""
+
+        await self._run_script(SET_INDEXED_SCRIPT, 2, key, index_key, json.dumps(value), ttl)
+
+    async def delete_indexed(self, keys: list[str], index_keys: list[str]) -> int:
+        """Delete ``keys`` and every key recorded in the ``index_keys`` sets, plus the sets, in one atomic step."""
+
+        result = await self._run_script(
+            DELETE_INDEXED_SCRIPT, len(keys) + len(index_keys), *keys, *index_keys, len(keys)
+        )
+        return int(result)
+
+    async def check_code_attempt(self, key: str, candidate_hash: str, max_attempts: int) -> str:
+        """Compare ``candidate_hash`` with the hash's ``code_hash`` field and count a mismatch, atomically.
+
+        Returns ``"missing"`` when there is no usable code, ``"exceeded"`` once
+        ``max_attempts`` failures are recorded, otherwise ``"match"`` or ``"mismatch"``.
+        """
+
+        return str(await self._run_script(CHECK_CODE_ATTEMPT_SCRIPT, 1, key, candidate_hash, max_attempts))
+
     async def hgetall(self, key: str) -> dict[str, str]:
         data = await cast("Awaitable[dict[Any, Any]]", self._client.hgetall(key))
         return dict(data)
@@ -66,9 +543,193 @@ class CacheService:
             results = await pipe.execute()
         return int(results[0])
 
+    async def replace_hash(self, key: str, mapping: dict[str, HashValue], ttl: int) -> None:
+        """Atomically swap a hash's fields and set its TTL; ``mapping`` must not be empty."""
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, ttl)
+            await pipe.execute()
+
+    async def revoke_session(
+        self, session_key: str, revocations_key: str, session_id: str, revoked_until: float, now: float, ttl: int
+    ) -> None:
+        """Delete a session record and mark the session revoked in the user's revocation hash, atomically."""
+
+        await self._run_script(
+            REVOKE_SESSION_SCRIPT, 2, session_key, revocations_key, session_id, revoked_until, now, ttl
+        )
+
+    async def bloom_check(self, key: str, offsets: list[int]) -> bool | None:
+        """Whether every bit in ``offsets`` (non-empty) is set, or ``None`` when the bitmap is missing."""
+
+        result = await cast("Awaitable[int | None]", self._run_script(BLOOM_CHECK_SCRIPT, 1, key, *offsets))
+        return None if result is None else bool(result)
+
+    async def bloom_add(self, keys: list[str], offsets: list[int]) -> int:
+        """Set ``offsets`` (non-empty) on each existing bitmap in ``keys``; returns how many were written."""
+
+        return int(await self._run_script(BLOOM_ADD_SCRIPT, len(keys), *keys, *offsets))
+
+    async def allocate_bitmap(self, key: str, size_bits: int, ttl: int) -> None:
+        """Replace ``key`` with an all-zero bitmap of ``size_bits`` bits that expires after ``ttl`` seconds."""
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.setbit(key, size_bits - 1, 0)
+            pipe.expire(key, ttl)
+            await pipe.execute()
+
+    async def rename_persistent(self, source: str, destination: str) -> None:
+        """Move ``source`` over ``destination`` and drop the TTL it carried, atomically."""
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.rename(source, destination)
+            pipe.persist(destination)
+            await pipe.execute()
+
     async def hincrby(self, key: str, field: str, amount: int = 1) -> int:
         return int(await cast("Awaitable[int]", self._client.hincrby(key, field, amount)))
 
+    async def exists(self, key: str) -> bool:
+        return int(await self._client.exists(key)) > 0
+
+    async def zincrby_with_expireat(self, member: str, amount: float, expire_at_by_key: Mapping[str, int]) -> None:
+        """Add ``amount`` to ``member`` in each sorted set, drop non-positive scores, and pin absolute expiries."""
+
+        if not expire_at_by_key:
+            return
+        async with self._client.pipeline(transaction=True) as pipe:
+            for key, expire_at in expire_at_by_key.items():
+                pipe.zincrby(key, amount, member)
+                pipe.zremrangebyscore(key, "-inf", 0)
+                pipe.expireat(key, expire_at)
+            await pipe.execute()
+
+    async def zunionstore_with_ttl(self, destination: str, keys: list[str], ttl: int) -> int:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.zunionstore(destination, keys)
+            pipe.expire(destination, ttl)
+            results = await pipe.execute()
+        return int(results[0])
+
+    async def zrevrange_with_scores(self, key: str, start: int, stop: int) -> list[tuple[str, float]]:
+        results = await self._client.zrevrange(key, start, stop, withscores=True)
+        return [(str(member), float(score)) for member, score in results]
+
+    async def zadd_capped_if_exists_many(self, keys: list[str], member: str, score: float, max_length: int) -> None:
+        """Add ``member`` to each cached sorted set and trim it to ``max_length``, in one pipelined round trip."""
+
+        if not keys:
+            return
+        await self._run_script_many(ZADD_CAPPED_IF_EXISTS_SCRIPT, [(1, key, member, score, max_length) for key in keys])
+
+    async def replace_sorted_set(self, key: str, mapping: Mapping[str, float], ttl: int) -> None:
+        """Atomically swap a sorted set's contents and set its TTL."""
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.zadd(key, dict(mapping))
+            pipe.expire(key, ttl)
+            await pipe.execute()
+
+    async def zrevrangebyscore_if_exists(
+        self,
+        key: str,
+        max_score: float | None,
+        min_score_exclusive: float,
+        count: int,
+    ) -> list[tuple[str, float]] | None:
+        """Return up to ``count`` members newest first plus any tied at ``max_score``, or ``None`` for a missing key.
+
+        ``max_score`` is inclusive and ``None`` means no upper bound.
+        """
+
+        max_arg = "+inf" if max_score is None else repr(max_score)
+        result = await cast(
+            "Awaitable[list[str] | None]",
+            self._run_script(ZREVRANGEBYSCORE_IF_EXISTS_SCRIPT, 1, key, max_arg, repr(min_score_exclusive), count),
+        )
+        if result is None:
+            return None
+        return [(str(result[index]), float(result[index + 1])) for index in range(0, len(result), 2)]
+
+    async def sadd_if_exists(self, key: str, member: str) -> bool:
+        """Add ``member`` to an existing set without creating it; ``False`` when the set is missing."""
+
+        result = await cast("Awaitable[int | None]", self._run_script(SADD_IF_EXISTS_SCRIPT, 1, key, member))
+        return result is not None
+
+    async def srem(self, key: str, member: str) -> int:
+        return int(await cast("Awaitable[int]", self._client.srem(key, member)))
+
+    async def replace_set(self, key: str, members: list[str], ttl: int) -> None:
+        """Atomically swap a set's members and set its TTL; ``members`` must not be empty."""
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.sadd(key, *members)
+            pipe.expire(key, ttl)
+            await pipe.execute()
+
+    async def smismember_if_exists(self, key: str, members: list[str]) -> list[bool] | None:
+        """Return whether each of ``members`` (non-empty) is in the set, or ``None`` when the set is missing."""
+
+        result = await cast(
+            "Awaitable[list[int] | None]",
+            self._run_script(SMISMEMBER_IF_EXISTS_SCRIPT, 1, key, *members),
+        )
+        return None if result is None else [bool(flag) for flag in result]
+
+    async def gcra_acquire(
+        self, keys: list[str], limits: list[tuple[int, int]], consume: bool
+    ) -> list[tuple[int, int, int, int]]:
+        """Test, and when ``consume`` is set charge, GCRA buckets in one atomic round trip.
+
+        ``limits`` holds each key's emission interval in microseconds and its burst size.
+        """
+
+        args: list[int] = [1 if consume else 0]
+        for interval_us, burst in limits:
+            args.extend((interval_us, burst))
+        result = await cast(
+            "Awaitable[list[list[int]]]",
+            self._run_script(GCRA_ACQUIRE_SCRIPT, len(keys), *keys, *args),
+        )
+        return [(int(allowed), int(remaining), int(reset), int(retry)) for allowed, remaining, reset, retry in result]
+
+    async def gcra_sync(self, keys: list[str], charges: list[tuple[int, int]]) -> list[int]:
+        """Add locally admitted requests to GCRA buckets; returns microseconds until each bucket's TAT.
+
+        ``charges`` holds each key's request count and emission interval in microseconds.
+        """
+
+        args: list[int] = []
+        for count, interval_us in charges:
+            args.extend((count, interval_us))
+        result = await cast(
+            "Awaitable[list[int]]",
+            self._run_script(GCRA_SYNC_SCRIPT, len(keys), *keys, *args),
+        )
+        return [int(offset) for offset in result]
+
+    async def publish(self, channel: str, message: str) -> int:
+        return int(await self._client.publish(channel, message))
+
+    async def publish_many(self, channel: str, messages: list[str]) -> None:
+        if not messages:
+            return
+        async with self._client.pipeline(transaction=False) as pipe:
+            for message in messages:
+                pipe.publish(channel, message)
+            await pipe.execute()
+
+    def pubsub(self) -> PubSub:
+        """Return a pub/sub handle on its own connection; the caller owns closing it."""
+
+        return self._client.pubsub(ignore_subscribe_messages=True)
+
     async def delete_many(self, keys: list[str]) -> int:
         if not keys:
             return 0
@@ -0,0 +1,162 @@
+"""Redis stream used to hand outbound emails to the email outbox worker.
+
+Request handlers append one email per message and return; the worker reads
+batches through the ``email-senders`` consumer group and acknowledges an entry
+only once the SMTP server accepted it, so a worker that dies mid-batch leaves
+its entries pending for another worker to reclaim. A failed send is moved to a
+sorted set scored by its next attempt time and promoted back onto the stream
+when that time has passed.
+
+Entries carry a template name and its parameters, not the rendered message,
+and the worker renders them just before sending. Parameters include reset and
+verification codes, so nothing stays in Redis longer than
+``EMAIL_OUTBOX_RETENTION_SECONDS``: every append trims older stream entries,
+and the retry set expires that long after its last write.
+"""
+
+import json
+import logging
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from uuid import uuid4
+
+from app.services.cache_service import CacheService
+from app.services.email_templates import EMAIL_TEMPLATE_PARAMS
+from app.types import EmailTemplate
+
+logger = logging.getLogger(__name__)
+
+EMAIL_OUTBOX_STREAM_KEY = "cinelog:email:outbox"
+EMAIL_OUTBOX_RETRY_KEY = "cinelog:email:outbox:retry"
+EMAIL_OUTBOX_GROUP = "email-senders"
+EMAIL_OUTBOX_MAX_LENGTH = 100_000
+# Longest any email may wait for delivery, and so the longest an entry stays in Redis.
+EMAIL_OUTBOX_RETENTION_SECONDS = 60 * 60
+
+_PAYLOAD_FIELD = "payload"
+
+
+@dataclass(frozen=True)
+class OutboundEmail:
+    """One queued email: a template with its parameters, the Unix time it expires, and the delivery attempt count."""
+
+    to_email: str
+    template: EmailTemplate
+    params: Mapping[str, str]
+    expires_at: float
+    attempt: int = 1
+    message_id: str = field(default_factory=lambda: uuid4().hex)
+
+
+@dataclass(frozen=True)
+class OutboxEntry:
+    """An email read from the stream, keyed by the entry ID used to acknowledge it."""
+
+    entry_id: str
+    email: OutboundEmail
+
+
+def _serialize(email: OutboundEmail) -> str:
+    return json.dumps(
+        {
+            "id": email.message_id,
+            "attempt": email.attempt,
+            "to": email.to_email,
+            "template": email.template,
+            "params": dict(email.params),
+            "expires_at": email.expires_at,
+        }
+    )
+
+
+def _deserialize(message: str) -> OutboundEmail:
+    payload = json.loads(message)
+    template = EmailTemplate(payload["template"])
+    params = {str(name): str(value) for name, value in payload["params"].items()}
+    if params.keys() != EMAIL_TEMPLATE_PARAMS[template]:
+        raise ValueError(f"Unexpected parameters for email template {template}")
+    return OutboundEmail(
+        to_email=str(payload["to"]),
+        template=template,
+        params=params,
+        expires_at=float(payload["expires_at"]),
+        attempt=int(payload["attempt"]),
+        message_id=str(payload["id"]),
+    )
+
+
+class EmailOutbox:
+    @property
+    def _cache(self) -> CacheService:
+        return CacheService.get_instance()
+
+    async def enqueue(self, email: OutboundEmail) -> None:
+        await self._cache.xadd(
+            EMAIL_OUTBOX_STREAM_KEY,
+            {_PAYLOAD_FIELD: _serialize(email)},
+            EMAIL_OUTBOX_MAX_LENGTH,
+            max_age_seconds=EMAIL_OUTBOX_RETENTION_SECONDS,
+        )
+
+    async def ensure_group(self) -> None:
+        await self._cache.ensure_stream_group(EMAIL_OUTBOX_STREAM_KEY, EMAIL_OUTBOX_GROUP)
+
+    async def read_batch(self, consumer: str, count: int, block_ms: int, reclaim_idle_ms: int) -> list[OutboxEntry]:
+        """Return up to ``count`` emails, reclaiming ones abandoned by dead consumers first.
+
+        Waits up to ``block_ms`` only when nothing was reclaimed. Malformed
+        entries are logged and acknowledged so they are never redelivered.
+        """
+
+        raw = await self._cache.xautoclaim(
+            EMAIL_OUTBOX_STREAM_KEY, EMAIL_OUTBOX_GROUP, consumer, reclaim_idle_ms, count
+        )
+        if len(raw) < count:
+            raw += await self._cache.xreadgroup(
+                EMAIL_OUTBOX_STREAM_KEY,
+                EMAIL_OUTBOX_GROUP,
+                consumer,
+                count - len(raw),
+                None if raw else block_ms,
+            )
+
+        entries: list[OutboxEntry] = []
+        malformed: list[str] = []
+        for entry_id, fields in raw:
+            try:
+                entries.append(OutboxEntry(entry_id=entry_id, email=_deserialize(fields[_PAYLOAD_FIELD])))
+            except (AttributeError, KeyError, TypeError, ValueError):
+                logger.warning("Dropping malformed outbox entry %s", entry_id)
+                malformed.append(entry_id)
+        await self.ack(malformed)
+        return entries
+
+    async def ack(self, entry_ids: list[str]) -> None:
+        await self._cache.xack_and_delete(EMAIL_OUTBOX_STREAM_KEY, EMAIL_OUTBOX_GROUP, entry_ids)
+
+    async def schedule_retry(self, entry: OutboxEntry, delay_seconds: float) -> None:
+        """Acknowledge ``entry`` and queue its next attempt ``delay_seconds`` from now."""
+
+        retry = replace(entry.email, attempt=entry.email.attempt + 1)
+        await self._cache.defer_stream_entry(
+            EMAIL_OUTBOX_STREAM_KEY,
+            EMAIL_OUTBOX_GROUP,
+            entry.entry_id,
+            EMAIL_OUTBOX_RETRY_KEY,
+            _serialize(retry),
+            time.time() + delay_seconds,
+            EMAIL_OUTBOX_RETENTION_SECONDS,
+        )
+
+    async def promote_due_retries(self, limit: int) -> int:
+        """Move retries whose backoff has elapsed back onto the stream; returns how many moved."""
+
+        return await self._cache.promote_due_to_stream(
+            EMAIL_OUTBOX_RETRY_KEY,
+            EMAIL_OUTBOX_STREAM_KEY,
+            _PAYLOAD_FIELD,
+            time.time(),
+            limit,
+            EMAIL_OUTBOX_MAX_LENGTH,
+        )
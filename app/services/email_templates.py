@@ -0,0 +1,67 @@
+"""Subjects and bodies of the transactional emails, rendered right before sending.
+
+The outbox stores only a template name and its parameters, so message bodies,
+and the codes inside them, never sit in Redis.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from app.types import EmailTemplate
+
+# Parameters each template is rendered with; outbox entries carrying any other set are malformed.
+EMAIL_TEMPLATE_PARAMS: dict[EmailTemplate, frozenset[str]] = {
+    EmailTemplate.RESET_PASSWORD: frozenset({"code"}),
+    EmailTemplate.REGISTRATION_VERIFICATION: frozenset({"code"}),
+    EmailTemplate.REGISTRATION_EXISTING_ACCOUNT: frozenset(),
+}
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    to_email: str
+    subject: str
+    text: str
+    html: str
+
+
+def render_email(to_email: str, template: EmailTemplate, params: Mapping[str, str]) -> RenderedEmail:
+    if template is EmailTemplate.RESET_PASSWORD:
+        code = params["code"]
+        text = f"Your password reset code is: {code}\nThis code will expire in 15 minutes."
+        html = f"""
+        <html>
+          <body>
+            <p>Your password reset code is: <strong>{code}</strong></p>
+            <p>This code will expire in 15 minutes.</p>
+          </body>
+        </html>
+        """
+        return RenderedEmail(to_email, "Password Reset - Cinelog", text, html)
+
+    if template is EmailTemplate.REGISTRATION_VERIFICATION:
+        code = params["code"]
+        text = f"Your Cinelog registration code is: {code}\nThis code will expire in 15 minutes."
+        html = f"""
+        <html>
+          <body>
+            <p>Your Cinelog registration code is: <strong>{code}</strong></p>
+            <p>This code will expire in 15 minutes.</p>
+          </body>
+        </html>
+        """
+        return RenderedEmail(to_email, "Verify your Cinelog email", text, html)
+
+    text = (
+        "A Cinelog account already exists for this email address.\n"
+        "If this was you, sign in or use password recovery if needed."
+    )
+    html = """
+        <html>
+          <body>
+            <p>A Cinelog account already exists for this email address.</p>
+            <p>If this was you, sign in or use password recovery if needed.</p>
+          </body>
+        </html>
+        """
+    return RenderedEmail(to_email, "Cinelog account already exists", text, html)
@@ -0,0 +1,114 @@
+import logging
+import os
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from app.repository.feed_repository_protocol import FeedEntry
+from app.services.cache_service import CacheService
+from app.types import TimestampUUIDCursor
+
+logger = logging.getLogger(__name__)
+
+FEED_TIMELINE_MAX_LENGTH = int(os.getenv("FEED_TIMELINE_MAX_LENGTH", "500"))
+FEED_TIMELINE_TTL = int(os.getenv("FEED_TIMELINE_TTL", "86400"))
+
+# Zero-score member that keeps a built timeline present while it has no logs.
+TIMELINE_MARKER = "built"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _to_score(moment: datetime) -> float:
+    """Encode a timestamp as whole epoch microseconds, which a Redis double holds exactly."""
+
+    return float((moment - _EPOCH) // timedelta(microseconds=1))
+
+
+def _from_score(score: float) -> datetime:
+    return _EPOCH + timedelta(microseconds=int(score))
+
+
+class FeedCacheService:
+    """Per-user home feed timelines kept as Redis sorted sets.
+
+    Members are log ids scored by creation time in microseconds. Timelines are
+    built from PostgreSQL on a miss and then receive new logs by fan-out on
+    write; a push never creates a missing timeline and never refreshes its
+    TTL, and each timeline is trimmed to its newest ``FEED_TIMELINE_MAX_LENGTH``
+    logs. Redis failures are logged and treated as misses.
+    """
+
+    @property
+    def _cache(self) -> CacheService:
+        return CacheService.get_instance()
+
+    @staticmethod
+    def build_timeline_key(user_id: UUID) -> str:
+        return f"cinelog:feed:{user_id}"
+
+    async def read_timeline(
+        self,
+        user_id: UUID,
+        *,
+        cursor: TimestampUUIDCursor | None,
+        limit: int,
+    ) -> list[FeedEntry] | None:
+        """Return up to ``limit`` entries older than ``cursor``, or ``None`` when the timeline is not built."""
+
+        key = self.build_timeline_key(user_id)
+        max_score = None if cursor is None else _to_score(cursor.timestamp)
+        try:
+            members = await self._cache.zrevrangebyscore_if_exists(key, max_score, 0.0, limit)
+        except Exception:
+            logger.exception("Feed timeline read failed for key=%s", key)
+            return None
+        if members is None:
+            logger.debug("Cache miss for key=%s", key)
+            return None
+
+        logger.debug("Cache hit for key=%s", key)
+        if cursor is not None:
+            # Members tied with the cursor's timestamp come back too; keep only
+            # those after it in (score, id) order, which matches PostgreSQL's.
+            position = (_to_score(cursor.timestamp), str(cursor.id))
+            members = [(member, score) for member, score in members if (score, member) < position]
+        return [FeedEntry(log_id=UUID(member), created_at=_from_score(score)) for member, score in members[:limit]]
+
+    async def store_timeline(self, user_id: UUID, entries: Sequence[FeedEntry]) -> None:
+        """Replace a timeline with freshly read entries, marking it built even when empty."""
+
+        key = self.build_timeline_key(user_id)
+        mapping = {str(entry.log_id): _to_score(entry.created_at) for entry in entries}
+        mapping[TIMELINE_MARKER] = 0.0
+        try:
+            await self._cache.replace_sorted_set(key, mapping, FEED_TIMELINE_TTL)
+            logger.debug("Cache set for key=%s", key)
+        except Exception:
+            logger.exception("Feed timeline store failed for key=%s", key)
+
+    async def push_entry(self, user_ids: Sequence[UUID], entry: FeedEntry) -> None:
+        """Add one log to every built timeline among ``user_ids`` in a single pipeline."""
+
+        if not user_ids:
+            return
+        keys = [self.build_timeline_key(user_id) for user_id in user_ids]
+        try:
+            await self._cache.zadd_capped_if_exists_many(
+                keys,
+                str(entry.log_id),
+                _to_score(entry.created_at),
+                FEED_TIMELINE_MAX_LENGTH,
+            )
+        except Exception:
+            logger.exception("Feed fan-out failed for log_id=%s to %d timelines", entry.log_id, len(keys))
+
+    async def invalidate_timelines(self, user_ids: Sequence[UUID]) -> None:
+        """Drop timelines so the next read rebuilds them from PostgreSQL."""
+
+        if not user_ids:
+            return
+        try:
+            await self._cache.delete_many([self.build_timeline_key(user_id) for user_id in user_ids])
+        except Exception:
+            logger.exception("Feed timeline invalidation failed for %d users", len(user_ids))
@@ -0,0 +1,157 @@
+"""Home feed of logs by followed users.
+
+Authors with at most ``FEED_FANOUT_MAX_FOLLOWERS`` followers are pushed: each
+new public log is written into their followers' built Redis timelines. Logs
+by authors above the threshold are pulled from PostgreSQL at read time and
+merged into the page, so one popular author never costs a write per
+follower. Timelines are dropped when what they should contain changes and
+rebuilt lazily on the next read.
+"""
+
+import logging
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from app.config.feed_config import FEED_FANOUT_MAX_FOLLOWERS, feed_cursor_scope
+from app.dependencies.repository_dependency import get_feed_repository
+from app.repository.feed_repository_protocol import FeedEntry, FeedLog, FeedRepositoryProtocol
+from app.schemas.feed_schemas import FeedAuthor, FeedItem, FeedRequest, FeedResponse
+from app.schemas.movie_schemas import MovieResponse
+from app.services.feed_cache_service import FEED_TIMELINE_MAX_LENGTH, FeedCacheService
+from app.types import TimestampUUIDCursor
+from app.utils.cursor_pagination_utils import decode_timestamp_uuid_cursor, encode_timestamp_uuid_cursor
+from app.utils.error_codes_utils import ErrorCodes
+from app.utils.exceptions_utils import AppException
+
+logger = logging.getLogger(__name__)
+
+
+class FeedService:
+    """Fan out new logs, invalidate timelines and serve feed pages."""
+
+    def __init__(
+        self,
+        feed_repository: FeedRepositoryProtocol | None = None,
+        feed_cache_service: FeedCacheService | None = None,
+    ):
+        self.feed_repository = feed_repository or get_feed_repository()
+        self.feed_cache_service = feed_cache_service or FeedCacheService()
+
+    async def publish_log(self, author_id: UUID, log_id: UUID, created_at: datetime) -> None:
+        """Push a new log to the author's followers; failures are logged, not raised."""
+
+        try:
+            audience = await self.feed_repository.get_audience(author_id, FEED_FANOUT_MAX_FOLLOWERS)
+        except Exception:
+            logger.exception("Feed audience lookup failed for author_id=%s", author_id)
+            return
+        if not audience.is_public or audience.follower_ids is None:
+            return
+        await self.feed_cache_service.push_entry(
+            audience.follower_ids,
+            FeedEntry(log_id=log_id, created_at=created_at),
+        )
+
+    async def invalidate_timeline(self, user_id: UUID) -> None:
+        """Rebuild a user's timeline on their next read, e.g. after they follow or unfollow someone."""
+
+        await self.feed_cache_service.invalidate_timelines([user_id])
+
+    async def invalidate_follower_timelines(self, author_id: UUID) -> None:
+        """Rebuild the timelines of an author's followers after the author's visibility changes.
+
+        Pulled authors are skipped: their logs are read live and already
+        filtered by visibility.
+        """
+
+        try:
+            audience = await self.feed_repository.get_audience(author_id, FEED_FANOUT_MAX_FOLLOWERS)
+        except Exception:
+            logger.exception("Feed audience lookup failed for author_id=%s", author_id)
+            return
+        if audience.follower_ids:
+            await self.feed_cache_service.invalidate_timelines(audience.follower_ids)
+
+    async def get_feed(self, user_id: UUID, request: FeedRequest) -> FeedResponse:
+        """Merge pushed and pulled entries newest first, then hydrate the page in one query."""
+
+        scope = feed_cursor_scope(user_id)
+        cursor = self._decode_cursor(request.cursor, scope)
+
+        pushed = await self._read_pushed_entries(user_id, cursor, request.limit + 1)
+        pulled = await self.feed_repository.list_pulled_entries(
+            user_id,
+            min_followers=FEED_FANOUT_MAX_FOLLOWERS,
+            limit=request.limit + 1,
+            cursor=cursor,
+        )
+        # An author who crossed the threshold can briefly appear in both.
+        merged = {entry.log_id: entry for entry in [*pushed, *pulled]}
+        entries = sorted(merged.values(), key=lambda entry: (entry.created_at, entry.log_id), reverse=True)
+        page = entries[: request.limit]
+
+        feed_logs = await self.feed_repository.get_feed_logs([entry.log_id for entry in page])
+        logs_by_id = {feed_log.log.id: feed_log for feed_log in feed_logs}
+
+        next_cursor = None
+        if len(entries) > request.limit:
+            last = page[-1]
+            next_cursor = encode_timestamp_uuid_cursor(
+                TimestampUUIDCursor(timestamp=last.created_at, id=last.log_id),
+                scope=scope,
+            )
+        return FeedResponse(
+            items=[self._to_item(logs_by_id[entry.log_id]) for entry in page if entry.log_id in logs_by_id],
+            next_cursor=next_cursor,
+        )
+
+    async def _read_pushed_entries(
+        self,
+        user_id: UUID,
+        cursor: TimestampUUIDCursor | None,
+        limit: int,
+    ) -> Sequence[FeedEntry]:
+        """Read the Redis timeline, rebuilding it from PostgreSQL when it is missing."""
+
+        entries = await self.feed_cache_service.read_timeline(user_id, cursor=cursor, limit=limit)
+        if entries is not None:
+            return entries
+
+        rebuilt = await self.feed_repository.list_timeline_entries(
+            user_id,
+            max_followers=FEED_FANOUT_MAX_FOLLOWERS,
+            limit=FEED_TIMELINE_MAX_LENGTH,
+        )
+        await self.feed_cache_service.store_timeline(user_id, rebuilt)
+        if cursor is not None:
+            rebuilt = [entry for entry in rebuilt if (entry.created_at, entry.log_id) < (cursor.timestamp, cursor.id)]
+        return rebuilt[:limit]
+
+    @staticmethod
+    def _decode_cursor(value: str | None, scope: str) -> TimestampUUIDCursor | None:
+        if value is None:
+            return None
+        try:
+            return decode_timestamp_uuid_cursor(value, expected_scope=scope)
+        except ValueError as exc:
+            raise AppException(ErrorCodes.INVALID_PAGINATION_CURSOR) from exc
+
+    @staticmethod
+    def _to_item(feed_log: FeedLog) -> FeedItem:
+        log = feed_log.log
+        return FeedItem(
+            id=log.id,
+            author=FeedAuthor(
+                handle=feed_log.author.handle,
+                first_name=feed_log.author.first_name,
+                last_name=feed_log.author.last_name,
+            ),
+            movie=MovieResponse.model_validate(feed_log.movie),
+            tmdb_id=log.tmdb_id,
+            date_watched=log.date_watched,
+            viewing_notes=log.viewing_notes,
+            poster_path=log.poster_path,
+            watched_where=log.watched_where,
+            created_at=log.created_at,
+        )
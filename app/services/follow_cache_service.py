@@ -0,0 +1,70 @@
+import logging
+import os
+from collections.abc import Sequence
+from uuid import UUID
+
+from app.services.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+FOLLOWING_SET_TTL = int(os.getenv("FOLLOWING_SET_TTL", "3600"))
+
+# Member that keeps a built set present while the user follows nobody.
+FOLLOWING_SET_MARKER = "built"
+
+
+class FollowCacheService:
+    """Per-user Redis sets of the user IDs each user follows.
+
+    A set is built from PostgreSQL on a miss and then kept current by follow
+    and unfollow writes. A follow never creates a missing set and neither
+    write refreshes its TTL, so a set that missed an update is rebuilt within
+    one TTL. Redis failures are logged and treated as misses.
+    """
+
+    @property
+    def _cache(self) -> CacheService:
+        return CacheService.get_instance()
+
+    @staticmethod
+    def build_following_key(user_id: UUID) -> str:
+        return f"cinelog:follows:following:{user_id}"
+
+    async def get_following_flags(self, user_id: UUID, candidate_ids: Sequence[UUID]) -> list[bool] | None:
+        """Return whether ``user_id`` follows each candidate, or ``None`` when the set is not built."""
+
+        if not candidate_ids:
+            return []
+        key = self.build_following_key(user_id)
+        try:
+            flags = await self._cache.smismember_if_exists(key, [str(candidate_id) for candidate_id in candidate_ids])
+        except Exception:
+            logger.exception("Following set read failed for key=%s", key)
+            return None
+        logger.debug("Cache %s for key=%s", "miss" if flags is None else "hit", key)
+        return flags
+
+    async def store_following(self, user_id: UUID, followed_ids: Sequence[UUID]) -> None:
+        """Replace the set with freshly read IDs, marking it built even when empty."""
+
+        key = self.build_following_key(user_id)
+        members = [FOLLOWING_SET_MARKER, *(str(followed_id) for followed_id in followed_ids)]
+        try:
+            await self._cache.replace_set(key, members, FOLLOWING_SET_TTL)
+            logger.debug("Cache set for key=%s", key)
+        except Exception:
+            logger.exception("Following set store failed for key=%s", key)
+
+    async def record_follow(self, user_id: UUID, followed_id: UUID) -> None:
+        key = self.build_following_key(user_id)
+        try:
+            await self._cache.sadd_if_exists(key, str(followed_id))
+        except Exception:
+            logger.exception("Following set update failed for key=%s", key)
+
+    async def record_unfollow(self, user_id: UUID, followed_id: UUID) -> None:
+        key = self.build_following_key(user_id)
+        try:
+            await self._cache.srem(key, str(followed_id))
+        except Exception:
+            logger.exception("Following set update failed for key=%s", key)
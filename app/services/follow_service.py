@@ -1,9 +1,26 @@
 """Business rules for basic public-profile following."""
 
+from collections.abc import Sequence
 from uuid import UUID
 
-from app.repository.follow_repository_protocol import FollowRepositoryProtocol
+from app.config.follow_config import followers_cursor_scope, following_cursor_scope
+from app.models.user_model import User
+from app.repository.follow_repository_protocol import FollowPage, FollowRepositoryProtocol
 from app.repository.user_repository_protocol import UserRepositoryProtocol
+from app.schemas.movie_schemas import MAX_MOVIE_FRIENDS, MovieFriend, MovieFriendsResponse
+from app.schemas.user_schemas import (
+    FollowListRequest,
+    FollowListResponse,
+    FollowUserSummary,
+    RelationshipsRequest,
+    RelationshipsResponse,
+    UserRelationship,
+)
+from app.services.feed_service import FeedService
+from app.services.follow_cache_service import FollowCacheService
+from app.services.movie_friends_cache_service import MovieFriendsCacheService
+from app.types import TimestampUUIDCursor
+from app.utils.cursor_pagination_utils import decode_timestamp_uuid_cursor, encode_timestamp_uuid_cursor
 from app.utils.error_codes_utils import ErrorCodes
 from app.utils.exceptions_utils import AppException
 
@@ -15,9 +32,15 @@ class FollowService:
         self,
         user_repository: UserRepositoryProtocol,
         follow_repository: FollowRepositoryProtocol,
+        feed_service: FeedService | None = None,
+        follow_cache_service: FollowCacheService | None = None,
+        movie_friends_cache_service: MovieFriendsCacheService | None = None,
     ):
         self.user_repository = user_repository
         self.follow_repository = follow_repository
+        self.feed_service = feed_service or FeedService()
+        self.follow_cache_service = follow_cache_service or FollowCacheService()
+        self.movie_friends_cache_service = movie_friends_cache_service or MovieFriendsCacheService()
 
     async def follow_user(self, follower_id: UUID, handle: str) -> None:
         """Follow an active public target, or keep an existing edge unchanged."""
@@ -40,6 +63,9 @@ class FollowService:
             raise AppException(ErrorCodes.PROFILE_NOT_PUBLIC)
 
         await self.follow_repository.create_follow(follower.id, target.id)
+        await self.follow_cache_service.record_follow(follower.id, target.id)
+        await self.movie_friends_cache_service.invalidate_user(follower.id)
+        await self.feed_service.invalidate_timeline(follower.id)
 
     async def unfollow_user(self, follower_id: UUID, handle: str) -> None:
         """Unfollow an active target regardless of its current visibility."""
@@ -53,3 +79,139 @@ class FollowService:
             raise AppException(ErrorCodes.USER_NOT_FOUND)
 
         await self.follow_repository.delete_follow(follower.id, target.id)
+        await self.follow_cache_service.record_unfollow(follower.id, target.id)
+        await self.movie_friends_cache_service.invalidate_user(follower.id)
+        await self.feed_service.invalidate_timeline(follower.id)
+
+    async def get_following_flags(self, follower_id: UUID, user_ids: Sequence[UUID]) -> dict[UUID, bool]:
+        """Return whether ``follower_id`` follows each user, from the cached following set when it is built.
+
+        A miss reads every followed ID from the edge primary key once and
+        builds the set, so the next lookup for any list of users is Redis only.
+        """
+
+        if not user_ids:
+            return {}
+        flags = await self.follow_cache_service.get_following_flags(follower_id, user_ids)
+        if flags is not None:
+            return dict(zip(user_ids, flags, strict=True))
+
+        followed_ids = await self.follow_repository.list_following_ids(follower_id)
+        await self.follow_cache_service.store_following(follower_id, followed_ids)
+        followed = set(followed_ids)
+        return {user_id: user_id in followed for user_id in user_ids}
+
+    async def get_relationships(self, requester_id: UUID, request: RelationshipsRequest) -> RelationshipsResponse:
+        """Resolve up to ``MAX_RELATIONSHIP_LOOKUP`` users and the requester's follow state for each."""
+
+        users = await self.user_repository.find_users_by_ids_or_handles(request.user_ids, request.handles)
+
+        requested: list[UUID | str] = [*request.user_ids, *(handle.lower() for handle in request.handles)]
+        positions: dict[UUID | str, int] = {}
+        for position, key in enumerate(requested):
+            positions.setdefault(key, position)
+        users = sorted(
+            users,
+            key=lambda user: min(
+                positions.get(user.id, len(positions)),
+                positions.get(user.handle.lower(), len(positions)),
+            ),
+        )
+
+        flags = await self.get_following_flags(requester_id, [user.id for user in users])
+        return RelationshipsResponse(
+            relationships=[
+                UserRelationship(user_id=user.id, handle=user.handle, is_following=flags[user.id]) for user in users
+            ]
+        )
+
+    async def get_movie_friends(self, requester_id: UUID, tmdb_id: int) -> MovieFriendsResponse:
+        """List the public users the requester follows who logged or rated a movie, cached per requester and movie."""
+
+        lookup = await self.movie_friends_cache_service.get_friends(requester_id, tmdb_id)
+        if lookup is not None and lookup.response is not None:
+            return lookup.response
+
+        page = await self.follow_repository.list_friend_movie_activity(requester_id, tmdb_id, limit=MAX_MOVIE_FRIENDS)
+        response = MovieFriendsResponse(
+            friends=[
+                MovieFriend(
+                    handle=item.user.handle,
+                    first_name=item.user.first_name,
+                    last_name=item.user.last_name,
+                    last_watched_at=item.last_watched_at,
+                    log_count=item.log_count,
+                    rating=item.rating,
+                )
+                for item in page.items
+            ],
+            total_count=page.total_count,
+        )
+        if lookup is not None:
+            await self.movie_friends_cache_service.store_friends(requester_id, tmdb_id, lookup, response)
+        return response
+
+    async def list_followers(self, handle: str, requester_id: UUID, request: FollowListRequest) -> FollowListResponse:
+        """Page through the active users following a visible profile."""
+
+        user = await self._find_listable_user(handle, requester_id)
+        scope = followers_cursor_scope(user.id)
+        page = await self.follow_repository.list_followers(
+            user.id,
+            limit=request.limit,
+            cursor=self._decode_cursor(request.cursor, scope),
+        )
+        return self._to_list_response(page, scope)
+
+    async def list_following(self, handle: str, requester_id: UUID, request: FollowListRequest) -> FollowListResponse:
+        """Page through the active users a visible profile follows."""
+
+        user = await self._find_listable_user(handle, requester_id)
+        scope = following_cursor_scope(user.id)
+        page = await self.follow_repository.list_following(
+            user.id,
+            limit=request.limit,
+            cursor=self._decode_cursor(request.cursor, scope),
+        )
+        return self._to_list_response(page, scope)
+
+    async def _find_listable_user(self, handle: str, requester_id: UUID) -> User:
+        """Resolve a profile whose relationships the requester may see, as for its movie logs."""
+
+        user: User | None = await self.user_repository.find_user_by_handle(handle.strip())
+        if user is None:
+            raise AppException(ErrorCodes.USER_NOT_FOUND)
+        if user.id != requester_id and user.profile_visibility != "public":
+            raise AppException(ErrorCodes.PROFILE_NOT_PUBLIC)
+        return user
+
+    @staticmethod
+    def _decode_cursor(value: str | None, scope: str) -> TimestampUUIDCursor | None:
+        if value is None:
+            return None
+        try:
+            return decode_timestamp_uuid_cursor(value, expected_scope=scope)
+        except ValueError as exc:
+            raise AppException(ErrorCodes.INVALID_PAGINATION_CURSOR) from exc
+
+    @staticmethod
+    def _to_list_response(page: FollowPage, scope: str) -> FollowListResponse:
+        next_cursor = None
+        if page.has_more and page.items:
+            last = page.items[-1]
+            next_cursor = encode_timestamp_uuid_cursor(
+                TimestampUUIDCursor(timestamp=last.followed_at, id=last.user.id),
+                scope=scope,
+            )
+        return FollowListResponse(
+            items=[
+                FollowUserSummary(
+                    handle=item.user.handle,
+                    first_name=item.user.first_name,
+                    last_name=item.user.last_name,
+                    followed_at=item.followed_at,
+                )
+                for item in page.items
+            ],
+            next_cursor=next_cursor,
+        )
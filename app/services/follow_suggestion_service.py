@@ -0,0 +1,83 @@
+"""Friends-of-friends follow suggestions, computed offline and served from PostgreSQL."""
+
+import logging
+import os
+from datetime import UTC, datetime
+from uuid import UUID
+
+from app.dependencies.repository_dependency import get_follow_suggestion_repository
+from app.repository.follow_suggestion_repository_protocol import (
+    FollowSuggestionRepositoryProtocol,
+    FollowSuggestionsRunResult,
+    ScoredSuggestion,
+)
+from app.schemas.user_schemas import FollowSuggestion, FollowSuggestionsRequest, FollowSuggestionsResponse
+from app.utils.follow_graph_utils import suggest_friends_of_friends
+
+logger = logging.getLogger(__name__)
+
+# Stored per user; more than the endpoint returns so users followed since the
+# last run can be skipped without leaving the list short.
+FOLLOW_SUGGESTIONS_TOP_K = int(os.getenv("FOLLOW_SUGGESTIONS_TOP_K", "50"))
+
+
+class FollowSuggestionService:
+    """Score second-degree follows in a batch job and serve the stored ranking."""
+
+    def __init__(self, follow_suggestion_repository: FollowSuggestionRepositoryProtocol | None = None):
+        self.follow_suggestion_repository = follow_suggestion_repository or get_follow_suggestion_repository()
+
+    async def compute_suggestions(self, *, top_k: int, batch_size: int) -> FollowSuggestionsRunResult:
+        """Rebuild every user's suggestions from one in-memory copy of the follow graph.
+
+        Users are scored and written ``batch_size`` at a time, each batch in
+        its own transaction. Rows from earlier runs that were not rewritten,
+        for users who now have no suggestions, are deleted at the end.
+        """
+
+        if top_k < 1 or batch_size < 1:
+            raise ValueError("top_k and batch_size must be positive")
+
+        computed_at = datetime.now(UTC)
+        graph = await self.follow_suggestion_repository.load_follow_graph(batch_size=batch_size)
+        logger.info("Loaded follow graph: users=%d edges=%d", graph.size, len(graph.targets))
+
+        users_scored = 0
+        written = 0
+        batch: dict[UUID, list[ScoredSuggestion]] = {}
+        for node in range(graph.size):
+            ranked = suggest_friends_of_friends(graph, node, top_k)
+            if not ranked:
+                continue
+            users_scored += 1
+            batch[graph.user_ids[node]] = [
+                ScoredSuggestion(suggested_user_id=graph.user_ids[candidate], mutual_count=mutual_count)
+                for candidate, mutual_count in ranked
+            ]
+            if len(batch) >= batch_size:
+                written += await self.follow_suggestion_repository.replace_suggestions(batch, computed_at)
+                batch = {}
+        written += await self.follow_suggestion_repository.replace_suggestions(batch, computed_at)
+
+        stale = await self.follow_suggestion_repository.delete_suggestions_computed_before(computed_at)
+        return FollowSuggestionsRunResult(
+            users_scored=users_scored,
+            suggestions_written=written,
+            stale_rows_deleted=stale,
+        )
+
+    async def get_suggestions(self, user_id: UUID, request: FollowSuggestionsRequest) -> FollowSuggestionsResponse:
+        """Return the user's stored suggestions that are still public, active, and not yet followed."""
+
+        items = await self.follow_suggestion_repository.list_suggestions(user_id, limit=request.limit)
+        return FollowSuggestionsResponse(
+            suggestions=[
+                FollowSuggestion(
+                    handle=item.user.handle,
+                    first_name=item.user.first_name,
+                    last_name=item.user.last_name,
+                    mutual_count=item.mutual_count,
+                )
+                for item in items
+            ]
+        )
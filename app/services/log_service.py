@@ -20,8 +20,12 @@ from app.schemas.log_schemas import (
     LogUpdateRequest,
 )
 from app.schemas.movie_schemas import MovieResponse
+from app.services.feed_service import FeedService
+from app.services.movie_friends_cache_service import MovieFriendsCacheService
 from app.services.movie_service import MovieService
+from app.services.movie_stats_cache_service import MovieStatsCacheService
 from app.services.stats_cache_service import StatsCacheService
+from app.services.trending_cache_service import TrendingCacheService
 from app.utils.error_codes_utils import ErrorCodes
 from app.utils.exceptions_utils import AppException
 
@@ -37,6 +41,10 @@ class LogService:
         movie_rating_repository: MovieRatingRepositoryProtocol | None = None,
         stats_cache_service: StatsCacheService | None = None,
         user_repository: UserRepositoryProtocol | None = None,
+        movie_stats_cache_service: MovieStatsCacheService | None = None,
+        trending_cache_service: TrendingCacheService | None = None,
+        feed_service: FeedService | None = None,
+        movie_friends_cache_service: MovieFriendsCacheService | None = None,
     ):
         self.log_repository = log_repository or get_log_repository()
         resolved_movie_repository = movie_repository or get_movie_repository()
@@ -48,6 +56,10 @@ class LogService:
         self.movie_repository = resolved_movie_repository
         self.stats_cache_service = stats_cache_service or StatsCacheService()
         self.user_repository = user_repository or get_user_repository()
+        self.movie_stats_cache_service = movie_stats_cache_service or MovieStatsCacheService()
+        self.trending_cache_service = trending_cache_service or TrendingCacheService()
+        self.feed_service = feed_service or FeedService()
+        self.movie_friends_cache_service = movie_friends_cache_service or MovieFriendsCacheService()
 
     def _map_movie_to_response(self, movie: Movie) -> MovieResponse:
         return MovieResponse(
@@ -81,6 +93,10 @@ class LogService:
         log = await self.log_repository.create_log(user_id=user_id, create_log_request=request)
 
         await self.stats_cache_service.invalidate_user_stats(user_id)
+        await self.movie_stats_cache_service.invalidate_movie_stats(log.tmdb_id)
+        await self.trending_cache_service.record_log_created(log.tmdb_id, log.created_at)
+        await self.movie_friends_cache_service.invalidate_movie(log.tmdb_id)
+        await self.feed_service.publish_log(user_id, log.id, log.created_at)
 
         return LogCreateResponse(
             id=str(log.id),
@@ -110,6 +126,7 @@ class LogService:
             raise AppException(ErrorCodes.MOVIE_NOT_FOUND)
 
         await self.stats_cache_service.invalidate_user_stats(user_id)
+        await self.movie_friends_cache_service.invalidate_movie(log.tmdb_id)
 
         return LogCreateResponse(
             id=str(log.id),
@@ -129,6 +146,9 @@ class LogService:
             raise AppException(ErrorCodes.LOG_NOT_FOUND)
 
         await self.stats_cache_service.invalidate_user_stats(user_id)
+        await self.movie_stats_cache_service.invalidate_movie_stats(deleted_log.tmdb_id)
+        await self.trending_cache_service.record_log_deleted(deleted_log.tmdb_id, deleted_log.created_at)
+        await self.movie_friends_cache_service.invalidate_movie(deleted_log.tmdb_id)
 
     async def get_user_logs(self, user_id: UUID, request: LogListRequest) -> LogListResponse:
         """Get list of user's viewing logs with optional filtering and sorting."""
@@ -0,0 +1,113 @@
+import logging
+import os
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+
+from app.schemas.cache_schemas import CachedMovieFriends
+from app.schemas.movie_schemas import MovieFriendsResponse
+from app.services.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+MOVIE_FRIENDS_CACHE_TTL = int(os.getenv("MOVIE_FRIENDS_CACHE_TTL", "300"))
+
+
+@dataclass(frozen=True)
+class MovieFriendsLookup:
+    """A cache read: the response when still valid, and the versions a rebuilt response must be stored under."""
+
+    response: MovieFriendsResponse | None
+    movie_version: str | None
+    user_version: str | None
+
+
+class MovieFriendsCacheService:
+    """Per-(requester, movie) friends-activity responses with version-token invalidation.
+
+    Each entry records the movie's and the requester's version tokens it was
+    read under. A log or rating write replaces the movie's token and a follow
+    change replaces the requester's, which orphans every affected entry in
+    one command instead of finding and deleting them. Tokens are random, so a
+    reissued token never matches an older entry, and they expire with the
+    entries they guard. Redis failures are logged and treated as misses.
+    """
+
+    @property
+    def _cache(self) -> CacheService:
+        return CacheService.get_instance()
+
+    @staticmethod
+    def build_entry_key(user_id: UUID, tmdb_id: int) -> str:
+        return f"cinelog:movie-friends:{user_id}:{tmdb_id}"
+
+    @staticmethod
+    def build_movie_version_key(tmdb_id: int) -> str:
+        return f"cinelog:movie-friends:version:movie:{tmdb_id}"
+
+    @staticmethod
+    def build_user_version_key(user_id: UUID) -> str:
+        return f"cinelog:movie-friends:version:user:{user_id}"
+
+    async def get_friends(self, user_id: UUID, tmdb_id: int) -> MovieFriendsLookup | None:
+        """Read the entry and both version tokens in one round trip; ``None`` when Redis is unavailable."""
+
+        key = self.build_entry_key(user_id, tmdb_id)
+        try:
+            raw_entry, movie_version, user_version = await self._cache.get_str_many(
+                [key, self.build_movie_version_key(tmdb_id), self.build_user_version_key(user_id)]
+            )
+        except Exception:
+            logger.exception("Movie friends cache read failed for key=%s", key)
+            return None
+
+        response = None
+        if raw_entry is not None:
+            try:
+                entry = CachedMovieFriends.model_validate_json(raw_entry)
+            except ValidationError:
+                logger.warning("Discarding unreadable movie friends entry for key=%s", key)
+            else:
+                if entry.movie_version == movie_version and entry.user_version == user_version:
+                    response = entry.response
+        logger.debug("Cache %s for key=%s", "miss" if response is None else "hit", key)
+        return MovieFriendsLookup(response=response, movie_version=movie_version, user_version=user_version)
+
+    async def store_friends(
+        self,
+        user_id: UUID,
+        tmdb_id: int,
+        lookup: MovieFriendsLookup,
+        response: MovieFriendsResponse,
+    ) -> None:
+        """Store a response read after ``lookup``, so a write that raced the read leaves it stale."""
+
+        key = self.build_entry_key(user_id, tmdb_id)
+        entry = CachedMovieFriends(
+            movie_version=lookup.movie_version,
+            user_version=lookup.user_version,
+            response=response,
+        )
+        try:
+            await self._cache.set_str(key, entry.model_dump_json(), MOVIE_FRIENDS_CACHE_TTL)
+            logger.debug("Cache set for key=%s", key)
+        except Exception:
+            logger.exception("Movie friends cache store failed for key=%s", key)
+
+    async def invalidate_movie(self, tmdb_id: int) -> None:
+        """Orphan every requester's entry for a movie after one of its logs or ratings changes."""
+
+        await self._replace_version(self.build_movie_version_key(tmdb_id))
+
+    async def invalidate_user(self, user_id: UUID) -> None:
+        """Orphan every movie entry for a requester after they follow or unfollow someone."""
+
+        await self._replace_version(self.build_user_version_key(user_id))
+
+    async def _replace_version(self, key: str) -> None:
+        try:
+            await self._cache.set_str(key, uuid4().hex, MOVIE_FRIENDS_CACHE_TTL)
+            logger.debug("Cache version replaced for key=%s", key)
+        except Exception:
+            logger.exception("Movie friends version update failed for key=%s", key)
@@ -2,7 +2,9 @@ from uuid import UUID
 
 from app.repository.movie_rating_repository_protocol import MovieRatingRepositoryProtocol
 from app.schemas.movie_rating_schemas import MovieRatingResponse
+from app.services.movie_friends_cache_service import MovieFriendsCacheService
 from app.services.movie_service import MovieService
+from app.services.movie_stats_cache_service import MovieStatsCacheService
 from app.services.stats_cache_service import StatsCacheService
 from app.utils.error_codes_utils import ErrorCodes
 from app.utils.exceptions_utils import AppException
@@ -14,10 +16,14 @@ class MovieRatingService:
         movie_rating_repository: MovieRatingRepositoryProtocol,
         movie_service: MovieService,
         stats_cache_service: StatsCacheService | None = None,
+        movie_stats_cache_service: MovieStatsCacheService | None = None,
+        movie_friends_cache_service: MovieFriendsCacheService | None = None,
     ):
         self.movie_rating_repository = movie_rating_repository
         self.movie_service = movie_service
         self.stats_cache_service = stats_cache_service or StatsCacheService()
+        self.movie_stats_cache_service = movie_stats_cache_service or MovieStatsCacheService()
+        self.movie_friends_cache_service = movie_friends_cache_service or MovieFriendsCacheService()
 
     async def create_update_movie_rating(
         self,
@@ -41,6 +47,8 @@ class MovieRatingService:
         )
 
         await self.stats_cache_service.invalidate_user_stats(user_id)
+        await self.movie_stats_cache_service.invalidate_movie_stats(tmdb_id)
+        await self.movie_friends_cache_service.invalidate_movie(tmdb_id)
 
         return self._get_movie_rating_response(movie_rating)
 
@@ -0,0 +1,39 @@
+import logging
+import os
+
+from app.schemas.movie_schemas import MovieStats
+from app.services.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+MOVIE_STATS_CACHE_TTL = int(os.getenv("MOVIE_STATS_CACHE_TTL", "300"))
+
+
+class MovieStatsCacheService:
+    @property
+    def _cache(self) -> CacheService:
+        return CacheService.get_instance()
+
+    @staticmethod
+    def build_key(tmdb_id: int) -> str:
+        return f"cinelog:movie-stats:{tmdb_id}"
+
+    async def get_movie_stats(self, tmdb_id: int) -> MovieStats | None:
+        key = self.build_key(tmdb_id)
+        data = await self._cache.get(key)
+        if data is None:
+            logger.debug("Cache miss for key=%s", key)
+            return None
+        logger.debug("Cache hit for key=%s", key)
+        return MovieStats.model_validate(data)
+
+    async def set_movie_stats(self, tmdb_id: int, stats: MovieStats) -> None:
+        key = self.build_key(tmdb_id)
+        await self._cache.set(key, stats.model_dump(mode="json"), ttl=MOVIE_STATS_CACHE_TTL)
+        logger.debug("Cache set for key=%s", key)
+
+    async def invalidate_movie_stats(self, *tmdb_ids: int) -> None:
+        if not tmdb_ids:
+            return
+        await self._cache.delete_many([self.build_key(tmdb_id) for tmdb_id in tmdb_ids])
+        logger.debug("Cache invalidated for tmdb_ids=%s", tmdb_ids)
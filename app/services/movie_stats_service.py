@@ -0,0 +1,46 @@
+from app.dependencies.repository_dependency import get_movie_stats_repository
+from app.models.movie_community_stats_model import MovieCommunityStats
+from app.repository.movie_stats_repository_protocol import MovieStatsReconcileResult, MovieStatsRepositoryProtocol
+from app.schemas.movie_schemas import MovieStats
+from app.services.movie_stats_cache_service import MovieStatsCacheService
+
+
+class MovieStatsService:
+    """Serve cached community counters for movie pages and reconcile them on schedule."""
+
+    def __init__(
+        self,
+        movie_stats_repository: MovieStatsRepositoryProtocol | None = None,
+        movie_stats_cache_service: MovieStatsCacheService | None = None,
+    ):
+        self.movie_stats_repository = movie_stats_repository or get_movie_stats_repository()
+        self.movie_stats_cache_service = movie_stats_cache_service or MovieStatsCacheService()
+
+    async def get_movie_stats(self, tmdb_id: int) -> MovieStats:
+        cached = await self.movie_stats_cache_service.get_movie_stats(tmdb_id)
+        if cached is not None:
+            return cached
+
+        counters = await self.movie_stats_repository.find_movie_stats_by_tmdb_id(tmdb_id)
+        stats = self._map_counters_to_stats(counters) if counters is not None else MovieStats()
+
+        await self.movie_stats_cache_service.set_movie_stats(tmdb_id, stats)
+        return stats
+
+    async def reconcile_movie_stats(self, batch_size: int = 500) -> MovieStatsReconcileResult:
+        """Repair counter drift and drop cached stats for every movie that changed."""
+
+        result = await self.movie_stats_repository.reconcile_movie_stats(batch_size=batch_size)
+        await self.movie_stats_cache_service.invalidate_movie_stats(*result.corrected_tmdb_ids)
+        return result
+
+    @staticmethod
+    def _map_counters_to_stats(counters: MovieCommunityStats) -> MovieStats:
+        rating_average = round(counters.rating_sum / counters.rating_count, 2) if counters.rating_count else None
+        return MovieStats(
+            log_count=counters.log_count,
+            watcher_count=counters.watcher_count,
+            rating_count=counters.rating_count,
+            rating_average=rating_average,
+            rating_histogram=counters.rating_histogram,
+        )
@@ -0,0 +1,76 @@
+import logging
+import os
+from uuid import UUID
+
+from app.services.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_UNREAD_COUNT_TTL = int(os.getenv("NOTIFICATION_UNREAD_COUNT_TTL", "900"))
+
+
+class NotificationCacheService:
+    """Per-recipient unread notification counters kept in Redis.
+
+    Counters are seeded from PostgreSQL on a miss and then adjusted in place.
+    Adjustments never create a missing key and never refresh its TTL, so a
+    counter that drifted through a lost update is rebuilt within one TTL.
+    Redis failures are logged and treated as misses; PostgreSQL stays the
+    source of truth.
+    """
+
+    @property
+    def _cache(self) -> CacheService:
+        return CacheService.get_instance()
+
+    @staticmethod
+    def build_unread_count_key(recipient_id: UUID) -> str:
+        return f"cinelog:notifications:unread:{recipient_id}"
+
+    async def get_unread_count(self, recipient_id: UUID) -> int | None:
+        key = self.build_unread_count_key(recipient_id)
+        try:
+            count = await self._cache.get_int(key)
+        except Exception:
+            logger.exception("Unread counter read failed for key=%s", key)
+            return None
+        if count is None:
+            logger.debug("Cache miss for key=%s", key)
+            return None
+        logger.debug("Cache hit for key=%s", key)
+        return count
+
+    async def seed_unread_count(self, recipient_id: UUID, count: int) -> None:
+        """Store a freshly counted value unless a counter already exists."""
+
+        key = self.build_unread_count_key(recipient_id)
+        try:
+            await self._cache.set_int_if_absent(key, count, NOTIFICATION_UNREAD_COUNT_TTL)
+            logger.debug("Cache set for key=%s", key)
+        except Exception:
+            logger.exception("Unread counter seed failed for key=%s", key)
+
+    async def increment_unread_counts(self, recipient_ids: list[UUID]) -> dict[UUID, int | None]:
+        """Add one to each cached counter in a single pipeline; uncached recipients map to ``None``."""
+
+        if not recipient_ids:
+            return {}
+        keys = [self.build_unread_count_key(recipient_id) for recipient_id in recipient_ids]
+        try:
+            counts = await self._cache.incrby_if_exists_many(keys, 1)
+        except Exception:
+            logger.exception("Unread counter batch update failed for %d recipients", len(recipient_ids))
+            return dict.fromkeys(recipient_ids)
+        return dict(zip(recipient_ids, counts, strict=True))
+
+    async def adjust_unread_count(self, recipient_id: UUID, delta: int) -> int | None:
+        """Apply ``delta`` to a cached counter, returning the new value or ``None`` when not cached."""
+
+        if not delta:
+            return await self.get_unread_count(recipient_id)
+        key = self.build_unread_count_key(recipient_id)
+        try:
+            return await self._cache.incrby_if_exists(key, delta)
+        except Exception:
+            logger.exception("Unread counter update failed for key=%s", key)
+            return None
@@ -0,0 +1,52 @@
+"""Redis list used to hand follower fan-out work to the background worker.
+
+Request handlers enqueue one small job per announcement; the worker pops jobs
+with BLPOP and writes the notifications in follower-ordered batches. A job that
+fails is pushed back with its attempt count; retries are safe because every
+fan-out carries a deduplication key and already-written rows are skipped.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+
+from app.schemas.notification_schemas import NotificationFanOutData
+from app.services.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_FANOUT_QUEUE_KEY = "cinelog:notifications:fanout"
+
+
+@dataclass(frozen=True)
+class NotificationFanOutJob:
+    """One queued fan-out together with how many times it has been attempted."""
+
+    data: NotificationFanOutData
+    attempt: int = 1
+
+
+class NotificationFanOutQueue:
+    @property
+    def _cache(self) -> CacheService:
+        return CacheService.get_instance()
+
+    async def enqueue(self, job: NotificationFanOutJob) -> None:
+        message = json.dumps({"attempt": job.attempt, "data": job.data.model_dump(mode="json", by_alias=True)})
+        await self._cache.rpush(NOTIFICATION_FANOUT_QUEUE_KEY, message)
+
+    async def dequeue(self, timeout: int) -> NotificationFanOutJob | None:
+        """Wait up to ``timeout`` seconds for a job; malformed payloads are logged and dropped."""
+
+        message = await self._cache.blpop(NOTIFICATION_FANOUT_QUEUE_KEY, timeout)
+        if message is None:
+            return None
+        try:
+            payload = json.loads(message)
+            return NotificationFanOutJob(
+                data=NotificationFanOutData.model_validate(payload["data"]),
+                attempt=int(payload["attempt"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Dropping malformed notification fan-out job")
+            return None
@@ -1,30 +1,54 @@
 """Business logic for the generic in-app notification inbox."""
 
-from collections.abc import Sequence
+import os
+from collections.abc import AsyncIterator, Sequence
+from datetime import timedelta
 from uuid import UUID
 
-from app.config.notification_config import notification_list_cursor_scope
+from app.config.notification_config import (
+    notification_list_cursor_scope,
+    notification_stream_cursor_scope,
+)
 from app.dependencies.repository_dependency import get_notification_repository
 from app.models.notification_model import Notification
+from app.models.user_model import User
 from app.repository.notification_repository_protocol import (
     NotificationCreateResult,
+    NotificationFanOutResult,
     NotificationRepositoryProtocol,
+    NotificationRetentionResult,
 )
 from app.schemas.notification_schemas import (
     BasicUserSummary,
     MarkAllNotificationsReadResponse,
     NotificationBaseResponse,
     NotificationCreateData,
+    NotificationFanOutData,
     NotificationListRequest,
     NotificationListResponse,
+    NotificationUnreadCountResponse,
+)
+from app.services.notification_cache_service import NotificationCacheService
+from app.services.notification_fanout_queue import NotificationFanOutJob, NotificationFanOutQueue
+from app.services.notification_stream_service import (
+    NOTIFICATION_STREAM_HEARTBEAT_SECONDS,
+    NOTIFICATION_STREAM_REPLAY_LIMIT,
+    NotificationStreamEvent,
+    NotificationStreamHub,
+    NotificationSubscription,
 )
-from app.types import NotificationType, TimestampUUIDCursor
+from app.types import NotificationStreamEventType, NotificationType, TimestampUUIDCursor
 from app.utils.cursor_pagination_utils import (
     decode_timestamp_uuid_cursor,
     encode_timestamp_uuid_cursor,
 )
 from app.utils.error_codes_utils import ErrorCodes
 from app.utils.exceptions_utils import AppException
+from app.utils.sse_utils import format_sse_comment, format_sse_event, format_sse_retry
+
+STREAM_RETRY_MILLISECONDS = 3000
+NOTIFICATION_FANOUT_BATCH_SIZE = int(os.getenv("NOTIFICATION_FANOUT_BATCH_SIZE", "1000"))
+NOTIFICATION_ARCHIVE_AFTER_DAYS = int(os.getenv("NOTIFICATION_ARCHIVE_AFTER_DAYS", "90"))
 
 
 class NotificationService:
@@ -33,8 +57,14 @@ class NotificationService:
     def __init__(
         self,
         repository: NotificationRepositoryProtocol | None = None,
+        notification_cache_service: NotificationCacheService | None = None,
+        notification_stream_hub: NotificationStreamHub | None = None,
+        notification_fanout_queue: NotificationFanOutQueue | None = None,
     ) -> None:
         self.repository = repository or get_notification_repository()
+        self.notification_cache_service = notification_cache_service or NotificationCacheService()
+        self.notification_stream_hub = notification_stream_hub or NotificationStreamHub.get_instance()
+        self.notification_fanout_queue = notification_fanout_queue or NotificationFanOutQueue()
 
     @staticmethod
     def _to_response(notification: Notification) -> NotificationBaseResponse:
@@ -43,11 +73,16 @@ class NotificationService:
         actor = notification.actor
         actor_summary = None
         if actor is not None and not actor.deleted:
-            actor_summary = BasicUserSummary(
-                handle=actor.handle,
-                first_name=actor.first_name,
-                last_name=actor.last_name,
-            )
+            actor_summary = NotificationService._to_user_summary(actor)
+
+        # The relationship loads sample actors in no particular order; the
+        # stored ID array keeps the most recent first.
+        sample_actors = {user.id: user for user in notification.sample_actors if not user.deleted}
+        sample_summaries = [
+            NotificationService._to_user_summary(sample_actors[actor_id])
+            for actor_id in notification.sample_actor_ids
+            if actor_id in sample_actors
+        ]
 
         return NotificationBaseResponse(
             id=notification.id,
@@ -55,37 +90,176 @@ class NotificationService:
             title=notification.title,
             body=notification.body,
             actor=actor_summary,
+            actor_count=notification.actor_count,
+            sample_actors=sample_summaries,
             available_actions=[],
             read_at=notification.read_at,
             created_at=notification.created_at,
         )
 
+    @staticmethod
+    def _to_user_summary(user: User) -> BasicUserSummary:
+        return BasicUserSummary(handle=user.handle, first_name=user.first_name, last_name=user.last_name)
+
     async def create_notification(self, data: NotificationCreateData) -> NotificationCreateResult:
         """Create a typed notification for use by future domain producers."""
 
-        return await self.repository.create_notification(data)
+        result = await self.repository.create_notification(data)
+        if result.created:
+            unread_count = await self._unread_count_after(
+                data.recipient_id,
+                await self.notification_cache_service.adjust_unread_count(data.recipient_id, 1),
+            )
+            await self.notification_stream_hub.publish(
+                data.recipient_id,
+                self._created_event(result.notification, data.recipient_id),
+                self._unread_count_event(unread_count),
+            )
+        elif result.aggregated:
+            await self.notification_stream_hub.publish(
+                data.recipient_id,
+                NotificationStreamEvent(
+                    type=NotificationStreamEventType.UPDATED,
+                    data=self._to_response(result.notification).model_dump(mode="json", by_alias=True),
+                ),
+            )
+        return result
+
+    async def enqueue_follower_fan_out(self, data: NotificationFanOutData) -> None:
+        """Queue a notification for every follower of ``data.actor_id`` without writing it inline.
+
+        No domain event fans out to followers yet; like ``create_notification``
+        this is the entry point for future producers, consumed by the
+        ``notification_fanout_worker`` job.
+        """
+
+        await self.notification_fanout_queue.enqueue(NotificationFanOutJob(data=data))
+
+    async def fan_out_to_followers(
+        self,
+        data: NotificationFanOutData,
+        *,
+        batch_size: int = NOTIFICATION_FANOUT_BATCH_SIZE,
+    ) -> NotificationFanOutResult:
+        """Write one notification per active follower in keyset-ordered batches.
+
+        Each batch is its own transaction, so a failure part way through leaves
+        earlier batches committed and a retry skips them via the deduplication
+        key. Unread counters and stream events are pushed once per batch.
+        """
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        batches = 0
+        created_count = 0
+        cursor: TimestampUUIDCursor | None = None
+        while True:
+            batch = await self.repository.create_follower_notifications_batch(data, after=cursor, limit=batch_size)
+            batches += 1
+            created_count += len(batch.notifications)
+            await self._announce_fan_out_batch(batch.notifications)
+            if batch.next_cursor is None:
+                return NotificationFanOutResult(batches=batches, created_count=created_count)
+            cursor = batch.next_cursor
+
+    async def apply_retention(
+        self,
+        *,
+        archive_after: timedelta = timedelta(days=NOTIFICATION_ARCHIVE_AFTER_DAYS),
+        batch_size: int = 1000,
+    ) -> NotificationRetentionResult:
+        """Archive old read notifications and purge soft-deleted ones, one short transaction per batch.
+
+        Neither step changes what a recipient sees: archived rows stay listable
+        and soft-deleted rows were already hidden, so counters and streams are
+        left alone.
+        """
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        archived_count = 0
+        while True:
+            moved = await self.repository.archive_read_notifications(older_than=archive_after, limit=batch_size)
+            archived_count += moved
+            if moved < batch_size:
+                break
+
+        purged_count = 0
+        while True:
+            purged = await self.repository.purge_deleted_notifications(limit=batch_size)
+            purged_count += purged
+            if purged < batch_size:
+                break
+
+        return NotificationRetentionResult(archived_count=archived_count, purged_count=purged_count)
+
+    async def _announce_fan_out_batch(self, notifications: Sequence[Notification]) -> None:
+        if not notifications:
+            return
+        unread_counts = await self.notification_cache_service.increment_unread_counts(
+            [notification.recipient_id for notification in notifications]
+        )
+        # A recipient without a cached counter gets no count event here; their
+        # next read rebuilds it, which avoids one COUNT query per follower.
+        events_by_recipient = []
+        for notification in notifications:
+            events = [self._created_event(notification, notification.recipient_id)]
+            unread_count = unread_counts.get(notification.recipient_id)
+            if unread_count is not None:
+                events.append(self._unread_count_event(unread_count))
+            events_by_recipient.append((notification.recipient_id, events))
+        await self.notification_stream_hub.publish_many(events_by_recipient)
+
+    async def count_unread_notifications(self, recipient_id: UUID) -> int:
+        """Return the recipient's unread count from Redis, rebuilding it from PostgreSQL on a miss."""
+
+        cached = await self.notification_cache_service.get_unread_count(recipient_id)
+        if cached is not None:
+            return cached
+
+        count = await self.repository.count_unread_notifications(recipient_id)
+        await self.notification_cache_service.seed_unread_count(recipient_id, count)
+        return count
+
+    async def get_unread_count(self, recipient_id: UUID) -> NotificationUnreadCountResponse:
+        """Return the badge count for the recipient's inbox."""
+
+        return NotificationUnreadCountResponse(unread_count=await self.count_unread_notifications(recipient_id))
 
     async def list_notifications(
         self,
         recipient_id: UUID,
         request: NotificationListRequest,
     ) -> NotificationListResponse[NotificationBaseResponse]:
-        """Return one stable inbox page without mutating read state."""
+        """Return one stable inbox page without mutating read state.
+
+        A cached unread count costs one Redis read; on a miss the page query
+        counts unread rows too, so either way the page is one database round trip.
+        """
 
         scope = notification_list_cursor_scope(recipient_id)
         cursor = self._decode_cursor(request.cursor, scope) if request.cursor is not None else None
+        unread_count = await self.notification_cache_service.get_unread_count(recipient_id)
         page = await self.repository.list_notifications(
             recipient_id,
             unread_only=request.unread_only,
             limit=request.limit,
             cursor=cursor,
+            count_unread=unread_count is None,
         )
+        if unread_count is None:
+            if page.unread_count is None:
+                raise RuntimeError("Notification page was not counted")
+            unread_count = page.unread_count
+            await self.notification_cache_service.seed_unread_count(recipient_id, unread_count)
         items = [self._to_response(notification) for notification in page.items]
         next_cursor = self._next_cursor(page.items, page.has_more, scope)
         return NotificationListResponse[NotificationBaseResponse](
             items=items,
             next_cursor=next_cursor,
-            unread_count=page.unread_count,
+            unread_count=unread_count,
         )
 
     async def mark_notification_read(
@@ -95,19 +269,135 @@ class NotificationService:
     ) -> NotificationBaseResponse:
         """Idempotently mark one owned notification read and return its persisted state."""
 
-        notification = await self.repository.mark_notification_read(notification_id, recipient_id)
-        if notification is None:
+        result = await self.repository.mark_notification_read(notification_id, recipient_id)
+        if result.notification is None:
             raise AppException(ErrorCodes.NOTIFICATION_NOT_FOUND)
 
-        return self._to_response(notification)
+        response = self._to_response(result.notification)
+        if result.updated:
+            unread_count = await self._unread_count_after(
+                recipient_id,
+                await self.notification_cache_service.adjust_unread_count(recipient_id, -1),
+            )
+            await self.notification_stream_hub.publish(
+                recipient_id,
+                NotificationStreamEvent(
+                    type=NotificationStreamEventType.READ,
+                    data=response.model_dump(mode="json", by_alias=True, include={"id", "read_at"}),
+                ),
+                self._unread_count_event(unread_count),
+            )
+        return response
 
     async def mark_all_notifications_read(self, recipient_id: UUID) -> MarkAllNotificationsReadResponse:
         """Mark all current active unread rows and return recipient-wide counts."""
 
         result = await self.repository.mark_all_notifications_read(recipient_id)
+        unread_count = await self._unread_count_after(
+            recipient_id,
+            await self.notification_cache_service.adjust_unread_count(recipient_id, -result.updated_count),
+        )
+        if result.updated_count:
+            await self.notification_stream_hub.publish(
+                recipient_id,
+                NotificationStreamEvent(
+                    type=NotificationStreamEventType.READ_ALL,
+                    data={"updatedCount": result.updated_count},
+                ),
+                self._unread_count_event(unread_count),
+            )
         return MarkAllNotificationsReadResponse(
             updated_count=result.updated_count,
-            unread_count=result.unread_count,
+            unread_count=unread_count,
+        )
+
+    async def open_notification_stream(
+        self,
+        recipient_id: UUID,
+        last_event_id: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Subscribe the recipient and return their SSE frames, replaying anything after ``last_event_id``.
+
+        The subscription is registered before the replay query runs so an event
+        committed in between is delivered live rather than lost. Validation and
+        replay happen before the first frame, so a rejected ID fails the request
+        instead of an already-started stream.
+        """
+
+        scope = notification_stream_cursor_scope(recipient_id)
+        cursor = self._decode_cursor(last_event_id, scope) if last_event_id else None
+        subscription = await self.notification_stream_hub.subscribe(recipient_id)
+        try:
+            replay = None
+            if cursor is not None:
+                replay = await self.repository.list_notifications_after(
+                    recipient_id,
+                    cursor=cursor,
+                    limit=NOTIFICATION_STREAM_REPLAY_LIMIT,
+                )
+            unread_count = await self.count_unread_notifications(recipient_id)
+        except BaseException:
+            self.notification_stream_hub.unsubscribe(subscription)
+            raise
+
+        initial: list[NotificationStreamEvent] = []
+        if replay is not None:
+            initial.extend(self._created_event(notification, recipient_id) for notification in replay.items)
+            if replay.has_more:
+                initial.append(NotificationStreamEvent(type=NotificationStreamEventType.RESYNC))
+        initial.append(self._unread_count_event(unread_count))
+        return self._stream_frames(subscription, initial)
+
+    async def _stream_frames(
+        self,
+        subscription: NotificationSubscription,
+        initial: list[NotificationStreamEvent],
+    ) -> AsyncIterator[str]:
+        replayed_ids = {event.id for event in initial if event.id is not None}
+        try:
+            yield format_sse_retry(STREAM_RETRY_MILLISECONDS)
+            for event in initial:
+                yield self._format_event(event)
+
+            while True:
+                try:
+                    queued = await subscription.next_event(NOTIFICATION_STREAM_HEARTBEAT_SECONDS)
+                except TimeoutError:
+                    yield format_sse_comment("heartbeat")
+                    continue
+                if queued is None:
+                    return
+                if queued.id is not None and queued.id in replayed_ids:
+                    continue
+                yield self._format_event(queued)
+        finally:
+            self.notification_stream_hub.unsubscribe(subscription)
+
+    @staticmethod
+    def _format_event(event: NotificationStreamEvent) -> str:
+        return format_sse_event(event.type.value, event.data, event.id)
+
+    async def _unread_count_after(self, recipient_id: UUID, adjusted: int | None) -> int:
+        if adjusted is not None:
+            return adjusted
+        return await self.count_unread_notifications(recipient_id)
+
+    def _created_event(self, notification: Notification, recipient_id: UUID) -> NotificationStreamEvent:
+        event_id = encode_timestamp_uuid_cursor(
+            TimestampUUIDCursor(timestamp=notification.created_at, id=notification.id),
+            scope=notification_stream_cursor_scope(recipient_id),
+        )
+        return NotificationStreamEvent(
+            type=NotificationStreamEventType.CREATED,
+            data=self._to_response(notification).model_dump(mode="json", by_alias=True),
+            id=event_id,
+        )
+
+    @staticmethod
+    def _unread_count_event(unread_count: int) -> NotificationStreamEvent:
+        return NotificationStreamEvent(
+            type=NotificationStreamEventType.UNREAD_COUNT,
+            data=NotificationUnreadCountResponse(unread_count=unread_count).model_dump(mode="json", by_alias=True),
         )
 
     @staticmethod
@@ -0,0 +1,219 @@
+"""Cross-worker notification event fan-out over Redis pub/sub.
+
+Every API worker runs one listener subscribed to a single Redis channel and
+forwards each event to the stream connections it holds for that recipient.
+Publishers never need to know which worker a recipient is connected to.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+from uuid import UUID
+
+from app.services.cache_service import CacheService
+from app.types import NotificationStreamEventType
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_STREAM_CHANNEL = "cinelog:notifications:events"
+NOTIFICATION_STREAM_QUEUE_SIZE = int(os.getenv("NOTIFICATION_STREAM_QUEUE_SIZE", "100"))
+NOTIFICATION_STREAM_HEARTBEAT_SECONDS = float(os.getenv("NOTIFICATION_STREAM_HEARTBEAT_SECONDS", "15"))
+NOTIFICATION_STREAM_REPLAY_LIMIT = int(os.getenv("NOTIFICATION_STREAM_REPLAY_LIMIT", "100"))
+LISTENER_RETRY_SECONDS = 1.0
+LISTENER_READY_TIMEOUT_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class NotificationStreamEvent:
+    """One event addressed to a recipient's open streams."""
+
+    type: NotificationStreamEventType
+    data: dict[str, Any] = field(default_factory=dict)
+    id: str | None = None
+
+
+class NotificationSubscription:
+    """Bounded event queue for one open stream connection.
+
+    A subscriber that falls ``maxsize`` events behind is closed rather than
+    allowed to grow without limit; the client reconnects with ``Last-Event-ID``
+    and replays what it missed from PostgreSQL.
+    """
+
+    def __init__(self, recipient_id: UUID, maxsize: int = NOTIFICATION_STREAM_QUEUE_SIZE):
+        self.recipient_id = recipient_id
+        self._queue: asyncio.Queue[NotificationStreamEvent | None] = asyncio.Queue(maxsize=maxsize)
+        self.closed = False
+
+    def offer(self, event: NotificationStreamEvent) -> None:
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning("Notification stream queue overflow for recipient_id=%s", self.recipient_id)
+            self.close()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def next_event(self, timeout: float) -> NotificationStreamEvent | None:
+        """Wait for the next event; raise ``TimeoutError`` when idle and return ``None`` once closed."""
+
+        return await asyncio.wait_for(self._queue.get(), timeout)
+
+
+class NotificationStreamHub:
+    """Per-process registry of open streams plus the Redis publisher and listener."""
+
+    _singleton: "NotificationStreamHub | None" = None
+    _singleton_lock = Lock()
+
+    def __init__(self) -> None:
+        self._subscriptions: dict[UUID, set[NotificationSubscription]] = {}
+        self._listener: asyncio.Task[None] | None = None
+        self._listening = asyncio.Event()
+
+    @classmethod
+    def get_instance(cls) -> "NotificationStreamHub":
+        with cls._singleton_lock:
+            if cls._singleton is None:
+                cls._singleton = cls()
+            return cls._singleton
+
+    @classmethod
+    async def aclose_all(cls) -> None:
+        with cls._singleton_lock:
+            singleton = cls._singleton
+            cls._singleton = None
+        if singleton is not None:
+            await singleton.aclose()
+
+    @property
+    def _cache(self) -> CacheService:
+        return CacheService.get_instance()
+
+    @property
+    def connection_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    @staticmethod
+    def _encode_message(recipient_id: UUID, events: Sequence[NotificationStreamEvent]) -> str:
+        return json.dumps(
+            {
+                "recipientId": str(recipient_id),
+                "events": [{"type": event.type.value, "data": event.data, "id": event.id} for event in events],
+            }
+        )
+
+    async def publish(self, recipient_id: UUID, *events: NotificationStreamEvent) -> None:
+        """Publish events for one recipient to every worker; failures are logged, not raised."""
+
+        if not events:
+            return
+        try:
+            await self._cache.publish(NOTIFICATION_STREAM_CHANNEL, self._encode_message(recipient_id, events))
+        except Exception:
+            logger.exception("Notification event publish failed for recipient_id=%s", recipient_id)
+
+    async def publish_many(self, events_by_recipient: Sequence[tuple[UUID, Sequence[NotificationStreamEvent]]]) -> None:
+        """Publish one message per recipient in a single pipelined round trip."""
+
+        messages = [
+            self._encode_message(recipient_id, events) for recipient_id, events in events_by_recipient if events
+        ]
+        try:
+            await self._cache.publish_many(NOTIFICATION_STREAM_CHANNEL, messages)
+        except Exception:
+            logger.exception("Notification event publish failed for %d recipients", len(messages))
+
+    async def subscribe(self, recipient_id: UUID) -> NotificationSubscription:
+        """Register a stream once this worker's listener is subscribed, so no later event is missed."""
+
+        self._ensure_listener()
+        await asyncio.wait_for(self._listening.wait(), LISTENER_READY_TIMEOUT_SECONDS)
+        subscription = NotificationSubscription(recipient_id)
+        self._subscriptions.setdefault(recipient_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: NotificationSubscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.recipient_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.recipient_id]
+
+    def dispatch(self, message: str) -> None:
+        """Route one raw pub/sub message to this worker's subscribers for the recipient."""
+
+        try:
+            payload = json.loads(message)
+            recipient_id = UUID(payload["recipientId"])
+            events = [
+                NotificationStreamEvent(
+                    type=NotificationStreamEventType(item["type"]),
+                    data=item["data"],
+                    id=item["id"],
+                )
+                for item in payload["events"]
+            ]
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Ignoring malformed notification event message")
+            return
+
+        for subscription in list(self._subscriptions.get(recipient_id, ())):
+            for event in events:
+                subscription.offer(event)
+
+    def _close_subscriptions(self) -> None:
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.close()
+        self._subscriptions.clear()
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self._cache.pubsub()
+            try:
+                await pubsub.subscribe(NOTIFICATION_STREAM_CHANNEL)
+                self._listening.set()
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.dispatch(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Events published while disconnected are lost; closing the
+                # open streams makes their clients reconnect and replay them.
+                logger.exception("Notification event listener failed; reconnecting")
+                self._listening.clear()
+                self._close_subscriptions()
+                await asyncio.sleep(LISTENER_RETRY_SECONDS)
+            finally:
+                await pubsub.aclose()
+
+    async def aclose(self) -> None:
+        self._close_subscriptions()
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._listening.clear()
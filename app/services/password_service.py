@@ -1,11 +1,253 @@
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
+
 import bcrypt
 
+from app.utils.error_codes_utils import ErrorCodes
+from app.utils.exceptions_utils import AppException
+
+logger = logging.getLogger(__name__)
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+# Interval of the pool activity log line; 0 disables it.
+PASSWORD_HASH_STATS_LOG_SECONDS = float(os.getenv("PASSWORD_HASH_STATS_LOG_SECONDS", "60"))
+# Explicit bcrypt cost; when unset the cost is calibrated at startup against the target latency.
+PASSWORD_HASH_ROUNDS = os.getenv("PASSWORD_HASH_ROUNDS")
+PASSWORD_HASH_TARGET_MS = float(os.getenv("PASSWORD_HASH_TARGET_MS", "250"))
+# bcrypt.gensalt()'s own default: calibration never picks a weaker cost than hashes already use.
+PASSWORD_HASH_MIN_ROUNDS = 12
+PASSWORD_HASH_MAX_ROUNDS = 16
+BCRYPT_VALID_ROUNDS = range(4, 32)
+
+T = TypeVar("T")
+
+
+def choose_bcrypt_rounds(
+    baseline_ms: float,
+    target_ms: float,
+    min_rounds: int = PASSWORD_HASH_MIN_ROUNDS,
+    max_rounds: int = PASSWORD_HASH_MAX_ROUNDS,
+) -> int:
+    """Return the highest cost whose projected hash time stays within ``target_ms``.
+
+    ``baseline_ms`` is the measured time at ``min_rounds``; each extra round doubles the work.
+    """
+
+    rounds = min_rounds
+    projected_ms = baseline_ms
+    while rounds < max_rounds and projected_ms * 2 <= target_ms:
+        rounds += 1
+        projected_ms *= 2
+    return rounds
+
+
+def get_bcrypt_rounds(hashed_password: str) -> int | None:
+    """Return the cost encoded in a ``$2b$<cost>$...`` hash, or ``None`` for other formats."""
+
+    parts = hashed_password.split("$")
+    if len(parts) != 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+@dataclass(frozen=True)
+class PasswordHashingStats:
+    """Per-worker counters for the password hashing pool."""
+
+    in_flight: int
+    queued: int
+    peak_in_flight: int
+    completed: int
+    rejected: int
+    queue_wait_seconds: float
+    run_seconds: float
+
 
 class PasswordService:
+    """bcrypt hashing and verification run on a dedicated, bounded thread pool.
+
+    bcrypt releases the GIL while it works, so threads keep the event loop free without the
+    pickling and memory cost of a process pool. ``in_flight`` counts queued and running jobs;
+    once it reaches ``PASSWORD_HASH_MAX_PENDING`` new work is rejected with a 503 instead of
+    growing an unbounded backlog behind a login burst.
+
+    New hashes use the cost chosen by ``calibrate()``; ``needs_rehash()`` flags older, cheaper
+    hashes so login can upgrade them.
+    """
+
+    _executor: ThreadPoolExecutor | None = None
+    _stats_task: "asyncio.Task[None] | None" = None
+    _rounds = PASSWORD_HASH_MIN_ROUNDS
+    _in_flight = 0
+    _peak_in_flight = 0
+    _completed = 0
+    _rejected = 0
+    _queue_wait_seconds = 0.0
+    _run_seconds = 0.0
+
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    async def verify_password(plain_password: str, hashed_password: str) -> bool:
+        return await PasswordService._run(
+            bcrypt.checkpw,
+            plain_password.encode("utf-8"),
+            hashed_password.encode("utf-8"),
+        )
 
     @staticmethod
-    def get_password_hash(password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    async def get_password_hash(password: str) -> str:
+        salt = bcrypt.gensalt(rounds=PasswordService._rounds)
+        hashed = await PasswordService._run(bcrypt.hashpw, password.encode("utf-8"), salt)
+        return hashed.decode("utf-8")
+
+    @classmethod
+    def needs_rehash(cls, hashed_password: str) -> bool:
+        """Whether a verified hash uses a lower cost than new hashes get."""
+
+        rounds = get_bcrypt_rounds(hashed_password)
+        return rounds is not None and rounds < cls._rounds
+
+    @classmethod
+    def rounds(cls) -> int:
+        return cls._rounds
+
+    @classmethod
+    def calibrate(cls) -> int:
+        """Pick the bcrypt cost for new hashes; called once during application startup.
+
+        Blocks for one hash at the minimum cost, before any request is served.
+        """
+
+        if PASSWORD_HASH_ROUNDS:
+            rounds = int(PASSWORD_HASH_ROUNDS)
+            if rounds not in BCRYPT_VALID_ROUNDS:
+                raise ValueError(f"PASSWORD_HASH_ROUNDS must be between 4 and 31, got {rounds}.")
+            cls._rounds = rounds
+            logger.info("Password hashing cost set to %s rounds", rounds)
+            return rounds
+
+        started_at = time.perf_counter()
+        bcrypt.hashpw(b"calibration-password", bcrypt.gensalt(rounds=PASSWORD_HASH_MIN_ROUNDS))
+        baseline_ms = (time.perf_counter() - started_at) * 1000
+
+        cls._rounds = choose_bcrypt_rounds(baseline_ms, PASSWORD_HASH_TARGET_MS)
+        logger.info(
+            "Password hashing cost calibrated to %s rounds (baseline %.0f ms at %s rounds, target %.0f ms)",
+            cls._rounds,
+            baseline_ms,
+            PASSWORD_HASH_MIN_ROUNDS,
+            PASSWORD_HASH_TARGET_MS,
+        )
+        return cls._rounds
+
+    @classmethod
+    def stats(cls) -> PasswordHashingStats:
+        return PasswordHashingStats(
+            in_flight=cls._in_flight,
+            queued=max(0, cls._in_flight - PASSWORD_HASH_WORKERS),
+            peak_in_flight=cls._peak_in_flight,
+            completed=cls._completed,
+            rejected=cls._rejected,
+            queue_wait_seconds=cls._queue_wait_seconds,
+            run_seconds=cls._run_seconds,
+        )
+
+    @classmethod
+    def log_stats(cls, previous: PasswordHashingStats) -> PasswordHashingStats:
+        """Log the pool's activity since ``previous`` and return the current stats.
+
+        Idle intervals are not logged; one with rejected work is logged as a warning.
+        """
+
+        current = cls.stats()
+        completed = current.completed - previous.completed
+        rejected = current.rejected - previous.rejected
+        if completed or rejected or current.in_flight:
+            log = logger.warning if rejected else logger.info
+            log(
+                "Password hashing pool: in_flight=%s queued=%s peak_in_flight=%s completed=%s rejected=%s "
+                "avg_queue_wait_ms=%.1f avg_run_ms=%.1f",
+                current.in_flight,
+                current.queued,
+                current.peak_in_flight,
+                completed,
+                rejected,
+                (current.queue_wait_seconds - previous.queue_wait_seconds) / completed * 1000 if completed else 0.0,
+                (current.run_seconds - previous.run_seconds) / completed * 1000 if completed else 0.0,
+            )
+        return current
+
+    @classmethod
+    def start_stats_log(cls, interval_seconds: float = PASSWORD_HASH_STATS_LOG_SECONDS) -> None:
+        """Log pool activity every ``interval_seconds``; called from the lifespan."""
+
+        if interval_seconds > 0 and (cls._stats_task is None or cls._stats_task.done()):
+            cls._stats_task = asyncio.create_task(cls._stats_log_loop(interval_seconds))
+
+    @classmethod
+    async def _stats_log_loop(cls, interval_seconds: float) -> None:
+        previous = cls.stats()
+        while True:
+            await asyncio.sleep(interval_seconds)
+            previous = cls.log_stats(previous)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop the pool, dropping queued jobs; used on application shutdown."""
+
+        if cls._stats_task is not None:
+            cls._stats_task.cancel()
+            cls._stats_task = None
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=PASSWORD_HASH_WORKERS,
+                thread_name_prefix="password-hash",
+            )
+        return cls._executor
+
+    @classmethod
+    async def _run(cls, func: Callable[..., T], *args: bytes) -> T:
+        if cls._in_flight >= PASSWORD_HASH_MAX_PENDING:
+            cls._rejected += 1
+            logger.warning("Password hashing pool saturated: in_flight=%s", cls._in_flight)
+            raise AppException(ErrorCodes.PASSWORD_HASHING_UNAVAILABLE)
+
+        loop = asyncio.get_running_loop()
+        submitted_at = time.perf_counter()
+
+        def timed() -> tuple[T, float, float]:
+            started_at = time.perf_counter()
+            result = func(*args)
+            return result, started_at - submitted_at, time.perf_counter() - started_at
+
+        future = cls._get_executor().submit(timed)
+        cls._in_flight += 1
+        cls._peak_in_flight = max(cls._peak_in_flight, cls._in_flight)
+        # Release the slot when the thread finishes, not when the awaiting request goes away,
+        # so a cancelled request cannot hide work that is still occupying the pool.
+        future.add_done_callback(lambda done: loop.call_soon_threadsafe(cls._record_done, done))
+
+        result, _, _ = await asyncio.wrap_future(future)
+        return result
+
+    @classmethod
+    def _record_done(cls, future: Future) -> None:
+        cls._in_flight -= 1
+        if future.cancelled() or future.exception() is not None:
+            return
+        _, queue_wait, run = future.result()
+        cls._completed += 1
+        cls._queue_wait_seconds += queue_wait
+        cls._run_seconds += run
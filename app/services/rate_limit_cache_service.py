@@ -18,24 +18,19 @@ class RateLimitCacheService:
     def build_session_key(session_id: str) -> str:
         return f"{RATE_LIMIT_SESSION_CACHE_PREFIX}{session_id}"
 
-    async def get_session(self, session_id: str) -> dict[str, bool] | None:
+    async def refresh_session(self, session_id: str) -> bool:
+        """Whether the session is registered; a registered session's TTL is extended in the same call."""
         key = self.build_session_key(session_id)
-        data = await self._cache.get(key)
+        data = await self._cache.get_and_expire(key, RATE_LIMIT_SESSION_TTL_SECONDS)
         if data is None:
             logger.debug("Rate-limit session cache miss for key=%s", key)
-            return None
-        if not isinstance(data, dict):
+            return False
+        if not isinstance(data, dict) or not isinstance(data.get("active"), bool):
             logger.warning("Invalid rate-limit session payload for key=%s", key)
-            return None
-
-        active = data.get("active")
-        if not isinstance(active, bool):
-            logger.warning("Invalid rate-limit session payload for key=%s", key)
-            return None
+            return False
 
         logger.debug("Rate-limit session cache hit for key=%s", key)
-        session_data: dict[str, bool] = {"active": active}
-        return session_data
+        return True
 
     async def upsert_session(self, session_id: str) -> None:
         key = self.build_session_key(session_id)
@@ -0,0 +1,357 @@
+"""Async rate limiting with one atomic round trip per check.
+
+Each bucket follows the generic cell rate algorithm (GCRA): it stores a single
+theoretical arrival time instead of a counter and window, so limits slide
+smoothly and cannot be doubled by bursting across a window boundary. A route
+with several limits (e.g. per session and per IP) checks and charges all of
+them in the same Redis script, and a rejected request charges none of them.
+
+Routes with generous limits can opt into hybrid mode: each worker admits
+requests from a local copy of the buckets and pushes the consumed counts to
+Redis in batches every ``RATE_LIMIT_SYNC_INTERVAL_MS``. Only the first
+request for a bucket on a worker waits for Redis. The shared limit can then be
+exceeded by what other workers admit between syncs, so tight limits such as
+login and password recovery stay strictly global.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, ParamSpec, Protocol, TypeVar
+
+from fastapi import Request, Response
+
+from app.services.cache_service import CacheService
+from app.utils.rate_limit_utils import (
+    RateLimitExceeded,
+    RateLimitItem,
+    RateLimitState,
+    inject_rate_limit_headers,
+    parse_rate_limit,
+)
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_KEY_PREFIX = "cinelog:ratelimit"
+RATE_LIMIT_SYNC_INTERVAL_MS = int(os.getenv("RATE_LIMIT_SYNC_INTERVAL_MS", "500"))
+RATE_LIMIT_SYNC_BATCH_SIZE = 500
+_RATE_LIMITED_ATTR = "__rate_limited__"
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class RateLimitBucket:
+    key: str
+    limit: RateLimitItem
+
+
+@dataclass(frozen=True)
+class RouteLimit:
+    limit: RateLimitItem
+    key_func: Callable[[Request], str]
+    hybrid: bool = False
+
+
+class RateLimitStorage(Protocol):
+    async def acquire(self, buckets: Sequence[RateLimitBucket], consume: bool) -> list[RateLimitState]: ...
+
+    async def sync(self, charges: Sequence[tuple[RateLimitBucket, int]]) -> list[int]: ...
+
+    async def clear(self, key: str) -> None: ...
+
+
+def _now_us() -> int:
+    return time.time_ns() // 1000
+
+
+def gcra_check(tat_us: int | None, now_us: int, limit: RateLimitItem) -> tuple[RateLimitState, int]:
+    """Evaluate one request against a bucket; returns its state and the TAT to store if charged.
+
+    Mirrors ``GCRA_ACQUIRE_SCRIPT`` in ``cache_service``.
+    """
+
+    interval = limit.emission_interval_us
+    capacity = interval * limit.amount
+    tat = max(tat_us if tat_us is not None else now_us, now_us)
+    new_tat = tat + interval
+    if new_tat - now_us <= capacity:
+        state = RateLimitState(
+            limit=limit,
+            allowed=True,
+            remaining=(capacity - (new_tat - now_us)) // interval,
+            reset_after=(new_tat - now_us) / 1_000_000,
+            retry_after=0.0,
+        )
+        return state, new_tat
+
+    state = RateLimitState(
+        limit=limit,
+        allowed=False,
+        remaining=0,
+        reset_after=(tat - now_us) / 1_000_000,
+        retry_after=(new_tat - now_us - capacity) / 1_000_000,
+    )
+    return state, tat
+
+
+class RedisRateLimitStorage:
+    """Buckets shared by every worker, evaluated by a Lua script on Redis server time."""
+
+    @property
+    def _cache(self) -> CacheService:
+        return CacheService.get_instance()
+
+    async def acquire(self, buckets: Sequence[RateLimitBucket], consume: bool) -> list[RateLimitState]:
+        results = await self._cache.gcra_acquire(
+            [bucket.key for bucket in buckets],
+            [(bucket.limit.emission_interval_us, bucket.limit.amount) for bucket in buckets],
+            consume,
+        )
+        return [
+            RateLimitState(
+                limit=bucket.limit,
+                allowed=bool(allowed),
+                remaining=remaining,
+                reset_after=reset_after_us / 1_000_000,
+                retry_after=retry_after_us / 1_000_000,
+            )
+            for bucket, (allowed, remaining, reset_after_us, retry_after_us) in zip(buckets, results, strict=True)
+        ]
+
+    async def sync(self, charges: Sequence[tuple[RateLimitBucket, int]]) -> list[int]:
+        return await self._cache.gcra_sync(
+            [bucket.key for bucket, _ in charges],
+            [(count, bucket.limit.emission_interval_us) for bucket, count in charges],
+        )
+
+    async def clear(self, key: str) -> None:
+        await self._cache.delete(key)
+
+
+class MemoryRateLimitStorage:
+    """Process-local buckets with the same semantics; used by the unit tests."""
+
+    def __init__(self) -> None:
+        self._tats: dict[str, int] = {}
+
+    async def acquire(self, buckets: Sequence[RateLimitBucket], consume: bool) -> list[RateLimitState]:
+        now_us = _now_us()
+        checks = [gcra_check(self._tats.get(bucket.key), now_us, bucket.limit) for bucket in buckets]
+        if consume and all(state.allowed for state, _ in checks):
+            for bucket, (_, new_tat) in zip(buckets, checks, strict=True):
+                self._tats[bucket.key] = new_tat
+        return [state for state, _ in checks]
+
+    async def sync(self, charges: Sequence[tuple[RateLimitBucket, int]]) -> list[int]:
+        now_us = _now_us()
+        offsets = []
+        for bucket, count in charges:
+            tat = max(self._tats.get(bucket.key, now_us), now_us) + count * bucket.limit.emission_interval_us
+            if count > 0:
+                self._tats[bucket.key] = tat
+            offsets.append(tat - now_us)
+        return offsets
+
+    async def clear(self, key: str) -> None:
+        self._tats.pop(key, None)
+
+
+@dataclass
+class _LocalBucket:
+    limit: RateLimitItem
+    tat_us: int
+    pending: int = 0
+
+
+class LocalRateLimitBuckets:
+    """One worker's copy of hybrid buckets plus the requests it has not yet reported."""
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, _LocalBucket] = {}
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def acquire(self, buckets: Sequence[RateLimitBucket], storage: RateLimitStorage) -> list[RateLimitState]:
+        if any(bucket.key not in self._buckets for bucket in buckets):
+            # A bucket first seen on this worker is charged globally, so a client that is
+            # already limited elsewhere cannot start over with a fresh local burst.
+            states = await storage.acquire(buckets, consume=True)
+            now_us = _now_us()
+            for bucket, state in zip(buckets, states, strict=True):
+                local = self._buckets.get(bucket.key)
+                pending = local.pending if local is not None else 0
+                tat_us = now_us + round(state.reset_after * 1_000_000) + pending * bucket.limit.emission_interval_us
+                self._buckets[bucket.key] = _LocalBucket(bucket.limit, tat_us, pending)
+            return states
+
+        now_us = _now_us()
+        checks = [gcra_check(self._buckets[bucket.key].tat_us, now_us, bucket.limit) for bucket in buckets]
+        if all(state.allowed for state, _ in checks):
+            for bucket, (_, new_tat) in zip(buckets, checks, strict=True):
+                local = self._buckets[bucket.key]
+                local.tat_us = new_tat
+                local.pending += 1
+        return [state for state, _ in checks]
+
+    async def sync(self, storage: RateLimitStorage) -> None:
+        """Report pending requests and adopt the shared state of every tracked bucket."""
+
+        now_us = _now_us()
+        for key, local in list(self._buckets.items()):
+            # A drained, idle bucket is dropped; its next request refetches the shared state.
+            if local.pending == 0 and local.tat_us <= now_us:
+                del self._buckets[key]
+
+        keys = list(self._buckets)
+        for start in range(0, len(keys), RATE_LIMIT_SYNC_BATCH_SIZE):
+            await self._sync_batch(keys[start : start + RATE_LIMIT_SYNC_BATCH_SIZE], storage)
+
+    async def _sync_batch(self, keys: list[str], storage: RateLimitStorage) -> None:
+        charges = [(RateLimitBucket(key, self._buckets[key].limit), self._buckets[key].pending) for key in keys]
+        for key in keys:
+            self._buckets[key].pending = 0
+        try:
+            offsets = await storage.sync(charges)
+        except Exception:
+            for bucket, count in charges:
+                if bucket.key in self._buckets:
+                    self._buckets[bucket.key].pending += count
+            raise
+
+        now_us = _now_us()
+        for (bucket, _), offset in zip(charges, offsets, strict=True):
+            local = self._buckets.get(bucket.key)
+            if local is not None:
+                # Requests admitted while the sync was in flight are still pending.
+                local.tat_us = now_us + offset + local.pending * bucket.limit.emission_interval_us
+
+    def clear(self, key: str) -> None:
+        self._buckets.pop(key, None)
+
+
+def _find_request(route: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Request:
+    for value in (*args, *kwargs.values()):
+        if isinstance(value, Request):
+            return value
+    raise TypeError(f"Rate-limited endpoint {route} must accept a `request: Request` parameter.")
+
+
+class AsyncLimiter:
+    """Route decorator and programmatic API over a ``RateLimitStorage``."""
+
+    def __init__(
+        self,
+        key_func: Callable[[Request], str],
+        storage: RateLimitStorage | None = None,
+    ):
+        self.key_func = key_func
+        self.storage: RateLimitStorage = storage or RedisRateLimitStorage()
+        self.local_buckets = LocalRateLimitBuckets()
+        self._route_limits: dict[str, list[RouteLimit]] = {}
+        self._sync_task: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def build_key(scope: str, limit: RateLimitItem, identifier: str) -> str:
+        return f"{RATE_LIMIT_KEY_PREFIX}:{scope}:{limit}:{identifier}"
+
+    def limit(
+        self,
+        limit_value: str,
+        key_func: Callable[[Request], str] | None = None,
+        hybrid: bool = False,
+    ) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+        """Limit an async endpoint; stacked decorators are checked together in one round trip.
+
+        ``hybrid`` admits from this worker's local buckets; a route is only checked locally when
+        all of its limits are hybrid.
+        """
+
+        route_limit = RouteLimit(parse_rate_limit(limit_value), key_func or self.key_func, hybrid)
+
+        def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+            route = f"{func.__module__}.{func.__qualname__}"
+            self._route_limits.setdefault(route, []).append(route_limit)
+            if getattr(func, _RATE_LIMITED_ATTR, False):
+                return func
+
+            @functools.wraps(func)
+            async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                state = await self.check_route(route, _find_request(route, args, kwargs))
+                result = await func(*args, **kwargs)
+                target = result if isinstance(result, Response) else kwargs.get("response")
+                if isinstance(target, Response):
+                    inject_rate_limit_headers(target, state)
+                return result
+
+            setattr(wrapper, _RATE_LIMITED_ATTR, True)
+            return wrapper
+
+        return decorator
+
+    async def check_route(self, route: str, request: Request) -> RateLimitState:
+        """Charge every limit of ``route`` or none; returns the tightest bucket for the headers."""
+
+        route_limits = self._route_limits[route]
+        buckets = [
+            RateLimitBucket(self.build_key(route, route_limit.limit, route_limit.key_func(request)), route_limit.limit)
+            for route_limit in route_limits
+        ]
+        if all(route_limit.hybrid for route_limit in route_limits):
+            states = await self.local_buckets.acquire(buckets, self.storage)
+        else:
+            states = await self.storage.acquire(buckets, consume=True)
+        blocked = [state for state in states if not state.allowed]
+        if blocked:
+            raise RateLimitExceeded(max(blocked, key=lambda state: state.retry_after))
+        return min(states, key=lambda state: state.remaining)
+
+    async def hit(self, limit: RateLimitItem, scope: str, identifier: str) -> bool:
+        bucket = RateLimitBucket(self.build_key(scope, limit, identifier), limit)
+        [state] = await self.storage.acquire([bucket], consume=True)
+        return state.allowed
+
+    async def test(self, limit: RateLimitItem, scope: str, identifier: str) -> bool:
+        bucket = RateLimitBucket(self.build_key(scope, limit, identifier), limit)
+        [state] = await self.storage.acquire([bucket], consume=False)
+        return state.allowed
+
+    async def clear(self, limit: RateLimitItem, scope: str, identifier: str) -> None:
+        key = self.build_key(scope, limit, identifier)
+        self.local_buckets.clear(key)
+        await self.storage.clear(key)
+
+    def start_sync(self, interval_seconds: float = RATE_LIMIT_SYNC_INTERVAL_MS / 1000) -> None:
+        """Start pushing hybrid bucket counts to the shared storage; called from the lifespan."""
+
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._sync_loop(interval_seconds))
+
+    async def _sync_loop(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.local_buckets.sync(self.storage)
+            except Exception:
+                logger.exception("Rate limit sync failed; pending counts are kept for the next attempt")
+
+    async def aclose(self) -> None:
+        """Stop the sync loop and report the counts admitted since the last sync."""
+
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            self._sync_task = None
+        try:
+            await self.local_buckets.sync(self.storage)
+        except Exception:
+            logger.exception("Final rate limit sync failed")
@@ -58,28 +58,16 @@ class RegistrationVerificationService:
         if code is None or not code.strip():
             raise AppException(ErrorCodes.EMAIL_VERIFICATION_CODE_REQUIRED)
 
-        key = self.build_key(email)
-        data = await self._cache.hgetall(key)
-        if not data:
-            raise AppException(ErrorCodes.EMAIL_VERIFICATION_CODE_EXPIRED)
-
-        code_hash = data.get("code_hash")
-        if not code_hash:
-            raise AppException(ErrorCodes.EMAIL_VERIFICATION_CODE_EXPIRED)
-
-        try:
-            attempts = int(data.get("attempts", "0"))
-        except ValueError as exc:
-            raise AppException(ErrorCodes.EMAIL_VERIFICATION_CODE_EXPIRED) from exc
-        if attempts >= REGISTRATION_VERIFICATION_MAX_ATTEMPTS:
-            raise AppException(ErrorCodes.EMAIL_VERIFICATION_CODE_ATTEMPTS_EXCEEDED)
-
-        candidate_hash = self.hash_code(email, code)
-        if secrets.compare_digest(code_hash, candidate_hash):
+        result = await self._cache.check_code_attempt(
+            self.build_key(email),
+            self.hash_code(email, code),
+            REGISTRATION_VERIFICATION_MAX_ATTEMPTS,
+        )
+        if result == "match":
             return
-
-        attempts = await self._cache.hincrby(key, "attempts", 1)
-        if attempts >= REGISTRATION_VERIFICATION_MAX_ATTEMPTS:
+        if result == "missing":
+            raise AppException(ErrorCodes.EMAIL_VERIFICATION_CODE_EXPIRED)
+        if result == "exceeded":
             raise AppException(ErrorCodes.EMAIL_VERIFICATION_CODE_ATTEMPTS_EXCEEDED)
 
         raise AppException(ErrorCodes.INVALID_EMAIL_VERIFICATION_CODE)
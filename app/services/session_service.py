@@ -0,0 +1,171 @@
+"""Server-side login sessions and their revocation.
+
+Every login creates a session whose ID is signed into both tokens as the
+``sid`` claim. The session record in Redis is what lets a refresh token be
+exchanged, so deleting it ends that device's session at its next refresh.
+
+Access tokens are checked against a per-user revocation hash instead: a
+``before`` watermark that revokes every token issued earlier (password change,
+account deletion) and individually revoked session IDs (logout). Each worker
+caches that hash for ``SESSION_REVOCATION_CACHE_SECONDS``, so an authenticated
+request only reaches Redis when its user's entry is missing or stale.
+Revocations made on another worker therefore take effect within that window.
+"""
+
+import logging
+import os
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.services.cache_service import CacheService
+from app.utils.auth_utils import ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS
+
+logger = logging.getLogger(__name__)
+
+SESSION_KEY_PREFIX = "cinelog:auth:session"
+SESSION_REVOCATIONS_KEY_PREFIX = "cinelog:auth:revocations"
+SESSION_TTL_SECONDS = REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+SESSION_REVOCATION_CACHE_SECONDS = float(os.getenv("SESSION_REVOCATION_CACHE_SECONDS", "5"))
+SESSION_REVOCATION_CACHE_SIZE = 10000
+REVOKED_BEFORE_FIELD = "before"
+
+
+@dataclass(frozen=True)
+class SessionRevocations:
+    """What one user has revoked: tokens issued before ``revoked_before`` and individual sessions."""
+
+    revoked_before: float = 0.0
+    revoked_session_ids: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_hash(cls, data: dict[str, str]) -> "SessionRevocations":
+        revoked_before = float(data.get(REVOKED_BEFORE_FIELD, 0))
+        return cls(
+            revoked_before=revoked_before,
+            revoked_session_ids=frozenset(field for field in data if field != REVOKED_BEFORE_FIELD),
+        )
+
+    def revokes(self, session_id: str, issued_at: float) -> bool:
+        return issued_at < self.revoked_before or session_id in self.revoked_session_ids
+
+
+class SessionRevocationCache:
+    """Bounded per-worker LRU of users' revocations, each entry trusted for ``ttl`` seconds."""
+
+    def __init__(self, ttl: float = SESSION_REVOCATION_CACHE_SECONDS, max_size: int = SESSION_REVOCATION_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[UUID, tuple[float, SessionRevocations]] = OrderedDict()
+
+    def get(self, user_id: UUID) -> SessionRevocations | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        fetched_at, revocations = entry
+        if time.monotonic() - fetched_at >= self.ttl:
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return revocations
+
+    def put(self, user_id: UUID, revocations: SessionRevocations) -> None:
+        if self.max_size <= 0 or self.ttl <= 0:
+            return
+        self._entries[user_id] = (time.monotonic(), revocations)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, user_id: UUID) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+session_revocation_cache = SessionRevocationCache()
+
+
+class SessionService:
+    @property
+    def _cache(self) -> CacheService:
+        return CacheService.get_instance()
+
+    @staticmethod
+    def build_session_key(session_id: str) -> str:
+        return f"{SESSION_KEY_PREFIX}:{session_id}"
+
+    @staticmethod
+    def build_revocations_key(user_id: UUID) -> str:
+        return f"{SESSION_REVOCATIONS_KEY_PREFIX}:{user_id}"
+
+    async def create_session(self, user_id: UUID) -> str:
+        """Register a new login session and return its ID for the ``sid`` claim."""
+
+        session_id = secrets.token_urlsafe(16)
+        await self._cache.set(self.build_session_key(session_id), {"user_id": str(user_id)}, ttl=SESSION_TTL_SECONDS)
+        return session_id
+
+    async def _load_revocations(self, user_id: UUID) -> SessionRevocations:
+        revocations = SessionRevocations.from_hash(await self._cache.hgetall(self.build_revocations_key(user_id)))
+        session_revocation_cache.put(user_id, revocations)
+        return revocations
+
+    async def refresh_session(self, user_id: UUID, session_id: str, issued_at: float) -> bool:
+        """Whether a refresh token may be exchanged; a live session's TTL is extended in the same call.
+
+        Reads Redis directly rather than the local cache, so a revoked session
+        can never be refreshed, and lets Redis errors propagate.
+        """
+
+        data = await self._cache.get_and_expire(self.build_session_key(session_id), SESSION_TTL_SECONDS)
+        if not isinstance(data, dict) or data.get("user_id") != str(user_id):
+            return False
+        revocations = await self._load_revocations(user_id)
+        return not revocations.revokes(session_id, issued_at)
+
+    async def is_revoked(self, user_id: UUID, session_id: str, issued_at: float) -> bool:
+        """Whether an access token was revoked, answered from the local cache when it is fresh.
+
+        Fails open when Redis is unavailable: access tokens are short-lived, and
+        refreshing them always checks Redis.
+        """
+
+        revocations = session_revocation_cache.get(user_id)
+        if revocations is None:
+            try:
+                revocations = await self._load_revocations(user_id)
+            except Exception:
+                logger.warning("Session revocation lookup failed for user_id=%s", user_id, exc_info=True)
+                return False
+        return revocations.revokes(session_id, issued_at)
+
+    async def revoke_session(self, user_id: UUID, session_id: str) -> None:
+        """End one session: its refresh token stops working and its access tokens are rejected."""
+
+        now = time.time()
+        await self._cache.revoke_session(
+            self.build_session_key(session_id),
+            self.build_revocations_key(user_id),
+            session_id,
+            now + ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+            now,
+            SESSION_TTL_SECONDS,
+        )
+        session_revocation_cache.discard(user_id)
+        logger.info("Revoked session for user_id=%s", user_id)
+
+    async def revoke_all_sessions(self, user_id: UUID) -> None:
+        """Revoke every token issued to the user so far; tokens issued afterwards are unaffected."""
+
+        revocations = SessionRevocations(revoked_before=time.time())
+        await self._cache.replace_hash(
+            self.build_revocations_key(user_id),
+            {REVOKED_BEFORE_FIELD: repr(revocations.revoked_before)},
+            SESSION_TTL_SECONDS,
+        )
+        session_revocation_cache.put(user_id, revocations)
+        logger.info("Revoked all sessions for user_id=%s", user_id)
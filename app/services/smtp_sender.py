@@ -0,0 +1,132 @@
+"""Deliver outbox emails over one SMTP connection kept open across batches.
+
+Opening a connection costs a TCP and TLS handshake plus EHLO and AUTH, which
+used to be paid for every message. The sender keeps its connection between
+sends and batches, drops it after ``idle_timeout`` seconds without use, and
+reconnects once when the server has closed a reused connection. ``smtplib``
+is blocking, so the worker runs ``send_batch`` in a thread.
+"""
+
+import logging
+import smtplib
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+from app.config.email_config import SMTPConfig
+from app.services.email_templates import RenderedEmail
+
+logger = logging.getLogger(__name__)
+
+SMTP_TIMEOUT_SECONDS = 10
+SMTP_IDLE_TIMEOUT_SECONDS = 30
+
+
+class SMTPUnavailableError(Exception):
+    """The SMTP server could not be reached or refused the session, so no message was attempted."""
+
+
+def build_mime_message(email: RenderedEmail, from_email: str) -> str:
+    message = MIMEMultipart("alternative")
+    message["Subject"] = email.subject
+    message["From"] = from_email
+    message["To"] = email.to_email
+    message.attach(MIMEText(email.text, "plain"))
+    message.attach(MIMEText(email.html, "html"))
+    return message.as_string()
+
+
+def is_permanent_failure(error: Exception) -> bool:
+    """Whether the server rejected the message itself, so retrying cannot help."""
+
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(error, smtplib.SMTPResponseException) and 500 <= error.smtp_code < 600
+
+
+class SMTPSender:
+    def __init__(
+        self,
+        config: SMTPConfig,
+        idle_timeout: float = SMTP_IDLE_TIMEOUT_SECONDS,
+        timeout: float = SMTP_TIMEOUT_SECONDS,
+    ):
+        self._config = config
+        self._idle_timeout = idle_timeout
+        self._timeout = timeout
+        self._connection: smtplib.SMTP | None = None
+        self._last_used_at = 0.0
+
+    def _connect(self) -> smtplib.SMTP:
+        config = self._config
+        connection: smtplib.SMTP
+        try:
+            if config["use_ssl"]:
+                connection = smtplib.SMTP_SSL(config["server"], config["port"], timeout=self._timeout)
+            else:
+                connection = smtplib.SMTP(config["server"], config["port"], timeout=self._timeout)
+        except (smtplib.SMTPException, OSError) as exc:
+            raise SMTPUnavailableError(str(exc)) from exc
+        try:
+            connection.ehlo()
+            if not config["use_ssl"] and connection.has_extn("STARTTLS"):
+                connection.starttls()
+                connection.ehlo()
+            if config["user"] and config["password"]:
+                connection.login(config["user"], config["password"])
+        except (smtplib.SMTPException, OSError) as exc:
+            connection.close()
+            raise SMTPUnavailableError(str(exc)) from exc
+        logger.info("Opened SMTP connection to %s:%d", config["server"], config["port"])
+        return connection
+
+    def _get_connection(self) -> smtplib.SMTP:
+        if self._connection is not None and time.monotonic() - self._last_used_at > self._idle_timeout:
+            self.close()
+        if self._connection is None:
+            self._connection = self._connect()
+        self._last_used_at = time.monotonic()
+        return self._connection
+
+    def _discard_connection(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def send(self, email: RenderedEmail) -> None:
+        message = build_mime_message(email, self._config["from_email"])
+        try:
+            self._get_connection().sendmail(self._config["from_email"], [email.to_email], message)
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            # The server may have closed a reused connection since the last send.
+            self._discard_connection()
+            self._get_connection().sendmail(self._config["from_email"], [email.to_email], message)
+
+    def send_batch(self, emails: list[RenderedEmail]) -> list[Exception | None]:
+        """Send each email in order, returning ``None`` for a delivery or the error that stopped it."""
+
+        results: list[Exception | None] = []
+        for index, email in enumerate(emails):
+            try:
+                self.send(email)
+            except SMTPUnavailableError as exc:
+                # Without a connection the rest of the batch would only fail the same way.
+                results.extend([exc] * (len(emails) - index))
+                break
+            except (smtplib.SMTPException, OSError) as exc:
+                if not isinstance(exc, smtplib.SMTPResponseException | smtplib.SMTPRecipientsRefused):
+                    # Anything short of a per-message rejection leaves the connection unusable.
+                    self._discard_connection()
+                results.append(exc)
+            else:
+                results.append(None)
+        return results
+
+    def close(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            self._connection.quit()
+        except (smtplib.SMTPException, OSError):
+            self._connection.close()
+        self._connection = None
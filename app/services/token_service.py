@@ -1,6 +1,11 @@
+import hashlib
 import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
+from uuid import UUID
 
 import jwt
 
@@ -11,6 +16,67 @@ if not SECRET_KEY:
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 15))
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7))
+ACCESS_TOKEN_CACHE_SIZE = int(os.getenv("ACCESS_TOKEN_CACHE_SIZE", 10000))
+
+
+@dataclass(frozen=True)
+class VerifiedAccessToken:
+    """Claims of an access token whose signature, type and subject were already checked."""
+
+    user_id: UUID
+    subject: str
+    session_id: str
+    issued_at: float
+    locale: str | None
+    expires_at: float
+
+
+class AccessTokenCache:
+    """Bounded per-worker LRU of verified access tokens, keyed by the SHA-256 of the token.
+
+    Entries are only served until the token's ``exp``, so a cached token never
+    outlives what ``jwt.decode`` would accept. Keys are digests so the cache
+    holds no usable bearer tokens. It is only touched from the async
+    ``auth_dependency`` on the event loop, with no ``await`` between reading and
+    updating the dict, so it needs no lock.
+    """
+
+    def __init__(self, max_size: int = ACCESS_TOKEN_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, VerifiedAccessToken] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> VerifiedAccessToken | None:
+        key = self._key(token)
+        verified = self._entries.get(key)
+        if verified is None:
+            return None
+        if verified.expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return verified
+
+    def put(self, token: str, verified: VerifiedAccessToken) -> None:
+        if self.max_size <= 0:
+            return
+        key = self._key(token)
+        self._entries[key] = verified
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+access_token_cache = AccessTokenCache()
 
 
 class TokenService:
@@ -20,12 +86,14 @@ class TokenService:
         Create a new JWT access token.
         """
         to_encode = data.copy()
+        issued_at = datetime.now(UTC)
         if expires_delta:
-            expire = datetime.now(UTC) + expires_delta
+            expire = issued_at + expires_delta
         else:
-            expire = datetime.now(UTC) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+            expire = issued_at + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
-        to_encode.update({"exp": expire, "type": "access"})
+        # Fractional ``iat`` so a revoke-all watermark never catches tokens issued later in the same second
+        to_encode.update({"exp": expire, "iat": issued_at.timestamp(), "type": "access"})
         return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
     @staticmethod
@@ -34,21 +102,25 @@ class TokenService:
         Create a new JWT refresh token.
         """
         to_encode = data.copy()
+        issued_at = datetime.now(UTC)
         if expires_delta:
-            expire = datetime.now(UTC) + expires_delta
+            expire = issued_at + expires_delta
         else:
-            expire = datetime.now(UTC) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+            expire = issued_at + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
 
-        to_encode.update({"exp": expire, "type": "refresh"})
+        to_encode.update({"exp": expire, "iat": issued_at.timestamp(), "type": "refresh"})
         return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
     @staticmethod
-    def decode_token(token: str) -> dict[str, Any]:
+    def decode_token(token: str, verify_expiry: bool = True) -> dict[str, Any]:
         """
         Decode and verify a JWT token.
+
+        ``verify_expiry=False`` still checks the signature; logout uses it to
+        revoke the session of an access token that has already expired.
         """
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": verify_expiry})
             return payload
         except jwt.ExpiredSignatureError:
             # Re-raise as AppException or handle in caller?
@@ -0,0 +1,86 @@
+import logging
+import os
+from datetime import UTC, datetime, timedelta
+
+from app.services.cache_service import CacheService
+from app.types import TrendingWindow
+
+logger = logging.getLogger(__name__)
+
+TRENDING_VIEW_CACHE_TTL = int(os.getenv("TRENDING_VIEW_CACHE_TTL", "60"))
+
+HOUR_BUCKET_RETENTION = timedelta(hours=25)
+DAY_BUCKET_RETENTION = timedelta(days=8)
+
+
+def _hour_start(moment: datetime) -> datetime:
+    return moment.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def _day_start(moment: datetime) -> datetime:
+    return _hour_start(moment).replace(hour=0)
+
+
+class TrendingCacheService:
+    """Time-bucketed Redis sorted sets of log counts per TMDB movie.
+
+    Every log increments its movie in one hourly and one daily bucket. The
+    ``24h`` window merges the last 24 hourly buckets and the ``7d`` window the
+    current day plus the six before it; merged views are cached briefly with
+    ZUNIONSTORE so reads are a single ZREVRANGE.
+    """
+
+    @property
+    def _cache(self) -> CacheService:
+        return CacheService.get_instance()
+
+    @staticmethod
+    def build_hour_key(moment: datetime) -> str:
+        return f"cinelog:trending:hour:{_hour_start(moment):%Y%m%d%H}"
+
+    @staticmethod
+    def build_day_key(moment: datetime) -> str:
+        return f"cinelog:trending:day:{_day_start(moment):%Y%m%d}"
+
+    @staticmethod
+    def build_view_key(window: TrendingWindow) -> str:
+        return f"cinelog:trending:view:{window.value}"
+
+    @classmethod
+    def window_bucket_keys(cls, window: TrendingWindow, now: datetime) -> list[str]:
+        if window is TrendingWindow.LAST_24_HOURS:
+            return [cls.build_hour_key(now - timedelta(hours=offset)) for offset in range(24)]
+        return [cls.build_day_key(now - timedelta(days=offset)) for offset in range(7)]
+
+    @classmethod
+    def _live_bucket_expiries(cls, logged_at: datetime, now: datetime) -> dict[str, int]:
+        buckets = {
+            cls.build_hour_key(logged_at): _hour_start(logged_at) + HOUR_BUCKET_RETENTION,
+            cls.build_day_key(logged_at): _day_start(logged_at) + DAY_BUCKET_RETENTION,
+        }
+        return {key: int(expires_at.timestamp()) for key, expires_at in buckets.items() if expires_at > now}
+
+    async def _adjust(self, tmdb_id: int, logged_at: datetime, amount: int) -> None:
+        expire_at_by_key = self._live_bucket_expiries(logged_at, datetime.now(UTC))
+        try:
+            await self._cache.zincrby_with_expireat(str(tmdb_id), amount, expire_at_by_key)
+        except Exception:
+            logger.exception("Trending counter update failed for tmdb_id=%s", tmdb_id)
+
+    async def record_log_created(self, tmdb_id: int, logged_at: datetime) -> None:
+        await self._adjust(tmdb_id, logged_at, 1)
+
+    async def record_log_deleted(self, tmdb_id: int, logged_at: datetime) -> None:
+        await self._adjust(tmdb_id, logged_at, -1)
+
+    async def get_top_movies(self, window: TrendingWindow, limit: int) -> list[tuple[int, int]]:
+        """Return ``(tmdb_id, log_count)`` pairs for the window, highest count first."""
+
+        view_key = self.build_view_key(window)
+        if not await self._cache.exists(view_key):
+            logger.debug("Cache miss for key=%s", view_key)
+            bucket_keys = self.window_bucket_keys(window, datetime.now(UTC))
+            await self._cache.zunionstore_with_ttl(view_key, bucket_keys, TRENDING_VIEW_CACHE_TTL)
+
+        entries = await self._cache.zrevrange_with_scores(view_key, 0, limit - 1)
+        return [(int(member), int(score)) for member, score in entries]
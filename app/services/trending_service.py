@@ -0,0 +1,34 @@
+from app.dependencies.repository_dependency import get_movie_repository
+from app.repository.movie_repository_protocol import MovieRepositoryProtocol
+from app.schemas.movie_schemas import MovieResponse, TrendingMovieItem, TrendingMoviesResponse
+from app.services.trending_cache_service import TrendingCacheService
+from app.types import TrendingWindow
+
+
+class TrendingService:
+    """Rank the most-logged movies from Redis window counters and hydrate them from PostgreSQL."""
+
+    def __init__(
+        self,
+        movie_repository: MovieRepositoryProtocol | None = None,
+        trending_cache_service: TrendingCacheService | None = None,
+    ):
+        self.movie_repository = movie_repository or get_movie_repository()
+        self.trending_cache_service = trending_cache_service or TrendingCacheService()
+
+    async def get_trending_movies(self, window: TrendingWindow, limit: int) -> TrendingMoviesResponse:
+        ranking = await self.trending_cache_service.get_top_movies(window, limit)
+
+        movies = await self.movie_repository.find_movies_by_tmdb_ids([tmdb_id for tmdb_id, _ in ranking])
+        movie_map = {movie.tmdb_id: movie for movie in movies}
+
+        items = [
+            TrendingMovieItem(
+                tmdb_id=tmdb_id,
+                log_count=log_count,
+                movie=MovieResponse.model_validate(movie_map[tmdb_id]),
+            )
+            for tmdb_id, log_count in ranking
+            if tmdb_id in movie_map
+        ]
+        return TrendingMoviesResponse(window=window, movies=items)
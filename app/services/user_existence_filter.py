@@ -0,0 +1,143 @@
+"""Bloom filter over registered emails and handles, kept in a Redis bitmap.
+
+Lookups by email or handle ask the filter first: a definite miss answers
+"no such user" without querying PostgreSQL, which is what address enumeration
+and repeated send-code calls mostly produce. A hit only means the user may
+exist, and the lookup goes on to the database as before.
+
+The filter never forgets on its own. New users are added before their row is
+inserted, so a failed insert leaves a false positive and never a miss.
+Deleted users cannot be removed from a Bloom filter; their entries stay until
+``app.jobs.rebuild_user_existence_filter`` rebuilds the bitmap from the active
+users. Until the first rebuild the key is missing and every lookup goes to the
+database, as it does when Redis is unavailable.
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import os
+from collections.abc import AsyncIterable, Iterable, Sequence
+from dataclasses import dataclass
+
+from app.services.cache_service import CacheService
+from app.utils.auth_utils import normalize_email_identifier
+
+logger = logging.getLogger(__name__)
+
+USER_EXISTENCE_FILTER_KEY_PREFIX = "cinelog:users:exists"
+# Expected emails plus handles, two per user; past it the false-positive rate climbs.
+USER_EXISTENCE_FILTER_CAPACITY = int(os.getenv("USER_EXISTENCE_FILTER_CAPACITY", "2000000"))
+USER_EXISTENCE_FILTER_ERROR_RATE = float(os.getenv("USER_EXISTENCE_FILTER_ERROR_RATE", "0.01"))
+# Lifetime of a rebuild's scratch bitmap, so an aborted rebuild cleans up after itself.
+USER_EXISTENCE_FILTER_REBUILD_TTL = 6 * 60 * 60
+
+
+@dataclass(frozen=True)
+class BloomParameters:
+    """Bitmap size and hash count of a Bloom filter, with the bit offsets each item maps to."""
+
+    size_bits: int
+    hash_count: int
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float) -> "BloomParameters":
+        size_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        return cls(size_bits=size_bits, hash_count=max(1, round(size_bits / capacity * math.log(2))))
+
+    def offsets(self, item: str) -> list[int]:
+        # Double hashing (Kirsch-Mitzenmacher): two 64-bit halves of one digest
+        # stand in for ``hash_count`` independent hash functions.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return [(first + index * second) % self.size_bits for index in range(self.hash_count)]
+
+
+class UserExistenceFilter:
+    def __init__(self, parameters: BloomParameters | None = None):
+        self.parameters = parameters or BloomParameters.for_capacity(
+            USER_EXISTENCE_FILTER_CAPACITY, USER_EXISTENCE_FILTER_ERROR_RATE
+        )
+
+    @property
+    def _cache(self) -> CacheService:
+        return CacheService.get_instance()
+
+    @property
+    def key(self) -> str:
+        # Sized keys: changing the capacity or error rate starts from a missing
+        # filter instead of probing an old bitmap with new offsets.
+        return f"{USER_EXISTENCE_FILTER_KEY_PREFIX}:{self.parameters.size_bits}:{self.parameters.hash_count}"
+
+    @property
+    def rebuild_key(self) -> str:
+        return f"{self.key}:rebuild"
+
+    @staticmethod
+    def email_item(email: str) -> str:
+        return f"email:{normalize_email_identifier(email)}"
+
+    @staticmethod
+    def handle_item(handle: str) -> str:
+        return f"handle:{handle.lower()}"
+
+    def _offsets(self, items: Iterable[str]) -> list[int]:
+        return sorted({offset for item in items for offset in self.parameters.offsets(item)})
+
+    async def _might_contain(self, item: str) -> bool:
+        try:
+            found = await self._cache.bloom_check(self.key, self.parameters.offsets(item))
+        except Exception:
+            logger.warning("User existence filter check failed", exc_info=True)
+            return True
+        return found is not False
+
+    async def might_contain_email(self, email: str) -> bool:
+        """``False`` only when no active user can have this email; fails open when Redis is unavailable."""
+
+        return await self._might_contain(self.email_item(email))
+
+    async def might_contain_handle(self, handle: str) -> bool:
+        """``False`` only when no active user can have this handle; fails open when Redis is unavailable."""
+
+        return await self._might_contain(self.handle_item(handle))
+
+    async def add(self, email: str, handle: str | None) -> None:
+        """Add a new user's email and handle, to a rebuild in progress as well as to the live filter.
+
+        Redis errors propagate: a user missing from a built filter could not sign in.
+        """
+
+        items = [self.email_item(email)]
+        if handle is not None:
+            items.append(self.handle_item(handle))
+        await self._cache.bloom_add([self.key, self.rebuild_key], self._offsets(items))
+
+    async def rebuild(self, users: AsyncIterable[Sequence[tuple[str, str]]], settle_seconds: float) -> int:
+        """Build a fresh bitmap from batches of active ``(email, handle)`` pairs and swap it in.
+
+        ``add`` writes to the scratch bitmap as soon as it exists. Waiting
+        ``settle_seconds`` before reading users lets registrations that were
+        added only to the old bitmap commit first, so the read sees them.
+        Returns the number of users added.
+        """
+
+        await self._cache.allocate_bitmap(
+            self.rebuild_key, self.parameters.size_bits, USER_EXISTENCE_FILTER_REBUILD_TTL
+        )
+        await asyncio.sleep(settle_seconds)
+
+        user_count = 0
+        async for batch in users:
+            if not batch:
+                continue
+            items = [item for email, handle in batch for item in (self.email_item(email), self.handle_item(handle))]
+            if not await self._cache.bloom_add([self.rebuild_key], self._offsets(items)):
+                raise RuntimeError("User existence filter rebuild bitmap expired before the rebuild finished")
+            user_count += len(batch)
+
+        await self._cache.rename_persistent(self.rebuild_key, self.key)
+        logger.info("Rebuilt user existence filter with %d users", user_count)
+        return user_count
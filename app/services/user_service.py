@@ -11,6 +11,7 @@ from app.schemas.user_schemas import (
     UserProfileResponse,
     UserResponse,
 )
+from app.services.feed_service import FeedService
 from app.services.password_service import PasswordService
 from app.utils.error_codes_utils import ErrorCodes
 from app.utils.exceptions_utils import AppException
@@ -19,14 +20,17 @@ from app.utils.exceptions_utils import AppException
 class UserService:
     user_repository: UserRepositoryProtocol
     follow_repository: FollowRepositoryProtocol
+    feed_service: FeedService
 
     def __init__(
         self,
         user_repository: UserRepositoryProtocol,
         follow_repository: FollowRepositoryProtocol,
+        feed_service: FeedService | None = None,
     ):
         self.user_repository = user_repository
         self.follow_repository = follow_repository
+        self.feed_service = feed_service or FeedService()
 
     async def get_user_info(self, user_id: UUID) -> UserResponse:
         """
@@ -99,6 +103,9 @@ class UserService:
         if not user:
             raise AppException(ErrorCodes.USER_NOT_FOUND)
 
+        if "profile_visibility" in update_data:
+            await self.feed_service.invalidate_follower_timelines(user.id)
+
         date_of_birth = user.date_of_birth.date() if isinstance(user.date_of_birth, datetime) else user.date_of_birth
 
         return UserResponse(
@@ -138,16 +145,17 @@ class UserService:
         Change user password.
         """
         user = await self.user_repository.find_user_by_id(user_id)
-        if not user or not user.password_hash:
+        password_hash = await self.user_repository.find_password_hash(user_id) if user else None
+        if not user or not password_hash:
             raise AppException(ErrorCodes.USER_NOT_FOUND)
 
-        if not PasswordService.verify_password(current_password, user.password_hash):
+        if not await PasswordService.verify_password(current_password, password_hash):
             raise AppException(ErrorCodes.INVALID_CURRENT_PASSWORD)
 
-        if PasswordService.verify_password(new_password, user.password_hash):
+        if await PasswordService.verify_password(new_password, password_hash):
             raise AppException(ErrorCodes.SAME_PASSWORD)
 
-        hashed_password = PasswordService.get_password_hash(new_password)
+        hashed_password = await PasswordService.get_password_hash(new_password)
         await self.user_repository.update_password(user, hashed_password)
 
         return ChangePasswordResponse(message="Password changed successfully")
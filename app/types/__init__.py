@@ -1,6 +1,9 @@
 from app.types.cursor_pagination_types import (
     TimestampUUIDCursor as TimestampUUIDCursor,
 )
+from app.types.email_types import (
+    EmailTemplate as EmailTemplate,
+)
 from app.types.log_validation import (
     WATCHED_WHERE_CHOICES as WATCHED_WHERE_CHOICES,
 )
@@ -10,9 +13,15 @@ from app.types.log_validation import (  # noqa: F401
 from app.types.log_validation import (
     validate_watched_where as validate_watched_where,
 )
+from app.types.movie_types import (
+    TrendingWindow as TrendingWindow,
+)
 from app.types.notification_types import (
     NotificationAction as NotificationAction,
 )
+from app.types.notification_types import (
+    NotificationStreamEventType as NotificationStreamEventType,
+)
 from app.types.notification_types import (
     NotificationType as NotificationType,
 )
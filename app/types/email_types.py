@@ -0,0 +1,16 @@
+"""
+Email-domain closed enum types.
+
+Types:
+    EmailTemplate — transactional emails the outbox worker knows how to render
+"""
+
+from enum import StrEnum
+
+
+class EmailTemplate(StrEnum):
+    """Registered transactional email templates."""
+
+    RESET_PASSWORD = "reset_password"  # nosec B105
+    REGISTRATION_VERIFICATION = "registration_verification"
+    REGISTRATION_EXISTING_ACCOUNT = "registration_existing_account"
@@ -0,0 +1,15 @@
+"""
+Movie-domain closed enum types.
+
+Types:
+    TrendingWindow — sliding windows accepted by the trending movies endpoint
+"""
+
+from enum import StrEnum
+
+
+class TrendingWindow(StrEnum):
+    """Sliding windows over which trending log counts are merged."""
+
+    LAST_24_HOURS = "24h"
+    LAST_7_DAYS = "7d"
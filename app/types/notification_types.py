@@ -4,6 +4,7 @@ Notification-domain closed enum types.
 Types:
     NotificationType   — registered notification identifiers accepted by persistence and API schemas
     NotificationAction — registered actions that a notification response may expose
+    NotificationStreamEventType — event names sent on the real-time notification stream
 """
 
 from enum import StrEnum
@@ -22,3 +23,14 @@ class NotificationAction(StrEnum):
 
     FOLLOW_REQUEST_ACCEPT = "follow_request.accept"
     FOLLOW_REQUEST_REJECT = "follow_request.reject"
+
+
+class NotificationStreamEventType(StrEnum):
+    """Server-Sent Event names emitted by the notification stream."""
+
+    CREATED = "notification.created"
+    UPDATED = "notification.updated"
+    READ = "notification.read"
+    READ_ALL = "notification.read_all"
+    UNREAD_COUNT = "notification.unread_count"
+    RESYNC = "notification.resync"
@@ -0,0 +1,44 @@
+"""Header and cookie access for pure ASGI middleware.
+
+Request headers are scanned once into a dict kept on the ASGI scope and the
+Cookie header is parsed at most once, so every middleware layer reads the same
+values without building its own Starlette ``Request``.
+"""
+
+from starlette.requests import cookie_parser
+from starlette.types import Scope
+
+_HEADERS_SCOPE_KEY = "cinelog.headers"
+_COOKIES_SCOPE_KEY = "cinelog.cookies"
+
+
+def get_scope_headers(scope: Scope) -> dict[bytes, bytes]:
+    """Return lower-case header names mapped to their first value."""
+    headers: dict[bytes, bytes] | None = scope.get(_HEADERS_SCOPE_KEY)
+    if headers is None:
+        headers = {}
+        for name, value in scope["headers"]:
+            headers.setdefault(name, value)
+        scope[_HEADERS_SCOPE_KEY] = headers
+    return headers
+
+
+def get_header(scope: Scope, name: bytes) -> str | None:
+    """Return the first value of header ``name`` (lower-case bytes), if present."""
+    value = get_scope_headers(scope).get(name)
+    return value.decode("latin-1") if value is not None else None
+
+
+def get_cookies(scope: Scope) -> dict[str, str]:
+    """Return the request cookies, parsed on first use."""
+    cookies: dict[str, str] | None = scope.get(_COOKIES_SCOPE_KEY)
+    if cookies is None:
+        cookie_header = get_header(scope, b"cookie")
+        cookies = cookie_parser(cookie_header) if cookie_header else {}
+        scope[_COOKIES_SCOPE_KEY] = cookies
+    return cookies
+
+
+def set_scope_state(scope: Scope, name: str, value: object) -> None:
+    """Set ``request.state.<name>`` for the handlers further down the stack."""
+    scope.setdefault("state", {})[name] = value
@@ -13,10 +13,19 @@ REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7))
 # This prevents subdomain cookie injection attacks
 ACCESS_TOKEN_COOKIE = "__Host-access_token"  # nosec B105
 CSRF_TOKEN_COOKIE = "__Host-csrf_token"  # nosec B105
-REFRESH_TOKEN_COOKIE = "refresh_token"  # nosec B105 — No __Host- prefix: needs path="/v1/auth/refresh"
+REFRESH_TOKEN_COOKIE = "refresh_token"  # nosec B105 — No __Host- prefix: needs a path below /
+# Sent to /refresh and to /logout, which revokes its session once the access cookie has expired
+REFRESH_TOKEN_COOKIE_PATH = "/v1/auth"  # nosec B105
+# Path of refresh cookies set before logout could read them; cleared alongside the current one
+LEGACY_REFRESH_TOKEN_COOKIE_PATH = "/v1/auth/refresh"  # nosec B105
 RATE_LIMIT_SESSION_COOKIE = "__Host-session_id"  # nosec B105
 RATE_LIMIT_SESSION_TTL_SECONDS = 3600 * 24 * 7
 
+# Access-token claim carrying the account locale so locale-aware requests skip the user lookup
+ACCESS_TOKEN_LOCALE_CLAIM = "locale"  # nosec B105
+# Claim on access and refresh tokens naming the server-side login session (see SessionService)
+SESSION_ID_CLAIM = "sid"
+
 
 def normalize_email_identifier(email: str) -> str:
     """Return the canonical email form used for auth lookups and keyed limits."""
@@ -33,20 +42,20 @@ def generate_rate_limit_session_id() -> str:
     return secrets.token_hex(16)
 
 
-def set_auth_cookies(response: Response, user_id: str):
+def set_access_token_cookie(response: Response, user_id: str, session_id: str, locale: str | None = None) -> str:
     """
-    Helper to set access and refresh tokens in HttpOnly cookies.
+    Helper to set only the access token cookie, optionally carrying the account locale claim.
     """
     from app.services.token_service import TokenService
 
-    # Create Tokens
+    claims = {"sub": user_id, SESSION_ID_CLAIM: session_id}
+    if locale is not None:
+        claims[ACCESS_TOKEN_LOCALE_CLAIM] = locale
+
     access_token = TokenService.create_access_token(
-        data={"sub": user_id},
+        data=claims,
         expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
     )
-    refresh_token = TokenService.create_refresh_token(
-        data={"sub": user_id}, expires_delta=timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    )
 
     # Set Access Token Cookie (__Host- prefix)
     response.set_cookie(
@@ -59,6 +68,24 @@ def set_auth_cookies(response: Response, user_id: str):
         path="/",
     )
 
+    return access_token
+
+
+def set_auth_cookies(response: Response, user_id: str, session_id: str, locale: str | None = None):
+    """
+    Helper to set access and refresh tokens in HttpOnly cookies.
+
+    Both tokens carry the session ID. The locale claim goes into the access
+    token only; refresh re-reads the preference.
+    """
+    from app.services.token_service import TokenService
+
+    # Create Tokens
+    access_token = set_access_token_cookie(response, user_id, session_id, locale=locale)
+    refresh_token = TokenService.create_refresh_token(
+        data={"sub": user_id, SESSION_ID_CLAIM: session_id}, expires_delta=timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    )
+
     # Set Refresh Token Cookie (path-scoped, no __Host- prefix)
     response.set_cookie(
         key=REFRESH_TOKEN_COOKIE,
@@ -67,7 +94,7 @@ def set_auth_cookies(response: Response, user_id: str):
         secure=True,
         samesite="strict",
         max_age=REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
-        path="/v1/auth/refresh",
+        path=REFRESH_TOKEN_COOKIE_PATH,
     )
 
     return access_token, refresh_token
@@ -95,13 +122,14 @@ def clear_auth_cookies(response: Response) -> None:
     Clears all authentication and CSRF cookies from the response.
     """
     response.delete_cookie(ACCESS_TOKEN_COOKIE, path="/", secure=True, httponly=True, samesite="strict")
-    response.delete_cookie(
-        REFRESH_TOKEN_COOKIE,
-        path="/v1/auth/refresh",
-        secure=True,
-        httponly=True,
-        samesite="strict",
-    )
+    for refresh_path in (REFRESH_TOKEN_COOKIE_PATH, LEGACY_REFRESH_TOKEN_COOKIE_PATH):
+        response.delete_cookie(
+            REFRESH_TOKEN_COOKIE,
+            path=refresh_path,
+            secure=True,
+            httponly=True,
+            samesite="strict",
+        )
     response.delete_cookie(CSRF_TOKEN_COOKIE, path="/", secure=True, httponly=True, samesite="lax")
 
 
@@ -73,6 +73,13 @@ class ErrorCodes:
         error_description="The current password provided is incorrect.",
     )
 
+    PASSWORD_HASHING_UNAVAILABLE = ErrorSchema(
+        error_code_name="PASSWORD_HASHING_UNAVAILABLE",
+        error_code=503,
+        error_message="Password service busy",
+        error_description="Too many password checks are in progress. Please try again shortly.",
+    )
+
     SAME_PASSWORD = ErrorSchema(
         error_code_name="SAME_PASSWORD",
         error_code=400,
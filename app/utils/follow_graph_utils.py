@@ -0,0 +1,110 @@
+"""In-memory follow graph for offline friends-of-friends scoring.
+
+The graph is stored in compressed sparse row (CSR) form: users are numbered
+``0..n-1`` and the users ``i`` follows are ``targets[offsets[i]:offsets[i + 1]]``.
+Both are flat ``array`` buffers of machine integers, so a graph with millions
+of edges costs a few bytes per edge instead of one Python object per edge,
+and a user's neighbours are a contiguous slice.
+"""
+
+import heapq
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class FollowGraph:
+    """Active users, their outgoing follow edges in CSR form, and who may be suggested."""
+
+    user_ids: Sequence[UUID]
+    offsets: array
+    targets: array
+    suggestible: bytearray
+    follower_counts: array
+
+    @property
+    def size(self) -> int:
+        return len(self.user_ids)
+
+    def following(self, node: int) -> array:
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+
+class FollowGraphBuilder:
+    """Accumulate ``(follower_id, followed_id)`` edges, in batches, into a ``FollowGraph``.
+
+    Users and edges must both be ordered by user ID, as scans of the ``users``
+    and ``user_follows`` primary keys return them, so each follower's edges
+    land in one contiguous slice. Edges touching a user not passed to the
+    constructor (for example a deactivated one) are skipped.
+    """
+
+    def __init__(self, users: Iterable[tuple[UUID, bool]]):
+        self._user_ids: list[UUID] = []
+        self._suggestible = bytearray()
+        for user_id, is_suggestible in users:
+            self._user_ids.append(user_id)
+            self._suggestible.append(1 if is_suggestible else 0)
+        self._index = {user_id: position for position, user_id in enumerate(self._user_ids)}
+        self._offsets = array("q", [0]) * (len(self._user_ids) + 1)
+        self._targets = array("l")
+        self._follower_counts = array("l", [0]) * len(self._user_ids)
+        self._previous = -1
+
+    def add_edges(self, edges: Iterable[tuple[UUID, UUID]]) -> None:
+        for follower_id, followed_id in edges:
+            follower = self._index.get(follower_id)
+            followed = self._index.get(followed_id)
+            if follower is None or followed is None:
+                continue
+            if follower < self._previous:
+                raise ValueError("Follow edges must be ordered by follower ID")
+            self._previous = follower
+            self._targets.append(followed)
+            self._offsets[follower + 1] += 1
+            self._follower_counts[followed] += 1
+
+    def build(self) -> FollowGraph:
+        """Turn per-user edge counts into cumulative offsets and return the graph."""
+
+        offsets = array("q", self._offsets)
+        for position in range(len(self._user_ids)):
+            offsets[position + 1] += offsets[position]
+        return FollowGraph(
+            user_ids=self._user_ids,
+            offsets=offsets,
+            targets=self._targets,
+            suggestible=self._suggestible,
+            follower_counts=self._follower_counts,
+        )
+
+
+def suggest_friends_of_friends(graph: FollowGraph, node: int, top_k: int) -> list[tuple[int, int]]:
+    """Return up to ``top_k`` ``(candidate, mutual_count)`` pairs for one user, best first.
+
+    A candidate is a suggestible user followed by a suggestible user ``node``
+    follows, who is not ``node`` and not already followed. The score is the
+    number of such intermediaries; ties go to the candidate with more
+    followers, then the lower node number so runs are repeatable.
+    """
+
+    followed = graph.following(node)
+    excluded = set(followed)
+    excluded.add(node)
+    suggestible = graph.suggestible
+    scores: dict[int, int] = {}
+    for intermediary in followed:
+        if not suggestible[intermediary]:
+            continue
+        for candidate in graph.following(intermediary):
+            if candidate not in excluded and suggestible[candidate]:
+                scores[candidate] = scores.get(candidate, 0) + 1
+
+    follower_counts = graph.follower_counts
+    return heapq.nlargest(
+        top_k,
+        scores.items(),
+        key=lambda item: (item[1], follower_counts[item[0]], -item[0]),
+    )
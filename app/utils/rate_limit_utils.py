@@ -1,21 +1,87 @@
 """
 Rate limiting utilities.
 
-Provides a custom exception handler for slowapi's RateLimitExceeded that
-returns a structured ErrorSchema response consistent with the rest of the API,
-while preserving the Retry-After and X-RateLimit-* headers injected by slowapi.
+Parses the ``"<amount>/<period>"`` limit notation used by the route decorators,
+describes the outcome of a bucket check, and provides the exception handler
+that turns a rejected check into a structured ErrorSchema response carrying
+the Retry-After and X-RateLimit-* headers.
 """
 
-from typing import cast
+import math
+import re
+import time
+from dataclasses import dataclass
 
-from fastapi import Request
+from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from slowapi.util import get_remote_address
 
 from app.utils.error_codes_utils import ErrorCodes
 
 RATE_LIMIT_SESSION_STATE = "rate_limit_session_id"
 
+_RATE_LIMIT_PERIOD_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_RATE_LIMIT_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(\d*)\s*(second|minute|hour|day)s?\s*$")
+
+
+@dataclass(frozen=True)
+class RateLimitItem:
+    """``amount`` requests per ``period_seconds``, enforced as a GCRA bucket of that burst."""
+
+    amount: int
+    period_seconds: int
+
+    def get_expiry(self) -> int:
+        return self.period_seconds
+
+    @property
+    def emission_interval_us(self) -> int:
+        """Microseconds of credit one request costs; a full bucket drains in one period."""
+        return max(1, self.period_seconds * 1_000_000 // self.amount)
+
+    def __str__(self) -> str:
+        return f"{self.amount}/{self.period_seconds}s"
+
+
+def parse_rate_limit(value: str) -> RateLimitItem:
+    """Parse limits such as ``"60/minute"`` or ``"5/15minute"``."""
+    match = _RATE_LIMIT_PATTERN.match(value.lower())
+    if match is None or int(match.group(1)) < 1:
+        raise ValueError(f"Invalid rate limit: {value!r}")
+
+    amount, multiples, granularity = match.groups()
+    return RateLimitItem(
+        amount=int(amount),
+        period_seconds=int(multiples or 1) * _RATE_LIMIT_PERIOD_SECONDS[granularity],
+    )
+
+
+@dataclass(frozen=True)
+class RateLimitState:
+    """Outcome of checking one bucket; durations are seconds from the check."""
+
+    limit: RateLimitItem
+    allowed: bool
+    remaining: int
+    reset_after: float
+    retry_after: float
+
+
+class RateLimitExceeded(Exception):
+    """Raised by rate-limited routes; ``state`` is the bucket that rejected the request."""
+
+    def __init__(self, state: RateLimitState):
+        super().__init__(f"Rate limit exceeded: {state.limit}")
+        self.state = state
+
+
+def inject_rate_limit_headers(response: Response, state: RateLimitState) -> None:
+    """Describe ``state`` in X-RateLimit-* headers, adding Retry-After when rejected."""
+    response.headers["X-RateLimit-Limit"] = str(state.limit.amount)
+    response.headers["X-RateLimit-Remaining"] = str(state.remaining)
+    response.headers["X-RateLimit-Reset"] = str(math.ceil(time.time() + state.reset_after))
+    if not state.allowed:
+        response.headers["Retry-After"] = str(max(1, math.ceil(state.retry_after)))
+
 
 async def rate_limit_exceeded_handler(request: Request, exc: Exception) -> JSONResponse:
     """Return a structured 429 response matching the API's ErrorSchema format."""
@@ -29,10 +95,8 @@ async def rate_limit_exceeded_handler(request: Request, exc: Exception) -> JSONR
             "error_description": error.error_description,
         },
     )
-    response = cast(
-        JSONResponse,
-        request.app.state.limiter._inject_headers(response, request.state.view_rate_limit),
-    )
+    if isinstance(exc, RateLimitExceeded):
+        inject_rate_limit_headers(response, exc.state)
     return response
 
 
@@ -47,7 +111,8 @@ def get_rate_limit_key(request: Request) -> str:
 
 def get_ip_rate_limit_key(request: Request) -> str:
     """Return the client IP key for coarse outer rate limits."""
-    return f"ip:{get_remote_address(request)}"
+    host = request.client.host if request.client else "127.0.0.1"
+    return f"ip:{host}"
 
 
 def get_session_rate_limit_key(request: Request) -> str:
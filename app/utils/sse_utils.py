@@ -0,0 +1,27 @@
+"""Server-Sent Events wire formatting helpers."""
+
+import json
+from typing import Any
+
+
+def format_sse_event(event: str, data: Any, event_id: str | None = None) -> str:
+    """Format one SSE frame with a JSON ``data`` line."""
+
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+def format_sse_comment(comment: str) -> str:
+    """Format an SSE comment line, which clients ignore but proxies see as traffic."""
+
+    return f": {comment}\n\n"
+
+
+def format_sse_retry(milliseconds: int) -> str:
+    """Tell the client how long to wait before reconnecting."""
+
+    return f"retry: {milliseconds}\n\n"
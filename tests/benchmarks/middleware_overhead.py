@@ -0,0 +1,145 @@
+"""Microbenchmark of the per-request cost of the HTTP middleware stack.
+
+Drives the ASGI callables directly with synthetic scopes, so the numbers are
+the middleware's own work without sockets, routing or Redis latency (the
+session store is an in-process stand-in). A no-op ``BaseHTTPMiddleware`` is
+included as the reference point for what the previous design paid per layer.
+
+Run with::
+
+    python -m tests.benchmarks.middleware_overhead --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint  # noqa: E402
+from starlette.middleware.cors import CORSMiddleware  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import Response  # noqa: E402
+from starlette.types import ASGIApp, Message, Receive, Scope, Send  # noqa: E402
+
+from app.config.cors import get_cors_config  # noqa: E402
+from app.config.public_routes import CSRF_EXEMPT_PATHS  # noqa: E402
+from app.middleware.csrf_middleware import CSRFMiddleware  # noqa: E402
+from app.middleware.rate_limit_session_middleware import RateLimitSessionMiddleware  # noqa: E402
+from app.utils.auth_utils import CSRF_TOKEN_COOKIE, RATE_LIMIT_SESSION_COOKIE  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+SESSION_ID = "benchmark-session"
+CSRF_TOKEN = "benchmark-csrf-token"
+
+
+class InMemorySessions:
+    async def refresh_session(self, session_id: str) -> bool:
+        return session_id == SESSION_ID
+
+    async def upsert_session(self, session_id: str) -> None:
+        return None
+
+
+class NoOpHTTPMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        return await call_next(request)
+
+
+async def endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-length", b"2")]})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def session_middleware(app: ASGIApp) -> RateLimitSessionMiddleware:
+    middleware = RateLimitSessionMiddleware(app)
+    middleware._rate_limit_cache = InMemorySessions()  # type: ignore[assignment]
+    return middleware
+
+
+def full_stack(app: ASGIApp) -> ASGIApp:
+    # Same order as app/__init__.py: CORS outermost, the session middleware innermost.
+    return CORSMiddleware(CSRFMiddleware(session_middleware(app), exempt_paths=CSRF_EXEMPT_PATHS), **get_cors_config())
+
+
+def make_scope(method: str, path: str) -> Scope:
+    cookie = f"{RATE_LIMIT_SESSION_COOKIE}={SESSION_ID}; {CSRF_TOKEN_COOKIE}={CSRF_TOKEN}"
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "https",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"api.cinelog.test"),
+            (b"user-agent", b"benchmark"),
+            (b"accept", b"application/json"),
+            (b"content-type", b"application/json"),
+            (b"cookie", cookie.encode()),
+            (b"x-csrf-token", CSRF_TOKEN.encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("api.cinelog.test", 443),
+    }
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message: Message) -> None:
+    return None
+
+
+async def time_app(app: ASGIApp, method: str, path: str, requests: int) -> float:
+    """Return the mean microseconds per request."""
+
+    for _ in range(min(requests, 1000)):
+        await app(make_scope(method, path), receive, send)
+
+    started_at = time.perf_counter()
+    for _ in range(requests):
+        await app(make_scope(method, path), receive, send)
+    return (time.perf_counter() - started_at) / requests * 1_000_000
+
+
+async def run(requests: int) -> None:
+    cases = [
+        ("GET  /v1/logs (untracked, safe)", "GET", "/v1/logs"),
+        ("POST /v1/logs (CSRF checked)", "POST", "/v1/logs"),
+        ("POST /v1/auth/login (session refreshed)", "POST", "/v1/auth/login"),
+    ]
+    stacks: list[tuple[str, ASGIApp]] = [
+        ("no-op BaseHTTPMiddleware", NoOpHTTPMiddleware(endpoint)),
+        ("CSRFMiddleware", CSRFMiddleware(endpoint, exempt_paths=CSRF_EXEMPT_PATHS)),
+        ("RateLimitSessionMiddleware", session_middleware(endpoint)),
+        ("full stack (CORS, CSRF, session)", full_stack(endpoint)),
+    ]
+
+    for label, method, path in cases:
+        baseline = await time_app(endpoint, method, path, requests)
+        logger.info("%s: bare endpoint %.2f us/request", label, baseline)
+        for name, app in stacks:
+            total = await time_app(app, method, path, requests)
+            logger.info("  %-34s +%6.2f us/request", name, total - baseline)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--requests", type=int, default=20000, help="Timed requests per case and stack")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
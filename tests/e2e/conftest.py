@@ -140,10 +140,10 @@ async def async_client(postgres_engine):
     CacheService.initialize(get_redis_config())
     registration_codes: dict[str, str] = {}
 
-    def capture_registration_code(self, to_email: str, code: str) -> None:
+    async def capture_registration_code(self, to_email: str, code: str) -> None:
         registration_codes[normalize_email_identifier(to_email)] = code
 
-    def capture_existing_account_notice(self, to_email: str) -> None:
+    async def capture_existing_account_notice(self, to_email: str) -> None:
         return None
 
     transport = httpx.ASGITransport(app=app)
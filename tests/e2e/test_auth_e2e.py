@@ -240,6 +240,12 @@ class TestAuthE2E:
         assert any("__Host-access_token=" in c and "Max-Age=0" in c for c in set_cookies)
         assert any("refresh_token=" in c and "Max-Age=0" in c for c in set_cookies)
 
+        # Logout revoked the session, so its refresh token can no longer be exchanged
+        async_client.cookies.set("refresh_token", login_resp.cookies["refresh_token"])
+        refresh_resp = await async_client.post("/v1/auth/refresh")
+        assert refresh_resp.status_code == 401
+        assert refresh_resp.json() == {"detail": "Session revoked"}
+
     async def test_refresh_token_success(self, async_client):
         """Test successful token refresh."""
         await async_client.post(
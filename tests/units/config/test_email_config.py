@@ -0,0 +1,29 @@
+import os
+from unittest.mock import patch
+
+from app.config.email_config import get_smtp_config
+
+
+def test_get_smtp_config_is_none_without_server():
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_smtp_config() is None
+
+
+def test_get_smtp_config_defaults():
+    with patch.dict(os.environ, {"SMTP_SERVER": "smtp.example.com", "SMTP_USER": ""}, clear=True):
+        config = get_smtp_config()
+        assert config == {
+            "server": "smtp.example.com",
+            "port": 587,
+            "user": None,
+            "password": None,
+            "from_email": "noreply@cinelog.app",
+            "use_ssl": False,
+        }
+
+
+def test_get_smtp_config_uses_ssl_on_port_465():
+    with patch.dict(os.environ, {"SMTP_SERVER": "smtp.example.com", "SMTP_PORT": "465"}, clear=True):
+        config = get_smtp_config()
+        assert config is not None
+        assert config["use_ssl"] is True
@@ -2,7 +2,10 @@
 
 from uuid import uuid4
 
-from app.config.notification_config import notification_list_cursor_scope
+from app.config.notification_config import (
+    notification_list_cursor_scope,
+    notification_stream_cursor_scope,
+)
 
 
 def test_notification_list_cursor_scope_is_unique_per_recipient():
@@ -12,3 +15,11 @@ def test_notification_list_cursor_scope_is_unique_per_recipient():
     assert notification_list_cursor_scope(recipient_id) == f"notifications.list:{recipient_id}"
     assert notification_list_cursor_scope(recipient_id) == notification_list_cursor_scope(recipient_id)
     assert notification_list_cursor_scope(recipient_id) != notification_list_cursor_scope(other_recipient_id)
+
+
+def test_notification_stream_cursor_scope_differs_from_list_scope():
+    recipient_id = uuid4()
+
+    assert notification_stream_cursor_scope(recipient_id) == f"notifications.stream:{recipient_id}"
+    assert notification_stream_cursor_scope(recipient_id) != notification_list_cursor_scope(recipient_id)
+    assert notification_stream_cursor_scope(recipient_id) != notification_stream_cursor_scope(uuid4())
@@ -1,8 +1,9 @@
 import pytest
-from limits.storage import MemoryStorage
-from limits.strategies import FixedWindowRateLimiter
 
 import app.config.rate_limiter as rate_limiter_module
+from app.services.rate_limit_engine import LocalRateLimitBuckets, MemoryRateLimitStorage
+from app.services.session_service import session_revocation_cache
+from app.services.token_service import access_token_cache
 
 
 @pytest.fixture(autouse=True)
@@ -10,16 +11,25 @@ def use_memory_storage_for_rate_limiter():
     """
     Swap the global rate limiter's Redis storage with in-memory storage for
     all unit tests. This prevents tests from requiring a live Redis connection.
-    Rate limit counts are reset per test via a fresh MemoryStorage instance.
+    Rate limit buckets are reset per test via a fresh MemoryRateLimitStorage
+    and an empty set of local hybrid buckets.
     """
-    memory_storage = MemoryStorage()
-    original_storage = rate_limiter_module.limiter._storage
-    original_limiter = rate_limiter_module.limiter._limiter
-
-    rate_limiter_module.limiter._storage = memory_storage
-    rate_limiter_module.limiter._limiter = FixedWindowRateLimiter(memory_storage)
+    original_storage = rate_limiter_module.limiter.storage
+    original_local_buckets = rate_limiter_module.limiter.local_buckets
+    rate_limiter_module.limiter.storage = MemoryRateLimitStorage()
+    rate_limiter_module.limiter.local_buckets = LocalRateLimitBuckets()
 
     yield
 
-    rate_limiter_module.limiter._storage = original_storage
-    rate_limiter_module.limiter._limiter = original_limiter
+    rate_limiter_module.limiter.storage = original_storage
+    rate_limiter_module.limiter.local_buckets = original_local_buckets
+
+
+@pytest.fixture(autouse=True)
+def clear_access_token_cache():
+    """Start every test without access tokens verified or revocations cached by an earlier one."""
+    access_token_cache.clear()
+    session_revocation_cache.clear()
+    yield
+    access_token_cache.clear()
+    session_revocation_cache.clear()
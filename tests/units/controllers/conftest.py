@@ -11,10 +11,15 @@ class FakeRedisClient:
         self.values: dict[str, str] = {}
         self.hashes: dict[str, dict[str, str]] = {}
         self.set_calls: list[tuple[str, str, int | None]] = []
+        self.getex_calls: list[tuple[str, int | None]] = []
 
     async def get(self, key: str) -> str | None:
         return self.values.get(key)
 
+    async def getex(self, key: str, ex: int | None = None) -> str | None:
+        self.getex_calls.append((key, ex))
+        return self.values.get(key)
+
     async def set(self, key: str, value: str, ex: int | None = None) -> bool:
         self.values[key] = value
         self.set_calls.append((key, value, ex))
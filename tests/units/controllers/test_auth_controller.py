@@ -2,16 +2,20 @@
 Unit tests for auth controller endpoints.
 """
 
+import json
+import time
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 
 from app import app
 from app.dependencies.auth_dependency import auth_dependency
-from app.dependencies.service_dependency import get_auth_service
+from app.dependencies.service_dependency import get_auth_service, get_session_service, get_user_service
 from app.schemas.auth_schemas import RegisterResponse
+from app.services.token_service import TokenService
 
 
 @pytest.fixture
@@ -19,6 +23,12 @@ def client():
     return TestClient(app)
 
 
+def _register_session(fake_cache_client, user_id: UUID) -> str:
+    session_id = f"session-{uuid4().hex}"
+    fake_cache_client.values[f"cinelog:auth:session:{session_id}"] = json.dumps({"user_id": str(user_id)})
+    return session_id
+
+
 class TestAuthController:
     """Tests for auth controller endpoints."""
 
@@ -223,3 +233,123 @@ class TestAuthController:
 
         assert response.status_code == 401
         assert response.json() == {"detail": "Unauthorized"}
+
+    @patch.object(get_user_service(), "get_locale", new_callable=AsyncMock)
+    def test_refresh_reissues_access_token_with_current_locale(self, mock_get_locale, client, fake_cache_client):
+        """Test refresh re-reads the saved locale into the rotated access token."""
+        user_id = uuid4()
+        mock_get_locale.return_value = "fr-FR"
+        session_id = _register_session(fake_cache_client, user_id)
+        client.cookies.set("refresh_token", TokenService.create_refresh_token({"sub": str(user_id), "sid": session_id}))
+
+        try:
+            response = client.post("/v1/auth/refresh")
+        finally:
+            client.cookies.clear()
+
+        assert response.status_code == 200
+        mock_get_locale.assert_awaited_once_with(user_id)
+        access_token = response.cookies.get("__Host-access_token")
+        assert access_token is not None
+        payload = TokenService.decode_token(access_token)
+        assert payload["sub"] == str(user_id)
+        assert payload["sid"] == session_id
+        assert payload["locale"] == "fr-FR"
+
+    @patch.object(get_user_service(), "get_locale", new_callable=AsyncMock)
+    def test_refresh_without_session_claim_is_rejected(self, mock_get_locale, client):
+        """Test refresh tokens issued before sessions existed must log in again."""
+        client.cookies.set("refresh_token", TokenService.create_refresh_token({"sub": str(uuid4())}))
+
+        try:
+            response = client.post("/v1/auth/refresh")
+        finally:
+            client.cookies.clear()
+
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Invalid token payload"}
+        mock_get_locale.assert_not_awaited()
+
+    @patch.object(get_user_service(), "get_locale", new_callable=AsyncMock)
+    def test_refresh_with_unknown_session_is_rejected(self, mock_get_locale, client):
+        """Test refresh fails once the session record was revoked (or never existed)."""
+        client.cookies.set(
+            "refresh_token", TokenService.create_refresh_token({"sub": str(uuid4()), "sid": "revoked-session"})
+        )
+
+        try:
+            response = client.post("/v1/auth/refresh")
+        finally:
+            client.cookies.clear()
+
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Session revoked"}
+        mock_get_locale.assert_not_awaited()
+
+    @patch.object(get_user_service(), "get_locale", new_callable=AsyncMock)
+    def test_refresh_issued_before_revoke_all_is_rejected(self, mock_get_locale, client, fake_cache_client):
+        """Test a password change or account deletion ends sessions on other devices."""
+        user_id = uuid4()
+        session_id = _register_session(fake_cache_client, user_id)
+        client.cookies.set("refresh_token", TokenService.create_refresh_token({"sub": str(user_id), "sid": session_id}))
+        fake_cache_client.hashes[f"cinelog:auth:revocations:{user_id}"] = {"before": str(time.time() + 1)}
+
+        try:
+            response = client.post("/v1/auth/refresh")
+        finally:
+            client.cookies.clear()
+
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Session revoked"}
+
+    @patch.object(get_session_service(), "revoke_session", new_callable=AsyncMock)
+    def test_logout_revokes_the_current_session(self, mock_revoke_session, client):
+        """Test logout ends the session named by the access token, even an expired one."""
+        user_id = uuid4()
+        token = TokenService.create_access_token(
+            {"sub": str(user_id), "sid": "session-1"}, expires_delta=timedelta(seconds=-1)
+        )
+        client.cookies.set("__Host-access_token", token)
+        client.cookies.set("__Host-csrf_token", "test-token")
+
+        try:
+            response = client.post("/v1/auth/logout", headers={"X-CSRF-Token": "test-token"})
+        finally:
+            client.cookies.clear()
+
+        assert response.status_code == 200
+        mock_revoke_session.assert_awaited_once_with(user_id, "session-1")
+
+    @patch.object(get_session_service(), "revoke_session", new_callable=AsyncMock)
+    def test_logout_revokes_the_session_from_the_refresh_cookie(self, mock_revoke_session, client):
+        """Test logout ends the session once the access cookie has lapsed, and clears the refresh cookie."""
+        user_id = uuid4()
+        client.cookies.set(
+            "refresh_token", TokenService.create_refresh_token({"sub": str(user_id), "sid": "session-1"})
+        )
+        client.cookies.set("__Host-csrf_token", "test-token")
+
+        try:
+            response = client.post("/v1/auth/logout", headers={"X-CSRF-Token": "test-token"})
+        finally:
+            client.cookies.clear()
+
+        assert response.status_code == 200
+        mock_revoke_session.assert_awaited_once_with(user_id, "session-1")
+        cleared = [c for c in response.headers.get_list("set-cookie") if c.startswith("refresh_token=")]
+        assert {c.split("Path=")[1].split(";")[0] for c in cleared} == {"/v1/auth", "/v1/auth/refresh"}
+
+    @patch.object(get_session_service(), "revoke_session", new_callable=AsyncMock)
+    def test_logout_clears_cookies_when_revocation_fails(self, mock_revoke_session, client):
+        """Test logout still succeeds when Redis is unavailable."""
+        mock_revoke_session.side_effect = ConnectionError("redis down")
+        client.cookies.set("__Host-access_token", TokenService.create_access_token({"sub": str(uuid4()), "sid": "s"}))
+        client.cookies.set("__Host-csrf_token", "test-token")
+
+        try:
+            response = client.post("/v1/auth/logout", headers={"X-CSRF-Token": "test-token"})
+        finally:
+            client.cookies.clear()
+
+        assert response.status_code == 200
+        assert any("__Host-access_token=" in c and "Max-Age=0" in c for c in response.headers.get_list("set-cookie"))
@@ -0,0 +1,79 @@
+"""Controller contract tests for the home feed."""
+
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app
+from app.dependencies.auth_dependency import auth_dependency
+from app.dependencies.service_dependency import get_feed_service
+from app.schemas.feed_schemas import FeedAuthor, FeedItem, FeedResponse
+from app.schemas.movie_schemas import MovieResponse
+from app.utils.error_codes_utils import ErrorCodes
+from app.utils.exceptions_utils import AppException
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def user_id():
+    return uuid4()
+
+
+@pytest.fixture
+def feed_service(user_id):
+    service = AsyncMock()
+    app.dependency_overrides[auth_dependency] = lambda: user_id
+    app.dependency_overrides[get_feed_service] = lambda: service
+    yield service
+    app.dependency_overrides = {}
+
+
+def test_get_feed_returns_items_with_aliases(client: TestClient, feed_service: AsyncMock, user_id):
+    feed_service.get_feed.return_value = FeedResponse(
+        items=[
+            FeedItem(
+                id=uuid4(),
+                author=FeedAuthor(handle="ada", first_name="Ada", last_name="Lovelace"),
+                movie=MovieResponse(id=uuid4(), title="Heat", tmdb_id=949),
+                tmdb_id=949,
+                date_watched=date(2026, 10, 1),
+                watched_where="cinema",
+                created_at=datetime(2026, 10, 1, 20, tzinfo=UTC),
+            )
+        ],
+        next_cursor="next-page",
+    )
+
+    response = client.get("/v1/feed?limit=10")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["nextCursor"] == "next-page"
+    assert body["items"][0]["author"]["firstName"] == "Ada"
+    assert body["items"][0]["tmdbId"] == 949
+    assert feed_service.get_feed.await_args.args[0] == user_id
+    assert feed_service.get_feed.await_args.args[1].limit == 10
+
+
+@pytest.mark.parametrize("query", ["limit=0", "limit=101", f"cursor={'a' * 513}", "unknown=value"])
+def test_get_feed_rejects_invalid_query(query: str, client: TestClient, feed_service: AsyncMock):
+    response = client.get(f"/v1/feed?{query}")
+
+    assert response.status_code == 422
+    feed_service.get_feed.assert_not_awaited()
+
+
+def test_get_feed_returns_422_for_a_rejected_cursor(client: TestClient, feed_service: AsyncMock):
+    feed_service.get_feed.side_effect = AppException(ErrorCodes.INVALID_PAGINATION_CURSOR)
+
+    response = client.get("/v1/feed?cursor=invalid")
+
+    assert response.status_code == 422
+    assert response.json()["error_code_name"] == "INVALID_PAGINATION_CURSOR"
@@ -1,5 +1,6 @@
 """Controller tests for idempotent follow mutations."""
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
@@ -8,7 +9,15 @@ from fastapi.testclient import TestClient
 
 from app import app
 from app.dependencies.auth_dependency import auth_dependency
-from app.dependencies.service_dependency import get_follow_service
+from app.dependencies.service_dependency import get_follow_service, get_follow_suggestion_service
+from app.schemas.user_schemas import (
+    FollowListResponse,
+    FollowSuggestion,
+    FollowSuggestionsResponse,
+    FollowUserSummary,
+    RelationshipsResponse,
+    UserRelationship,
+)
 from app.utils.error_codes_utils import ErrorCodes
 from app.utils.exceptions_utils import AppException
 
@@ -91,3 +100,123 @@ class TestFollowController:
         )
 
         assert response.status_code == 401
+
+
+class TestFollowListController:
+    @patch.object(get_follow_service(), "list_followers", new_callable=AsyncMock)
+    def test_list_followers_passes_query_and_returns_camel_case(self, mock_list, client, override_auth):
+        app.dependency_overrides[auth_dependency] = override_auth
+        mock_list.return_value = FollowListResponse(
+            items=[
+                FollowUserSummary(
+                    handle="fan",
+                    first_name="Fan",
+                    last_name="User",
+                    followed_at=datetime(2026, 10, 1, tzinfo=UTC),
+                )
+            ],
+            next_cursor="next-page",
+        )
+
+        response = client.get(
+            "/v1/users/Profile/followers?limit=5&cursor=abc",
+            cookies={"__Host-access_token": "token"},
+        )
+
+        app.dependency_overrides = {}
+        assert response.status_code == 200
+        assert response.json() == {
+            "items": [{"handle": "fan", "firstName": "Fan", "lastName": "User", "followedAt": "2026-10-01T00:00:00Z"}],
+            "nextCursor": "next-page",
+        }
+        kwargs = mock_list.await_args.kwargs
+        assert (kwargs["handle"], kwargs["requester_id"]) == ("Profile", override_auth())
+        assert (kwargs["request"].limit, kwargs["request"].cursor) == (5, "abc")
+
+    @pytest.mark.parametrize("query", ["limit=0", "limit=101", "unknown=value"])
+    @patch.object(get_follow_service(), "list_following", new_callable=AsyncMock)
+    def test_list_following_rejects_invalid_query(self, mock_list, query, client, override_auth):
+        app.dependency_overrides[auth_dependency] = override_auth
+
+        response = client.get(f"/v1/users/Profile/following?{query}", cookies={"__Host-access_token": "token"})
+
+        app.dependency_overrides = {}
+        assert response.status_code == 422
+        mock_list.assert_not_awaited()
+
+
+class TestRelationshipsController:
+    @patch.object(get_follow_service(), "get_relationships", new_callable=AsyncMock)
+    def test_relationships_resolves_ids_and_handles(self, mock_relationships, client, override_auth):
+        app.dependency_overrides[auth_dependency] = override_auth
+        followed_id = uuid4()
+        mock_relationships.return_value = RelationshipsResponse(
+            relationships=[UserRelationship(user_id=followed_id, handle="followed", is_following=True)]
+        )
+
+        response = client.post(
+            "/v1/users/relationships",
+            json={"userIds": [str(followed_id)], "handles": ["other_user"]},
+            **_csrf_request_kwargs(),
+        )
+
+        app.dependency_overrides = {}
+        assert response.status_code == 200
+        assert response.json() == {
+            "relationships": [{"userId": str(followed_id), "handle": "followed", "isFollowing": True}]
+        }
+        kwargs = mock_relationships.await_args.kwargs
+        assert kwargs["requester_id"] == override_auth()
+        assert (kwargs["request"].user_ids, kwargs["request"].handles) == ([followed_id], ["other_user"])
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {},
+            {"userIds": [], "handles": []},
+            {"userIds": [str(uuid4()) for _ in range(60)], "handles": [f"user_{index}" for index in range(41)]},
+            {"handles": ["valid_user"], "unknown": True},
+        ],
+    )
+    @patch.object(get_follow_service(), "get_relationships", new_callable=AsyncMock)
+    def test_relationships_rejects_empty_oversized_or_unknown_body(
+        self, mock_relationships, body, client, override_auth
+    ):
+        app.dependency_overrides[auth_dependency] = override_auth
+
+        response = client.post("/v1/users/relationships", json=body, **_csrf_request_kwargs())
+
+        app.dependency_overrides = {}
+        assert response.status_code == 422
+        mock_relationships.assert_not_awaited()
+
+
+class TestFollowSuggestionsController:
+    @patch.object(get_follow_suggestion_service(), "get_suggestions", new_callable=AsyncMock)
+    def test_suggestions_return_stored_ranking(self, mock_suggestions, client, override_auth):
+        app.dependency_overrides[auth_dependency] = override_auth
+        mock_suggestions.return_value = FollowSuggestionsResponse(
+            suggestions=[FollowSuggestion(handle="critic", first_name="Film", last_name="Critic", mutual_count=3)]
+        )
+
+        response = client.get("/v1/users/suggestions?limit=5", cookies={"__Host-access_token": "token"})
+
+        app.dependency_overrides = {}
+        assert response.status_code == 200
+        assert response.json() == {
+            "suggestions": [{"handle": "critic", "firstName": "Film", "lastName": "Critic", "mutualCount": 3}]
+        }
+        kwargs = mock_suggestions.await_args.kwargs
+        assert kwargs["user_id"] == override_auth()
+        assert kwargs["request"].limit == 5
+
+    @pytest.mark.parametrize("query", ["limit=0", "limit=21", "cursor=abc"])
+    @patch.object(get_follow_suggestion_service(), "get_suggestions", new_callable=AsyncMock)
+    def test_suggestions_reject_invalid_query(self, mock_suggestions, query, client, override_auth):
+        app.dependency_overrides[auth_dependency] = override_auth
+
+        response = client.get(f"/v1/users/suggestions?{query}", cookies={"__Host-access_token": "token"})
+
+        app.dependency_overrides = {}
+        assert response.status_code == 422
+        mock_suggestions.assert_not_awaited()
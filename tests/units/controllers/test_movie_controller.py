@@ -1,10 +1,20 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 
 from app import app
 from app.dependencies.auth_dependency import auth_dependency
+from app.dependencies.service_dependency import get_follow_service, get_movie_stats_service, get_trending_service
+from app.schemas.movie_schemas import (
+    MovieFriend,
+    MovieFriendsResponse,
+    MovieResponse,
+    MovieStats,
+    TrendingMovieItem,
+    TrendingMoviesResponse,
+)
 from app.schemas.tmdb_schemas import (
     TMDBGenre,
     TMDBMovieDetails,
@@ -14,6 +24,7 @@ from app.schemas.tmdb_schemas import (
     TMDBProductionCountry,
     TMDBSpokenLanguage,
 )
+from app.types import TrendingWindow
 from app.utils.error_codes_utils import ErrorCodes
 from app.utils.exceptions_utils import AppException
 
@@ -29,6 +40,21 @@ def override_auth():
     return lambda: "user123"
 
 
+@pytest.fixture
+def mock_movie_stats_service():
+    service = MagicMock()
+    service.get_movie_stats = AsyncMock(
+        return_value=MovieStats(
+            log_count=12,
+            watcher_count=9,
+            rating_count=4,
+            rating_average=7.5,
+            rating_histogram=[0, 0, 0, 0, 0, 1, 1, 1, 1, 0],
+        )
+    )
+    return service
+
+
 class TestMovieController:
     """Tests for movie controller endpoints."""
 
@@ -88,9 +114,10 @@ class TestMovieController:
         "app.controllers.movie_controller.tmdb_service.get_movie_details",
         new_callable=AsyncMock,
     )
-    def test_get_movie_details_success(self, mock_get_details, client, override_auth):
-        """Test getting movie details."""
+    def test_get_movie_details_success(self, mock_get_details, client, override_auth, mock_movie_stats_service):
+        """Test getting movie details with community stats."""
         app.dependency_overrides[auth_dependency] = override_auth
+        app.dependency_overrides[get_movie_stats_service] = lambda: mock_movie_stats_service
 
         mock_get_details.return_value = TMDBMovieDetails(
             id=550,
@@ -133,7 +160,15 @@ class TestMovieController:
         assert response.status_code == 200
         data = response.json()
         assert data["title"] == "Fight Club"
+        assert data["communityStats"] == {
+            "logCount": 12,
+            "watcherCount": 9,
+            "ratingCount": 4,
+            "ratingAverage": 7.5,
+            "ratingHistogram": [0, 0, 0, 0, 0, 1, 1, 1, 1, 0],
+        }
         mock_get_details.assert_awaited_once_with(tmdb_id=550, locale="it-IT")
+        mock_movie_stats_service.get_movie_stats.assert_awaited_once_with(550)
 
     def test_get_movie_details_unauthorized(self, client):
         """Test getting movie details without authentication."""
@@ -165,9 +200,16 @@ class TestMovieController:
         "app.controllers.movie_controller.tmdb_service.get_movie_details",
         new_callable=AsyncMock,
     )
-    def test_get_movie_details_app_exception(self, mock_get_details, client, override_auth):
+    def test_get_movie_details_app_exception(
+        self,
+        mock_get_details,
+        client,
+        override_auth,
+        mock_movie_stats_service,
+    ):
         """Test get movie details re-raises AppException."""
         app.dependency_overrides[auth_dependency] = override_auth
+        app.dependency_overrides[get_movie_stats_service] = lambda: mock_movie_stats_service
         mock_get_details.side_effect = AppException(ErrorCodes.MOVIE_NOT_FOUND)
 
         response = client.get(
@@ -179,3 +221,116 @@ class TestMovieController:
         app.dependency_overrides = {}
 
         assert response.status_code == ErrorCodes.MOVIE_NOT_FOUND.error_code
+
+    def test_get_trending_movies_success(self, client, override_auth):
+        """Test trending movies are served from the trending service and not captured by /{tmdb_id}."""
+        trending_service = MagicMock()
+        trending_service.get_trending_movies = AsyncMock(
+            return_value=TrendingMoviesResponse(
+                window=TrendingWindow.LAST_7_DAYS,
+                movies=[
+                    TrendingMovieItem(
+                        tmdb_id=550,
+                        log_count=12,
+                        movie=MovieResponse(id=uuid4(), title="Fight Club", tmdb_id=550),
+                    )
+                ],
+            )
+        )
+        app.dependency_overrides[auth_dependency] = override_auth
+        app.dependency_overrides[get_trending_service] = lambda: trending_service
+
+        response = client.get(
+            "/v1/movies/trending?window=7d&limit=5",
+            cookies={"__Host-access_token": "token"},
+        )
+
+        app.dependency_overrides = {}
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["window"] == "7d"
+        assert data["movies"][0]["tmdbId"] == 550
+        assert data["movies"][0]["logCount"] == 12
+        assert data["movies"][0]["movie"]["title"] == "Fight Club"
+        trending_service.get_trending_movies.assert_awaited_once_with(window=TrendingWindow.LAST_7_DAYS, limit=5)
+
+    def test_get_trending_movies_defaults_to_24h(self, client, override_auth):
+        """Test the trending window defaults to the last 24 hours."""
+        trending_service = MagicMock()
+        trending_service.get_trending_movies = AsyncMock(
+            return_value=TrendingMoviesResponse(window=TrendingWindow.LAST_24_HOURS, movies=[])
+        )
+        app.dependency_overrides[auth_dependency] = override_auth
+        app.dependency_overrides[get_trending_service] = lambda: trending_service
+
+        response = client.get("/v1/movies/trending", cookies={"__Host-access_token": "token"})
+
+        app.dependency_overrides = {}
+
+        assert response.status_code == 200
+        trending_service.get_trending_movies.assert_awaited_once_with(window=TrendingWindow.LAST_24_HOURS, limit=20)
+
+    def test_get_trending_movies_unauthorized(self, client):
+        """Test the trending endpoint requires authentication."""
+        response = client.get("/v1/movies/trending")
+
+        assert response.status_code == 401
+
+    @pytest.mark.parametrize("query", ["window=30d", "limit=0", "limit=51"])
+    def test_get_trending_movies_rejects_invalid_query(self, client, override_auth, query):
+        """Test unsupported windows and limits are rejected."""
+        app.dependency_overrides[auth_dependency] = override_auth
+
+        response = client.get(f"/v1/movies/trending?{query}", cookies={"__Host-access_token": "token"})
+
+        app.dependency_overrides = {}
+
+        assert response.status_code == 422
+
+    def test_get_movie_friends_success(self, client, override_auth):
+        """Test the followed users who logged or rated a movie are returned for the requester."""
+        follow_service = MagicMock()
+        follow_service.get_movie_friends = AsyncMock(
+            return_value=MovieFriendsResponse(
+                friends=[
+                    MovieFriend(
+                        handle="critic",
+                        first_name="Film",
+                        last_name="Critic",
+                        last_watched_at=None,
+                        log_count=0,
+                        rating=8,
+                    )
+                ],
+                total_count=1,
+            )
+        )
+        app.dependency_overrides[auth_dependency] = override_auth
+        app.dependency_overrides[get_follow_service] = lambda: follow_service
+
+        response = client.get("/v1/movies/550/friends", cookies={"__Host-access_token": "token"})
+
+        app.dependency_overrides = {}
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "friends": [
+                {
+                    "handle": "critic",
+                    "firstName": "Film",
+                    "lastName": "Critic",
+                    "lastWatchedAt": None,
+                    "logCount": 0,
+                    "rating": 8,
+                }
+            ],
+            "totalCount": 1,
+        }
+        follow_service.get_movie_friends.assert_awaited_once_with(requester_id="user123", tmdb_id=550)
+
+    def test_get_movie_friends_unauthorized(self, client):
+        """Test the friends endpoint requires authentication."""
+        response = client.get("/v1/movies/550/friends")
+
+        assert response.status_code == 401
@@ -14,6 +14,7 @@ from app.schemas.notification_schemas import (
     MarkAllNotificationsReadResponse,
     NotificationBaseResponse,
     NotificationListResponse,
+    NotificationUnreadCountResponse,
 )
 from app.types import NotificationType
 from app.utils.error_codes_utils import ErrorCodes
@@ -38,6 +39,8 @@ def notification_response():
         title="New follower",
         body="Someone followed you.",
         actor=None,
+        actor_count=1,
+        sample_actors=[],
         available_actions=[],
         read_at=None,
         created_at=datetime(2026, 7, 18, 10, 0, tzinfo=UTC),
@@ -146,6 +149,68 @@ def test_mark_notification_read_returns_404_for_foreign_or_missing_id(
     assert response.json()["error_code_name"] == "NOTIFICATION_NOT_FOUND"
 
 
+def test_get_unread_count_returns_badge_count(
+    client: TestClient,
+    notification_service: AsyncMock,
+    recipient_id,
+):
+    notification_service.get_unread_count.return_value = NotificationUnreadCountResponse(unread_count=7)
+
+    response = client.get("/v1/notifications/unread-count", cookies={"__Host-access_token": "token"})
+
+    assert response.status_code == 200
+    assert response.json() == {"unreadCount": 7}
+    notification_service.get_unread_count.assert_awaited_once_with(recipient_id)
+
+
+def test_get_unread_count_requires_authentication(client: TestClient):
+    app.dependency_overrides = {}
+
+    response = client.get("/v1/notifications/unread-count")
+
+    assert response.status_code == 401
+
+
+def test_stream_notifications_returns_event_stream_and_forwards_last_event_id(
+    client: TestClient,
+    notification_service: AsyncMock,
+    recipient_id,
+):
+    async def frames():
+        yield "retry: 3000\n\n"
+        yield 'event: notification.unread_count\ndata: {"unreadCount":1}\n\n'
+
+    notification_service.open_notification_stream.return_value = frames()
+
+    response = client.get(
+        "/v1/notifications/stream",
+        headers={"Last-Event-ID": "last-id"},
+        cookies={"__Host-access_token": "token"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.text == 'retry: 3000\n\nevent: notification.unread_count\ndata: {"unreadCount":1}\n\n'
+    notification_service.open_notification_stream.assert_awaited_once_with(recipient_id, "last-id")
+
+
+def test_stream_notifications_returns_422_for_a_rejected_last_event_id(
+    client: TestClient,
+    notification_service: AsyncMock,
+):
+    notification_service.open_notification_stream.side_effect = AppException(ErrorCodes.INVALID_PAGINATION_CURSOR)
+
+    response = client.get(
+        "/v1/notifications/stream",
+        headers={"Last-Event-ID": "forged"},
+        cookies={"__Host-access_token": "token"},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["error_code_name"] == "INVALID_PAGINATION_CURSOR"
+
+
 def test_mark_all_notifications_read_returns_counts(
     client: TestClient,
     notification_service: AsyncMock,
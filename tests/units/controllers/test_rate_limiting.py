@@ -64,7 +64,7 @@ def assert_429_response(response):
 
 
 def assert_custom_429_response(response):
-    """Assert a structured 429 response raised outside slowapi."""
+    """Assert a structured 429 response raised outside the route limiter."""
     assert response.status_code == 429
     body = response.json()
     assert body["error_code_name"] == "RATE_LIMIT_EXCEEDED"
@@ -525,7 +525,7 @@ class TestLoginRateLimit:
             response = client.post("/v1/auth/login", json=self.LOGIN_PAYLOAD)
 
         assert response.status_code == 200
-        clear_limit.assert_called_once()
+        clear_limit.assert_awaited_once()
 
     @patch.object(get_auth_service(), "login", new_callable=AsyncMock)
     def test_login_ignores_failure_bucket_cleanup_errors(self, mock_login, client):
@@ -565,11 +565,11 @@ class TestLoginRateLimit:
         mock_login.side_effect = AppException(ErrorCodes.INVALID_CREDENTIALS)
         captured: dict[str, str] = {}
 
-        def record_hit_limit(self, limit_item, scope: str, key: str) -> bool:
+        async def record_hit_limit(self, limit_item, scope: str, key: str) -> bool:
             if scope == "auth:login:account":
                 captured["scope"] = scope
                 captured["key"] = key
-            return original_hit_limit(self, limit_item, scope, key)
+            return await original_hit_limit(self, limit_item, scope, key)
 
         with patch.object(
             AuthRateLimitService,
@@ -910,11 +910,11 @@ class TestSearchMoviesRateLimit:
 
     @pytest.fixture
     def user_one_token(self):
-        return TokenService.create_access_token({"sub": "0f0e8400-e29b-41d4-a716-446655440011"})
+        return TokenService.create_access_token({"sub": "0f0e8400-e29b-41d4-a716-446655440011", "sid": "session-one"})
 
     @pytest.fixture
     def user_two_token(self):
-        return TokenService.create_access_token({"sub": "0f0e8400-e29b-41d4-a716-446655440012"})
+        return TokenService.create_access_token({"sub": "0f0e8400-e29b-41d4-a716-446655440012", "sid": "session-two"})
 
     @patch(
         "app.controllers.movie_controller.tmdb_service.search_movie",
@@ -1306,11 +1306,8 @@ class TestRateLimitSessionMiddleware:
         assert RATE_LIMIT_SESSION_COOKIE not in response.cookies, (
             "Should not re-set session cookie when the current one is valid"
         )
-        assert fake_cache_client.set_calls[-1] == (
-            session_key,
-            '{"active": true}',
-            604800,
-        )
+        assert fake_cache_client.getex_calls == [(session_key, 604800)]
+        assert fake_cache_client.set_calls == [], "A valid session is refreshed by GETEX alone"
         client.cookies.clear()
 
     def test_reissues_cookie_when_session_cookie_is_unknown(self, client, fake_cache_client, rate_limit_cache_service):
@@ -2,6 +2,7 @@ from datetime import date
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from fastapi import Request
 from fastapi.testclient import TestClient
 
 from app import app
@@ -13,6 +14,7 @@ from app.schemas.user_schemas import (
     UserProfileResponse,
     UserResponse,
 )
+from app.services.token_service import TokenService
 from app.utils.error_codes_utils import ErrorCodes
 from app.utils.exceptions_utils import AppException
 
@@ -24,7 +26,13 @@ def client():
 
 @pytest.fixture
 def override_auth():
-    return lambda: "user123"
+    def authenticated(request: Request) -> str:
+        # Mirrors what auth_dependency stores for the verified token
+        request.state.session_id = "session-1"
+        request.state.token_locale = "it-IT"
+        return "user123"
+
+    return authenticated
 
 
 class TestUserController:
@@ -284,6 +292,11 @@ class TestUpdateLocaleController:
         assert response.status_code == 200
         assert response.json() == {"locale": "it-IT"}
         mock_update_locale.assert_awaited_once_with("user123", "it-IT")
+        access_token = response.cookies.get("__Host-access_token")
+        assert access_token is not None
+        payload = TokenService.decode_token(access_token)
+        assert payload["locale"] == "it-IT"
+        assert payload["sid"] == "session-1"
 
     @patch.object(get_user_service(), "update_locale", new_callable=AsyncMock)
     def test_update_locale_rejects_unsupported_locale(self, mock_update_locale, client, override_auth):
@@ -319,7 +332,7 @@ class TestUpdateLocaleController:
 
 class TestChangePasswordController:
     @patch.object(get_user_service(), "change_password", new_callable=AsyncMock)
-    def test_change_password_success(self, mock_change_password, client, override_auth):
+    def test_change_password_success(self, mock_change_password, client, override_auth, fake_cache_client):
         app.dependency_overrides[auth_dependency] = override_auth
 
         mock_change_password.return_value = ChangePasswordResponse(message="Password updated successfully")
@@ -343,6 +356,13 @@ class TestChangePasswordController:
             current_password="oldpass123",
             new_password="newpass123",
         )
+        # The password change revoked every session; this device gets a fresh one
+        access_payload = TokenService.decode_token(response.cookies["__Host-access_token"])
+        refresh_payload = TokenService.decode_token(response.cookies["refresh_token"])
+        assert access_payload["sid"] != "session-1"
+        assert access_payload["sid"] == refresh_payload["sid"]
+        assert access_payload["locale"] == "it-IT"
+        assert f"cinelog:auth:session:{access_payload['sid']}" in fake_cache_client.values
 
     def test_change_password_unauthorized(self, client):
         app.dependency_overrides = {}
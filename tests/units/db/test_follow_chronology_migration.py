@@ -0,0 +1,32 @@
+"""PostgreSQL integration tests for the followed-user chronology index migration."""
+
+from tests.alembic_test_harness import AlembicTestHarness
+
+PREVIOUS_REVISION = "009_create_movie_stats_table"
+
+
+def _indexes(harness: AlembicTestHarness) -> dict[str, str]:
+    with harness.connect() as connection:
+        return {
+            row[0]: row[1]
+            for row in connection.execute(
+                "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = 'user_follows'"
+            ).fetchall()
+        }
+
+
+def test_follow_chronology_migration_adds_composite_index(alembic_test_harness: AlembicTestHarness):
+    alembic_test_harness.upgrade()
+
+    indexes = _indexes(alembic_test_harness)
+
+    assert "ix_user_follows_followed_id" in indexes
+    assert indexes["ix_user_follows_followed_chronology"].endswith("(followed_id, created_at, follower_id)")
+
+
+def test_follow_chronology_migration_downgrades_cleanly(alembic_test_harness: AlembicTestHarness):
+    alembic_test_harness.upgrade()
+
+    alembic_test_harness.downgrade(PREVIOUS_REVISION)
+
+    assert "ix_user_follows_followed_chronology" not in _indexes(alembic_test_harness)
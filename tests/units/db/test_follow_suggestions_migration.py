@@ -0,0 +1,38 @@
+"""PostgreSQL integration tests for the follow suggestions migration."""
+
+from tests.alembic_test_harness import AlembicTestHarness
+
+PREVIOUS_REVISION = "014_add_log_feed_index"
+
+
+def test_follow_suggestions_migration_creates_ranked_table(alembic_test_harness: AlembicTestHarness):
+    alembic_test_harness.upgrade()
+
+    with alembic_test_harness.connect() as connection:
+        primary_key = connection.execute(
+            """
+            SELECT array_agg(a.attname ORDER BY array_position(i.indkey, a.attnum))
+            FROM pg_index i
+            JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+            WHERE i.indrelid = 'user_follow_suggestions'::regclass AND i.indisprimary
+            """
+        ).fetchone()
+        indexes = {
+            row[0]
+            for row in connection.execute(
+                "SELECT indexname FROM pg_indexes WHERE tablename = 'user_follow_suggestions'"
+            ).fetchall()
+        }
+
+    assert primary_key == (["user_id", "rank"],)
+    assert "ix_user_follow_suggestions_computed_at" in indexes
+
+
+def test_follow_suggestions_migration_downgrades_cleanly(alembic_test_harness: AlembicTestHarness):
+    alembic_test_harness.upgrade()
+
+    alembic_test_harness.downgrade(PREVIOUS_REVISION)
+
+    with alembic_test_harness.connect() as connection:
+        table = connection.execute("SELECT to_regclass('user_follow_suggestions')").fetchone()
+    assert table == (None,)
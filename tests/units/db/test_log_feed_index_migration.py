@@ -0,0 +1,31 @@
+"""PostgreSQL integration tests for the per-author log chronology index migration."""
+
+from tests.alembic_test_harness import AlembicTestHarness
+
+PREVIOUS_REVISION = "013_create_user_follow_stats"
+
+
+def _indexes(harness: AlembicTestHarness) -> dict[str, str]:
+    with harness.connect() as connection:
+        return {
+            row[0]: row[1]
+            for row in connection.execute(
+                "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = 'logs'"
+            ).fetchall()
+        }
+
+
+def test_log_feed_index_migration_adds_descending_index(alembic_test_harness: AlembicTestHarness):
+    alembic_test_harness.upgrade()
+
+    indexes = _indexes(alembic_test_harness)
+
+    assert indexes["ix_logs_user_created_at"].endswith("(user_id, created_at DESC, id DESC)")
+
+
+def test_log_feed_index_migration_downgrades_cleanly(alembic_test_harness: AlembicTestHarness):
+    alembic_test_harness.upgrade()
+
+    alembic_test_harness.downgrade(PREVIOUS_REVISION)
+
+    assert "ix_logs_user_created_at" not in _indexes(alembic_test_harness)
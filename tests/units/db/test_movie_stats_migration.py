@@ -0,0 +1,97 @@
+"""PostgreSQL integration tests for the community movie-stats migration."""
+
+from uuid import UUID
+
+from tests.alembic_test_harness import AlembicTestHarness
+
+PREVIOUS_REVISION = "008_add_locale_to_users"
+
+
+def _insert_user(harness: AlembicTestHarness, *, suffix: str) -> UUID:
+    with harness.connect() as connection:
+        row = connection.execute(
+            """
+            INSERT INTO users (email, handle, first_name, last_name)
+            VALUES (%s, %s, 'Stats', 'User')
+            RETURNING id
+            """,
+            (f"stats-{suffix}@example.com", f"stats-{suffix}"),
+        ).fetchone()
+    assert row is not None
+    return row[0]
+
+
+def _insert_movie(harness: AlembicTestHarness, *, tmdb_id: int) -> UUID:
+    with harness.connect() as connection:
+        row = connection.execute(
+            "INSERT INTO movies (tmdb_id, title) VALUES (%s, 'Movie') RETURNING id",
+            (tmdb_id,),
+        ).fetchone()
+    assert row is not None
+    return row[0]
+
+
+def _insert_log(harness: AlembicTestHarness, *, user_id: UUID, movie_id: UUID, deleted: bool = False) -> None:
+    with harness.connect() as connection:
+        connection.execute(
+            """
+            INSERT INTO logs (user_id, movie_id, tmdb_id, date_watched, deleted)
+            SELECT %s, id, tmdb_id, now(), %s FROM movies WHERE id = %s
+            """,
+            (user_id, deleted, movie_id),
+        )
+
+
+def _insert_rating(harness: AlembicTestHarness, *, user_id: UUID, movie_id: UUID, rating: int) -> None:
+    with harness.connect() as connection:
+        connection.execute(
+            """
+            INSERT INTO movie_ratings (user_id, movie_id, tmdb_id, rating)
+            SELECT %s, id, tmdb_id, %s FROM movies WHERE id = %s
+            """,
+            (user_id, rating, movie_id),
+        )
+
+
+def test_movie_community_stats_migration_backfills_existing_activity(
+    alembic_test_harness: AlembicTestHarness,
+):
+    alembic_test_harness.upgrade(PREVIOUS_REVISION)
+    alice = _insert_user(alembic_test_harness, suffix="alice")
+    bob = _insert_user(alembic_test_harness, suffix="bob")
+    watched = _insert_movie(alembic_test_harness, tmdb_id=550)
+    unwatched = _insert_movie(alembic_test_harness, tmdb_id=551)
+    _insert_log(alembic_test_harness, user_id=alice, movie_id=watched)
+    _insert_log(alembic_test_harness, user_id=alice, movie_id=watched)
+    _insert_log(alembic_test_harness, user_id=bob, movie_id=watched)
+    _insert_log(alembic_test_harness, user_id=bob, movie_id=unwatched, deleted=True)
+    _insert_rating(alembic_test_harness, user_id=alice, movie_id=watched, rating=8)
+    _insert_rating(alembic_test_harness, user_id=bob, movie_id=watched, rating=6)
+
+    alembic_test_harness.upgrade()
+
+    with alembic_test_harness.connect() as connection:
+        rows = connection.execute(
+            """
+            SELECT tmdb_id, log_count, watcher_count, rating_count, rating_sum,
+                   rating_6_count, rating_8_count, rating_10_count
+            FROM movie_community_stats
+            ORDER BY tmdb_id
+            """
+        ).fetchall()
+
+    assert rows == [
+        (550, 3, 2, 2, 14, 1, 1, 0),
+        (551, 0, 0, 0, 0, 0, 0, 0),
+    ]
+
+
+def test_movie_community_stats_migration_downgrades_cleanly(alembic_test_harness: AlembicTestHarness):
+    alembic_test_harness.upgrade()
+
+    alembic_test_harness.downgrade(PREVIOUS_REVISION)
+
+    with alembic_test_harness.connect() as connection:
+        table = connection.execute("SELECT to_regclass('public.movie_community_stats')").fetchone()
+
+    assert table == (None,)
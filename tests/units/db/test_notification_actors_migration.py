@@ -0,0 +1,63 @@
+"""PostgreSQL integration tests for the notification actors migration."""
+
+from uuid import UUID
+
+from tests.alembic_test_harness import AlembicTestHarness
+
+PREVIOUS_REVISION = "015_create_follow_suggestions"
+
+
+def _insert_user(harness: AlembicTestHarness, suffix: str) -> UUID:
+    with harness.connect() as connection:
+        row = connection.execute(
+            """
+            INSERT INTO users (email, handle, first_name, last_name)
+            VALUES (%s, %s, 'Actors', 'User')
+            RETURNING id
+            """,
+            (f"actors-{suffix}@example.com", f"actors-{suffix}"),
+        ).fetchone()
+    assert row is not None
+    return row[0]
+
+
+def _insert_aggregate(harness: AlembicTestHarness, recipient_id: UUID, actor_ids: list[UUID], *, read: bool) -> UUID:
+    with harness.connect() as connection:
+        row = connection.execute(
+            """
+            INSERT INTO notifications
+                (recipient_id, type, title, body, aggregation_key, actor_count, sample_actor_ids, read_at)
+            VALUES (%s, 'follow.started', 'Title', 'Body', 'follow.started:1', %s, %s,
+                    CASE WHEN %s THEN now() END)
+            RETURNING id
+            """,
+            (recipient_id, len(actor_ids), actor_ids, read),
+        ).fetchone()
+    assert row is not None
+    return row[0]
+
+
+def test_notification_actors_migration_seeds_open_aggregates_from_their_sample(
+    alembic_test_harness: AlembicTestHarness,
+):
+    alembic_test_harness.upgrade(PREVIOUS_REVISION)
+    recipient_id = _insert_user(alembic_test_harness, "recipient")
+    actor_ids = [_insert_user(alembic_test_harness, f"actor-{index}") for index in range(2)]
+    open_aggregate = _insert_aggregate(alembic_test_harness, recipient_id, actor_ids, read=False)
+    _insert_aggregate(alembic_test_harness, recipient_id, actor_ids, read=True)
+
+    alembic_test_harness.upgrade()
+
+    with alembic_test_harness.connect() as connection:
+        rows = connection.execute("SELECT notification_id, actor_id FROM notification_actors").fetchall()
+    assert set(rows) == {(open_aggregate, actor_id) for actor_id in actor_ids}
+
+
+def test_notification_actors_migration_downgrades_cleanly(alembic_test_harness: AlembicTestHarness):
+    alembic_test_harness.upgrade()
+
+    alembic_test_harness.downgrade(PREVIOUS_REVISION)
+
+    with alembic_test_harness.connect() as connection:
+        table = connection.execute("SELECT to_regclass('notification_actors')").fetchone()
+    assert table == (None,)
@@ -0,0 +1,88 @@
+"""PostgreSQL integration tests for the notification aggregation migration."""
+
+from uuid import UUID
+
+import pytest
+from psycopg.errors import UniqueViolation
+
+from tests.alembic_test_harness import AlembicTestHarness
+
+PREVIOUS_REVISION = "010_add_follow_chronology_index"
+
+
+def _insert_user(harness: AlembicTestHarness, suffix: str) -> UUID:
+    with harness.connect() as connection:
+        row = connection.execute(
+            """
+            INSERT INTO users (email, handle, first_name, last_name)
+            VALUES (%s, %s, 'Aggregation', 'User')
+            RETURNING id
+            """,
+            (f"aggregation-{suffix}@example.com", f"aggregation-{suffix}"),
+        ).fetchone()
+    assert row is not None
+    return row[0]
+
+
+def _insert_aggregate(harness: AlembicTestHarness, recipient_id: UUID, key: str) -> UUID:
+    with harness.connect() as connection:
+        row = connection.execute(
+            """
+            INSERT INTO notifications (recipient_id, type, title, body, aggregation_key)
+            VALUES (%s, 'follow.started', 'Title', 'Body', %s)
+            RETURNING id
+            """,
+            (recipient_id, key),
+        ).fetchone()
+    assert row is not None
+    return row[0]
+
+
+def test_aggregation_migration_backfills_defaults_and_limits_open_aggregates(
+    alembic_test_harness: AlembicTestHarness,
+):
+    alembic_test_harness.upgrade(PREVIOUS_REVISION)
+    recipient_id = _insert_user(alembic_test_harness, "recipient")
+    with alembic_test_harness.connect() as connection:
+        connection.execute(
+            "INSERT INTO notifications (recipient_id, type, title, body) VALUES (%s, 'follow.started', 'T', 'B')",
+            (recipient_id,),
+        )
+
+    alembic_test_harness.upgrade()
+
+    with alembic_test_harness.connect() as connection:
+        existing = connection.execute(
+            "SELECT actor_count, sample_actor_ids, aggregation_key FROM notifications"
+        ).fetchone()
+    assert existing == (1, [], None)
+
+    first = _insert_aggregate(alembic_test_harness, recipient_id, "follow.started:1")
+    with pytest.raises(UniqueViolation):
+        _insert_aggregate(alembic_test_harness, recipient_id, "follow.started:1")
+
+    with alembic_test_harness.connect() as connection:
+        connection.execute("UPDATE notifications SET read_at = now() WHERE id = %s", (first,))
+    _insert_aggregate(alembic_test_harness, recipient_id, "follow.started:1")
+
+
+def test_aggregation_migration_downgrades_cleanly(alembic_test_harness: AlembicTestHarness):
+    alembic_test_harness.upgrade()
+
+    alembic_test_harness.downgrade(PREVIOUS_REVISION)
+
+    with alembic_test_harness.connect() as connection:
+        columns = {
+            row[0]
+            for row in connection.execute(
+                "SELECT column_name FROM information_schema.columns WHERE table_name = 'notifications'"
+            ).fetchall()
+        }
+        indexes = {
+            row[0]
+            for row in connection.execute(
+                "SELECT indexname FROM pg_indexes WHERE tablename = 'notifications'"
+            ).fetchall()
+        }
+    assert columns.isdisjoint({"aggregation_key", "actor_count", "sample_actor_ids"})
+    assert "uq_notifications_open_aggregation_key" not in indexes
@@ -0,0 +1,54 @@
+"""PostgreSQL integration tests for the notification archive migration."""
+
+from tests.alembic_test_harness import AlembicTestHarness
+
+PREVIOUS_REVISION = "011_add_notification_aggregation"
+
+
+def _columns(harness: AlembicTestHarness, table: str) -> list[str]:
+    with harness.connect() as connection:
+        return [
+            row[0]
+            for row in connection.execute(
+                """
+                SELECT column_name FROM information_schema.columns
+                WHERE table_name = %s ORDER BY ordinal_position
+                """,
+                (table,),
+            ).fetchall()
+        ]
+
+
+def _indexes(harness: AlembicTestHarness, table: str) -> dict[str, str]:
+    with harness.connect() as connection:
+        return {
+            row[0]: row[1]
+            for row in connection.execute(
+                "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s",
+                (table,),
+            ).fetchall()
+        }
+
+
+def test_archive_migration_mirrors_notification_columns_in_order(alembic_test_harness: AlembicTestHarness):
+    alembic_test_harness.upgrade()
+
+    assert _columns(alembic_test_harness, "notifications_archive") == _columns(alembic_test_harness, "notifications")
+    archive_indexes = _indexes(alembic_test_harness, "notifications_archive")
+    hot_indexes = _indexes(alembic_test_harness, "notifications")
+    assert archive_indexes["ix_notifications_archive_recipient_chronology"].endswith(
+        "(recipient_id, created_at DESC, id DESC)"
+    )
+    assert "WHERE ((deleted IS FALSE) AND (read_at IS NOT NULL))" in hot_indexes["ix_notifications_archivable"]
+    assert "WHERE (deleted IS TRUE)" in hot_indexes["ix_notifications_soft_deleted"]
+
+
+def test_archive_migration_downgrades_cleanly(alembic_test_harness: AlembicTestHarness):
+    alembic_test_harness.upgrade()
+
+    alembic_test_harness.downgrade(PREVIOUS_REVISION)
+
+    assert _columns(alembic_test_harness, "notifications_archive") == []
+    assert {"ix_notifications_archivable", "ix_notifications_soft_deleted"}.isdisjoint(
+        _indexes(alembic_test_harness, "notifications")
+    )
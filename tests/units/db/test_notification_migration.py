@@ -77,6 +77,9 @@ def test_notification_migration_enforces_closed_common_schema(
         "body",
         "deduplication_key",
         "read_at",
+        "aggregation_key",
+        "actor_count",
+        "sample_actor_ids",
         "deleted",
         "deleted_at",
         "created_at",
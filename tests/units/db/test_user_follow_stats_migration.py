@@ -0,0 +1,67 @@
+"""PostgreSQL integration tests for the user follow-stats migration."""
+
+from uuid import UUID
+
+from tests.alembic_test_harness import AlembicTestHarness
+
+PREVIOUS_REVISION = "012_create_notifications_archive"
+
+
+def _insert_user(harness: AlembicTestHarness, *, suffix: str, deleted: bool = False) -> UUID:
+    with harness.connect() as connection:
+        row = connection.execute(
+            """
+            INSERT INTO users (email, handle, first_name, last_name, deleted)
+            VALUES (%s, %s, 'Follow', 'User', %s)
+            RETURNING id
+            """,
+            (f"follow-{suffix}@example.com", f"follow-{suffix}", deleted),
+        ).fetchone()
+    assert row is not None
+    return row[0]
+
+
+def _insert_follow(harness: AlembicTestHarness, follower_id: UUID, followed_id: UUID) -> None:
+    with harness.connect() as connection:
+        connection.execute(
+            "INSERT INTO user_follows (follower_id, followed_id) VALUES (%s, %s)",
+            (follower_id, followed_id),
+        )
+
+
+def test_user_follow_stats_migration_backfills_active_edge_counts(alembic_test_harness: AlembicTestHarness):
+    alembic_test_harness.upgrade(PREVIOUS_REVISION)
+    alice = _insert_user(alembic_test_harness, suffix="alice")
+    bob = _insert_user(alembic_test_harness, suffix="bob")
+    gone = _insert_user(alembic_test_harness, suffix="gone", deleted=True)
+    _insert_user(alembic_test_harness, suffix="loner")
+    _insert_follow(alembic_test_harness, alice, bob)
+    _insert_follow(alembic_test_harness, bob, alice)
+    _insert_follow(alembic_test_harness, gone, bob)
+    _insert_follow(alembic_test_harness, alice, gone)
+
+    alembic_test_harness.upgrade()
+
+    with alembic_test_harness.connect() as connection:
+        rows = connection.execute("SELECT user_id, follower_count, following_count FROM user_follow_stats").fetchall()
+        indexes = {
+            row[0]: row[1]
+            for row in connection.execute(
+                "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = 'user_follows'"
+            ).fetchall()
+        }
+
+    assert {row[0]: (row[1], row[2]) for row in rows} == {alice: (1, 1), bob: (1, 1)}
+    assert indexes["ix_user_follows_follower_chronology"].endswith("(follower_id, created_at, followed_id)")
+
+
+def test_user_follow_stats_migration_downgrades_cleanly(alembic_test_harness: AlembicTestHarness):
+    alembic_test_harness.upgrade()
+
+    alembic_test_harness.downgrade(PREVIOUS_REVISION)
+
+    with alembic_test_harness.connect() as connection:
+        table = connection.execute("SELECT to_regclass('user_follow_stats')").fetchone()
+        index = connection.execute("SELECT to_regclass('ix_user_follows_follower_chronology')").fetchone()
+    assert table == (None,)
+    assert index == (None,)
@@ -1,4 +1,5 @@
-from unittest.mock import Mock, patch
+import time
+from unittest.mock import AsyncMock, Mock, patch
 from uuid import UUID
 
 import pytest
@@ -6,112 +7,195 @@ from fastapi import HTTPException
 from jwt import ExpiredSignatureError, InvalidTokenError
 
 from app.dependencies.auth_dependency import auth_dependency
+from app.services.token_service import TokenService, access_token_cache
 
+USER_ID = "3f6f4d8c-c729-4c09-93aa-fbffcd2d1c4f"
 
+
+def _payload(**claims):
+    """Decoded access-token claims as issued at login, with ``claims`` overriding them."""
+    payload = {"sub": USER_ID, "sid": "session-1", "iat": time.time(), "exp": time.time() + 900, "type": "access"}
+    payload.update(claims)
+    return payload
+
+
+def _request(token: str | None = "valid_token") -> Mock:
+    mock_request = Mock()
+    mock_request.cookies = {} if token is None else {"__Host-access_token": token}
+    mock_request.headers = {}
+    return mock_request
+
+
+@pytest.fixture
+def session_service():
+    service = Mock()
+    service.is_revoked = AsyncMock(return_value=False)
+    return service
+
+
+@pytest.mark.asyncio
 class TestAuthDependency:
     """Test cases for the AuthDependency class."""
 
-    def test_when_sub_is_not_a_uuid_rejects_token(self):
+    async def test_when_sub_is_not_a_uuid_rejects_token(self, session_service):
         """Test that a stale pre-cutover (Mongo ObjectId) sub is rejected with 401."""
-        mock_request = Mock()
-        mock_request.cookies = {"__Host-access_token": "valid_token"}
-        mock_request.headers = {}
+        mock_request = _request()
 
         with patch("app.dependencies.auth_dependency.TokenService.decode_token") as mock_decode:
-            mock_decode.return_value = {"sub": "507f1f77bcf86cd799439011", "type": "access"}
+            mock_decode.return_value = _payload(sub="507f1f77bcf86cd799439011")
 
             with pytest.raises(HTTPException) as exc_info:
-                auth_dependency(mock_request)
+                await auth_dependency(mock_request, session_service)
 
             assert exc_info.value.status_code == 401
             assert exc_info.value.detail == "Unauthorized"
 
-    def test_when_cookie_contains_uuid_sub_returns_uuid(self):
+    async def test_when_cookie_contains_uuid_sub_returns_uuid(self, session_service):
         """Test that auth_dependency returns UUID when JWT sub is a UUID string."""
-        mock_request = Mock()
-        mock_request.cookies = {"__Host-access_token": "valid_token"}
-        mock_request.headers = {}
-        user_id_str = "3f6f4d8c-c729-4c09-93aa-fbffcd2d1c4f"
+        mock_request = _request()
+        payload = _payload()
 
         with patch("app.dependencies.auth_dependency.TokenService.decode_token") as mock_decode:
-            mock_decode.return_value = {"sub": user_id_str, "type": "access"}
+            mock_decode.return_value = payload
 
-            result = auth_dependency(mock_request)
+            result = await auth_dependency(mock_request, session_service)
 
-            assert result == UUID(user_id_str)
-            assert mock_request.state.user_id == user_id_str
+            assert result == UUID(USER_ID)
+            assert mock_request.state.user_id == USER_ID
+            assert mock_request.state.session_id == "session-1"
+            assert mock_request.state.token_locale is None
             mock_decode.assert_called_once_with("valid_token")
+            session_service.is_revoked.assert_awaited_once_with(UUID(USER_ID), "session-1", payload["iat"])
 
-    def test_when_cookie_is_missing(self):
-        """Test that auth_dependency raises an HTTPException when no cookie is provided."""
-        mock_request = Mock()
-        mock_request.cookies = {}
-        mock_request.headers = {}
+    async def test_when_token_has_locale_claim_stores_it_on_request_state(self, session_service):
+        """Test that the signed locale claim is exposed to locale_dependency via request state."""
+        mock_request = _request()
+
+        with patch("app.dependencies.auth_dependency.TokenService.decode_token") as mock_decode:
+            mock_decode.return_value = _payload(locale="it-IT")
+
+            await auth_dependency(mock_request, session_service)
 
+            assert mock_request.state.token_locale == "it-IT"
+
+    async def test_when_cookie_is_missing(self, session_service):
+        """Test that auth_dependency raises an HTTPException when no cookie is provided."""
         with pytest.raises(HTTPException) as exc_info:
-            auth_dependency(mock_request)
+            await auth_dependency(_request(token=None), session_service)
 
         assert exc_info.value.status_code == 401
         assert exc_info.value.detail == "Unauthorized"
 
-    def test_when_token_is_invalid(self):
+    async def test_when_token_is_invalid(self, session_service):
         """Test function raises HTTPException when token is invalid."""
-        mock_request = Mock()
-        mock_request.cookies = {"__Host-access_token": "invalid_token"}
-        mock_request.headers = {}
-
         with patch(
             "app.dependencies.auth_dependency.TokenService.decode_token",
             side_effect=InvalidTokenError,
         ):
             with pytest.raises(HTTPException) as exc_info:
-                auth_dependency(mock_request)
+                await auth_dependency(_request("invalid_token"), session_service)
 
             assert exc_info.value.status_code == 401
             assert exc_info.value.detail == "Unauthorized"
 
-    def test_when_token_is_expired(self):
+    async def test_when_token_is_expired(self, session_service):
         """Test function raises HTTPException when token is expired."""
-        mock_request = Mock()
-        mock_request.cookies = {"__Host-access_token": "expired_token"}
-        mock_request.headers = {}
-
         with patch(
             "app.dependencies.auth_dependency.TokenService.decode_token",
             side_effect=ExpiredSignatureError,
         ):
             with pytest.raises(HTTPException) as exc_info:
-                auth_dependency(mock_request)
+                await auth_dependency(_request("expired_token"), session_service)
 
             assert exc_info.value.status_code == 401
             assert exc_info.value.detail == "Unauthorized"
 
-    def test_when_token_type_is_invalid(self):
+    async def test_when_token_type_is_invalid(self, session_service):
         """Test function raises HTTPException when token type is not 'access'."""
-        mock_request = Mock()
-        mock_request.cookies = {"__Host-access_token": "refresh_token"}
-        mock_request.headers = {}
-
         with patch("app.dependencies.auth_dependency.TokenService.decode_token") as mock_decode:
-            mock_decode.return_value = {"sub": "user123", "type": "refresh"}
+            mock_decode.return_value = _payload(type="refresh")
 
             with pytest.raises(HTTPException) as exc_info:
-                auth_dependency(mock_request)
+                await auth_dependency(_request("refresh_token"), session_service)
 
             assert exc_info.value.status_code == 401
             assert exc_info.value.detail == "Invalid token type"
 
-    def test_when_token_payload_missing_sub(self):
+    async def test_when_token_payload_missing_sub(self, session_service):
         """Test function raises HTTPException when token payload is missing 'sub'."""
-        mock_request = Mock()
-        mock_request.cookies = {"__Host-access_token": "valid_token"}
-        mock_request.headers = {}
+        payload = _payload()
+        del payload["sub"]
+
+        with patch("app.dependencies.auth_dependency.TokenService.decode_token") as mock_decode:
+            mock_decode.return_value = payload
+
+            with pytest.raises(HTTPException) as exc_info:
+                await auth_dependency(_request(), session_service)
+
+            assert exc_info.value.status_code == 401
+            assert exc_info.value.detail == "Invalid token payload"
+
+    @pytest.mark.parametrize("claim", ["sid", "iat"])
+    async def test_when_token_predates_sessions_rejects_it(self, session_service, claim):
+        """Test that tokens without a session ID or issue time are rejected, since they cannot be revoked."""
+        payload = _payload()
+        del payload[claim]
 
         with patch("app.dependencies.auth_dependency.TokenService.decode_token") as mock_decode:
-            mock_decode.return_value = {"type": "access"}  # Missing sub
+            mock_decode.return_value = payload
 
             with pytest.raises(HTTPException) as exc_info:
-                auth_dependency(mock_request)
+                await auth_dependency(_request(), session_service)
 
             assert exc_info.value.status_code == 401
             assert exc_info.value.detail == "Invalid token payload"
+
+    async def test_when_session_is_revoked_rejects_token(self, session_service):
+        """Test that a valid token from a revoked session gets 401."""
+        session_service.is_revoked.return_value = True
+        mock_request = _request()
+
+        with patch("app.dependencies.auth_dependency.TokenService.decode_token") as mock_decode:
+            mock_decode.return_value = _payload()
+
+            with pytest.raises(HTTPException) as exc_info:
+                await auth_dependency(mock_request, session_service)
+
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.detail == "Session revoked"
+
+    async def test_repeated_token_is_verified_once(self, session_service):
+        """Test that a verified token is served from the LRU on later requests."""
+        token = TokenService.create_access_token({"sub": USER_ID, "sid": "session-1", "locale": "it-IT"})
+
+        assert await auth_dependency(_request(token), session_service) == UUID(USER_ID)
+
+        with patch("app.dependencies.auth_dependency.TokenService.decode_token") as mock_decode:
+            cached_request = _request(token)
+
+            assert await auth_dependency(cached_request, session_service) == UUID(USER_ID)
+
+            mock_decode.assert_not_called()
+            assert cached_request.state.user_id == USER_ID
+            assert cached_request.state.token_locale == "it-IT"
+            assert session_service.is_revoked.await_count == 2
+
+    async def test_cached_token_is_still_checked_for_revocation(self, session_service):
+        """Test that the token LRU does not bypass session revocation."""
+        token = TokenService.create_access_token({"sub": USER_ID, "sid": "session-1"})
+        await auth_dependency(_request(token), session_service)
+        session_service.is_revoked.return_value = True
+
+        with pytest.raises(HTTPException) as exc_info:
+            await auth_dependency(_request(token), session_service)
+
+        assert exc_info.value.detail == "Session revoked"
+
+    async def test_rejected_token_is_not_cached(self, session_service):
+        """Test that tokens failing validation are verified again on every request."""
+        token = TokenService.create_refresh_token({"sub": USER_ID, "sid": "session-1"})
+
+        with pytest.raises(HTTPException):
+            await auth_dependency(_request(token), session_service)
+
+        assert access_token_cache.get(token) is None
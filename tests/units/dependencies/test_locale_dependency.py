@@ -10,7 +10,7 @@ from app.dependencies.locale_dependency import locale_dependency
 @pytest.mark.asyncio
 async def test_locale_dependency_prefers_supported_header_without_service_lookup():
     user_service = AsyncMock()
-    request = SimpleNamespace(headers={"accept-language": "fr-CA, en-US;q=0.8"})
+    request = SimpleNamespace(headers={"accept-language": "fr-CA, en-US;q=0.8"}, state=SimpleNamespace())
 
     result = await locale_dependency(request, uuid4(), user_service)
 
@@ -23,7 +23,7 @@ async def test_locale_dependency_uses_saved_locale_when_header_has_no_match():
     user_id = uuid4()
     user_service = AsyncMock()
     user_service.get_locale.return_value = "it-IT"
-    request = SimpleNamespace(headers={"accept-language": "de-DE"})
+    request = SimpleNamespace(headers={"accept-language": "de-DE"}, state=SimpleNamespace())
 
     result = await locale_dependency(request, user_id, user_service)
 
@@ -35,7 +35,7 @@ async def test_locale_dependency_uses_saved_locale_when_header_has_no_match():
 async def test_locale_dependency_falls_back_to_english_for_missing_user():
     user_service = AsyncMock()
     user_service.get_locale.return_value = None
-    request = SimpleNamespace(headers={})
+    request = SimpleNamespace(headers={}, state=SimpleNamespace())
 
     assert await locale_dependency(request, uuid4(), user_service) == "en-US"
 
@@ -44,7 +44,39 @@ async def test_locale_dependency_falls_back_to_english_for_missing_user():
 async def test_locale_dependency_propagates_service_errors():
     user_service = AsyncMock()
     user_service.get_locale.side_effect = RuntimeError("database unavailable")
-    request = SimpleNamespace(headers={})
+    request = SimpleNamespace(headers={}, state=SimpleNamespace())
 
     with pytest.raises(RuntimeError, match="database unavailable"):
         await locale_dependency(request, uuid4(), user_service)
+
+
+@pytest.mark.asyncio
+async def test_locale_dependency_uses_token_claim_without_service_lookup():
+    user_service = AsyncMock()
+    request = SimpleNamespace(headers={}, state=SimpleNamespace(token_locale="fr-FR"))
+
+    result = await locale_dependency(request, uuid4(), user_service)
+
+    assert result == "fr-FR"
+    user_service.get_locale.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_locale_dependency_prefers_header_over_token_claim():
+    user_service = AsyncMock()
+    request = SimpleNamespace(headers={"accept-language": "it-IT"}, state=SimpleNamespace(token_locale="fr-FR"))
+
+    assert await locale_dependency(request, uuid4(), user_service) == "it-IT"
+
+
+@pytest.mark.asyncio
+async def test_locale_dependency_ignores_unsupported_token_claim():
+    user_id = uuid4()
+    user_service = AsyncMock()
+    user_service.get_locale.return_value = "it-IT"
+    request = SimpleNamespace(headers={}, state=SimpleNamespace(token_locale="de-DE"))
+
+    result = await locale_dependency(request, user_id, user_service)
+
+    assert result == "it-IT"
+    user_service.get_locale.assert_awaited_once_with(user_id)
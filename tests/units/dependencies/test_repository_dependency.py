@@ -2,6 +2,7 @@ import pytest
 
 from app.dependencies.repository_dependency import (
     get_follow_repository,
+    get_follow_suggestion_repository,
     get_log_repository,
     get_movie_rating_repository,
     get_movie_repository,
@@ -9,6 +10,7 @@ from app.dependencies.repository_dependency import (
     get_user_repository,
 )
 from app.repository.follow_repository import FollowRepository
+from app.repository.follow_suggestion_repository import FollowSuggestionRepository
 from app.repository.log_repository import LogRepository
 from app.repository.movie_rating_repository import MovieRatingRepository
 from app.repository.movie_repository import MovieRepository
@@ -19,6 +21,7 @@ from app.repository.user_repository import UserRepository
 @pytest.fixture(autouse=True)
 def clear_repository_caches():
     get_follow_repository.cache_clear()
+    get_follow_suggestion_repository.cache_clear()
     get_log_repository.cache_clear()
     get_movie_rating_repository.cache_clear()
     get_movie_repository.cache_clear()
@@ -26,6 +29,7 @@ def clear_repository_caches():
     get_user_repository.cache_clear()
     yield
     get_follow_repository.cache_clear()
+    get_follow_suggestion_repository.cache_clear()
     get_log_repository.cache_clear()
     get_movie_rating_repository.cache_clear()
     get_movie_repository.cache_clear()
@@ -40,6 +44,13 @@ def test_get_follow_repository_returns_postgres_repository():
     assert get_follow_repository() is repository
 
 
+def test_get_follow_suggestion_repository_returns_postgres_repository():
+    repository = get_follow_suggestion_repository()
+
+    assert isinstance(repository, FollowSuggestionRepository)
+    assert get_follow_suggestion_repository() is repository
+
+
 def test_get_movie_repository_returns_postgres_repository():
     repository = get_movie_repository()
 
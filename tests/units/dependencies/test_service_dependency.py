@@ -6,7 +6,10 @@ from app.dependencies.repository_dependency import (
 )
 from app.dependencies.service_dependency import (
     _get_runtime_log_repository,
+    _get_runtime_user_repository,
+    get_feed_service,
     get_follow_service,
+    get_log_service,
     get_stats_service,
     get_user_service,
 )
@@ -14,6 +17,8 @@ from app.repository.follow_repository import FollowRepository
 from app.repository.log_cache_repository import LogCacheRepository
 from app.repository.log_repository import LogRepository
 from app.repository.stats_repository import StatsRepository
+from app.repository.user_cache_repository import UserCacheRepository
+from app.repository.user_repository import UserRepository
 
 
 def clear_caches() -> None:
@@ -37,6 +42,17 @@ def test_get_runtime_log_repository_wraps_postgres_repository_with_cache():
     clear_caches()
 
 
+def test_get_runtime_user_repository_wraps_postgres_repository_with_cache():
+    clear_caches()
+
+    repository = _get_runtime_user_repository()
+
+    assert isinstance(repository, UserCacheRepository)
+    assert isinstance(repository.repository, UserRepository)
+
+    clear_caches()
+
+
 def test_get_stats_service_uses_dedicated_stats_repository():
     clear_caches()
 
@@ -57,3 +73,19 @@ def test_follow_and_user_services_share_follow_repository():
     assert user_service.follow_repository is follow_service.follow_repository
 
     clear_caches()
+
+
+def test_log_follow_and_user_services_share_feed_service():
+    clear_caches()
+    get_feed_service.cache_clear()
+    get_log_service.cache_clear()
+
+    feed_service = get_feed_service()
+
+    assert get_follow_service().feed_service is feed_service
+    assert get_user_service().feed_service is feed_service
+    assert get_log_service().feed_service is feed_service
+
+    get_feed_service.cache_clear()
+    get_log_service.cache_clear()
+    clear_caches()
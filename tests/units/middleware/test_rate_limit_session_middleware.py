@@ -0,0 +1,60 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.middleware.rate_limit_session_middleware import RateLimitSessionMiddleware
+from app.utils.auth_utils import RATE_LIMIT_SESSION_COOKIE
+from app.utils.rate_limit_utils import RATE_LIMIT_SESSION_STATE
+
+
+async def login(request: Request):
+    response = JSONResponse({"session": getattr(request.state, RATE_LIMIT_SESSION_STATE, None)})
+    response.set_cookie("other", "value")
+    return response
+
+
+def make_client(refresh_result: bool) -> tuple[TestClient, MagicMock]:
+    app = RateLimitSessionMiddleware(
+        Starlette(routes=[Route("/v1/auth/login", login, methods=["POST"]), Route("/other", login, methods=["GET"])])
+    )
+    cache = MagicMock()
+    cache.refresh_session = AsyncMock(return_value=refresh_result)
+    cache.upsert_session = AsyncMock()
+    app._rate_limit_cache = cache
+    return TestClient(app, base_url="https://testserver"), cache
+
+
+def test_valid_session_is_refreshed_in_one_call_without_new_cookie():
+    client, cache = make_client(refresh_result=True)
+    client.cookies.set(RATE_LIMIT_SESSION_COOKIE, "known")
+
+    response = client.post("/v1/auth/login")
+
+    assert response.json() == {"session": "known"}
+    assert RATE_LIMIT_SESSION_COOKIE not in response.cookies
+    cache.refresh_session.assert_awaited_once_with("known")
+    cache.upsert_session.assert_not_awaited()
+
+
+def test_new_session_cookie_is_appended_to_existing_cookies():
+    client, cache = make_client(refresh_result=False)
+
+    response = client.post("/v1/auth/login")
+
+    issued = response.json()["session"]
+    assert response.cookies[RATE_LIMIT_SESSION_COOKIE] == issued
+    assert response.cookies["other"] == "value"
+    cache.upsert_session.assert_awaited_once_with(issued)
+
+
+def test_untracked_path_skips_session_work():
+    client, cache = make_client(refresh_result=True)
+
+    response = client.get("/other")
+
+    assert response.json() == {"session": None}
+    cache.refresh_session.assert_not_awaited()
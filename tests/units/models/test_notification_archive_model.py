@@ -0,0 +1,23 @@
+from app.models.notification_archive_model import NotificationArchive
+from app.models.notification_model import Notification
+
+
+def test_notification_archive_mirrors_notification_columns():
+    archive_columns = NotificationArchive.__table__.c
+    for column in Notification.__table__.c:
+        assert column.key in archive_columns
+        assert type(archive_columns[column.key].type) is type(column.type)
+        assert archive_columns[column.key].nullable == column.nullable
+    assert set(archive_columns.keys()) == set(Notification.__table__.c.keys())
+
+
+def test_notification_archive_has_only_the_chronology_index():
+    indexes = {index.name: index for index in NotificationArchive.__table__.indexes}
+
+    assert set(indexes) == {"ix_notifications_archive_recipient_chronology"}
+    assert [str(expression) for expression in indexes["ix_notifications_archive_recipient_chronology"].expressions] == [
+        "notifications_archive.recipient_id",
+        "created_at DESC",
+        "id DESC",
+    ]
+    assert NotificationArchive.__table__.c.id.server_default is None
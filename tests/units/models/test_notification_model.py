@@ -15,6 +15,9 @@ def test_notification_model_contains_only_common_typed_columns():
         "body",
         "deduplication_key",
         "read_at",
+        "aggregation_key",
+        "actor_count",
+        "sample_actor_ids",
         "deleted",
         "deleted_at",
         "created_at",
@@ -32,12 +35,33 @@ def test_notification_model_has_closed_type_constraint_and_expected_indexes():
 
     assert constraints["ck_notifications_type"] == ("type IN ('follow.started', 'follow.requested', 'follow.accepted')")
     assert set(indexes) == {
+        "ix_notifications_archivable",
+        "ix_notifications_soft_deleted",
         "ix_notifications_recipient_chronology",
         "ix_notifications_recipient_unread_chronology",
         "uq_notifications_active_recipient_deduplication_key",
+        "uq_notifications_open_aggregation_key",
     }
     assert indexes["uq_notifications_active_recipient_deduplication_key"].unique is True
     assert (
         indexes["uq_notifications_active_recipient_deduplication_key"].dialect_options["postgresql"]["where"]
         is not None
     )
+
+
+def test_notification_model_allows_one_open_aggregate_per_key():
+    index = next(
+        index for index in Notification.__table__.indexes if index.name == "uq_notifications_open_aggregation_key"
+    )
+    constraints = {
+        constraint.name: str(constraint.sqltext)
+        for constraint in Notification.__table__.constraints
+        if isinstance(constraint, CheckConstraint)
+    }
+
+    assert index.unique is True
+    assert [column.name for column in index.columns] == ["recipient_id", "aggregation_key"]
+    assert str(index.dialect_options["postgresql"]["where"]) == (
+        "deleted IS FALSE AND read_at IS NULL AND aggregation_key IS NOT NULL"
+    )
+    assert constraints["ck_notifications_actor_count_positive"] == "actor_count >= 1"
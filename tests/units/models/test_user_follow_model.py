@@ -26,5 +26,19 @@ def test_user_follow_model_prevents_self_follows_and_indexes_reverse_lookup():
     indexes = {index.name: index for index in UserFollow.__table__.indexes}
 
     assert constraints["ck_user_follows_not_self"] == "follower_id <> followed_id"
-    assert set(indexes) == {"ix_user_follows_followed_id"}
+    assert set(indexes) == {
+        "ix_user_follows_followed_id",
+        "ix_user_follows_followed_chronology",
+        "ix_user_follows_follower_chronology",
+    }
     assert [column.name for column in indexes["ix_user_follows_followed_id"].columns] == ["followed_id"]
+    assert [column.name for column in indexes["ix_user_follows_followed_chronology"].columns] == [
+        "followed_id",
+        "created_at",
+        "follower_id",
+    ]
+    assert [column.name for column in indexes["ix_user_follows_follower_chronology"].columns] == [
+        "follower_id",
+        "created_at",
+        "followed_id",
+    ]
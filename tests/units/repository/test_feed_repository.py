@@ -0,0 +1,188 @@
+"""PostgreSQL integration tests for ``FeedRepository``."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from pytest_postgresql.janitor import DatabaseJanitor
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.base_model import Base
+from app.models.log_model import Log
+from app.models.movie_model import Movie
+from app.models.user_model import User
+from app.repository.feed_repository import FeedRepository
+from app.repository.feed_repository_protocol import FeedEntry
+from app.repository.follow_repository import FollowRepository
+from app.types import TimestampUUIDCursor
+
+BASE = datetime(2026, 10, 1, 12, tzinfo=UTC)
+MAX_FOLLOWERS = 1
+
+
+def _async_url(pg, dbname: str) -> str:
+    return f"postgresql+asyncpg://{pg.user}:{pg.password}@{pg.host}:{pg.port}/{dbname}"
+
+
+@pytest_asyncio.fixture
+async def pg_engine(postgresql_proc):
+    dbname = f"cinelog_feed_test_{uuid4().hex[:8]}"
+    with DatabaseJanitor(
+        user=postgresql_proc.user,
+        host=postgresql_proc.host,
+        port=postgresql_proc.port,
+        dbname=dbname,
+        version=postgresql_proc.version,
+        password=postgresql_proc.password,
+    ):
+        engine = create_async_engine(_async_url(postgresql_proc, dbname))
+        async with engine.begin() as connection:
+            await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pgcrypto"))
+            await connection.run_sync(Base.metadata.create_all)
+        yield engine
+        await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session_factory(pg_engine):
+    return async_sessionmaker(pg_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+def session_provider(session_factory):
+    @asynccontextmanager
+    async def provider():
+        async with session_factory() as session:
+            yield session
+
+    return provider
+
+
+@pytest.fixture
+def repository(session_provider):
+    return FeedRepository(session_provider)
+
+
+@pytest.fixture
+def follow_repository(session_provider):
+    return FollowRepository(session_provider)
+
+
+@pytest_asyncio.fixture
+async def seed_session(session_factory):
+    async with session_factory() as session:
+        yield session
+
+
+async def _user(session: AsyncSession, suffix: str, *, visibility: str = "public", deleted: bool = False) -> User:
+    user = User(
+        email=f"{suffix}@example.com",
+        handle=suffix,
+        first_name=suffix.title(),
+        last_name="User",
+        profile_visibility=visibility,
+        deleted=deleted,
+    )
+    session.add(user)
+    await session.commit()
+    return user
+
+
+async def _movie(session: AsyncSession) -> Movie:
+    movie = Movie(tmdb_id=949, title="Heat")
+    session.add(movie)
+    await session.commit()
+    return movie
+
+
+async def _log(session: AsyncSession, author: User, movie: Movie, minutes: int, *, deleted: bool = False) -> Log:
+    log = Log(
+        user_id=author.id,
+        movie_id=movie.id,
+        tmdb_id=movie.tmdb_id,
+        date_watched=BASE,
+        created_at=BASE + timedelta(minutes=minutes),
+        deleted=deleted,
+    )
+    session.add(log)
+    await session.commit()
+    return log
+
+
+@pytest_asyncio.fixture
+async def graph(seed_session, follow_repository):
+    """A viewer following one pushed author, one pulled author and one private author."""
+
+    viewer = await _user(seed_session, "viewer")
+    other = await _user(seed_session, "other")
+    pushed = await _user(seed_session, "pushed")
+    pulled = await _user(seed_session, "pulled")
+    private = await _user(seed_session, "private", visibility="private")
+    for author in (pushed, pulled, private):
+        await follow_repository.create_follow(viewer.id, author.id)
+    await follow_repository.create_follow(other.id, pulled.id)
+    return viewer, other, pushed, pulled, private
+
+
+@pytest.mark.asyncio
+async def test_get_audience_splits_pushed_and_pulled_authors(repository, graph, seed_session):
+    viewer, other, pushed, pulled, private = graph
+    gone = await _user(seed_session, "gone", deleted=True)
+
+    assert (await repository.get_audience(pushed.id, MAX_FOLLOWERS)).follower_ids == [viewer.id]
+    pulled_audience = await repository.get_audience(pulled.id, MAX_FOLLOWERS)
+    assert pulled_audience.is_public is True
+    assert pulled_audience.follower_ids is None
+    private_audience = await repository.get_audience(private.id, MAX_FOLLOWERS)
+    assert private_audience.is_public is False
+    assert private_audience.follower_ids == [viewer.id]
+    assert (await repository.get_audience(gone.id, MAX_FOLLOWERS)).follower_ids == ()
+
+
+@pytest.mark.asyncio
+async def test_timeline_and_pulled_entries_partition_followed_public_logs(repository, graph, seed_session):
+    viewer, _other, pushed, pulled, private = graph
+    movie = await _movie(seed_session)
+    pushed_old = await _log(seed_session, pushed, movie, 1)
+    pushed_new = await _log(seed_session, pushed, movie, 3)
+    await _log(seed_session, pushed, movie, 4, deleted=True)
+    pulled_old = await _log(seed_session, pulled, movie, 2)
+    pulled_new = await _log(seed_session, pulled, movie, 5)
+    await _log(seed_session, private, movie, 6)
+
+    timeline = await repository.list_timeline_entries(viewer.id, max_followers=MAX_FOLLOWERS, limit=10)
+    assert timeline == [
+        FeedEntry(log_id=pushed_new.id, created_at=pushed_new.created_at),
+        FeedEntry(log_id=pushed_old.id, created_at=pushed_old.created_at),
+    ]
+
+    first = await repository.list_pulled_entries(viewer.id, min_followers=MAX_FOLLOWERS, limit=1, cursor=None)
+    assert [entry.log_id for entry in first] == [pulled_new.id]
+    rest = await repository.list_pulled_entries(
+        viewer.id,
+        min_followers=MAX_FOLLOWERS,
+        limit=10,
+        cursor=TimestampUUIDCursor(timestamp=pulled_new.created_at, id=pulled_new.id),
+    )
+    assert [entry.log_id for entry in rest] == [pulled_old.id]
+
+
+@pytest.mark.asyncio
+async def test_get_feed_logs_hydrates_visible_logs_only(repository, graph, seed_session):
+    _viewer, _other, pushed, _pulled, private = graph
+    movie = await _movie(seed_session)
+    visible = await _log(seed_session, pushed, movie, 1)
+    deleted = await _log(seed_session, pushed, movie, 2, deleted=True)
+    hidden = await _log(seed_session, private, movie, 3)
+
+    feed_logs = await repository.get_feed_logs([visible.id, deleted.id, hidden.id])
+
+    assert [(feed_log.log.id, feed_log.movie.title, feed_log.author.handle) for feed_log in feed_logs] == [
+        (visible.id, "Heat", "pushed")
+    ]
+    assert await repository.get_feed_logs([]) == []
@@ -15,9 +15,15 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.models.base_model import Base
+from app.models.log_model import Log
+from app.models.movie_model import Movie
+from app.models.movie_rating_model import MovieRating
 from app.models.user_follow_model import UserFollow
+from app.models.user_follow_stats_model import UserFollowStats
 from app.models.user_model import User
 from app.repository.follow_repository import FollowRepository
+from app.repository.user_repository import UserRepository
+from app.types import TimestampUUIDCursor
 
 
 def _async_url(pg, dbname: str) -> str:
@@ -49,13 +55,18 @@ async def session_factory(pg_engine):
 
 
 @pytest.fixture
-def repository(session_factory):
+def session_provider(session_factory):
     @asynccontextmanager
     async def provider():
         async with session_factory() as session:
             yield session
 
-    return FollowRepository(provider)
+    return provider
+
+
+@pytest.fixture
+def repository(session_provider):
+    return FollowRepository(session_provider)
 
 
 @pytest_asyncio.fixture
@@ -157,3 +168,142 @@ async def test_hard_deleted_user_cascades_relationships(repository, seed_session
 
     count = await seed_session.scalar(select(func.count()).select_from(UserFollow))
     assert count == 0
+
+
+async def _counts(session: AsyncSession, user_id) -> tuple[int, int] | None:
+    row = (
+        await session.execute(
+            select(UserFollowStats.follower_count, UserFollowStats.following_count).where(
+                UserFollowStats.user_id == user_id
+            )
+        )
+    ).one_or_none()
+    return None if row is None else (row.follower_count, row.following_count)
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_edge_writes_and_soft_deletes(repository, session_provider, seed_session):
+    celebrity = await _user(seed_session, "counter-celebrity")
+    fans = [await _user(seed_session, f"counter-fan-{index}") for index in range(3)]
+    inactive = await _user(seed_session, "counter-inactive", deleted=True)
+
+    for fan in fans:
+        await repository.create_follow(fan.id, celebrity.id)
+        await repository.create_follow(fan.id, celebrity.id)
+    await repository.create_follow(inactive.id, celebrity.id)
+    await repository.create_follow(celebrity.id, fans[0].id)
+    await repository.delete_follow(fans[1].id, celebrity.id)
+    await repository.delete_follow(fans[1].id, celebrity.id)
+
+    assert await _counts(seed_session, celebrity.id) == (2, 1)
+    assert await _counts(seed_session, fans[0].id) == (1, 1)
+    assert await _counts(seed_session, fans[1].id) == (0, 0)
+
+    await UserRepository(session_provider).delete_user(fans[0].id)
+
+    summary = await repository.get_follow_summary(celebrity.id, fans[2].id)
+    assert (summary.follower_count, summary.following_count, summary.is_following) == (1, 0, True)
+
+
+@pytest.mark.asyncio
+async def test_follow_lists_page_newest_first_over_active_users(repository, seed_session):
+    profile = await _user(seed_session, "list-profile")
+    followers = [await _user(seed_session, f"list-follower-{index}") for index in range(3)]
+    inactive = await _user(seed_session, "list-inactive", deleted=True)
+    for index, follower in enumerate([*followers, inactive]):
+        await repository.create_follow(follower.id, profile.id)
+        await repository.create_follow(profile.id, follower.id)
+        await seed_session.execute(
+            UserFollow.__table__.update()
+            .where(UserFollow.follower_id == follower.id)
+            .values(created_at=datetime(2026, 10, 1, index, tzinfo=UTC))
+        )
+    await seed_session.commit()
+
+    first = await repository.list_followers(profile.id, limit=2, cursor=None)
+    last = first.items[-1]
+    second = await repository.list_followers(
+        profile.id,
+        limit=2,
+        cursor=TimestampUUIDCursor(timestamp=last.followed_at, id=last.user.id),
+    )
+    following = await repository.list_following(profile.id, limit=10, cursor=None)
+
+    assert [item.user.handle for item in first.items] == ["list-follower-2", "list-follower-1"]
+    assert first.has_more is True
+    assert [item.user.handle for item in second.items] == ["list-follower-0"]
+    assert second.has_more is False
+    assert {item.user.handle for item in following.items} == {f"list-follower-{index}" for index in range(3)}
+
+
+@pytest.mark.asyncio
+async def test_list_following_ids_returns_every_followed_user(repository, seed_session):
+    follower = await _user(seed_session, "ids-follower")
+    first = await _user(seed_session, "ids-first")
+    second = await _user(seed_session, "ids-second")
+    await repository.create_follow(follower.id, first.id)
+    await repository.create_follow(follower.id, second.id)
+    await repository.create_follow(first.id, follower.id)
+
+    assert set(await repository.list_following_ids(follower.id)) == {first.id, second.id}
+    assert await repository.list_following_ids(second.id) == []
+
+
+@pytest.mark.asyncio
+async def test_list_friend_movie_activity_joins_logs_and_ratings_of_followed_users(repository, seed_session):
+    viewer = await _user(seed_session, "movie-viewer")
+    watcher = await _user(seed_session, "movie-watcher")
+    rater = await _user(seed_session, "movie-rater")
+    rewatcher = await _user(seed_session, "movie-rewatcher")
+    stranger = await _user(seed_session, "movie-stranger")
+    hidden = await _user(seed_session, "movie-hidden")
+    hidden.profile_visibility = "private"
+    for followed in (watcher, rater, rewatcher, hidden):
+        await repository.create_follow(viewer.id, followed.id)
+
+    movie = Movie(tmdb_id=603, title="The Matrix")
+    other_movie = Movie(tmdb_id=604, title="The Matrix Reloaded")
+    seed_session.add_all([movie, other_movie])
+    await seed_session.commit()
+
+    def log(user: User, target: Movie, day: int, *, deleted: bool = False) -> Log:
+        return Log(
+            user_id=user.id,
+            movie_id=target.id,
+            tmdb_id=target.tmdb_id,
+            date_watched=datetime(2026, 1, day, tzinfo=UTC),
+            deleted=deleted,
+        )
+
+    seed_session.add_all(
+        [
+            log(watcher, movie, 3),
+            log(rewatcher, movie, 1),
+            log(rewatcher, movie, 5),
+            log(rewatcher, movie, 9, deleted=True),
+            log(rater, other_movie, 7),
+            log(stranger, movie, 8),
+            log(hidden, movie, 8),
+            MovieRating(user_id=rater.id, movie_id=movie.id, tmdb_id=603, rating=7),
+            MovieRating(user_id=rewatcher.id, movie_id=movie.id, tmdb_id=603, rating=10),
+            MovieRating(user_id=stranger.id, movie_id=movie.id, tmdb_id=603, rating=1),
+        ]
+    )
+    await seed_session.commit()
+
+    page = await repository.list_friend_movie_activity(viewer.id, 603, limit=10)
+
+    assert page.total_count == 3
+    assert [(item.user.handle, item.last_watched_at, item.log_count, item.rating) for item in page.items] == [
+        ("movie-rewatcher", datetime(2026, 1, 5, tzinfo=UTC), 2, 10),
+        ("movie-watcher", datetime(2026, 1, 3, tzinfo=UTC), 1, None),
+        ("movie-rater", None, 0, 7),
+    ]
+
+    limited = await repository.list_friend_movie_activity(viewer.id, 603, limit=1)
+    assert [item.user.handle for item in limited.items] == ["movie-rewatcher"]
+    assert limited.total_count == 3
+
+    empty = await repository.list_friend_movie_activity(stranger.id, 603, limit=10)
+    assert empty.items == []
+    assert empty.total_count == 0
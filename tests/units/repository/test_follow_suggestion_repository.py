@@ -0,0 +1,180 @@
+"""PostgreSQL integration tests for ``FollowSuggestionRepository``."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from pytest_postgresql.janitor import DatabaseJanitor
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.base_model import Base
+from app.models.user_follow_suggestion_model import UserFollowSuggestion
+from app.models.user_model import User
+from app.repository.follow_repository import FollowRepository
+from app.repository.follow_suggestion_repository import FollowSuggestionRepository
+from app.repository.follow_suggestion_repository_protocol import ScoredSuggestion
+
+RUN_AT = datetime(2026, 10, 1, 3, tzinfo=UTC)
+
+
+def _async_url(pg, dbname: str) -> str:
+    return f"postgresql+asyncpg://{pg.user}:{pg.password}@{pg.host}:{pg.port}/{dbname}"
+
+
+@pytest_asyncio.fixture
+async def pg_engine(postgresql_proc):
+    dbname = f"cinelog_suggestion_test_{uuid4().hex[:8]}"
+    with DatabaseJanitor(
+        user=postgresql_proc.user,
+        host=postgresql_proc.host,
+        port=postgresql_proc.port,
+        dbname=dbname,
+        version=postgresql_proc.version,
+        password=postgresql_proc.password,
+    ):
+        engine = create_async_engine(_async_url(postgresql_proc, dbname))
+        async with engine.begin() as connection:
+            await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pgcrypto"))
+            await connection.run_sync(Base.metadata.create_all)
+        yield engine
+        await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session_factory(pg_engine):
+    return async_sessionmaker(pg_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+def session_provider(session_factory):
+    @asynccontextmanager
+    async def provider():
+        async with session_factory() as session:
+            yield session
+
+    return provider
+
+
+@pytest.fixture
+def repository(session_provider):
+    return FollowSuggestionRepository(session_provider)
+
+
+@pytest.fixture
+def follow_repository(session_provider):
+    return FollowRepository(session_provider)
+
+
+@pytest_asyncio.fixture
+async def seed_session(session_factory):
+    async with session_factory() as session:
+        yield session
+
+
+async def _user(session: AsyncSession, suffix: str, *, visibility: str = "public", deleted: bool = False) -> User:
+    user = User(
+        email=f"{suffix}@example.com",
+        handle=suffix,
+        first_name=suffix.title(),
+        last_name="User",
+        profile_visibility=visibility,
+        deleted=deleted,
+    )
+    session.add(user)
+    await session.commit()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_load_follow_graph_streams_active_edges_in_csr_order(repository, follow_repository, seed_session):
+    users = [await _user(seed_session, f"graph-{index}") for index in range(4)]
+    hidden = await _user(seed_session, "graph-hidden", visibility="private")
+    gone = await _user(seed_session, "graph-gone", deleted=True)
+    for follower, followed in [(0, 1), (0, 2), (2, 3), (3, 0)]:
+        await follow_repository.create_follow(users[follower].id, users[followed].id)
+    await follow_repository.create_follow(users[1].id, hidden.id)
+    await follow_repository.create_follow(users[1].id, gone.id)
+
+    graph = await repository.load_follow_graph(batch_size=2)
+
+    assert list(graph.user_ids) == sorted(graph.user_ids)
+    assert gone.id not in graph.user_ids
+    index = {user_id: position for position, user_id in enumerate(graph.user_ids)}
+    edges = {
+        (graph.user_ids[node], graph.user_ids[target]) for node in range(graph.size) for target in graph.following(node)
+    }
+    assert edges == {
+        (users[0].id, users[1].id),
+        (users[0].id, users[2].id),
+        (users[2].id, users[3].id),
+        (users[3].id, users[0].id),
+        (users[1].id, hidden.id),
+    }
+    assert graph.suggestible[index[hidden.id]] == 0
+    assert graph.suggestible[index[users[0].id]] == 1
+
+
+@pytest.mark.asyncio
+async def test_replace_and_sweep_suggestions(repository, seed_session):
+    viewer = await _user(seed_session, "sweep-viewer")
+    leaver = await _user(seed_session, "sweep-leaver")
+    first = await _user(seed_session, "sweep-first")
+    second = await _user(seed_session, "sweep-second")
+
+    earlier = RUN_AT - timedelta(days=1)
+    await repository.replace_suggestions(
+        {
+            viewer.id: [ScoredSuggestion(first.id, 1)],
+            leaver.id: [ScoredSuggestion(first.id, 1), ScoredSuggestion(second.id, 1)],
+        },
+        earlier,
+    )
+    written = await repository.replace_suggestions(
+        {viewer.id: [ScoredSuggestion(second.id, 3), ScoredSuggestion(first.id, 2)]},
+        RUN_AT,
+    )
+    deleted = await repository.delete_suggestions_computed_before(RUN_AT)
+
+    rows = (
+        await seed_session.execute(
+            select(UserFollowSuggestion.user_id, UserFollowSuggestion.rank, UserFollowSuggestion.suggested_user_id)
+        )
+    ).all()
+    assert (written, deleted) == (2, 2)
+    assert sorted(rows, key=lambda row: row.rank) == [(viewer.id, 1, second.id), (viewer.id, 2, first.id)]
+    assert await repository.replace_suggestions({}, RUN_AT) == 0
+
+
+@pytest.mark.asyncio
+async def test_list_suggestions_drops_users_changed_since_the_run(repository, follow_repository, seed_session):
+    viewer = await _user(seed_session, "list-viewer")
+    kept = await _user(seed_session, "list-kept")
+    now_followed = await _user(seed_session, "list-followed")
+    now_private = await _user(seed_session, "list-private")
+    also_kept = await _user(seed_session, "list-also-kept")
+    await repository.replace_suggestions(
+        {
+            viewer.id: [
+                ScoredSuggestion(now_followed.id, 4),
+                ScoredSuggestion(kept.id, 3),
+                ScoredSuggestion(now_private.id, 2),
+                ScoredSuggestion(also_kept.id, 1),
+            ]
+        },
+        RUN_AT,
+    )
+    await follow_repository.create_follow(viewer.id, now_followed.id)
+    now_private.profile_visibility = "private"
+    await seed_session.commit()
+
+    items = await repository.list_suggestions(viewer.id, limit=10)
+    limited = await repository.list_suggestions(viewer.id, limit=1)
+
+    assert [(item.user.handle, item.mutual_count) for item in items] == [("list-kept", 3), ("list-also-kept", 1)]
+    assert [item.user.handle for item in limited] == ["list-kept"]
+    assert await seed_session.scalar(select(func.count()).select_from(UserFollowSuggestion)) == 4
@@ -1,5 +1,5 @@
 from datetime import UTC, date, datetime
-from unittest.mock import AsyncMock, MagicMock, call, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID, uuid4
 
 import pytest
@@ -33,8 +33,8 @@ def _mock_cache() -> MagicMock:
     cache = MagicMock()
     cache.get = AsyncMock(return_value=None)
     cache.set = AsyncMock(return_value=True)
-    cache.delete = AsyncMock(return_value=True)
-    cache.invalidate_pattern = AsyncMock(return_value=1)
+    cache.set_indexed = AsyncMock()
+    cache.delete_indexed = AsyncMock(return_value=1)
     return cache
 
 
@@ -157,7 +157,9 @@ async def test_find_logs_by_user_id_cache_miss_uses_filter_specific_key():
         sort_by="dateWatched",
         sort_order="desc",
     )
-    cache.set.assert_awaited_once_with(expected_key, repository._serialize_logs([log]), ttl=LOG_CACHE_TTL)
+    cache.set_indexed.assert_awaited_once_with(
+        expected_key, repository._serialize_logs([log]), repository.build_user_logs_index_key(user_id), LOG_CACHE_TTL
+    )
 
 
 @pytest.mark.asyncio
@@ -209,7 +211,12 @@ async def test_find_logs_by_movie_id_cache_miss_queries_repository_and_sets_cach
     expected_key = repository.build_movie_logs_key(log.movie_id, log.user_id)
     assert result == [log]
     inner_repository.find_logs_by_movie_id.assert_awaited_once_with(log.movie_id, log.user_id)
-    cache.set.assert_awaited_once_with(expected_key, repository._serialize_logs([log]), ttl=LOG_CACHE_TTL)
+    cache.set_indexed.assert_awaited_once_with(
+        expected_key,
+        repository._serialize_logs([log]),
+        repository.build_movie_logs_index_key(log.movie_id),
+        LOG_CACHE_TTL,
+    )
 
 
 @pytest.mark.asyncio
@@ -250,13 +257,10 @@ async def test_create_log_invalidates_user_and_movie_lists():
         result = await repository.create_log(log.user_id, request)
 
     assert result == log
-    cache.invalidate_pattern.assert_has_awaits(
-        [
-            call(repository.build_user_logs_pattern(log.user_id)),
-            call(repository.build_movie_logs_pattern(log.movie_id)),
-        ]
+    cache.delete_indexed.assert_awaited_once_with(
+        [],
+        [repository.build_user_logs_index_key(log.user_id), repository.build_movie_logs_index_key(log.movie_id)],
     )
-    assert cache.invalidate_pattern.await_count == 2
 
 
 @pytest.mark.asyncio
@@ -272,14 +276,10 @@ async def test_update_log_invalidates_id_user_and_movie_cache():
         result = await repository.update_log(log.id, log.user_id, request)
 
     assert result == log
-    cache.delete.assert_awaited_once_with(repository.build_log_key(log.id, log.user_id))
-    cache.invalidate_pattern.assert_has_awaits(
-        [
-            call(repository.build_user_logs_pattern(log.user_id)),
-            call(repository.build_movie_logs_pattern(log.movie_id)),
-        ]
+    cache.delete_indexed.assert_awaited_once_with(
+        [repository.build_log_key(log.id, log.user_id)],
+        [repository.build_user_logs_index_key(log.user_id), repository.build_movie_logs_index_key(log.movie_id)],
     )
-    assert cache.invalidate_pattern.await_count == 2
 
 
 @pytest.mark.asyncio
@@ -298,7 +298,10 @@ async def test_update_log_uses_repository_lookup_without_reading_cache():
     assert result is not None
     inner_repository.update_log.assert_awaited_once_with(log.id, log.user_id, request)
     cache.get.assert_not_awaited()
-    cache.delete.assert_awaited_once_with(repository.build_log_key(log.id, log.user_id))
+    cache.delete_indexed.assert_awaited_once_with(
+        [repository.build_log_key(log.id, log.user_id)],
+        [repository.build_user_logs_index_key(log.user_id), repository.build_movie_logs_index_key(log.movie_id)],
+    )
 
 
 @pytest.mark.asyncio
@@ -315,14 +318,10 @@ async def test_delete_log_invalidates_only_after_successful_delete():
     assert result == log
     inner_repository.find_log_by_id.assert_not_awaited()
     inner_repository.delete_log.assert_awaited_once_with(log.id, log.user_id)
-    cache.delete.assert_awaited_once_with(repository.build_log_key(log.id, log.user_id))
-    cache.invalidate_pattern.assert_has_awaits(
-        [
-            call(repository.build_user_logs_pattern(log.user_id)),
-            call(repository.build_movie_logs_pattern(log.movie_id)),
-        ]
+    cache.delete_indexed.assert_awaited_once_with(
+        [repository.build_log_key(log.id, log.user_id)],
+        [repository.build_user_logs_index_key(log.user_id), repository.build_movie_logs_index_key(log.movie_id)],
     )
-    assert cache.invalidate_pattern.await_count == 2
 
 
 @pytest.mark.asyncio
@@ -340,7 +339,10 @@ async def test_delete_log_uses_repository_lookup_without_reading_cache():
     assert result is not None
     inner_repository.delete_log.assert_awaited_once_with(log.id, log.user_id)
     cache.get.assert_not_awaited()
-    cache.delete.assert_awaited_once_with(repository.build_log_key(log.id, log.user_id))
+    cache.delete_indexed.assert_awaited_once_with(
+        [repository.build_log_key(log.id, log.user_id)],
+        [repository.build_user_logs_index_key(log.user_id), repository.build_movie_logs_index_key(log.movie_id)],
+    )
 
 
 @pytest.mark.asyncio
@@ -357,15 +359,14 @@ async def test_delete_log_not_found_skips_invalidation():
 
     assert result is None
     inner_repository.delete_log.assert_awaited_once_with(log_id, user_id)
-    cache.delete.assert_not_awaited()
-    cache.invalidate_pattern.assert_not_awaited()
+    cache.delete_indexed.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_invalidation_failure_does_not_raise():
     log = _sample_log()
     cache = _mock_cache()
-    cache.invalidate_pattern.side_effect = RuntimeError("redis down")
+    cache.delete_indexed.side_effect = RuntimeError("redis down")
     inner_repository = _mock_log_repository()
     inner_repository.create_log.return_value = log
     repository = LogCacheRepository(inner_repository)
@@ -380,10 +381,7 @@ async def test_invalidation_failure_does_not_raise():
         result = await repository.create_log(log.user_id, request)
 
     assert result == log
-    cache.invalidate_pattern.assert_has_awaits(
-        [
-            call(repository.build_user_logs_pattern(log.user_id)),
-            call(repository.build_movie_logs_pattern(log.movie_id)),
-        ]
+    cache.delete_indexed.assert_awaited_once_with(
+        [],
+        [repository.build_user_logs_index_key(log.user_id), repository.build_movie_logs_index_key(log.movie_id)],
     )
-    assert cache.invalidate_pattern.await_count == 2
@@ -251,3 +251,23 @@ async def test_find_movies_by_ids_accepts_iterable(repository: MovieRepository,
     found = await repository.find_movies_by_ids([first.id, second.id])
 
     assert {movie.id for movie in found} == {first.id, second.id}
+
+
+@pytest.mark.asyncio
+async def test_find_movies_by_tmdb_ids_filters_deleted_and_unknown(
+    repository: MovieRepository,
+    seed_session: AsyncSession,
+):
+    a = Movie(tmdb_id=811, title="A")
+    b = Movie(tmdb_id=812, title="B", deleted=True, deleted_at=datetime.now(UTC))
+    c = Movie(tmdb_id=813, title="C")
+    await _add(seed_session, a, b, c)
+
+    found = await repository.find_movies_by_tmdb_ids([811, 812, 813, 999])
+
+    assert {m.tmdb_id for m in found} == {811, 813}
+
+
+@pytest.mark.asyncio
+async def test_find_movies_by_tmdb_ids_with_empty_list_short_circuits(repository: MovieRepository):
+    assert await repository.find_movies_by_tmdb_ids([]) == []
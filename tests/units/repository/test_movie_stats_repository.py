@@ -0,0 +1,271 @@
+"""Unit tests for community movie-stats counters and ``MovieStatsRepository``."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from pytest_postgresql.janitor import DatabaseJanitor
+from sqlalchemy import text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.base_model import Base
+from app.models.movie_community_stats_model import MovieCommunityStats
+from app.models.movie_model import Movie
+from app.models.movie_rating_model import MovieRating
+from app.models.user_model import User
+from app.repository.log_repository import LogRepository
+from app.repository.movie_rating_repository import MovieRatingRepository
+from app.repository.movie_stats_repository import MovieStatsRepository
+from app.schemas.log_schemas import LogCreateRequest
+
+
+def _async_url(pg, dbname: str) -> str:
+    return f"postgresql+asyncpg://{pg.user}:{pg.password}@{pg.host}:{pg.port}/{dbname}"
+
+
+@pytest_asyncio.fixture
+async def pg_engine(postgresql_proc):
+    """Create a fresh database per test and return an async SQLAlchemy engine."""
+    dbname = f"cinelog_movie_stats_test_{uuid4().hex[:8]}"
+
+    with DatabaseJanitor(
+        user=postgresql_proc.user,
+        host=postgresql_proc.host,
+        port=postgresql_proc.port,
+        dbname=dbname,
+        version=postgresql_proc.version,
+        password=postgresql_proc.password,
+    ):
+        engine = create_async_engine(_async_url(postgresql_proc, dbname))
+        async with engine.begin() as connection:
+            await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pgcrypto"))
+            await connection.run_sync(Base.metadata.create_all)
+
+        try:
+            yield engine
+        finally:
+            await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session_factory(pg_engine):
+    return async_sessionmaker(pg_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+def session_provider(session_factory):
+    @asynccontextmanager
+    async def _provider():
+        async with session_factory() as session:
+            yield session
+
+    return _provider
+
+
+@pytest.fixture
+def repository(session_provider) -> MovieStatsRepository:
+    return MovieStatsRepository(session_provider=session_provider)
+
+
+@pytest.fixture
+def log_repository(session_provider) -> LogRepository:
+    return LogRepository(session_provider=session_provider)
+
+
+@pytest.fixture
+def movie_rating_repository(session_provider) -> MovieRatingRepository:
+    return MovieRatingRepository(session_provider=session_provider)
+
+
+@pytest_asyncio.fixture
+async def seed_session(session_factory):
+    async with session_factory() as session:
+        yield session
+
+
+async def _add(seed_session: AsyncSession, *entities) -> None:
+    seed_session.add_all(entities)
+    await seed_session.commit()
+    for entity in entities:
+        await seed_session.refresh(entity)
+
+
+def _user(suffix: str) -> User:
+    return User(
+        email=f"stats-{suffix}@example.com",
+        handle=f"stats-{suffix}",
+        first_name="Stats",
+        last_name="User",
+        date_of_birth=date(1990, 1, 1),
+    )
+
+
+async def _seed(seed_session: AsyncSession) -> tuple[User, User, Movie]:
+    alice = _user("alice")
+    bob = _user("bob")
+    movie = Movie(tmdb_id=550, title="Fight Club")
+    await _add(seed_session, alice, bob, movie)
+    return alice, bob, movie
+
+
+def _log_request(movie: Movie) -> LogCreateRequest:
+    return LogCreateRequest(
+        movie_id=movie.id,
+        tmdb_id=movie.tmdb_id,
+        date_watched=date(2024, 1, 15),
+        watched_where="cinema",
+    )
+
+
+async def _rate(repository: MovieRatingRepository, user: User, movie: Movie, rating: int) -> MovieRating:
+    return await repository.create_update_movie_rating(
+        user_id=user.id,
+        movie_id=movie.id,
+        rating=rating,
+        comment=None,
+        tmdb_id=movie.tmdb_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_find_movie_stats_returns_none_for_untouched_movie(
+    repository: MovieStatsRepository,
+    seed_session: AsyncSession,
+):
+    await _seed(seed_session)
+
+    assert await repository.find_movie_stats_by_tmdb_id(550) is None
+
+
+@pytest.mark.asyncio
+async def test_log_writes_maintain_log_and_distinct_watcher_counts(
+    repository: MovieStatsRepository,
+    log_repository: LogRepository,
+    seed_session: AsyncSession,
+):
+    alice, bob, movie = await _seed(seed_session)
+
+    first = await log_repository.create_log(alice.id, _log_request(movie))
+    rewatch = await log_repository.create_log(alice.id, _log_request(movie))
+    await log_repository.create_log(bob.id, _log_request(movie))
+
+    stats = await repository.find_movie_stats_by_tmdb_id(550)
+    assert stats is not None
+    assert (stats.log_count, stats.watcher_count) == (3, 2)
+
+    await log_repository.delete_log(first.id, alice.id)
+    stats = await repository.find_movie_stats_by_tmdb_id(550)
+    assert stats is not None
+    assert (stats.log_count, stats.watcher_count) == (2, 2)
+
+    await log_repository.delete_log(rewatch.id, alice.id)
+    stats = await repository.find_movie_stats_by_tmdb_id(550)
+    assert stats is not None
+    assert (stats.log_count, stats.watcher_count) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_logs_by_one_user_count_a_single_watcher(
+    repository: MovieStatsRepository,
+    log_repository: LogRepository,
+    seed_session: AsyncSession,
+):
+    alice, _, movie = await _seed(seed_session)
+
+    await asyncio.gather(*(log_repository.create_log(alice.id, _log_request(movie)) for _ in range(4)))
+
+    stats = await repository.find_movie_stats_by_tmdb_id(550)
+    assert stats is not None
+    assert (stats.log_count, stats.watcher_count) == (4, 1)
+
+
+@pytest.mark.asyncio
+async def test_rating_upserts_move_sum_and_histogram(
+    repository: MovieStatsRepository,
+    movie_rating_repository: MovieRatingRepository,
+    seed_session: AsyncSession,
+):
+    alice, bob, movie = await _seed(seed_session)
+
+    await _rate(movie_rating_repository, alice, movie, 8)
+    await _rate(movie_rating_repository, bob, movie, 6)
+    await _rate(movie_rating_repository, alice, movie, 9)
+    await _rate(movie_rating_repository, alice, movie, 9)
+
+    stats = await repository.find_movie_stats_by_tmdb_id(550)
+    assert stats is not None
+    assert (stats.rating_count, stats.rating_sum) == (2, 15)
+    assert stats.rating_histogram == [0, 0, 0, 0, 0, 1, 0, 0, 1, 0]
+
+
+@pytest.mark.asyncio
+async def test_reviving_soft_deleted_rating_counts_it_again(
+    repository: MovieStatsRepository,
+    movie_rating_repository: MovieRatingRepository,
+    seed_session: AsyncSession,
+):
+    alice, _, movie = await _seed(seed_session)
+    await _add(
+        seed_session,
+        MovieRating(user_id=alice.id, movie_id=movie.id, tmdb_id=movie.tmdb_id, rating=3, deleted=True),
+    )
+
+    await _rate(movie_rating_repository, alice, movie, 7)
+
+    stats = await repository.find_movie_stats_by_tmdb_id(550)
+    assert stats is not None
+    assert (stats.rating_count, stats.rating_sum) == (1, 7)
+    assert stats.rating_7_count == 1
+    assert stats.rating_3_count == 0
+
+
+@pytest.mark.asyncio
+async def test_reconcile_repairs_drift_and_reports_corrected_movies(
+    repository: MovieStatsRepository,
+    log_repository: LogRepository,
+    movie_rating_repository: MovieRatingRepository,
+    seed_session: AsyncSession,
+):
+    alice, bob, movie = await _seed(seed_session)
+    untouched = Movie(tmdb_id=551, title="Untouched")
+    await _add(seed_session, untouched)
+    await log_repository.create_log(alice.id, _log_request(movie))
+    await log_repository.create_log(bob.id, _log_request(movie))
+    await _rate(movie_rating_repository, alice, movie, 10)
+
+    await seed_session.execute(
+        update(MovieCommunityStats)
+        .where(MovieCommunityStats.movie_id == movie.id)
+        .values(log_count=40, watcher_count=0, rating_sum=3, rating_10_count=0)
+    )
+    await seed_session.commit()
+
+    result = await repository.reconcile_movie_stats(batch_size=1)
+
+    assert result.movies_scanned == 2
+    assert sorted(result.corrected_tmdb_ids) == [550, 551]
+    assert result.rows_corrected == 2
+
+    stats = await repository.find_movie_stats_by_tmdb_id(550)
+    assert stats is not None
+    assert (stats.log_count, stats.watcher_count, stats.rating_count, stats.rating_sum) == (2, 2, 1, 10)
+    assert stats.rating_10_count == 1
+
+    empty = await repository.find_movie_stats_by_tmdb_id(551)
+    assert empty is not None
+    assert (empty.log_count, empty.watcher_count, empty.rating_count) == (0, 0, 0)
+
+    second_pass = await repository.reconcile_movie_stats()
+    assert second_pass.rows_corrected == 0
+    assert second_pass.corrected_tmdb_ids == []
+
+
+@pytest.mark.asyncio
+async def test_reconcile_rejects_non_positive_batch_size(repository: MovieStatsRepository):
+    with pytest.raises(ValueError, match="batch_size"):
+        await repository.reconcile_movie_stats(batch_size=0)
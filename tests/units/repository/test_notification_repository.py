@@ -5,19 +5,23 @@ from __future__ import annotations
 import asyncio
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
-from uuid import uuid4
+from unittest.mock import patch
+from uuid import UUID, uuid4
 
 import pytest
 import pytest_asyncio
 from pytest_postgresql.janitor import DatabaseJanitor
-from sqlalchemy import event, select, text, update
+from sqlalchemy import event, func, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.models.base_model import Base
+from app.models.notification_actor_model import NotificationActor
+from app.models.notification_archive_model import NotificationArchive
 from app.models.notification_model import Notification
+from app.models.user_follow_model import UserFollow
 from app.models.user_model import User
 from app.repository.notification_repository import NotificationRepository
-from app.schemas.notification_schemas import NotificationCreateData
+from app.schemas.notification_schemas import NotificationCreateData, NotificationFanOutData
 from app.types import NotificationType, TimestampUUIDCursor
 
 
@@ -96,6 +100,27 @@ def _create_data(recipient_id, *, actor_id=None, key="event-key") -> Notificatio
     )
 
 
+def _fan_out_data(actor_id, *, key="fan-out-key") -> NotificationFanOutData:
+    return NotificationFanOutData(
+        actor_id=actor_id,
+        type=NotificationType.FOLLOW_STARTED,
+        title="New from someone you follow",
+        body="A user you follow posted an update.",
+        deduplication_key=key,
+    )
+
+
+async def _fan_out_all(repository: NotificationRepository, data: NotificationFanOutData, limit: int):
+    batches = []
+    cursor = None
+    while True:
+        batch = await repository.create_follower_notifications_batch(data, after=cursor, limit=limit)
+        batches.append(batch)
+        if batch.next_cursor is None:
+            return batches
+        cursor = batch.next_cursor
+
+
 @pytest.mark.asyncio
 async def test_create_notification_is_idempotent_per_recipient_and_reuses_soft_deleted_keys(
     repository: NotificationRepository,
@@ -215,8 +240,8 @@ async def test_list_notifications_is_stable_scoped_and_does_not_mark_rows_read(
     assert [item.id for item in second_page.items] == [older.id]
     assert first_page.has_more is True
     assert second_page.has_more is False
-    assert first_page.unread_count == 2
-    assert unread_page.unread_count == 2
+    assert await repository.count_unread_notifications(recipient.id) == 2
+    assert await repository.count_unread_notifications(other.id) == 1
     assert {item.id for item in unread_page.items} == {older.id, tied_first.id}
     assert first_page.items[0].read_at == expected_tied[0].read_at
     assert first_page.items[1].read_at == expected_tied[1].read_at
@@ -227,7 +252,46 @@ async def test_list_notifications_is_stable_scoped_and_does_not_mark_rows_read(
 
 
 @pytest.mark.asyncio
-async def test_listing_uses_fixed_query_count_for_batched_actor_loading(
+async def test_list_notifications_after_replays_newer_rows_oldest_first(
+    repository: NotificationRepository,
+    seed_session: AsyncSession,
+):
+    recipient = await _user(seed_session, "replay-recipient")
+    other = await _user(seed_session, "replay-other")
+    timestamp = datetime(2026, 7, 18, 10, 0, tzinfo=UTC)
+
+    def _at(recipient_id, moment, **kwargs) -> Notification:
+        return Notification(
+            recipient_id=recipient_id,
+            type=NotificationType.FOLLOW_STARTED.value,
+            title="Title",
+            body="Body",
+            created_at=moment,
+            updated_at=moment,
+            **kwargs,
+        )
+
+    seen = _at(recipient.id, timestamp, id=UUID(int=5))
+    tied_before = _at(recipient.id, timestamp, id=UUID(int=4))
+    tied_after = _at(recipient.id, timestamp, id=UUID(int=6))
+    newer = _at(recipient.id, timestamp + timedelta(minutes=1))
+    newest = _at(recipient.id, timestamp + timedelta(minutes=2))
+    foreign = _at(other.id, timestamp + timedelta(minutes=1))
+    deleted = _at(recipient.id, timestamp + timedelta(minutes=1), deleted=True, deleted_at=timestamp)
+    await _add(seed_session, seen, tied_before, tied_after, newer, newest, foreign, deleted)
+
+    cursor = TimestampUUIDCursor(timestamp=seen.created_at, id=seen.id)
+    first = await repository.list_notifications_after(recipient.id, cursor=cursor, limit=2)
+    everything = await repository.list_notifications_after(recipient.id, cursor=cursor, limit=10)
+
+    assert [item.id for item in first.items] == [tied_after.id, newer.id]
+    assert first.has_more is True
+    assert [item.id for item in everything.items] == [tied_after.id, newer.id, newest.id]
+    assert everything.has_more is False
+
+
+@pytest.mark.asyncio
+async def test_listing_loads_page_actors_and_unread_count_in_one_statement(
     repository: NotificationRepository,
     seed_session: AsyncSession,
     pg_engine,
@@ -243,6 +307,7 @@ async def test_listing_uses_fixed_query_count_for_batched_actor_loading(
                 type=NotificationType.FOLLOW_STARTED.value,
                 title="Title",
                 body="Body",
+                sample_actor_ids=[actor.id, actors[0].id],
             )
             for actor in actors
         ],
@@ -254,12 +319,44 @@ async def test_listing_uses_fixed_query_count_for_batched_actor_loading(
 
     event.listen(pg_engine.sync_engine, "before_cursor_execute", record_query)
     try:
-        page = await repository.list_notifications(recipient.id, unread_only=False, limit=20, cursor=None)
+        page = await repository.list_notifications(
+            recipient.id, unread_only=False, limit=20, cursor=None, count_unread=True
+        )
     finally:
         event.remove(pg_engine.sync_engine, "before_cursor_execute", record_query)
 
     assert len(page.items) == 5
-    assert len(statements) == 3
+    assert {item.actor.handle for item in page.items if item.actor is not None} == {
+        f"query-actor-{index}" for index in range(5)
+    }
+    assert all(len(item.sample_actors) == len(set(item.sample_actor_ids)) for item in page.items)
+    assert page.unread_count == 5
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_listing_counts_unread_rows_past_the_end_of_the_inbox(
+    repository: NotificationRepository,
+    seed_session: AsyncSession,
+):
+    recipient = await _user(seed_session, "count-recipient")
+    notification = Notification(
+        recipient_id=recipient.id,
+        type=NotificationType.FOLLOW_STARTED.value,
+        title="Title",
+        body="Body",
+    )
+    await _add(seed_session, notification)
+    past_end = TimestampUUIDCursor(timestamp=notification.created_at, id=notification.id)
+
+    counted = await repository.list_notifications(
+        recipient.id, unread_only=False, limit=20, cursor=past_end, count_unread=True
+    )
+    uncounted = await repository.list_notifications(recipient.id, unread_only=False, limit=20, cursor=None)
+
+    assert (counted.items, counted.has_more, counted.unread_count) == ([], False, 1)
+    assert len(uncounted.items) == 1
+    assert uncounted.unread_count is None
 
 
 @pytest.mark.asyncio
@@ -282,12 +379,15 @@ async def test_mark_notification_read_is_server_owned_scoped_and_idempotent(
     repeated = await repository.mark_notification_read(notification.id, recipient.id)
     foreign = await repository.mark_notification_read(notification.id, other.id)
 
-    assert first is not None
-    assert repeated is not None
-    assert first.read_at is not None
-    assert before <= first.read_at <= datetime.now(UTC)
-    assert repeated.read_at == first.read_at
-    assert foreign is None
+    assert first.updated is True
+    assert repeated.updated is False
+    assert foreign.updated is False
+    assert first.notification is not None
+    assert repeated.notification is not None
+    assert first.notification.read_at is not None
+    assert before <= first.notification.read_at <= datetime.now(UTC)
+    assert repeated.notification.read_at == first.notification.read_at
+    assert foreign.notification is None
 
 
 @pytest.mark.asyncio
@@ -339,8 +439,9 @@ async def test_mark_all_notifications_read_uses_one_timestamp_and_preserves_exis
     deleted_id = deleted.id
     notification_ids = [unread_a_id, unread_b_id, already_read_id, foreign_id, deleted_id]
 
-    first = await repository.mark_all_notifications_read(recipient.id)
-    repeated = await repository.mark_all_notifications_read(recipient.id)
+    recipient_id = recipient.id
+    first = await repository.mark_all_notifications_read(recipient_id)
+    repeated = await repository.mark_all_notifications_read(recipient_id)
     seed_session.expire_all()
     persisted = {
         item.id: item
@@ -350,10 +451,193 @@ async def test_mark_all_notifications_read_uses_one_timestamp_and_preserves_exis
     }
 
     assert first.updated_count == 2
-    assert first.unread_count == 0
     assert repeated.updated_count == 0
-    assert repeated.unread_count == 0
+    assert await repository.count_unread_notifications(recipient_id) == 0
     assert persisted[unread_a_id].read_at == persisted[unread_b_id].read_at
     assert persisted[already_read_id].read_at == old_read_at
     assert persisted[foreign_id].read_at is None
     assert persisted[deleted_id].read_at is None
+
+
+@pytest.mark.asyncio
+async def test_follower_fan_out_batches_skip_inactive_followers_and_retries(
+    repository: NotificationRepository,
+    seed_session: AsyncSession,
+):
+    actor = await _user(seed_session, "fanout-actor")
+    followers = [await _user(seed_session, f"fanout-follower-{index}") for index in range(5)]
+    gone = await _user(seed_session, "fanout-gone", deleted=True)
+    stranger = await _user(seed_session, "fanout-stranger")
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    await _add(
+        seed_session,
+        *[
+            UserFollow(follower_id=follower.id, followed_id=actor.id, created_at=base + timedelta(minutes=index))
+            for index, follower in enumerate([*followers, gone])
+        ],
+        UserFollow(follower_id=actor.id, followed_id=stranger.id),
+    )
+    actor_id = actor.id
+    follower_ids = [follower.id for follower in followers]
+
+    batches = await _fan_out_all(repository, _fan_out_data(actor_id), limit=2)
+
+    assert [len(batch.notifications) for batch in batches] == [2, 2, 1, 0]
+    assert batches[0].next_cursor == TimestampUUIDCursor(timestamp=base + timedelta(minutes=1), id=follower_ids[1])
+    created = [notification for batch in batches for notification in batch.notifications]
+    assert sorted(notification.recipient_id for notification in created) == sorted(follower_ids)
+    assert all(notification.actor.id == actor_id for notification in created)
+    assert all(notification.read_at is None for notification in created)
+
+    retried = await _fan_out_all(repository, _fan_out_data(actor_id), limit=10)
+    fresh_key = await _fan_out_all(repository, _fan_out_data(actor_id, key="second-post"), limit=10)
+
+    assert [len(batch.notifications) for batch in retried] == [0]
+    assert [len(batch.notifications) for batch in fresh_key] == [5]
+    total = await seed_session.scalar(select(func.count()).select_from(Notification))
+    assert total == 10
+
+
+def _aggregate_data(recipient_id, actor_id, *, key="follow.started") -> NotificationCreateData:
+    return NotificationCreateData(
+        recipient_id=recipient_id,
+        actor_id=actor_id,
+        type=NotificationType.FOLLOW_STARTED,
+        title="New follower",
+        body="Someone followed you.",
+        aggregation_key=key,
+    )
+
+
+@pytest.mark.asyncio
+async def test_aggregated_events_fold_into_one_open_row_per_window(
+    repository: NotificationRepository,
+    seed_session: AsyncSession,
+):
+    recipient = await _user(seed_session, "aggregate-recipient")
+    actors = [await _user(seed_session, f"aggregate-actor-{index}") for index in range(5)]
+    recipient_id = recipient.id
+    actor_ids = [actor.id for actor in actors]
+
+    first = await repository.create_notification(_aggregate_data(recipient_id, actor_ids[0]))
+    results = [await repository.create_notification(_aggregate_data(recipient_id, actor_id)) for actor_id in actor_ids]
+    other_key = await repository.create_notification(_aggregate_data(recipient_id, actor_ids[0], key="other"))
+
+    assert (first.created, first.aggregated) == (True, False)
+    assert all((result.created, result.aggregated) == (False, True) for result in results)
+    assert {result.notification.id for result in results} == {first.notification.id}
+    aggregate = results[-1].notification
+    # The repeated first actor is not counted twice.
+    assert aggregate.actor_count == 5
+    assert aggregate.actor_id == actor_ids[4]
+    assert aggregate.sample_actor_ids == [actor_ids[4], actor_ids[3], actor_ids[2]]
+    assert {user.id for user in aggregate.sample_actors} == set(actor_ids[2:])
+    assert other_key.created is True
+    assert other_key.notification.id != aggregate.id
+
+    await repository.mark_notification_read(aggregate.id, recipient_id)
+    after_read = await repository.create_notification(_aggregate_data(recipient_id, actor_ids[1]))
+
+    assert after_read.created is True
+    assert after_read.notification.id != aggregate.id
+    assert after_read.notification.actor_count == 1
+    assert after_read.notification.sample_actor_ids == [actor_ids[1]]
+
+
+@pytest.mark.asyncio
+async def test_aggregated_actor_count_is_exact_after_actors_leave_the_sample(
+    repository: NotificationRepository,
+    seed_session: AsyncSession,
+):
+    recipient = await _user(seed_session, "exact-count-recipient")
+    actors = [await _user(seed_session, f"exact-count-actor-{index}") for index in range(4)]
+    recipient_id = recipient.id
+    actor_ids = [actor.id for actor in actors]
+
+    for actor_id in [*actor_ids, actor_ids[0]]:
+        result = await repository.create_notification(_aggregate_data(recipient_id, actor_id))
+
+    # The first actor left the three-entry sample before acting again, and is still counted once.
+    assert result.notification.actor_count == 4
+    assert result.notification.sample_actor_ids == [actor_ids[0], actor_ids[3], actor_ids[2]]
+    recorded = await seed_session.scalars(
+        select(NotificationActor.actor_id).where(NotificationActor.notification_id == result.notification.id)
+    )
+    assert set(recorded) == set(actor_ids)
+
+
+@pytest.mark.asyncio
+async def test_aggregated_events_start_a_new_row_in_the_next_window(
+    repository: NotificationRepository,
+    seed_session: AsyncSession,
+):
+    recipient = await _user(seed_session, "window-recipient")
+    actor = await _user(seed_session, "window-actor")
+    recipient_id = recipient.id
+    actor_id = actor.id
+
+    with patch("app.repository.notification_repository.NOTIFICATION_AGGREGATION_WINDOW_SECONDS", 1):
+        first = await repository.create_notification(_aggregate_data(recipient_id, actor_id))
+        await asyncio.sleep(1.1)
+        second = await repository.create_notification(_aggregate_data(recipient_id, actor_id))
+
+    assert first.created is True
+    assert second.created is True
+    assert second.notification.id != first.notification.id
+
+
+@pytest.mark.asyncio
+async def test_retention_archives_old_read_rows_and_listing_spans_both_tables(
+    repository: NotificationRepository,
+    seed_session: AsyncSession,
+):
+    recipient = await _user(seed_session, "retention-recipient")
+    recipient_id = recipient.id
+    now = datetime.now(UTC)
+    old = now - timedelta(days=200)
+
+    def _row(created_at, *, read: bool, deleted: bool = False) -> Notification:
+        return Notification(
+            recipient_id=recipient_id,
+            type=NotificationType.FOLLOW_STARTED.value,
+            title="Title",
+            body="Body",
+            read_at=created_at if read else None,
+            deleted=deleted,
+            created_at=created_at,
+        )
+
+    archivable = [_row(old + timedelta(minutes=minute), read=True) for minute in (0, 2, 4)]
+    old_unread = _row(old + timedelta(minutes=3), read=False)
+    recent_read = _row(now, read=True)
+    soft_deleted = _row(old, read=True, deleted=True)
+    await _add(seed_session, *archivable, old_unread, recent_read, soft_deleted)
+    expected_order = [recent_read.id, archivable[2].id, old_unread.id, archivable[1].id, archivable[0].id]
+
+    moved = [await repository.archive_read_notifications(older_than=timedelta(days=90), limit=2) for _ in range(3)]
+    purged = await repository.purge_deleted_notifications(limit=10)
+
+    assert moved == [2, 1, 0]
+    assert purged == 1
+    hot_ids = set((await seed_session.scalars(select(Notification.id))).all())
+    archived_ids = set((await seed_session.scalars(select(NotificationArchive.id))).all())
+    assert hot_ids == {old_unread.id, recent_read.id}
+    assert archived_ids == {row.id for row in archivable}
+
+    listed = []
+    cursor = None
+    while True:
+        page = await repository.list_notifications(recipient_id, unread_only=False, limit=2, cursor=cursor)
+        listed.extend(page.items)
+        if not page.has_more:
+            break
+        cursor = TimestampUUIDCursor(timestamp=page.items[-1].created_at, id=page.items[-1].id)
+    unread = await repository.list_notifications(recipient_id, unread_only=True, limit=10, cursor=None)
+    archived_read = await repository.mark_notification_read(archivable[0].id, recipient_id)
+
+    assert [notification.id for notification in listed] == expected_order
+    assert all(isinstance(notification, Notification) for notification in listed)
+    assert [notification.id for notification in unread.items] == [old_unread.id]
+    assert archived_read.updated is False
+    assert archived_read.notification is not None
+    assert archived_read.notification.read_at == archivable[0].read_at
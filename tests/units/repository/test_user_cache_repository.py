@@ -0,0 +1,369 @@
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.models.user_model import User
+from app.repository.user_cache_repository import USER_CACHE_TTL, UserCacheRepository
+
+
+def _sample_user(handle: str = "CineFan") -> User:
+    return User(
+        id=uuid4(),
+        email="cinefan@example.com",
+        handle=handle,
+        first_name="Cine",
+        last_name="Fan",
+        bio="Watches everything",
+        profile_visibility="public",
+        locale="en-US",
+        date_of_birth=date(1990, 5, 17),
+        password_hash="hashed-password",
+        reset_password_code="123456",
+        reset_password_expires=datetime(2024, 1, 3, tzinfo=UTC),
+        deleted=False,
+        deleted_at=None,
+        created_at=datetime(2024, 1, 2, tzinfo=UTC),
+        updated_at=datetime(2024, 1, 2, tzinfo=UTC),
+    )
+
+
+def _mock_cache() -> MagicMock:
+    cache = MagicMock()
+    cache.get = AsyncMock(return_value=None)
+    cache.set = AsyncMock(return_value=True)
+    cache.delete_many = AsyncMock(return_value=2)
+    cache.bloom_check = AsyncMock(return_value=True)
+    cache.bloom_add = AsyncMock(return_value=1)
+    return cache
+
+
+def _mock_user_repository() -> MagicMock:
+    repository = MagicMock()
+    repository.create_user = AsyncMock()
+    repository.find_user_by_email = AsyncMock()
+    repository.find_password_hash = AsyncMock()
+    repository.find_user_by_handle = AsyncMock()
+    repository.find_user_by_id = AsyncMock()
+    repository.delete_user = AsyncMock()
+    repository.delete_user_oblivion = AsyncMock()
+    repository.update_password = AsyncMock()
+    repository.rehash_password = AsyncMock()
+    repository.set_reset_password_code = AsyncMock()
+    repository.update_user_profile = AsyncMock()
+    repository.update_user_locale = AsyncMock()
+    return repository
+
+
+def _mock_session_service() -> MagicMock:
+    session_service = MagicMock()
+    session_service.revoke_all_sessions = AsyncMock()
+    return session_service
+
+
+def test_build_user_handle_key_lowercases_handle():
+    repository = UserCacheRepository(_mock_user_repository())
+
+    assert repository.build_user_handle_key("CineFan") == "cinelog:users:handle:cinefan"
+
+
+def test_serialize_deserialize_round_trip_omits_credentials():
+    user = _sample_user()
+    repository = UserCacheRepository(_mock_user_repository())
+
+    payload = repository._serialize_user(user)
+    restored = repository._deserialize_user(payload)
+
+    assert "password_hash" not in payload
+    assert "reset_password_code" not in payload
+    assert "reset_password_expires" not in payload
+    assert restored.id == user.id
+    assert restored.handle == user.handle
+    assert restored.locale == user.locale
+    assert restored.date_of_birth == user.date_of_birth
+    assert restored.profile_visibility == user.profile_visibility
+    assert restored.updated_at == user.updated_at
+    assert restored.password_hash is None
+    assert restored.reset_password_code is None
+
+
+@pytest.mark.asyncio
+async def test_find_user_by_id_cache_hit_skips_repository():
+    user = _sample_user()
+    cache = _mock_cache()
+    inner_repository = _mock_user_repository()
+    repository = UserCacheRepository(inner_repository)
+    cache.get.return_value = repository._serialize_user(user)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await repository.find_user_by_id(user.id)
+
+    assert result is not None
+    assert result.id == user.id
+    inner_repository.find_user_by_id.assert_not_awaited()
+    cache.get.assert_awaited_once_with(repository.build_user_id_key(user.id))
+
+
+@pytest.mark.asyncio
+async def test_find_user_by_handle_cache_miss_queries_repository_and_sets_cache():
+    user = _sample_user()
+    cache = _mock_cache()
+    inner_repository = _mock_user_repository()
+    inner_repository.find_user_by_handle.return_value = user
+    repository = UserCacheRepository(inner_repository)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await repository.find_user_by_handle("CINEFAN")
+
+    assert result == user
+    inner_repository.find_user_by_handle.assert_awaited_once_with("CINEFAN")
+    cache.set.assert_awaited_once_with(
+        "cinelog:users:handle:cinefan",
+        repository._serialize_user(user),
+        ttl=USER_CACHE_TTL,
+    )
+
+
+@pytest.mark.asyncio
+async def test_find_user_by_id_miss_for_unknown_user_is_not_cached():
+    cache = _mock_cache()
+    inner_repository = _mock_user_repository()
+    inner_repository.find_user_by_id.return_value = None
+    repository = UserCacheRepository(inner_repository)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await repository.find_user_by_id(uuid4())
+
+    assert result is None
+    cache.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cache_failures_fall_back_to_repository():
+    user = _sample_user()
+    cache = _mock_cache()
+    cache.get.side_effect = RuntimeError("redis down")
+    cache.set.side_effect = RuntimeError("redis down")
+    inner_repository = _mock_user_repository()
+    inner_repository.find_user_by_id.return_value = user
+    repository = UserCacheRepository(inner_repository)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await repository.find_user_by_id(user.id)
+
+    assert result == user
+    inner_repository.find_user_by_id.assert_awaited_once_with(user.id)
+
+
+@pytest.mark.asyncio
+async def test_find_user_by_email_bypasses_cache():
+    user = _sample_user()
+    cache = _mock_cache()
+    inner_repository = _mock_user_repository()
+    inner_repository.find_user_by_email.return_value = user
+    repository = UserCacheRepository(inner_repository)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await repository.find_user_by_email(user.email)
+
+    assert result == user
+    cache.get.assert_not_awaited()
+    cache.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_find_password_hash_bypasses_cache():
+    user = _sample_user()
+    cache = _mock_cache()
+    inner_repository = _mock_user_repository()
+    inner_repository.find_password_hash.return_value = user.password_hash
+    repository = UserCacheRepository(inner_repository)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await repository.find_password_hash(user.id)
+
+    assert result == "hashed-password"
+    inner_repository.find_password_hash.assert_awaited_once_with(user.id)
+    cache.get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_existence_filter_miss_skips_repository():
+    cache = _mock_cache()
+    cache.bloom_check.return_value = False
+    inner_repository = _mock_user_repository()
+    repository = UserCacheRepository(inner_repository)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        assert await repository.find_user_by_email("nobody@example.com") is None
+        assert await repository.find_user_by_handle("nobody") is None
+
+    inner_repository.find_user_by_email.assert_not_awaited()
+    inner_repository.find_user_by_handle.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_existence_filter_failure_falls_back_to_repository():
+    user = _sample_user()
+    cache = _mock_cache()
+    cache.bloom_check.side_effect = RuntimeError("redis down")
+    inner_repository = _mock_user_repository()
+    inner_repository.find_user_by_email.return_value = user
+    repository = UserCacheRepository(inner_repository)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await repository.find_user_by_email(user.email)
+
+    assert result == user
+
+
+@pytest.mark.asyncio
+async def test_create_user_adds_to_existence_filter_before_insert():
+    user = _sample_user()
+    cache = _mock_cache()
+    calls: list[str] = []
+    cache.bloom_add.side_effect = lambda keys, offsets: calls.append("filter") or 1
+    inner_repository = _mock_user_repository()
+    inner_repository.create_user.side_effect = lambda request: calls.append("insert") or user
+    repository = UserCacheRepository(inner_repository)
+    request = MagicMock(email=user.email, handle=user.handle)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await repository.create_user(request)
+
+    assert result == user
+    assert calls == ["filter", "insert"]
+    keys, offsets = cache.bloom_add.await_args.args
+    assert keys == [repository.existence_filter.key, repository.existence_filter.rebuild_key]
+    assert set(repository.existence_filter.parameters.offsets(f"handle:{user.handle.lower()}")) <= set(offsets)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("method_name", "args"),
+    [
+        ("update_user_profile", ({"bio": "New bio"},)),
+        ("update_user_locale", ("it-IT",)),
+    ],
+)
+async def test_user_updates_invalidate_id_and_handle_keys(method_name, args):
+    user = _sample_user()
+    cache = _mock_cache()
+    inner_repository = _mock_user_repository()
+    getattr(inner_repository, method_name).return_value = user
+    repository = UserCacheRepository(inner_repository)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await getattr(repository, method_name)(user.id, *args)
+
+    assert result == user
+    cache.delete_many.assert_awaited_once_with(
+        [repository.build_user_id_key(user.id), repository.build_user_handle_key(user.handle)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_password_invalidates_id_and_handle_keys():
+    user = _sample_user()
+    cache = _mock_cache()
+    inner_repository = _mock_user_repository()
+    inner_repository.update_password.return_value = user
+    session_service = _mock_session_service()
+    repository = UserCacheRepository(inner_repository, session_service=session_service)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await repository.update_password(user, "new-hash")
+
+    assert result == user
+    session_service.revoke_all_sessions.assert_awaited_once_with(user.id)
+    inner_repository.update_password.assert_awaited_once_with(user, "new-hash")
+    cache.delete_many.assert_awaited_once_with(
+        [repository.build_user_id_key(user.id), repository.build_user_handle_key(user.handle)]
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("rehashed", "invalidations"), [(True, 1), (False, 0)])
+async def test_rehash_password_invalidates_only_when_hash_was_swapped(rehashed, invalidations):
+    user = _sample_user()
+    cache = _mock_cache()
+    inner_repository = _mock_user_repository()
+    inner_repository.rehash_password.return_value = rehashed
+    repository = UserCacheRepository(inner_repository)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await repository.rehash_password(user, "old-hash", "new-hash")
+
+    assert result is rehashed
+    inner_repository.rehash_password.assert_awaited_once_with(user, "old-hash", "new-hash")
+    assert cache.delete_many.await_count == invalidations
+
+
+@pytest.mark.asyncio
+async def test_update_user_profile_not_found_skips_invalidation():
+    cache = _mock_cache()
+    inner_repository = _mock_user_repository()
+    inner_repository.update_user_profile.return_value = None
+    repository = UserCacheRepository(inner_repository)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await repository.update_user_profile(uuid4(), {"bio": "New bio"})
+
+    assert result is None
+    cache.delete_many.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method_name", ["delete_user", "delete_user_oblivion"])
+async def test_deletes_invalidate_original_handle(method_name):
+    user = _sample_user()
+    cache = _mock_cache()
+    inner_repository = _mock_user_repository()
+    inner_repository.find_user_by_id.return_value = user
+    getattr(inner_repository, method_name).return_value = True
+    session_service = _mock_session_service()
+    repository = UserCacheRepository(inner_repository, session_service=session_service)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await getattr(repository, method_name)(user.id)
+
+    assert result is True
+    session_service.revoke_all_sessions.assert_awaited_once_with(user.id)
+    cache.get.assert_not_awaited()
+    cache.delete_many.assert_awaited_once_with(
+        [repository.build_user_id_key(user.id), repository.build_user_handle_key("CineFan")]
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_user_not_found_skips_invalidation():
+    cache = _mock_cache()
+    inner_repository = _mock_user_repository()
+    inner_repository.find_user_by_id.return_value = None
+    inner_repository.delete_user.return_value = False
+    session_service = _mock_session_service()
+    repository = UserCacheRepository(inner_repository, session_service=session_service)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await repository.delete_user(uuid4())
+
+    assert result is False
+    cache.delete_many.assert_not_awaited()
+    session_service.revoke_all_sessions.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_invalidation_failure_does_not_raise():
+    user = _sample_user()
+    cache = _mock_cache()
+    cache.delete_many.side_effect = RuntimeError("redis down")
+    inner_repository = _mock_user_repository()
+    inner_repository.update_user_locale.return_value = user
+    repository = UserCacheRepository(inner_repository)
+
+    with patch("app.repository.user_cache_repository.CacheService.get_instance", return_value=cache):
+        result = await repository.update_user_locale(user.id, "it-IT")
+
+    assert result == user
+    cache.delete_many.assert_awaited_once()
@@ -189,6 +189,53 @@ async def test_find_user_by_id_excludes_deleted_and_unknown(repository: UserRepo
     assert (await repository.find_user_by_id(uuid4())) is None
 
 
+@pytest.mark.asyncio
+async def test_find_users_by_ids_or_handles_matches_either_and_skips_deleted(
+    repository: UserRepository,
+    seed_session: AsyncSession,
+):
+    by_id = User(email="by-id@example.com", handle="by_id", first_name="By", last_name="Id")
+    by_handle = User(email="by-handle@example.com", handle="By_Handle", first_name="By", last_name="Handle")
+    deleted = User(
+        email="gone@example.com",
+        handle="gone",
+        first_name="Gone",
+        last_name="User",
+        deleted=True,
+        deleted_at=datetime.now(UTC),
+    )
+    await _add(seed_session, by_id, by_handle, deleted)
+
+    users = await repository.find_users_by_ids_or_handles([by_id.id, deleted.id, uuid4()], ["by_handle", "gone"])
+
+    assert {user.id for user in users} == {by_id.id, by_handle.id}
+    assert await repository.find_users_by_ids_or_handles([], []) == []
+
+
+@pytest.mark.asyncio
+async def test_stream_active_identifiers_batches_active_users(repository: UserRepository, seed_session: AsyncSession):
+    deleted = User(
+        email="gone@example.com",
+        handle="gone",
+        first_name="Gone",
+        last_name="User",
+        deleted=True,
+        deleted_at=datetime.now(UTC),
+    )
+    await _add(seed_session, deleted)
+    for index in range(3):
+        await repository.create_user(_user_request(email=f"user{index}@example.com", handle=f"User{index}"))
+
+    batches = [batch async for batch in repository.stream_active_identifiers(batch_size=2)]
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert {pair for batch in batches for pair in batch} == {
+        ("user0@example.com", "User0"),
+        ("user1@example.com", "User1"),
+        ("user2@example.com", "User2"),
+    }
+
+
 @pytest.mark.asyncio
 async def test_delete_user_soft_deletes_row(repository: UserRepository, seed_session: AsyncSession):
     user = await repository.create_user(_user_request(email="softdelete@example.com", handle="softdelete"))
@@ -238,6 +285,17 @@ async def test_delete_user_oblivion_overwrites_sensitive_fields(repository: User
     assert persisted.deleted is True
 
 
+@pytest.mark.asyncio
+async def test_find_password_hash_reads_active_rows_only(repository: UserRepository):
+    user = await repository.create_user(_user_request(email="hash@example.com", handle="hashhandle"))
+
+    assert await repository.find_password_hash(user.id) == "$2b$12$hashed"
+
+    await repository.delete_user(user.id)
+
+    assert await repository.find_password_hash(user.id) is None
+
+
 @pytest.mark.asyncio
 async def test_update_password_changes_hash(repository: UserRepository, seed_session: AsyncSession):
     user = await repository.create_user(_user_request(email="password@example.com", handle="passwordhandle"))
@@ -250,6 +308,39 @@ async def test_update_password_changes_hash(repository: UserRepository, seed_ses
     assert persisted.password_hash == "$2b$12$new_hashed"
 
 
+@pytest.mark.asyncio
+async def test_rehash_password_swaps_unchanged_hash_without_touching_updated_at(
+    repository: UserRepository, seed_session: AsyncSession
+):
+    user = await repository.create_user(_user_request(email="rehash@example.com", handle="rehashhandle"))
+    assert user.password_hash is not None
+
+    rehashed = await repository.rehash_password(user, user.password_hash, "$2b$13$upgraded")
+
+    assert rehashed is True
+    persisted = await seed_session.get(User, user.id)
+    assert persisted is not None
+    assert persisted.password_hash == "$2b$13$upgraded"
+    assert persisted.updated_at == user.updated_at
+
+
+@pytest.mark.asyncio
+async def test_rehash_password_skips_when_password_changed_since_login(
+    repository: UserRepository, seed_session: AsyncSession
+):
+    user = await repository.create_user(_user_request(email="changed@example.com", handle="changedhandle"))
+    stale_hash = user.password_hash
+    assert stale_hash is not None
+    await repository.update_password(user, "$2b$12$changed")
+
+    rehashed = await repository.rehash_password(user, stale_hash, "$2b$13$upgraded")
+
+    assert rehashed is False
+    persisted = await seed_session.get(User, user.id)
+    assert persisted is not None
+    assert persisted.password_hash == "$2b$12$changed"
+
+
 @pytest.mark.asyncio
 async def test_set_reset_password_code_updates_fields(repository: UserRepository):
     user = await repository.create_user(_user_request(email="reset@example.com", handle="resethandle"))
@@ -11,6 +11,7 @@ from app.schemas.notification_schemas import (
     BasicUserSummary,
     MarkAllNotificationsReadResponse,
     NotificationBaseResponse,
+    NotificationCreateData,
     NotificationListRequest,
     NotificationListResponse,
 )
@@ -24,6 +25,8 @@ def _notification_response() -> NotificationBaseResponse:
         title="New follow request",
         body="A user requested to follow you.",
         actor=BasicUserSummary(handle="viewer", first_name="View", last_name="Er"),
+        actor_count=1,
+        sample_actors=[],
         available_actions=[
             NotificationAction.FOLLOW_REQUEST_ACCEPT,
             NotificationAction.FOLLOW_REQUEST_REJECT,
@@ -39,6 +42,8 @@ def test_notification_response_uses_camel_case_and_serializes_enum_values():
     assert payload["type"] == "follow.requested"
     assert payload["availableActions"] == ["follow_request.accept", "follow_request.reject"]
     assert payload["readAt"] is None
+    assert payload["actorCount"] == 1
+    assert payload["sampleActors"] == []
     assert payload["createdAt"] == "2026-07-18T08:30:00Z"
     assert payload["actor"] == {
         "handle": "viewer",
@@ -101,3 +106,22 @@ def test_notification_list_request_treats_cursor_as_a_bounded_opaque_string():
 
     with pytest.raises(ValidationError):
         NotificationListRequest(cursor="a" * (MAX_CURSOR_LENGTH + 1))
+
+
+def test_notification_create_data_aggregation_needs_an_actor_and_no_deduplication_key():
+    recipient_id = uuid4()
+    base = {
+        "recipient_id": recipient_id,
+        "type": NotificationType.FOLLOW_STARTED,
+        "title": "New follower",
+        "body": "Someone followed you.",
+        "aggregation_key": "follow.started",
+    }
+
+    assert NotificationCreateData(**base, actor_id=uuid4()).aggregation_key == "follow.started"
+    with pytest.raises(ValidationError, match="requires actor_id"):
+        NotificationCreateData(**base)
+    with pytest.raises(ValidationError, match="cannot be combined"):
+        NotificationCreateData(**base, actor_id=uuid4(), deduplication_key="event")
+    with pytest.raises(ValidationError):
+        NotificationCreateData(**{**base, "aggregation_key": ""}, actor_id=uuid4())
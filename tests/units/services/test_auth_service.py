@@ -1,12 +1,15 @@
+import asyncio
 from datetime import date
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
 
 import pytest
 
 from app.schemas.auth_schemas import RegisterRequest
 from app.services.auth_rate_limit_service import AuthRateLimitService
 from app.services.auth_service import AuthService
+from app.services.password_service import PasswordService
 from app.utils.error_codes_utils import ErrorCodes
 from app.utils.exceptions_utils import AppException
 
@@ -18,7 +21,7 @@ class TestAuthService:
 
     @pytest.fixture
     def mock_email_service(self):
-        return MagicMock()
+        return AsyncMock()
 
     @pytest.fixture
     def mock_registration_verification_service(self):
@@ -47,8 +50,8 @@ class TestAuthService:
 
         mock_user_repo.find_user_by_email.assert_awaited_once_with("user@example.com")
         mock_registration_verification_service.issue_code.assert_awaited_once_with("user@example.com")
-        mock_email_service.send_registration_verification_email.assert_called_once_with("user@example.com", "ABC123")
-        mock_email_service.send_registration_existing_account_email.assert_not_called()
+        mock_email_service.send_registration_verification_email.assert_awaited_once_with("user@example.com", "ABC123")
+        mock_email_service.send_registration_existing_account_email.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_send_registration_verification_code_for_existing_email(
@@ -64,8 +67,8 @@ class TestAuthService:
 
         mock_user_repo.find_user_by_email.assert_awaited_once_with("user@example.com")
         mock_registration_verification_service.issue_code.assert_not_awaited()
-        mock_email_service.send_registration_existing_account_email.assert_called_once_with("user@example.com")
-        mock_email_service.send_registration_verification_email.assert_not_called()
+        mock_email_service.send_registration_existing_account_email.assert_awaited_once_with("user@example.com")
+        mock_email_service.send_registration_verification_email.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_forgot_password_success(self, auth_service, mock_user_repo, mock_email_service):
@@ -76,7 +79,7 @@ class TestAuthService:
         await auth_service.forgot_password(email)
 
         mock_user_repo.set_reset_password_code.assert_awaited_once()
-        mock_email_service.send_reset_password_email.assert_called_once()
+        mock_email_service.send_reset_password_email.assert_awaited_once()
 
         repo_call_args = mock_user_repo.set_reset_password_code.call_args[0]
         email_call_args = mock_email_service.send_reset_password_email.call_args[0]
@@ -172,7 +175,7 @@ class TestAuthService:
         with pytest.MonkeyPatch.context() as m:
             from app.services.password_service import PasswordService
 
-            m.setattr(PasswordService, "verify_password", lambda p, h: p == "password123")
+            m.setattr(PasswordService, "verify_password", AsyncMock(side_effect=lambda p, h: p == "password123"))
 
             user = await auth_service.login(email, password)
             assert user == mock_user
@@ -188,13 +191,64 @@ class TestAuthService:
         with pytest.MonkeyPatch.context() as m:
             from app.services.password_service import PasswordService
 
-            m.setattr(PasswordService, "verify_password", lambda p, h: False)
+            m.setattr(PasswordService, "verify_password", AsyncMock(return_value=False))
 
             with pytest.raises(AppException) as exc:
                 await auth_service.login(email, "wrongpassword")
 
             assert exc.value.error.error_code == 401
 
+    @pytest.mark.asyncio
+    async def test_login_rehashes_outdated_cost_in_background(self, auth_service, mock_user_repo):
+        old_hash = "$2b$10$" + "a" * 53
+        mock_user = SimpleNamespace(id=uuid4(), email="john@example.com", password_hash=old_hash)
+        mock_user_repo.find_user_by_email.return_value = mock_user
+        mock_user_repo.rehash_password.return_value = True
+
+        with (
+            patch.object(PasswordService, "verify_password", AsyncMock(return_value=True)),
+            patch.object(PasswordService, "get_password_hash", AsyncMock(return_value="$2b$12$upgraded")),
+            patch.object(PasswordService, "_rounds", 12),
+        ):
+            user = await auth_service.login("john@example.com", "password123")
+            await asyncio.gather(*auth_service._background_tasks)
+
+        assert user == mock_user
+        mock_user_repo.rehash_password.assert_awaited_once_with(mock_user, old_hash, "$2b$12$upgraded")
+
+    @pytest.mark.asyncio
+    async def test_login_with_current_cost_does_not_rehash(self, auth_service, mock_user_repo):
+        current_hash = "$2b$12$" + "a" * 53
+        mock_user = SimpleNamespace(id=uuid4(), email="john@example.com", password_hash=current_hash)
+        mock_user_repo.find_user_by_email.return_value = mock_user
+
+        with (
+            patch.object(PasswordService, "verify_password", AsyncMock(return_value=True)),
+            patch.object(PasswordService, "_rounds", 12),
+        ):
+            await auth_service.login("john@example.com", "password123")
+
+        assert not auth_service._background_tasks
+        mock_user_repo.rehash_password.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_login_rehash_failure_is_logged_not_raised(self, auth_service, mock_user_repo):
+        mock_user = SimpleNamespace(id=uuid4(), email="john@example.com", password_hash="$2b$10$" + "a" * 53)
+        mock_user_repo.find_user_by_email.return_value = mock_user
+        mock_user_repo.rehash_password.side_effect = RuntimeError("database unavailable")
+
+        with (
+            patch.object(PasswordService, "verify_password", AsyncMock(return_value=True)),
+            patch.object(PasswordService, "get_password_hash", AsyncMock(return_value="$2b$12$upgraded")),
+            patch.object(PasswordService, "_rounds", 12),
+            patch("app.services.auth_service.logger") as mock_logger,
+        ):
+            user = await auth_service.login("john@example.com", "password123")
+            await asyncio.gather(*auth_service._background_tasks)
+
+        assert user == mock_user
+        mock_logger.exception.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_login_migration_required(self, auth_service, mock_user_repo):
         mock_user = SimpleNamespace(email="old@example.com", password_hash=None)
@@ -262,7 +316,7 @@ class TestAuthService:
         with pytest.MonkeyPatch.context() as m:
             from app.services.password_service import PasswordService
 
-            m.setattr(PasswordService, "verify_password", lambda p, h: p == "password123")
+            m.setattr(PasswordService, "verify_password", AsyncMock(side_effect=lambda p, h: p == "password123"))
 
             user = await auth_service.login(email_input, password)
             assert user == mock_user
@@ -298,14 +352,14 @@ class TestAuthRateLimitService:
 
         assert first_key != second_key
 
-    def test_register_verification_account_limit_blocks_after_five_attempts(self, rate_limit_service):
+    async def test_register_verification_account_limit_blocks_after_five_attempts(self, rate_limit_service):
         email = "User@Example.com "
 
         for _ in range(5):
-            rate_limit_service.enforce_register_verification_limit(email)
-            rate_limit_service.record_register_verification_attempt(email)
+            await rate_limit_service.enforce_register_verification_limit(email)
+            await rate_limit_service.record_register_verification_attempt(email)
 
         with pytest.raises(AppException) as exc_info:
-            rate_limit_service.enforce_register_verification_limit("user@example.com")
+            await rate_limit_service.enforce_register_verification_limit("user@example.com")
 
         assert exc_info.value.error == ErrorCodes.RATE_LIMIT_EXCEEDED
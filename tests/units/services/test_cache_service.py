@@ -1,10 +1,29 @@
+import hashlib
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import pytest_asyncio
-
-from app.services.cache_service import CacheService
+from redis.exceptions import NoScriptError, ResponseError
+
+from app.services.cache_service import (
+    BLOOM_ADD_SCRIPT,
+    BLOOM_CHECK_SCRIPT,
+    CHECK_CODE_ATTEMPT_SCRIPT,
+    DELETE_INDEXED_SCRIPT,
+    GCRA_ACQUIRE_SCRIPT,
+    GCRA_SYNC_SCRIPT,
+    INCRBY_IF_EXISTS_SCRIPT,
+    LUA_SCRIPTS,
+    PROMOTE_DUE_TO_STREAM_SCRIPT,
+    REVOKE_SESSION_SCRIPT,
+    SADD_IF_EXISTS_SCRIPT,
+    SET_INDEXED_SCRIPT,
+    SMISMEMBER_IF_EXISTS_SCRIPT,
+    ZADD_CAPPED_IF_EXISTS_SCRIPT,
+    ZREVRANGEBYSCORE_IF_EXISTS_SCRIPT,
+    CacheService,
+)
 
 
 class TestCacheServiceEnabled:
@@ -19,6 +38,16 @@ class TestCacheServiceEnabled:
             svc._mock_client = mock_client  # type: ignore[attr-defined]
             yield svc
 
+    @pytest.fixture
+    def fake_pipeline(self, service):
+        """Pipeline returned by the mocked client; tests set ``execute.return_value`` and inspect ``method_calls``."""
+        pipeline = MagicMock()
+        pipeline.__aenter__ = AsyncMock(return_value=pipeline)
+        pipeline.__aexit__ = AsyncMock(return_value=None)
+        pipeline.execute = AsyncMock()
+        service._mock_client.pipeline = MagicMock(return_value=pipeline)
+        return pipeline
+
     @pytest.mark.asyncio
     async def test_get_returns_data(self, service):
         data = {"title": "Fight Club"}
@@ -47,6 +76,25 @@ class TestCacheServiceEnabled:
         await service.set("key", {"a": 1})
         service._mock_client.set.assert_awaited_once_with("key", json.dumps({"a": 1}), ex=300)
 
+    @pytest.mark.asyncio
+    async def test_get_str_many_reads_raw_values_in_one_round_trip(self, service):
+        service._mock_client.mget = AsyncMock(return_value=['{"a": 1}', None, "token"])
+        result = await service.get_str_many(["entry", "missing", "version"])
+        assert result == ['{"a": 1}', None, "token"]
+        service._mock_client.mget.assert_awaited_once_with(["entry", "missing", "version"])
+
+    @pytest.mark.asyncio
+    async def test_get_str_many_empty_list(self, service):
+        service._mock_client.mget = AsyncMock()
+        assert await service.get_str_many([]) == []
+        service._mock_client.mget.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_set_str_stores_raw_value(self, service):
+        service._mock_client.set = AsyncMock()
+        await service.set_str("version", "token", 60)
+        service._mock_client.set.assert_awaited_once_with("version", "token", ex=60)
+
     @pytest.mark.asyncio
     async def test_delete_existing_key(self, service):
         service._mock_client.delete = AsyncMock(return_value=1)
@@ -109,6 +157,480 @@ class TestCacheServiceEnabled:
         assert result == 1
         service._mock_client.hincrby.assert_awaited_once_with("auth:register-verification:key", "attempts", 1)
 
+    @pytest.mark.asyncio
+    async def test_get_int_parses_counter(self, service):
+        service._mock_client.get = AsyncMock(return_value="7")
+        assert await service.get_int("cinelog:notifications:unread:u1") == 7
+
+    @pytest.mark.asyncio
+    async def test_get_int_returns_none_on_miss(self, service):
+        service._mock_client.get = AsyncMock(return_value=None)
+        assert await service.get_int("cinelog:notifications:unread:u1") is None
+
+    @pytest.mark.asyncio
+    async def test_set_int_if_absent_uses_nx_and_ttl(self, service):
+        service._mock_client.set = AsyncMock(return_value=None)
+        assert await service.set_int_if_absent("counter", 3, 60) is False
+        service._mock_client.set.assert_awaited_once_with("counter", 3, ex=60, nx=True)
+
+    @pytest.mark.asyncio
+    async def test_incrby_if_exists_runs_script(self, service):
+        service._mock_client.evalsha = AsyncMock(return_value=4)
+        assert await service.incrby_if_exists("counter", -1) == 4
+        service._mock_client.evalsha.assert_awaited_once_with(INCRBY_IF_EXISTS_SCRIPT.sha, 1, "counter", -1)
+
+    @pytest.mark.asyncio
+    async def test_incrby_if_exists_returns_none_for_missing_key(self, service):
+        service._mock_client.evalsha = AsyncMock(return_value=None)
+        assert await service.incrby_if_exists("counter", 1) is None
+
+    @pytest.mark.asyncio
+    async def test_incrby_if_exists_many_pipelines_the_script(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = [3, None]
+
+        assert await service.incrby_if_exists_many(["a", "b"], 1) == [3, None]
+        service._mock_client.pipeline.assert_called_once_with(transaction=False)
+        assert fake_pipeline.method_calls[:2] == [
+            ("evalsha", (INCRBY_IF_EXISTS_SCRIPT.sha, 1, "a", 1), {}),
+            ("evalsha", (INCRBY_IF_EXISTS_SCRIPT.sha, 1, "b", 1), {}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_incrby_if_exists_many_without_keys_is_noop(self, service):
+        service._mock_client.pipeline = MagicMock()
+        assert await service.incrby_if_exists_many([], 1) == []
+        service._mock_client.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rpush_and_blpop(self, service):
+        service._mock_client.rpush = AsyncMock(return_value=1)
+        service._mock_client.blpop = AsyncMock(side_effect=[["queue", "job"], None])
+
+        assert await service.rpush("queue", "job") == 1
+        assert await service.blpop("queue", 5) == "job"
+        assert await service.blpop("queue", 5) is None
+        service._mock_client.blpop.assert_awaited_with(["queue"], timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_publish_many_pipelines_messages(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = [1, 1]
+
+        await service.publish_many("channel", ["a", "b"])
+
+        service._mock_client.pipeline.assert_called_once_with(transaction=False)
+        assert fake_pipeline.publish.call_args_list == [(("channel", "a"),), (("channel", "b"),)]
+
+    @pytest.mark.asyncio
+    async def test_publish(self, service):
+        service._mock_client.publish = AsyncMock(return_value=2)
+        assert await service.publish("cinelog:notifications:events", "{}") == 2
+        service._mock_client.publish.assert_awaited_once_with("cinelog:notifications:events", "{}")
+
+    @pytest.mark.asyncio
+    async def test_pubsub_ignores_subscribe_confirmations(self, service):
+        service._mock_client.pubsub = MagicMock(return_value="pubsub")
+        assert service.pubsub() == "pubsub"
+        service._mock_client.pubsub.assert_called_once_with(ignore_subscribe_messages=True)
+
+    @pytest.mark.asyncio
+    async def test_exists(self, service):
+        service._mock_client.exists = AsyncMock(return_value=1)
+        assert await service.exists("cinelog:trending:view:24h") is True
+        service._mock_client.exists.assert_awaited_once_with("cinelog:trending:view:24h")
+
+    @pytest.mark.asyncio
+    async def test_zincrby_with_expireat_pipelines_every_bucket(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = []
+
+        await service.zincrby_with_expireat("550", -1, {"hour": 100, "day": 200})
+
+        service._mock_client.pipeline.assert_called_once_with(transaction=True)
+        assert fake_pipeline.method_calls == [
+            ("zincrby", ("hour", -1, "550"), {}),
+            ("zremrangebyscore", ("hour", "-inf", 0), {}),
+            ("expireat", ("hour", 100), {}),
+            ("zincrby", ("day", -1, "550"), {}),
+            ("zremrangebyscore", ("day", "-inf", 0), {}),
+            ("expireat", ("day", 200), {}),
+            ("execute", (), {}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_zincrby_with_expireat_without_keys_is_noop(self, service):
+        service._mock_client.pipeline = MagicMock()
+        await service.zincrby_with_expireat("550", 1, {})
+        service._mock_client.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_zunionstore_with_ttl(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = [2, True]
+
+        result = await service.zunionstore_with_ttl("view", ["a", "b"], 60)
+
+        assert result == 2
+        fake_pipeline.zunionstore.assert_called_once_with("view", ["a", "b"])
+        fake_pipeline.expire.assert_called_once_with("view", 60)
+
+    @pytest.mark.asyncio
+    async def test_zrevrange_with_scores(self, service):
+        service._mock_client.zrevrange = AsyncMock(return_value=[("550", 3.0), ("680", 1.0)])
+        result = await service.zrevrange_with_scores("view", 0, 9)
+        assert result == [("550", 3.0), ("680", 1.0)]
+        service._mock_client.zrevrange.assert_awaited_once_with("view", 0, 9, withscores=True)
+
+    @pytest.mark.asyncio
+    async def test_zadd_capped_if_exists_many_pipelines_one_script_per_key(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = [1, 0]
+
+        await service.zadd_capped_if_exists_many(["feed:a", "feed:b"], "log-1", 42.0, 500)
+
+        service._mock_client.pipeline.assert_called_once_with(transaction=False)
+        assert fake_pipeline.method_calls[:2] == [
+            ("evalsha", (ZADD_CAPPED_IF_EXISTS_SCRIPT.sha, 1, "feed:a", "log-1", 42.0, 500), {}),
+            ("evalsha", (ZADD_CAPPED_IF_EXISTS_SCRIPT.sha, 1, "feed:b", "log-1", 42.0, 500), {}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_zadd_capped_if_exists_many_without_keys_is_noop(self, service):
+        service._mock_client.pipeline = MagicMock()
+        await service.zadd_capped_if_exists_many([], "log-1", 42.0, 500)
+        service._mock_client.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_replace_sorted_set_swaps_contents_in_transaction(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = [1, 2, True]
+
+        await service.replace_sorted_set("feed:a", {"built": 0.0, "log-1": 42.0}, 60)
+
+        service._mock_client.pipeline.assert_called_once_with(transaction=True)
+        assert fake_pipeline.method_calls[:3] == [
+            ("delete", ("feed:a",), {}),
+            ("zadd", ("feed:a", {"built": 0.0, "log-1": 42.0}), {}),
+            ("expire", ("feed:a", 60), {}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_zrevrangebyscore_if_exists_pairs_members_with_scores(self, service):
+        service._mock_client.evalsha = AsyncMock(return_value=["log-2", "43", "log-1", "42"])
+
+        result = await service.zrevrangebyscore_if_exists("feed:a", 43.0, 0.0, 10)
+
+        assert result == [("log-2", 43.0), ("log-1", 42.0)]
+        service._mock_client.evalsha.assert_awaited_once_with(
+            ZREVRANGEBYSCORE_IF_EXISTS_SCRIPT.sha, 1, "feed:a", "43.0", "0.0", 10
+        )
+
+    @pytest.mark.asyncio
+    async def test_zrevrangebyscore_if_exists_without_upper_bound(self, service):
+        service._mock_client.evalsha = AsyncMock(return_value=[])
+
+        result = await service.zrevrangebyscore_if_exists("feed:a", None, 0.0, 10)
+
+        assert result == []
+        service._mock_client.evalsha.assert_awaited_once_with(
+            ZREVRANGEBYSCORE_IF_EXISTS_SCRIPT.sha, 1, "feed:a", "+inf", "0.0", 10
+        )
+
+    @pytest.mark.asyncio
+    async def test_zrevrangebyscore_if_exists_returns_none_for_missing_key(self, service):
+        service._mock_client.evalsha = AsyncMock(return_value=None)
+        assert await service.zrevrangebyscore_if_exists("feed:a", None, 0.0, 10) is None
+
+    @pytest.mark.asyncio
+    async def test_sadd_if_exists_reports_missing_set(self, service):
+        service._mock_client.evalsha = AsyncMock(side_effect=[1, None])
+
+        assert await service.sadd_if_exists("following:a", "user-1") is True
+        assert await service.sadd_if_exists("following:b", "user-1") is False
+        service._mock_client.evalsha.assert_awaited_with(SADD_IF_EXISTS_SCRIPT.sha, 1, "following:b", "user-1")
+
+    @pytest.mark.asyncio
+    async def test_srem(self, service):
+        service._mock_client.srem = AsyncMock(return_value=1)
+        assert await service.srem("following:a", "user-1") == 1
+        service._mock_client.srem.assert_awaited_once_with("following:a", "user-1")
+
+    @pytest.mark.asyncio
+    async def test_replace_set_swaps_members_in_transaction(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = [1, 2, True]
+
+        await service.replace_set("following:a", ["built", "user-1"], 60)
+
+        service._mock_client.pipeline.assert_called_once_with(transaction=True)
+        assert fake_pipeline.method_calls[:3] == [
+            ("delete", ("following:a",), {}),
+            ("sadd", ("following:a", "built", "user-1"), {}),
+            ("expire", ("following:a", 60), {}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_smismember_if_exists(self, service):
+        service._mock_client.evalsha = AsyncMock(side_effect=[[1, 0], None])
+
+        assert await service.smismember_if_exists("following:a", ["user-1", "user-2"]) == [True, False]
+        assert await service.smismember_if_exists("following:b", ["user-1"]) is None
+        service._mock_client.evalsha.assert_awaited_with(SMISMEMBER_IF_EXISTS_SCRIPT.sha, 1, "following:b", "user-1")
+
+    @pytest.mark.asyncio
+    async def test_gcra_acquire_checks_all_buckets_in_one_script(self, service):
+        service._mock_client.evalsha = AsyncMock(return_value=[[1, 4, 12000, 0], [0, 0, 60000, 2000]])
+
+        result = await service.gcra_acquire(["rl:a", "rl:b"], [(12000, 5), (6000, 10)], consume=True)
+
+        assert result == [(1, 4, 12000, 0), (0, 0, 60000, 2000)]
+        service._mock_client.evalsha.assert_awaited_once_with(
+            GCRA_ACQUIRE_SCRIPT.sha, 2, "rl:a", "rl:b", 1, 12000, 5, 6000, 10
+        )
+
+    @pytest.mark.asyncio
+    async def test_gcra_acquire_peek_passes_zero_cost(self, service):
+        service._mock_client.evalsha = AsyncMock(return_value=[[1, 9, 6000, 0]])
+
+        await service.gcra_acquire(["rl:a"], [(6000, 10)], consume=False)
+
+        service._mock_client.evalsha.assert_awaited_once_with(GCRA_ACQUIRE_SCRIPT.sha, 1, "rl:a", 0, 6000, 10)
+
+    @pytest.mark.asyncio
+    async def test_gcra_sync_sends_counts_and_intervals(self, service):
+        service._mock_client.evalsha = AsyncMock(return_value=[24000, 0])
+
+        assert await service.gcra_sync(["rl:a", "rl:b"], [(2, 12000), (0, 6000)]) == [24000, 0]
+        service._mock_client.evalsha.assert_awaited_once_with(
+            GCRA_SYNC_SCRIPT.sha, 2, "rl:a", "rl:b", 2, 12000, 0, 6000
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_and_expire_decodes_and_resets_ttl(self, service):
+        service._mock_client.getex = AsyncMock(side_effect=['{"active": true}', None])
+
+        assert await service.get_and_expire("session", 60) == {"active": True}
+        assert await service.get_and_expire("missing", 60) is None
+        service._mock_client.getex.assert_awaited_with("missing", ex=60)
+
+    @pytest.mark.asyncio
+    async def test_xadd_trims_stream_approximately(self, service):
+        service._mock_client.xadd = AsyncMock(return_value="1700000000000-0")
+
+        assert await service.xadd("outbox", {"payload": "{}"}, 1000) == "1700000000000-0"
+        service._mock_client.xadd.assert_awaited_once_with("outbox", {"payload": "{}"}, maxlen=1000, approximate=True)
+
+    @pytest.mark.asyncio
+    async def test_xadd_with_max_age_trims_older_entries_in_the_same_round_trip(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = ["1700000000000-0", 3]
+
+        with patch("app.services.cache_service.time.time", return_value=1700000000.0):
+            entry_id = await service.xadd("outbox", {"payload": "{}"}, 1000, max_age_seconds=3600)
+
+        assert entry_id == "1700000000000-0"
+        service._mock_client.pipeline.assert_called_once_with(transaction=False)
+        assert fake_pipeline.method_calls[:2] == [
+            ("xadd", ("outbox", {"payload": "{}"}), {"maxlen": 1000, "approximate": True}),
+            ("xtrim", ("outbox",), {"minid": "1699996400000", "approximate": False}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_ensure_stream_group_ignores_existing_group(self, service):
+        service._mock_client.xgroup_create = AsyncMock(
+            side_effect=[ResponseError("BUSYGROUP Consumer Group name already exists"), ResponseError("WRONGTYPE")]
+        )
+
+        await service.ensure_stream_group("outbox", "senders")
+        with pytest.raises(ResponseError):
+            await service.ensure_stream_group("outbox", "senders")
+        service._mock_client.xgroup_create.assert_awaited_with("outbox", "senders", id="0", mkstream=True)
+
+    @pytest.mark.asyncio
+    async def test_xreadgroup_returns_new_entries_of_the_stream(self, service):
+        service._mock_client.xreadgroup = AsyncMock(side_effect=[[["outbox", [("1-0", {"payload": "a"})]]], []])
+
+        assert await service.xreadgroup("outbox", "senders", "worker-1", 10, 5000) == [("1-0", {"payload": "a"})]
+        assert await service.xreadgroup("outbox", "senders", "worker-1", 10, None) == []
+        service._mock_client.xreadgroup.assert_awaited_with(
+            "senders", "worker-1", {"outbox": ">"}, count=10, block=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_xautoclaim_skips_entries_deleted_while_pending(self, service):
+        service._mock_client.xautoclaim = AsyncMock(return_value=["0-0", [("1-0", {"payload": "a"}), (None, None)], []])
+
+        assert await service.xautoclaim("outbox", "senders", "worker-1", 60000, 10) == [("1-0", {"payload": "a"})]
+        service._mock_client.xautoclaim.assert_awaited_once_with(
+            "outbox", "senders", "worker-1", 60000, start_id="0-0", count=10
+        )
+
+    @pytest.mark.asyncio
+    async def test_xack_and_delete_runs_in_one_transaction(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = [2, 2]
+
+        await service.xack_and_delete("outbox", "senders", [])
+        service._mock_client.pipeline.assert_not_called()
+
+        await service.xack_and_delete("outbox", "senders", ["1-0", "2-0"])
+        service._mock_client.pipeline.assert_called_once_with(transaction=True)
+        assert fake_pipeline.method_calls[:2] == [
+            ("xack", ("outbox", "senders", "1-0", "2-0"), {}),
+            ("xdel", ("outbox", "1-0", "2-0"), {}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_defer_stream_entry_parks_member_and_acknowledges_entry(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = [1, True, 1, 1]
+
+        await service.defer_stream_entry("outbox", "senders", "1-0", "outbox:retry", "payload", 1700000030.0, 3600)
+
+        service._mock_client.pipeline.assert_called_once_with(transaction=True)
+        assert fake_pipeline.method_calls[:4] == [
+            ("zadd", ("outbox:retry", {"payload": 1700000030.0}), {}),
+            ("expire", ("outbox:retry", 3600), {}),
+            ("xack", ("outbox", "senders", "1-0"), {}),
+            ("xdel", ("outbox", "1-0"), {}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_promote_due_to_stream_moves_due_members_in_one_script(self, service):
+        service._mock_client.evalsha = AsyncMock(return_value=2)
+
+        assert await service.promote_due_to_stream("outbox:retry", "outbox", "payload", 1700000000.0, 50, 1000) == 2
+        service._mock_client.evalsha.assert_awaited_once_with(
+            PROMOTE_DUE_TO_STREAM_SCRIPT.sha, 2, "outbox:retry", "outbox", 1700000000.0, 50, "payload", 1000
+        )
+
+    def test_registered_scripts_are_keyed_by_their_redis_sha(self):
+        assert len({script.sha for script in LUA_SCRIPTS}) == len(LUA_SCRIPTS)
+        for script in LUA_SCRIPTS:
+            assert script.sha == hashlib.sha1(script.source.encode(), usedforsecurity=False).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_load_scripts_loads_every_registered_script_in_one_round_trip(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = [script.sha for script in LUA_SCRIPTS]
+
+        await service.load_scripts()
+
+        assert fake_pipeline.method_calls[: len(LUA_SCRIPTS)] == [
+            ("script_load", (script.source,), {}) for script in LUA_SCRIPTS
+        ]
+        fake_pipeline.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_script_is_loaded_and_retried_after_noscript(self, service):
+        service._mock_client.evalsha = AsyncMock(side_effect=[NoScriptError("NOSCRIPT"), 4])
+        service._mock_client.script_load = AsyncMock(return_value=INCRBY_IF_EXISTS_SCRIPT.sha)
+
+        assert await service.incrby_if_exists("counter", 1) == 4
+        service._mock_client.script_load.assert_awaited_once_with(INCRBY_IF_EXISTS_SCRIPT.source)
+        assert service._mock_client.evalsha.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_pipelined_scripts_rerun_only_the_calls_that_missed_the_cache(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = [NoScriptError("NOSCRIPT"), 7]
+        service._mock_client.evalsha = AsyncMock(side_effect=[NoScriptError("NOSCRIPT"), 3])
+        service._mock_client.script_load = AsyncMock(return_value=INCRBY_IF_EXISTS_SCRIPT.sha)
+
+        assert await service.incrby_if_exists_many(["a", "b"], 1) == [3, 7]
+        fake_pipeline.execute.assert_awaited_once_with(raise_on_error=False)
+        service._mock_client.evalsha.assert_awaited_with(INCRBY_IF_EXISTS_SCRIPT.sha, 1, "a", 1)
+
+    @pytest.mark.asyncio
+    async def test_pipelined_scripts_raise_other_errors(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = [ResponseError("WRONGTYPE")]
+
+        with pytest.raises(ResponseError):
+            await service.incrby_if_exists_many(["a"], 1)
+
+    @pytest.mark.asyncio
+    async def test_set_indexed_stores_value_and_records_key_in_one_script(self, service):
+        service._mock_client.evalsha = AsyncMock(return_value=1)
+
+        await service.set_indexed("logs:user:1:list", [{"id": 1}], "logs:user:1:keys", 60)
+
+        service._mock_client.evalsha.assert_awaited_once_with(
+            SET_INDEXED_SCRIPT.sha, 2, "logs:user:1:list", "logs:user:1:keys", json.dumps([{"id": 1}]), 60
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete_indexed_passes_plain_keys_before_index_keys(self, service):
+        service._mock_client.evalsha = AsyncMock(return_value=5)
+
+        assert await service.delete_indexed(["log:1"], ["logs:user:1:keys", "logs:movie:2:keys"]) == 5
+        service._mock_client.evalsha.assert_awaited_once_with(
+            DELETE_INDEXED_SCRIPT.sha, 3, "log:1", "logs:user:1:keys", "logs:movie:2:keys", 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_check_code_attempt_returns_the_script_verdict(self, service):
+        service._mock_client.evalsha = AsyncMock(return_value="mismatch")
+
+        assert await service.check_code_attempt("verification:key", "candidate", 5) == "mismatch"
+        service._mock_client.evalsha.assert_awaited_once_with(
+            CHECK_CODE_ATTEMPT_SCRIPT.sha, 1, "verification:key", "candidate", 5
+        )
+
+    @pytest.mark.asyncio
+    async def test_replace_hash_swaps_fields_in_transaction(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = [1, 1, True]
+
+        await service.replace_hash("revocations:a", {"before": "12.5"}, 60)
+
+        service._mock_client.pipeline.assert_called_once_with(transaction=True)
+        assert fake_pipeline.method_calls[:3] == [
+            ("delete", ("revocations:a",), {}),
+            ("hset", ("revocations:a",), {"mapping": {"before": "12.5"}}),
+            ("expire", ("revocations:a", 60), {}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_revoke_session_runs_the_script(self, service):
+        service._mock_client.evalsha = AsyncMock(return_value=1)
+
+        await service.revoke_session("session:s1", "revocations:a", "s1", 1900.0, 1000.0, 60)
+
+        service._mock_client.evalsha.assert_awaited_once_with(
+            REVOKE_SESSION_SCRIPT.sha, 2, "session:s1", "revocations:a", "s1", 1900.0, 1000.0, 60
+        )
+
+    @pytest.mark.asyncio
+    async def test_bloom_check_tells_a_missing_filter_from_a_miss(self, service):
+        service._mock_client.evalsha = AsyncMock(side_effect=[None, 0, 1])
+
+        assert await service.bloom_check("filter", [3, 17]) is None
+        assert await service.bloom_check("filter", [3, 17]) is False
+        assert await service.bloom_check("filter", [3, 17]) is True
+        service._mock_client.evalsha.assert_awaited_with(BLOOM_CHECK_SCRIPT.sha, 1, "filter", 3, 17)
+
+    @pytest.mark.asyncio
+    async def test_bloom_add_passes_every_key_then_the_offsets(self, service):
+        service._mock_client.evalsha = AsyncMock(return_value=1)
+
+        assert await service.bloom_add(["filter", "filter:rebuild"], [3, 17]) == 1
+
+        service._mock_client.evalsha.assert_awaited_once_with(
+            BLOOM_ADD_SCRIPT.sha, 2, "filter", "filter:rebuild", 3, 17
+        )
+
+    @pytest.mark.asyncio
+    async def test_allocate_bitmap_replaces_the_key_with_a_zeroed_bitmap(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = [1, 0, True]
+
+        await service.allocate_bitmap("filter:rebuild", 1024, 60)
+
+        service._mock_client.pipeline.assert_called_once_with(transaction=True)
+        assert fake_pipeline.method_calls[:3] == [
+            ("delete", ("filter:rebuild",), {}),
+            ("setbit", ("filter:rebuild", 1023, 0), {}),
+            ("expire", ("filter:rebuild", 60), {}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rename_persistent_drops_the_source_ttl(self, service, fake_pipeline):
+        fake_pipeline.execute.return_value = [True, True]
+
+        await service.rename_persistent("filter:rebuild", "filter")
+
+        assert fake_pipeline.method_calls[:2] == [
+            ("rename", ("filter:rebuild", "filter"), {}),
+            ("persist", ("filter",), {}),
+        ]
+
     @pytest.mark.asyncio
     async def test_delete_many(self, service):
         service._mock_client.delete = AsyncMock(return_value=3)
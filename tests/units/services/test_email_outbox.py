@@ -0,0 +1,139 @@
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.email_outbox import (
+    EMAIL_OUTBOX_GROUP,
+    EMAIL_OUTBOX_MAX_LENGTH,
+    EMAIL_OUTBOX_RETENTION_SECONDS,
+    EMAIL_OUTBOX_RETRY_KEY,
+    EMAIL_OUTBOX_STREAM_KEY,
+    EmailOutbox,
+    OutboundEmail,
+    OutboxEntry,
+)
+from app.types import EmailTemplate
+
+
+@pytest.fixture
+def mock_cache():
+    cache = MagicMock()
+    cache.xadd = AsyncMock(return_value="1-0")
+    cache.xautoclaim = AsyncMock(return_value=[])
+    cache.xreadgroup = AsyncMock(return_value=[])
+    cache.xack_and_delete = AsyncMock()
+    cache.defer_stream_entry = AsyncMock()
+    cache.promote_due_to_stream = AsyncMock(return_value=0)
+    with patch("app.services.email_outbox.CacheService.get_instance", return_value=cache):
+        yield cache
+
+
+def _email(attempt: int = 1) -> OutboundEmail:
+    return OutboundEmail(
+        to_email="user@example.com",
+        template=EmailTemplate.RESET_PASSWORD,
+        params={"code": "ABC123"},
+        expires_at=1900.0,
+        attempt=attempt,
+    )
+
+
+def _payload(**overrides: object) -> str:
+    payload: dict[str, object] = {
+        "id": "abc",
+        "attempt": 1,
+        "to": "user@example.com",
+        "template": "reset_password",
+        "params": {"code": "ABC123"},
+        "expires_at": 1900.0,
+    }
+    return json.dumps(payload | overrides)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_then_read_batch_round_trips_the_email(mock_cache):
+    email = _email(attempt=2)
+    outbox = EmailOutbox()
+
+    await outbox.enqueue(email)
+    key, fields, max_length = mock_cache.xadd.await_args.args
+    mock_cache.xreadgroup.return_value = [("1-0", fields)]
+
+    assert key == EMAIL_OUTBOX_STREAM_KEY
+    assert max_length == EMAIL_OUTBOX_MAX_LENGTH
+    assert mock_cache.xadd.await_args.kwargs == {"max_age_seconds": EMAIL_OUTBOX_RETENTION_SECONDS}
+    assert json.loads(fields["payload"]) == {
+        "id": email.message_id,
+        "attempt": 2,
+        "to": "user@example.com",
+        "template": "reset_password",
+        "params": {"code": "ABC123"},
+        "expires_at": 1900.0,
+    }
+    assert await outbox.read_batch("worker-1", 10, 5000, 60000) == [OutboxEntry(entry_id="1-0", email=email)]
+    mock_cache.xreadgroup.assert_awaited_once_with(EMAIL_OUTBOX_STREAM_KEY, EMAIL_OUTBOX_GROUP, "worker-1", 10, 5000)
+
+
+@pytest.mark.asyncio
+async def test_read_batch_takes_reclaimed_entries_without_blocking(mock_cache):
+    email = _email()
+    outbox = EmailOutbox()
+    await outbox.enqueue(email)
+    fields = mock_cache.xadd.await_args.args[1]
+    mock_cache.xautoclaim.return_value = [("1-0", fields)]
+
+    entries = await outbox.read_batch("worker-1", 3, 5000, 60000)
+
+    assert [entry.entry_id for entry in entries] == ["1-0"]
+    mock_cache.xautoclaim.assert_awaited_once_with(EMAIL_OUTBOX_STREAM_KEY, EMAIL_OUTBOX_GROUP, "worker-1", 60000, 3)
+    mock_cache.xreadgroup.assert_awaited_once_with(EMAIL_OUTBOX_STREAM_KEY, EMAIL_OUTBOX_GROUP, "worker-1", 2, None)
+
+
+@pytest.mark.asyncio
+async def test_read_batch_acknowledges_malformed_entries(mock_cache):
+    mock_cache.xreadgroup.return_value = [
+        ("1-0", {"payload": "not json"}),
+        ("2-0", {"other": "field"}),
+        ("3-0", {"payload": json.dumps({"to": "user@example.com"})}),
+        ("4-0", {"payload": _payload(template="welcome")}),
+        ("5-0", {"payload": _payload(params={})}),
+        ("6-0", {"payload": _payload(params=["ABC123"])}),
+    ]
+
+    assert await EmailOutbox().read_batch("worker-1", 10, 0, 60000) == []
+    mock_cache.xack_and_delete.assert_awaited_once_with(
+        EMAIL_OUTBOX_STREAM_KEY, EMAIL_OUTBOX_GROUP, ["1-0", "2-0", "3-0", "4-0", "5-0", "6-0"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_schedule_retry_defers_the_next_attempt(mock_cache):
+    email = _email(attempt=2)
+
+    with patch("app.services.email_outbox.time.time", return_value=1000.0):
+        await EmailOutbox().schedule_retry(OutboxEntry(entry_id="1-0", email=email), 60)
+
+    key, group, entry_id, delay_key, member, due_at, ttl = mock_cache.defer_stream_entry.await_args.args
+    assert (key, group, entry_id, delay_key, due_at, ttl) == (
+        EMAIL_OUTBOX_STREAM_KEY,
+        EMAIL_OUTBOX_GROUP,
+        "1-0",
+        EMAIL_OUTBOX_RETRY_KEY,
+        1060.0,
+        EMAIL_OUTBOX_RETENTION_SECONDS,
+    )
+    assert json.loads(member)["attempt"] == 3
+    assert json.loads(member)["id"] == email.message_id
+
+
+@pytest.mark.asyncio
+async def test_promote_due_retries_moves_them_back_onto_the_stream(mock_cache):
+    mock_cache.promote_due_to_stream.return_value = 4
+
+    with patch("app.services.email_outbox.time.time", return_value=1000.0):
+        assert await EmailOutbox().promote_due_retries(50) == 4
+
+    mock_cache.promote_due_to_stream.assert_awaited_once_with(
+        EMAIL_OUTBOX_RETRY_KEY, EMAIL_OUTBOX_STREAM_KEY, "payload", 1000.0, 50, EMAIL_OUTBOX_MAX_LENGTH
+    )
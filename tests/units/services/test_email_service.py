@@ -0,0 +1,44 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.email_outbox import OutboundEmail
+from app.services.email_service import RESET_PASSWORD_CODE_TTL_SECONDS, EmailService
+from app.types import EmailTemplate
+
+
+@pytest.fixture
+def outbox():
+    mock_outbox = AsyncMock()
+    mock_outbox.enqueue = AsyncMock()
+    return mock_outbox
+
+
+@pytest.mark.asyncio
+async def test_emails_are_queued_when_smtp_is_configured(monkeypatch, outbox):
+    monkeypatch.setenv("SMTP_SERVER", "smtp.example.com")
+    service = EmailService(outbox=outbox)
+
+    with patch("app.services.email_service.time.time", return_value=1000.0):
+        await service.send_reset_password_email("user@example.com", "ABC123")
+
+    outbox.enqueue.assert_awaited_once()
+    email: OutboundEmail = outbox.enqueue.await_args.args[0]
+    assert email.to_email == "user@example.com"
+    assert email.template == EmailTemplate.RESET_PASSWORD
+    assert email.params == {"code": "ABC123"}
+    assert email.expires_at == 1000.0 + RESET_PASSWORD_CODE_TTL_SECONDS
+    assert email.attempt == 1
+
+
+@pytest.mark.asyncio
+async def test_emails_are_logged_instead_of_queued_without_smtp(monkeypatch, capsys, outbox):
+    monkeypatch.delenv("SMTP_SERVER", raising=False)
+    service = EmailService(outbox=outbox)
+
+    await service.send_registration_verification_email("user@example.com", "XYZ789")
+
+    outbox.enqueue.assert_not_awaited()
+    output = capsys.readouterr().out
+    assert "Subject: Verify your Cinelog email" in output
+    assert "Code: XYZ789" in output
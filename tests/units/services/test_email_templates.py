@@ -0,0 +1,31 @@
+import pytest
+
+from app.services.email_templates import EMAIL_TEMPLATE_PARAMS, render_email
+from app.types import EmailTemplate
+
+
+def test_every_template_declares_its_parameters():
+    assert EMAIL_TEMPLATE_PARAMS.keys() == set(EmailTemplate)
+
+
+@pytest.mark.parametrize(
+    ("template", "subject"),
+    [
+        (EmailTemplate.RESET_PASSWORD, "Password Reset - Cinelog"),
+        (EmailTemplate.REGISTRATION_VERIFICATION, "Verify your Cinelog email"),
+    ],
+)
+def test_code_emails_carry_the_code_in_both_bodies(template, subject):
+    email = render_email("user@example.com", template, {"code": "ABC123"})
+
+    assert email.to_email == "user@example.com"
+    assert email.subject == subject
+    assert "ABC123" in email.text
+    assert "<strong>ABC123</strong>" in email.html
+
+
+def test_existing_account_notice_needs_no_parameters():
+    email = render_email("user@example.com", EmailTemplate.REGISTRATION_EXISTING_ACCOUNT, {})
+
+    assert email.subject == "Cinelog account already exists"
+    assert "password recovery" in email.text
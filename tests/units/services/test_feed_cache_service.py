@@ -0,0 +1,127 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.repository.feed_repository_protocol import FeedEntry
+from app.services.feed_cache_service import (
+    FEED_TIMELINE_MAX_LENGTH,
+    FEED_TIMELINE_TTL,
+    TIMELINE_MARKER,
+    FeedCacheService,
+)
+from app.types import TimestampUUIDCursor
+
+CREATED_AT = datetime(2026, 10, 1, 12, 30, 15, 123456, tzinfo=UTC)
+CREATED_AT_SCORE = 1790857815123456.0
+
+
+@pytest.fixture
+def mock_cache():
+    cache = MagicMock()
+    cache.zrevrangebyscore_if_exists = AsyncMock(return_value=None)
+    cache.replace_sorted_set = AsyncMock()
+    cache.zadd_capped_if_exists_many = AsyncMock()
+    cache.delete_many = AsyncMock(return_value=0)
+    with patch(
+        "app.services.feed_cache_service.CacheService.get_instance",
+        return_value=cache,
+    ):
+        yield cache
+
+
+def test_build_timeline_key():
+    user_id = uuid4()
+    assert FeedCacheService.build_timeline_key(user_id) == f"cinelog:feed:{user_id}"
+
+
+@pytest.mark.asyncio
+async def test_read_timeline_miss_returns_none(mock_cache):
+    user_id = uuid4()
+
+    assert await FeedCacheService().read_timeline(user_id, cursor=None, limit=5) is None
+    mock_cache.zrevrangebyscore_if_exists.assert_awaited_once_with(f"cinelog:feed:{user_id}", None, 0.0, 5)
+
+
+@pytest.mark.asyncio
+async def test_read_timeline_decodes_microsecond_scores(mock_cache):
+    log_id = uuid4()
+    mock_cache.zrevrangebyscore_if_exists.return_value = [(str(log_id), CREATED_AT_SCORE)]
+
+    entries = await FeedCacheService().read_timeline(uuid4(), cursor=None, limit=5)
+
+    assert entries == [FeedEntry(log_id=log_id, created_at=CREATED_AT)]
+
+
+@pytest.mark.asyncio
+async def test_read_timeline_skips_entries_tied_at_or_before_cursor(mock_cache):
+    low, cursor_id, high = (UUID(int=value) for value in (1, 2, 3))
+    older = uuid4()
+    mock_cache.zrevrangebyscore_if_exists.return_value = [
+        (str(high), CREATED_AT_SCORE),
+        (str(cursor_id), CREATED_AT_SCORE),
+        (str(low), CREATED_AT_SCORE),
+        (str(older), CREATED_AT_SCORE - 1),
+    ]
+
+    entries = await FeedCacheService().read_timeline(
+        uuid4(),
+        cursor=TimestampUUIDCursor(timestamp=CREATED_AT, id=cursor_id),
+        limit=1,
+    )
+
+    assert entries == [FeedEntry(log_id=low, created_at=CREATED_AT)]
+    assert mock_cache.zrevrangebyscore_if_exists.await_args.args[1:] == (CREATED_AT_SCORE, 0.0, 1)
+
+
+@pytest.mark.asyncio
+async def test_read_timeline_treats_redis_errors_as_miss(mock_cache):
+    mock_cache.zrevrangebyscore_if_exists.side_effect = ConnectionError("down")
+
+    assert await FeedCacheService().read_timeline(uuid4(), cursor=None, limit=5) is None
+
+
+@pytest.mark.asyncio
+async def test_store_timeline_marks_empty_timeline_as_built(mock_cache):
+    user_id = uuid4()
+
+    await FeedCacheService().store_timeline(user_id, [])
+
+    mock_cache.replace_sorted_set.assert_awaited_once_with(
+        f"cinelog:feed:{user_id}",
+        {TIMELINE_MARKER: 0.0},
+        FEED_TIMELINE_TTL,
+    )
+
+
+@pytest.mark.asyncio
+async def test_push_entry_targets_every_follower_timeline(mock_cache):
+    followers = [uuid4(), uuid4()]
+    log_id = uuid4()
+
+    await FeedCacheService().push_entry(followers, FeedEntry(log_id=log_id, created_at=CREATED_AT))
+
+    mock_cache.zadd_capped_if_exists_many.assert_awaited_once_with(
+        [f"cinelog:feed:{follower_id}" for follower_id in followers],
+        str(log_id),
+        CREATED_AT_SCORE,
+        FEED_TIMELINE_MAX_LENGTH,
+    )
+
+
+@pytest.mark.asyncio
+async def test_push_entry_logs_redis_errors(mock_cache):
+    mock_cache.zadd_capped_if_exists_many.side_effect = ConnectionError("down")
+
+    await FeedCacheService().push_entry([uuid4()], FeedEntry(log_id=uuid4(), created_at=CREATED_AT))
+
+
+@pytest.mark.asyncio
+async def test_invalidate_timelines_deletes_keys(mock_cache):
+    user_ids = [uuid4(), uuid4()]
+
+    await FeedCacheService().invalidate_timelines(user_ids)
+    await FeedCacheService().invalidate_timelines([])
+
+    mock_cache.delete_many.assert_awaited_once_with([f"cinelog:feed:{user_id}" for user_id in user_ids])
@@ -0,0 +1,201 @@
+"""Unit tests for home feed fan-out, invalidation and paging."""
+
+from datetime import UTC, date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.config.feed_config import FEED_FANOUT_MAX_FOLLOWERS, feed_cursor_scope
+from app.repository.feed_repository_protocol import FeedAudience, FeedEntry, FeedLog
+from app.schemas.feed_schemas import FeedRequest
+from app.services.feed_cache_service import FEED_TIMELINE_MAX_LENGTH
+from app.services.feed_service import FeedService
+from app.types import TimestampUUIDCursor
+from app.utils.cursor_pagination_utils import decode_timestamp_uuid_cursor, encode_timestamp_uuid_cursor
+from app.utils.error_codes_utils import ErrorCodes
+from app.utils.exceptions_utils import AppException
+
+BASE = datetime(2026, 10, 1, 12, tzinfo=UTC)
+
+
+@pytest.fixture
+def feed_repository():
+    repository = AsyncMock()
+    repository.list_pulled_entries.return_value = []
+    repository.get_feed_logs.side_effect = lambda log_ids: [_feed_log(log_id) for log_id in log_ids]
+    return repository
+
+
+@pytest.fixture
+def feed_cache_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(feed_repository, feed_cache_service):
+    return FeedService(feed_repository=feed_repository, feed_cache_service=feed_cache_service)
+
+
+def _entry(minutes: int, log_id: UUID | None = None) -> FeedEntry:
+    return FeedEntry(log_id=log_id or uuid4(), created_at=BASE + timedelta(minutes=minutes))
+
+
+def _feed_log(log_id: UUID) -> FeedLog:
+    movie = SimpleNamespace(
+        id=uuid4(),
+        title="Heat",
+        tmdb_id=949,
+        poster_path=None,
+        release_date=None,
+        overview=None,
+        vote_average=None,
+        runtime=None,
+        original_language="en",
+        created_at=None,
+        updated_at=None,
+    )
+    log = SimpleNamespace(
+        id=log_id,
+        tmdb_id=949,
+        date_watched=date(2026, 10, 1),
+        viewing_notes=None,
+        poster_path=None,
+        watched_where="cinema",
+        created_at=BASE,
+    )
+    author = SimpleNamespace(handle="author", first_name="Ada", last_name="Author")
+    return FeedLog(log=log, movie=movie, author=author)
+
+
+@pytest.mark.asyncio
+async def test_publish_log_pushes_to_followers_of_public_author(service, feed_repository, feed_cache_service):
+    author_id, log_id = uuid4(), uuid4()
+    followers = [uuid4(), uuid4()]
+    feed_repository.get_audience.return_value = FeedAudience(is_public=True, follower_ids=followers)
+
+    await service.publish_log(author_id, log_id, BASE)
+
+    feed_repository.get_audience.assert_awaited_once_with(author_id, FEED_FANOUT_MAX_FOLLOWERS)
+    feed_cache_service.push_entry.assert_awaited_once_with(followers, FeedEntry(log_id=log_id, created_at=BASE))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "audience",
+    [
+        FeedAudience(is_public=False, follower_ids=[uuid4()]),
+        FeedAudience(is_public=True, follower_ids=None),
+    ],
+)
+async def test_publish_log_skips_private_and_pulled_authors(service, feed_repository, feed_cache_service, audience):
+    feed_repository.get_audience.return_value = audience
+
+    await service.publish_log(uuid4(), uuid4(), BASE)
+
+    feed_cache_service.push_entry.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_publish_log_swallows_audience_errors(service, feed_repository, feed_cache_service):
+    feed_repository.get_audience.side_effect = RuntimeError("db down")
+
+    await service.publish_log(uuid4(), uuid4(), BASE)
+
+    feed_cache_service.push_entry.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_follower_timelines_skips_pulled_authors(service, feed_repository, feed_cache_service):
+    followers = [uuid4()]
+    feed_repository.get_audience.return_value = FeedAudience(is_public=False, follower_ids=followers)
+
+    await service.invalidate_follower_timelines(uuid4())
+
+    feed_cache_service.invalidate_timelines.assert_awaited_once_with(followers)
+
+    feed_cache_service.invalidate_timelines.reset_mock()
+    feed_repository.get_audience.return_value = FeedAudience(is_public=True, follower_ids=None)
+
+    await service.invalidate_follower_timelines(uuid4())
+
+    feed_cache_service.invalidate_timelines.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_feed_rebuilds_missing_timeline(service, feed_repository, feed_cache_service):
+    user_id = uuid4()
+    rebuilt = [_entry(3), _entry(2), _entry(1)]
+    feed_cache_service.read_timeline.return_value = None
+    feed_repository.list_timeline_entries.return_value = rebuilt
+
+    response = await service.get_feed(user_id, FeedRequest(limit=2))
+
+    feed_repository.list_timeline_entries.assert_awaited_once_with(
+        user_id,
+        max_followers=FEED_FANOUT_MAX_FOLLOWERS,
+        limit=FEED_TIMELINE_MAX_LENGTH,
+    )
+    feed_cache_service.store_timeline.assert_awaited_once_with(user_id, rebuilt)
+    assert [item.id for item in response.items] == [rebuilt[0].log_id, rebuilt[1].log_id]
+    assert response.items[0].author.handle == "author"
+    cursor = decode_timestamp_uuid_cursor(response.next_cursor, expected_scope=feed_cursor_scope(user_id))
+    assert cursor == TimestampUUIDCursor(timestamp=rebuilt[1].created_at, id=rebuilt[1].log_id)
+
+
+@pytest.mark.asyncio
+async def test_get_feed_merges_pulled_entries_and_deduplicates(service, feed_repository, feed_cache_service):
+    shared = _entry(2)
+    pushed = [_entry(4), shared]
+    pulled = [_entry(3), shared]
+    feed_cache_service.read_timeline.return_value = pushed
+    feed_repository.list_pulled_entries.return_value = pulled
+
+    response = await service.get_feed(uuid4(), FeedRequest(limit=5))
+
+    assert [item.id for item in response.items] == [pushed[0].log_id, pulled[0].log_id, shared.log_id]
+    assert response.next_cursor is None
+    feed_repository.get_feed_logs.assert_awaited_once_with([pushed[0].log_id, pulled[0].log_id, shared.log_id])
+
+
+@pytest.mark.asyncio
+async def test_get_feed_passes_cursor_to_both_sources(service, feed_repository, feed_cache_service):
+    user_id = uuid4()
+    position = TimestampUUIDCursor(timestamp=BASE, id=uuid4())
+    cursor = encode_timestamp_uuid_cursor(position, scope=feed_cursor_scope(user_id))
+    feed_cache_service.read_timeline.return_value = []
+
+    await service.get_feed(user_id, FeedRequest(limit=10, cursor=cursor))
+
+    feed_cache_service.read_timeline.assert_awaited_once_with(user_id, cursor=position, limit=11)
+    feed_repository.list_pulled_entries.assert_awaited_once_with(
+        user_id,
+        min_followers=FEED_FANOUT_MAX_FOLLOWERS,
+        limit=11,
+        cursor=position,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_feed_drops_logs_that_no_longer_hydrate(service, feed_repository, feed_cache_service):
+    kept, gone = _entry(2), _entry(1)
+    feed_cache_service.read_timeline.return_value = [kept, gone]
+    feed_repository.get_feed_logs.side_effect = lambda log_ids: [_feed_log(kept.log_id)]
+
+    response = await service.get_feed(uuid4(), FeedRequest(limit=5))
+
+    assert [item.id for item in response.items] == [kept.log_id]
+
+
+@pytest.mark.asyncio
+async def test_get_feed_rejects_cursor_from_another_user(service):
+    cursor = encode_timestamp_uuid_cursor(
+        TimestampUUIDCursor(timestamp=BASE, id=uuid4()),
+        scope=feed_cursor_scope(uuid4()),
+    )
+
+    with pytest.raises(AppException) as exc_info:
+        await service.get_feed(uuid4(), FeedRequest(cursor=cursor))
+
+    assert exc_info.value.error is ErrorCodes.INVALID_PAGINATION_CURSOR
@@ -0,0 +1,90 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.services.follow_cache_service import FOLLOWING_SET_MARKER, FOLLOWING_SET_TTL, FollowCacheService
+
+
+@pytest.fixture
+def mock_cache():
+    cache = MagicMock()
+    cache.smismember_if_exists = AsyncMock(return_value=None)
+    cache.replace_set = AsyncMock()
+    cache.sadd_if_exists = AsyncMock(return_value=True)
+    cache.srem = AsyncMock(return_value=1)
+    with patch(
+        "app.services.follow_cache_service.CacheService.get_instance",
+        return_value=cache,
+    ):
+        yield cache
+
+
+def test_build_following_key():
+    user_id = uuid4()
+    assert FollowCacheService.build_following_key(user_id) == f"cinelog:follows:following:{user_id}"
+
+
+@pytest.mark.asyncio
+async def test_get_following_flags_hit_and_miss(mock_cache):
+    user_id, first, second = uuid4(), uuid4(), uuid4()
+    service = FollowCacheService()
+
+    assert await service.get_following_flags(user_id, [first, second]) is None
+
+    mock_cache.smismember_if_exists.return_value = [True, False]
+    assert await service.get_following_flags(user_id, [first, second]) == [True, False]
+    mock_cache.smismember_if_exists.assert_awaited_with(
+        f"cinelog:follows:following:{user_id}",
+        [str(first), str(second)],
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_following_flags_without_candidates_skips_redis(mock_cache):
+    assert await FollowCacheService().get_following_flags(uuid4(), []) == []
+    mock_cache.smismember_if_exists.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_following_flags_treats_redis_errors_as_miss(mock_cache):
+    mock_cache.smismember_if_exists.side_effect = ConnectionError("down")
+
+    assert await FollowCacheService().get_following_flags(uuid4(), [uuid4()]) is None
+
+
+@pytest.mark.asyncio
+async def test_store_following_marks_empty_set_as_built(mock_cache):
+    user_id, followed_id = uuid4(), uuid4()
+    service = FollowCacheService()
+
+    await service.store_following(user_id, [])
+    await service.store_following(user_id, [followed_id])
+
+    key = f"cinelog:follows:following:{user_id}"
+    assert mock_cache.replace_set.await_args_list[0].args == (key, [FOLLOWING_SET_MARKER], FOLLOWING_SET_TTL)
+    assert mock_cache.replace_set.await_args_list[1].args == (
+        key,
+        [FOLLOWING_SET_MARKER, str(followed_id)],
+        FOLLOWING_SET_TTL,
+    )
+
+
+@pytest.mark.asyncio
+async def test_record_follow_and_unfollow_update_existing_set(mock_cache):
+    user_id, followed_id = uuid4(), uuid4()
+    service = FollowCacheService()
+
+    await service.record_follow(user_id, followed_id)
+    await service.record_unfollow(user_id, followed_id)
+
+    key = f"cinelog:follows:following:{user_id}"
+    mock_cache.sadd_if_exists.assert_awaited_once_with(key, str(followed_id))
+    mock_cache.srem.assert_awaited_once_with(key, str(followed_id))
+
+
+@pytest.mark.asyncio
+async def test_record_follow_logs_redis_errors(mock_cache):
+    mock_cache.sadd_if_exists.side_effect = ConnectionError("down")
+
+    await FollowCacheService().record_follow(uuid4(), uuid4())
@@ -1,12 +1,25 @@
 """Unit tests for public-profile follow business rules."""
 
+from datetime import UTC, datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 
+from app.config.follow_config import followers_cursor_scope, following_cursor_scope
+from app.repository.follow_repository_protocol import (
+    FollowListItem,
+    FollowPage,
+    FriendMovieActivity,
+    FriendMovieActivityPage,
+)
+from app.schemas.movie_schemas import MAX_MOVIE_FRIENDS, MovieFriendsResponse
+from app.schemas.user_schemas import FollowListRequest, RelationshipsRequest
 from app.services.follow_service import FollowService
+from app.services.movie_friends_cache_service import MovieFriendsLookup
+from app.types import TimestampUUIDCursor
+from app.utils.cursor_pagination_utils import decode_timestamp_uuid_cursor, encode_timestamp_uuid_cursor
 from app.utils.error_codes_utils import ErrorCodes
 from app.utils.exceptions_utils import AppException
 
@@ -24,10 +37,28 @@ def follow_repository():
 
 
 @pytest.fixture
-def service(user_repository, follow_repository):
+def feed_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def follow_cache_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def movie_friends_cache_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(user_repository, follow_repository, feed_service, follow_cache_service, movie_friends_cache_service):
     return FollowService(
         user_repository=user_repository,
         follow_repository=follow_repository,
+        feed_service=feed_service,
+        follow_cache_service=follow_cache_service,
+        movie_friends_cache_service=movie_friends_cache_service,
     )
 
 
@@ -36,7 +67,14 @@ def _user(*, visibility: str = "public"):
 
 
 @pytest.mark.asyncio
-async def test_follow_public_target_creates_directional_edge(service, user_repository, follow_repository):
+async def test_follow_public_target_creates_directional_edge(
+    service,
+    user_repository,
+    follow_repository,
+    feed_service,
+    follow_cache_service,
+    movie_friends_cache_service,
+):
     follower = _user(visibility="private")
     target = _user()
     user_repository.find_user_by_id.return_value = follower
@@ -46,6 +84,9 @@ async def test_follow_public_target_creates_directional_edge(service, user_repos
 
     user_repository.find_user_by_handle.assert_awaited_once_with("TargetUser")
     follow_repository.create_follow.assert_awaited_once_with(follower.id, target.id)
+    feed_service.invalidate_timeline.assert_awaited_once_with(follower.id)
+    follow_cache_service.record_follow.assert_awaited_once_with(follower.id, target.id)
+    movie_friends_cache_service.invalidate_user.assert_awaited_once_with(follower.id)
 
 
 @pytest.mark.asyncio
@@ -125,7 +166,14 @@ async def test_follow_rejects_missing_target(service, user_repository, follow_re
 
 
 @pytest.mark.asyncio
-async def test_unfollow_deletes_edge_regardless_of_visibility(service, user_repository, follow_repository):
+async def test_unfollow_deletes_edge_regardless_of_visibility(
+    service,
+    user_repository,
+    follow_repository,
+    feed_service,
+    follow_cache_service,
+    movie_friends_cache_service,
+):
     follower = _user()
     target = _user(visibility="followers_only")
     user_repository.find_user_by_id.return_value = follower
@@ -134,6 +182,9 @@ async def test_unfollow_deletes_edge_regardless_of_visibility(service, user_repo
     await service.unfollow_user(follower.id, "target")
 
     follow_repository.delete_follow.assert_awaited_once_with(follower.id, target.id)
+    feed_service.invalidate_timeline.assert_awaited_once_with(follower.id)
+    follow_cache_service.record_unfollow.assert_awaited_once_with(follower.id, target.id)
+    movie_friends_cache_service.invalidate_user.assert_awaited_once_with(follower.id)
 
 
 @pytest.mark.asyncio
@@ -159,3 +210,179 @@ async def test_unfollow_rejects_missing_target(service, user_repository, follow_
 
     assert exc_info.value.error is ErrorCodes.USER_NOT_FOUND
     follow_repository.delete_follow.assert_not_awaited()
+
+
+def _list_item(handle: str, hour: int) -> FollowListItem:
+    user = SimpleNamespace(id=uuid4(), handle=handle, first_name="First", last_name="Last")
+    return FollowListItem(user=user, followed_at=datetime(2026, 10, 1, hour, tzinfo=UTC))
+
+
+@pytest.mark.asyncio
+async def test_list_followers_pages_with_a_user_bound_cursor(service, user_repository, follow_repository):
+    profile = _user()
+    requester_id = uuid4()
+    prior = TimestampUUIDCursor(timestamp=datetime(2026, 10, 2, tzinfo=UTC), id=uuid4())
+    newest, older = _list_item("newest", 5), _list_item("older", 4)
+    user_repository.find_user_by_handle.return_value = profile
+    follow_repository.list_followers.return_value = FollowPage(items=[newest, older], has_more=True)
+
+    response = await service.list_followers(
+        " Profile ",
+        requester_id,
+        FollowListRequest(
+            limit=2, cursor=encode_timestamp_uuid_cursor(prior, scope=followers_cursor_scope(profile.id))
+        ),
+    )
+
+    user_repository.find_user_by_handle.assert_awaited_once_with("Profile")
+    follow_repository.list_followers.assert_awaited_once_with(profile.id, limit=2, cursor=prior)
+    assert [item.handle for item in response.items] == ["newest", "older"]
+    assert response.next_cursor is not None
+    assert decode_timestamp_uuid_cursor(
+        response.next_cursor, expected_scope=followers_cursor_scope(profile.id)
+    ) == TimestampUUIDCursor(timestamp=older.followed_at, id=older.user.id)
+
+
+@pytest.mark.asyncio
+async def test_list_following_rejects_a_followers_cursor(service, user_repository, follow_repository):
+    profile = _user()
+    user_repository.find_user_by_handle.return_value = profile
+    cursor = encode_timestamp_uuid_cursor(
+        TimestampUUIDCursor(timestamp=datetime(2026, 10, 2, tzinfo=UTC), id=uuid4()),
+        scope=followers_cursor_scope(profile.id),
+    )
+
+    with pytest.raises(AppException) as exc_info:
+        await service.list_following("profile", uuid4(), FollowListRequest(cursor=cursor))
+
+    assert exc_info.value.error is ErrorCodes.INVALID_PAGINATION_CURSOR
+    assert following_cursor_scope(profile.id) != followers_cursor_scope(profile.id)
+    follow_repository.list_following.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("visibility", ["private", "followers_only"])
+async def test_follow_lists_require_a_public_profile_unless_owner(
+    visibility,
+    service,
+    user_repository,
+    follow_repository,
+):
+    profile = _user(visibility=visibility)
+    user_repository.find_user_by_handle.return_value = profile
+    follow_repository.list_following.return_value = FollowPage(items=[], has_more=False)
+
+    with pytest.raises(AppException) as exc_info:
+        await service.list_followers("profile", uuid4(), FollowListRequest())
+    own = await service.list_following("profile", profile.id, FollowListRequest())
+
+    assert exc_info.value.error is ErrorCodes.PROFILE_NOT_PUBLIC
+    assert own.items == []
+    assert own.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_following_flags_read_cached_set(service, follow_repository, follow_cache_service):
+    requester_id, followed_id, other_id = uuid4(), uuid4(), uuid4()
+    follow_cache_service.get_following_flags.return_value = [True, False]
+
+    flags = await service.get_following_flags(requester_id, [followed_id, other_id])
+
+    assert flags == {followed_id: True, other_id: False}
+    follow_cache_service.get_following_flags.assert_awaited_once_with(requester_id, [followed_id, other_id])
+    follow_repository.list_following_ids.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_following_flags_build_set_on_miss(service, follow_repository, follow_cache_service):
+    requester_id, followed_id, other_id = uuid4(), uuid4(), uuid4()
+    follow_cache_service.get_following_flags.return_value = None
+    follow_repository.list_following_ids.return_value = [followed_id]
+
+    flags = await service.get_following_flags(requester_id, [followed_id, other_id])
+
+    assert flags == {followed_id: True, other_id: False}
+    follow_repository.list_following_ids.assert_awaited_once_with(requester_id)
+    follow_cache_service.store_following.assert_awaited_once_with(requester_id, [followed_id])
+
+
+@pytest.mark.asyncio
+async def test_following_flags_for_no_users_skip_cache(service, follow_cache_service):
+    assert await service.get_following_flags(uuid4(), []) == {}
+    follow_cache_service.get_following_flags.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_relationships_keep_request_order_and_omit_unknown_users(
+    service,
+    user_repository,
+    follow_cache_service,
+):
+    by_id = SimpleNamespace(id=uuid4(), handle="by_id")
+    by_handle = SimpleNamespace(id=uuid4(), handle="By_Handle")
+    user_repository.find_users_by_ids_or_handles.return_value = [by_handle, by_id]
+    follow_cache_service.get_following_flags.return_value = [False, True]
+    request = RelationshipsRequest(user_ids=[uuid4(), by_id.id], handles=["by_handle"])
+
+    response = await service.get_relationships(uuid4(), request)
+
+    user_repository.find_users_by_ids_or_handles.assert_awaited_once_with(request.user_ids, ["by_handle"])
+    assert [(item.handle, item.is_following) for item in response.relationships] == [
+        ("by_id", False),
+        ("By_Handle", True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_movie_friends_return_valid_cached_response(service, follow_repository, movie_friends_cache_service):
+    cached = MovieFriendsResponse(friends=[], total_count=0)
+    movie_friends_cache_service.get_friends.return_value = MovieFriendsLookup(
+        response=cached,
+        movie_version="m1",
+        user_version=None,
+    )
+
+    assert await service.get_movie_friends(uuid4(), 550) is cached
+    follow_repository.list_friend_movie_activity.assert_not_awaited()
+    movie_friends_cache_service.store_friends.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_movie_friends_read_join_and_store_under_read_versions(
+    service,
+    follow_repository,
+    movie_friends_cache_service,
+):
+    requester_id = uuid4()
+    friend = SimpleNamespace(handle="critic", first_name="Film", last_name="Critic")
+    watched_at = datetime(2026, 3, 1, 20, 0, tzinfo=UTC)
+    lookup = MovieFriendsLookup(response=None, movie_version="m1", user_version="u1")
+    movie_friends_cache_service.get_friends.return_value = lookup
+    follow_repository.list_friend_movie_activity.return_value = FriendMovieActivityPage(
+        items=[FriendMovieActivity(user=friend, last_watched_at=watched_at, log_count=2, rating=9)],
+        total_count=3,
+    )
+
+    response = await service.get_movie_friends(requester_id, 550)
+
+    follow_repository.list_friend_movie_activity.assert_awaited_once_with(requester_id, 550, limit=MAX_MOVIE_FRIENDS)
+    assert response.total_count == 3
+    assert [(item.handle, item.last_watched_at, item.log_count, item.rating) for item in response.friends] == [
+        ("critic", watched_at, 2, 9)
+    ]
+    movie_friends_cache_service.store_friends.assert_awaited_once_with(requester_id, 550, lookup, response)
+
+
+@pytest.mark.asyncio
+async def test_movie_friends_skip_store_when_cache_is_unavailable(
+    service,
+    follow_repository,
+    movie_friends_cache_service,
+):
+    movie_friends_cache_service.get_friends.return_value = None
+    follow_repository.list_friend_movie_activity.return_value = FriendMovieActivityPage(items=[], total_count=0)
+
+    response = await service.get_movie_friends(uuid4(), 550)
+
+    assert response.friends == []
+    movie_friends_cache_service.store_friends.assert_not_awaited()
@@ -0,0 +1,74 @@
+"""Unit tests for offline follow suggestion scoring and serving."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+
+from app.repository.follow_suggestion_repository_protocol import FollowSuggestionItem, ScoredSuggestion
+from app.schemas.user_schemas import FollowSuggestionsRequest
+from app.services.follow_suggestion_service import FollowSuggestionService
+from app.utils.follow_graph_utils import FollowGraphBuilder
+
+
+def _ids(count: int) -> list[UUID]:
+    return [UUID(int=index + 1) for index in range(count)]
+
+
+@pytest.fixture
+def follow_suggestion_repository():
+    repository = AsyncMock()
+    repository.replace_suggestions.side_effect = lambda batch, _computed_at: sum(map(len, batch.values()))
+    repository.delete_suggestions_computed_before.return_value = 4
+    return repository
+
+
+@pytest.fixture
+def service(follow_suggestion_repository):
+    return FollowSuggestionService(follow_suggestion_repository=follow_suggestion_repository)
+
+
+@pytest.mark.asyncio
+async def test_compute_suggestions_writes_batches_and_sweeps_stale_rows(service, follow_suggestion_repository):
+    alice, bob, carol, dave = _ids(4)
+    builder = FollowGraphBuilder([(user_id, True) for user_id in (alice, bob, carol, dave)])
+    builder.add_edges([(alice, bob), (bob, carol), (carol, dave)])
+    follow_suggestion_repository.load_follow_graph.return_value = builder.build()
+
+    result = await service.compute_suggestions(top_k=5, batch_size=1)
+
+    follow_suggestion_repository.load_follow_graph.assert_awaited_once_with(batch_size=1)
+    batches = [call.args[0] for call in follow_suggestion_repository.replace_suggestions.await_args_list]
+    assert batches == [
+        {alice: [ScoredSuggestion(suggested_user_id=carol, mutual_count=1)]},
+        {bob: [ScoredSuggestion(suggested_user_id=dave, mutual_count=1)]},
+        {},
+    ]
+    computed_at = {call.args[1] for call in follow_suggestion_repository.replace_suggestions.await_args_list}
+    assert len(computed_at) == 1
+    follow_suggestion_repository.delete_suggestions_computed_before.assert_awaited_once_with(computed_at.pop())
+    assert (result.users_scored, result.suggestions_written, result.stale_rows_deleted) == (2, 2, 4)
+
+
+@pytest.mark.asyncio
+async def test_compute_suggestions_rejects_non_positive_settings(service, follow_suggestion_repository):
+    with pytest.raises(ValueError):
+        await service.compute_suggestions(top_k=0, batch_size=10)
+    follow_suggestion_repository.load_follow_graph.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_suggestions_maps_stored_rows(service, follow_suggestion_repository):
+    user_id = _ids(1)[0]
+    follow_suggestion_repository.list_suggestions.return_value = [
+        FollowSuggestionItem(
+            user=SimpleNamespace(handle="critic", first_name="Film", last_name="Critic"),
+            mutual_count=3,
+        )
+    ]
+
+    response = await service.get_suggestions(user_id, FollowSuggestionsRequest(limit=5))
+
+    follow_suggestion_repository.list_suggestions.assert_awaited_once_with(user_id, limit=5)
+    assert [(item.handle, item.mutual_count) for item in response.suggestions] == [("critic", 3)]
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import UTC, date, datetime
 from unittest.mock import AsyncMock, MagicMock, Mock
 from uuid import uuid4
 
@@ -25,23 +25,51 @@ def mock_stats_cache_service():
     return AsyncMock()
 
 
+@pytest.fixture
+def mock_movie_stats_cache_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_trending_cache_service():
+    return AsyncMock()
+
+
 @pytest.fixture
 def mock_user_repository():
     return AsyncMock()
 
 
+@pytest.fixture
+def mock_feed_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_movie_friends_cache_service():
+    return AsyncMock()
+
+
 @pytest.fixture
 def log_service(
     mock_log_repository,
     mock_movie_service,
     mock_stats_cache_service,
     mock_user_repository,
+    mock_movie_stats_cache_service,
+    mock_trending_cache_service,
+    mock_feed_service,
+    mock_movie_friends_cache_service,
 ):
     return LogService(
         log_repository=mock_log_repository,
         movie_service=mock_movie_service,
         stats_cache_service=mock_stats_cache_service,
         user_repository=mock_user_repository,
+        movie_stats_cache_service=mock_movie_stats_cache_service,
+        trending_cache_service=mock_trending_cache_service,
+        feed_service=mock_feed_service,
+        movie_friends_cache_service=mock_movie_friends_cache_service,
     )
 
 
@@ -101,8 +129,12 @@ class TestLogService:
         mock_log_repository,
         mock_movie_service,
         mock_stats_cache_service,
+        mock_movie_stats_cache_service,
+        mock_trending_cache_service,
+        mock_feed_service,
+        mock_movie_friends_cache_service,
     ):
-        """Test that creating a log invalidates the stats cache."""
+        """Test that creating a log invalidates stats caches, counts it as trending and fans it out."""
         user_id = uuid4()
         mock_movie = Mock()
         mock_movie.id = uuid4()
@@ -126,12 +158,17 @@ class TestLogService:
         mock_log.viewing_notes = None
         mock_log.poster_path = "/poster.jpg"
         mock_log.watched_where = "cinema"
+        mock_log.created_at = datetime(2024, 1, 15, 20, 0, tzinfo=UTC)
         mock_log_repository.create_log.return_value = mock_log
 
         request = LogCreateRequest(tmdb_id=550, date_watched=date(2024, 1, 15), watched_where="cinema")
         await log_service.create_log(user_id, request)
 
         mock_stats_cache_service.invalidate_user_stats.assert_awaited_once_with(user_id)
+        mock_movie_stats_cache_service.invalidate_movie_stats.assert_awaited_once_with(550)
+        mock_trending_cache_service.record_log_created.assert_awaited_once_with(550, mock_log.created_at)
+        mock_feed_service.publish_log.assert_awaited_once_with(user_id, "log123", mock_log.created_at)
+        mock_movie_friends_cache_service.invalidate_movie.assert_awaited_once_with(550)
 
     @pytest.mark.asyncio
     async def test_create_log_auto_populate_poster(self, log_service, mock_log_repository, mock_movie_service):
@@ -216,8 +253,9 @@ class TestLogService:
         mock_log_repository,
         mock_movie_service,
         mock_stats_cache_service,
+        mock_movie_friends_cache_service,
     ):
-        """Test that updating a log invalidates the stats cache."""
+        """Test that updating a log invalidates the stats and friends-activity caches."""
         user_id = uuid4()
         mock_log = Mock()
         mock_log.id = "log123"
@@ -248,6 +286,7 @@ class TestLogService:
         await log_service.update_log(user_id, log_id, request)
 
         mock_stats_cache_service.invalidate_user_stats.assert_awaited_once_with(user_id)
+        mock_movie_friends_cache_service.invalidate_movie.assert_awaited_once_with(550)
 
     @pytest.mark.asyncio
     async def test_update_log_not_found(self, log_service, mock_log_repository):
@@ -260,16 +299,28 @@ class TestLogService:
             await log_service.update_log("user123", uuid4(), request)
 
     @pytest.mark.asyncio
-    async def test_delete_log_success(self, log_service, mock_log_repository, mock_stats_cache_service):
-        """Test successful log deletion invalidates the stats cache."""
+    async def test_delete_log_success(
+        self,
+        log_service,
+        mock_log_repository,
+        mock_stats_cache_service,
+        mock_movie_stats_cache_service,
+        mock_trending_cache_service,
+        mock_movie_friends_cache_service,
+    ):
+        """Test successful log deletion invalidates stats caches and uncounts it from trending."""
         user_id = uuid4()
         log_id = uuid4()
-        mock_log_repository.delete_log.return_value = MagicMock()
+        created_at = datetime(2024, 1, 15, 20, 0, tzinfo=UTC)
+        mock_log_repository.delete_log.return_value = MagicMock(tmdb_id=550, created_at=created_at)
 
         await log_service.delete_log(user_id=user_id, log_id=log_id)
 
         mock_log_repository.delete_log.assert_awaited_once_with(log_id=log_id, user_id=user_id)
         mock_stats_cache_service.invalidate_user_stats.assert_awaited_once_with(user_id)
+        mock_movie_stats_cache_service.invalidate_movie_stats.assert_awaited_once_with(550)
+        mock_trending_cache_service.record_log_deleted.assert_awaited_once_with(550, created_at)
+        mock_movie_friends_cache_service.invalidate_movie.assert_awaited_once_with(550)
 
     @pytest.mark.asyncio
     async def test_delete_log_not_found_raises(self, log_service, mock_log_repository, mock_stats_cache_service):
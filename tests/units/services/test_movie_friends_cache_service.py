@@ -0,0 +1,146 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.cache_schemas import CachedMovieFriends
+from app.schemas.movie_schemas import MovieFriend, MovieFriendsResponse
+from app.services.movie_friends_cache_service import (
+    MOVIE_FRIENDS_CACHE_TTL,
+    MovieFriendsCacheService,
+    MovieFriendsLookup,
+)
+
+
+@pytest.fixture
+def mock_cache():
+    cache = MagicMock()
+    cache.get_str_many = AsyncMock(return_value=[None, None, None])
+    cache.set_str = AsyncMock()
+    with patch(
+        "app.services.movie_friends_cache_service.CacheService.get_instance",
+        return_value=cache,
+    ):
+        yield cache
+
+
+def _response() -> MovieFriendsResponse:
+    return MovieFriendsResponse(
+        friends=[
+            MovieFriend(
+                handle="critic",
+                first_name="Film",
+                last_name="Critic",
+                last_watched_at=datetime(2026, 3, 1, 20, 0, tzinfo=UTC),
+                log_count=2,
+                rating=9,
+            )
+        ],
+        total_count=1,
+    )
+
+
+def _entry(movie_version: str | None, user_version: str | None) -> str:
+    return CachedMovieFriends(
+        movie_version=movie_version,
+        user_version=user_version,
+        response=_response(),
+    ).model_dump_json()
+
+
+def test_build_keys():
+    user_id = uuid4()
+    assert MovieFriendsCacheService.build_entry_key(user_id, 550) == f"cinelog:movie-friends:{user_id}:550"
+    assert MovieFriendsCacheService.build_movie_version_key(550) == "cinelog:movie-friends:version:movie:550"
+    assert MovieFriendsCacheService.build_user_version_key(user_id) == f"cinelog:movie-friends:version:user:{user_id}"
+
+
+@pytest.mark.asyncio
+async def test_get_friends_returns_entry_read_under_current_versions(mock_cache):
+    user_id = uuid4()
+    mock_cache.get_str_many.return_value = [_entry("m1", None), "m1", None]
+
+    lookup = await MovieFriendsCacheService().get_friends(user_id, 550)
+
+    assert lookup == MovieFriendsLookup(response=_response(), movie_version="m1", user_version=None)
+    mock_cache.get_str_many.assert_awaited_once_with(
+        [
+            f"cinelog:movie-friends:{user_id}:550",
+            "cinelog:movie-friends:version:movie:550",
+            f"cinelog:movie-friends:version:user:{user_id}",
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    ("movie_version", "user_version"),
+    [("m2", "u1"), ("m1", "u2"), ("m1", None), (None, "u1")],
+)
+@pytest.mark.asyncio
+async def test_get_friends_ignores_entry_after_a_version_changes(mock_cache, movie_version, user_version):
+    mock_cache.get_str_many.return_value = [_entry("m1", "u1"), movie_version, user_version]
+
+    lookup = await MovieFriendsCacheService().get_friends(uuid4(), 550)
+
+    assert lookup == MovieFriendsLookup(response=None, movie_version=movie_version, user_version=user_version)
+
+
+@pytest.mark.asyncio
+async def test_get_friends_discards_unreadable_entry(mock_cache):
+    mock_cache.get_str_many.return_value = ["not json", None, None]
+
+    lookup = await MovieFriendsCacheService().get_friends(uuid4(), 550)
+
+    assert lookup == MovieFriendsLookup(response=None, movie_version=None, user_version=None)
+
+
+@pytest.mark.asyncio
+async def test_get_friends_returns_none_on_redis_error(mock_cache):
+    mock_cache.get_str_many.side_effect = ConnectionError("down")
+
+    assert await MovieFriendsCacheService().get_friends(uuid4(), 550) is None
+
+
+@pytest.mark.asyncio
+async def test_store_friends_records_lookup_versions(mock_cache):
+    user_id = uuid4()
+    lookup = MovieFriendsLookup(response=None, movie_version="m1", user_version="u1")
+
+    await MovieFriendsCacheService().store_friends(user_id, 550, lookup, _response())
+
+    mock_cache.set_str.assert_awaited_once_with(
+        f"cinelog:movie-friends:{user_id}:550",
+        _entry("m1", "u1"),
+        MOVIE_FRIENDS_CACHE_TTL,
+    )
+
+
+@pytest.mark.asyncio
+async def test_invalidations_replace_version_tokens(mock_cache):
+    user_id = uuid4()
+    service = MovieFriendsCacheService()
+
+    await service.invalidate_movie(550)
+    await service.invalidate_movie(550)
+    await service.invalidate_user(user_id)
+
+    calls = mock_cache.set_str.await_args_list
+    assert [call.args[0] for call in calls] == [
+        "cinelog:movie-friends:version:movie:550",
+        "cinelog:movie-friends:version:movie:550",
+        f"cinelog:movie-friends:version:user:{user_id}",
+    ]
+    assert calls[0].args[1] != calls[1].args[1]
+    assert all(call.args[2] == MOVIE_FRIENDS_CACHE_TTL for call in calls)
+
+
+@pytest.mark.asyncio
+async def test_write_errors_are_logged_not_raised(mock_cache):
+    mock_cache.set_str.side_effect = ConnectionError("down")
+    service = MovieFriendsCacheService()
+    lookup = MovieFriendsLookup(response=None, movie_version=None, user_version=None)
+
+    await service.store_friends(uuid4(), 550, lookup, _response())
+    await service.invalidate_movie(550)
+    await service.invalidate_user(uuid4())
@@ -22,16 +22,30 @@ def mock_stats_cache_service():
     return AsyncMock()
 
 
+@pytest.fixture
+def mock_movie_stats_cache_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_movie_friends_cache_service():
+    return AsyncMock()
+
+
 @pytest.fixture
 def movie_rating_service(
     mock_movie_rating_repository,
     mock_movie_service,
     mock_stats_cache_service,
+    mock_movie_stats_cache_service,
+    mock_movie_friends_cache_service,
 ):
     return MovieRatingService(
         movie_rating_repository=mock_movie_rating_repository,
         movie_service=mock_movie_service,
         stats_cache_service=mock_stats_cache_service,
+        movie_stats_cache_service=mock_movie_stats_cache_service,
+        movie_friends_cache_service=mock_movie_friends_cache_service,
     )
 
 
@@ -91,8 +105,10 @@ class TestMovieRatingService:
         mock_movie_rating_repository,
         mock_movie_service,
         mock_stats_cache_service,
+        mock_movie_stats_cache_service,
+        mock_movie_friends_cache_service,
     ):
-        """Test that creating/updating a rating invalidates the stats cache."""
+        """Test that creating/updating a rating invalidates the user and movie stats caches."""
         user_id = uuid4()
         mock_movie = Mock()
         mock_movie.id = uuid4()
@@ -112,6 +128,8 @@ class TestMovieRatingService:
         await movie_rating_service.create_update_movie_rating(user_id=user_id, tmdb_id=550, rating=8, comment="Great!")
 
         mock_stats_cache_service.invalidate_user_stats.assert_awaited_once_with(user_id)
+        mock_movie_stats_cache_service.invalidate_movie_stats.assert_awaited_once_with(550)
+        mock_movie_friends_cache_service.invalidate_movie.assert_awaited_once_with(550)
 
     @pytest.mark.asyncio
     async def test_get_movie_rating_found(self, movie_rating_service, mock_movie_rating_repository):
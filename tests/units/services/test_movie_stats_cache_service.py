@@ -0,0 +1,64 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.schemas.movie_schemas import MovieStats
+from app.services.movie_stats_cache_service import MOVIE_STATS_CACHE_TTL, MovieStatsCacheService
+
+
+@pytest.fixture
+def mock_cache():
+    cache = MagicMock()
+    cache.get = AsyncMock(return_value=None)
+    cache.set = AsyncMock(return_value=True)
+    cache.delete_many = AsyncMock(return_value=1)
+    with patch(
+        "app.services.movie_stats_cache_service.CacheService.get_instance",
+        return_value=cache,
+    ):
+        yield cache
+
+
+def test_build_key():
+    assert MovieStatsCacheService.build_key(550) == "cinelog:movie-stats:550"
+
+
+@pytest.mark.asyncio
+async def test_get_movie_stats_miss_returns_none(mock_cache):
+    assert await MovieStatsCacheService().get_movie_stats(550) is None
+    mock_cache.get.assert_awaited_once_with("cinelog:movie-stats:550")
+
+
+@pytest.mark.asyncio
+async def test_get_movie_stats_hit_returns_schema(mock_cache):
+    stats = MovieStats(log_count=3, watcher_count=2, rating_count=1, rating_average=9.0)
+    mock_cache.get.return_value = stats.model_dump(mode="json")
+
+    assert await MovieStatsCacheService().get_movie_stats(550) == stats
+
+
+@pytest.mark.asyncio
+async def test_set_movie_stats_uses_ttl(mock_cache):
+    stats = MovieStats(log_count=1, watcher_count=1)
+
+    await MovieStatsCacheService().set_movie_stats(550, stats)
+
+    mock_cache.set.assert_awaited_once_with(
+        "cinelog:movie-stats:550",
+        stats.model_dump(mode="json"),
+        ttl=MOVIE_STATS_CACHE_TTL,
+    )
+
+
+@pytest.mark.asyncio
+async def test_invalidate_movie_stats_deletes_every_key(mock_cache):
+    await MovieStatsCacheService().invalidate_movie_stats(550, 551)
+
+    mock_cache.delete_many.assert_awaited_once_with(["cinelog:movie-stats:550", "cinelog:movie-stats:551"])
+
+
+@pytest.mark.asyncio
+async def test_invalidate_movie_stats_without_ids_is_noop(mock_cache):
+    await MovieStatsCacheService().invalidate_movie_stats()
+
+    mock_cache.delete_many.assert_not_called()
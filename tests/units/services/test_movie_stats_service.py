@@ -0,0 +1,108 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.models.movie_community_stats_model import MovieCommunityStats
+from app.repository.movie_stats_repository_protocol import MovieStatsReconcileResult
+from app.schemas.movie_schemas import MovieStats
+from app.services.movie_stats_service import MovieStatsService
+
+
+@pytest.fixture
+def mock_movie_stats_repository():
+    repository = AsyncMock()
+    repository.find_movie_stats_by_tmdb_id.return_value = None
+    return repository
+
+
+@pytest.fixture
+def mock_movie_stats_cache_service():
+    cache = AsyncMock()
+    cache.get_movie_stats.return_value = None
+    return cache
+
+
+@pytest.fixture
+def movie_stats_service(mock_movie_stats_repository, mock_movie_stats_cache_service):
+    return MovieStatsService(
+        movie_stats_repository=mock_movie_stats_repository,
+        movie_stats_cache_service=mock_movie_stats_cache_service,
+    )
+
+
+def _counters(**overrides) -> MovieCommunityStats:
+    values = {
+        "movie_id": uuid4(),
+        "tmdb_id": 550,
+        "log_count": 5,
+        "watcher_count": 4,
+        "rating_count": 3,
+        "rating_sum": 22,
+        **{f"rating_{rating}_count": 0 for rating in range(1, 11)},
+    }
+    values.update(rating_6_count=1, rating_8_count=2)
+    values.update(overrides)
+    return MovieCommunityStats(**values)
+
+
+@pytest.mark.asyncio
+async def test_get_movie_stats_returns_cached_value(
+    movie_stats_service,
+    mock_movie_stats_repository,
+    mock_movie_stats_cache_service,
+):
+    cached = MovieStats(log_count=9)
+    mock_movie_stats_cache_service.get_movie_stats.return_value = cached
+
+    assert await movie_stats_service.get_movie_stats(550) is cached
+    mock_movie_stats_repository.find_movie_stats_by_tmdb_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_movie_stats_maps_counters_and_caches(
+    movie_stats_service,
+    mock_movie_stats_repository,
+    mock_movie_stats_cache_service,
+):
+    mock_movie_stats_repository.find_movie_stats_by_tmdb_id.return_value = _counters()
+
+    result = await movie_stats_service.get_movie_stats(550)
+
+    assert result == MovieStats(
+        log_count=5,
+        watcher_count=4,
+        rating_count=3,
+        rating_average=7.33,
+        rating_histogram=[0, 0, 0, 0, 0, 1, 0, 2, 0, 0],
+    )
+    mock_movie_stats_cache_service.set_movie_stats.assert_awaited_once_with(550, result)
+
+
+@pytest.mark.asyncio
+async def test_get_movie_stats_defaults_to_zeroes_without_activity(
+    movie_stats_service,
+    mock_movie_stats_cache_service,
+):
+    result = await movie_stats_service.get_movie_stats(550)
+
+    assert result == MovieStats()
+    assert result.rating_average is None
+    assert result.rating_histogram == [0] * 10
+    mock_movie_stats_cache_service.set_movie_stats.assert_awaited_once_with(550, result)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_movie_stats_invalidates_corrected_movies(
+    movie_stats_service,
+    mock_movie_stats_repository,
+    mock_movie_stats_cache_service,
+):
+    reconcile_result = MovieStatsReconcileResult(movies_scanned=10, rows_corrected=2, corrected_tmdb_ids=[550, 551])
+    mock_movie_stats_repository.reconcile_movie_stats.return_value = reconcile_result
+
+    result = await movie_stats_service.reconcile_movie_stats(batch_size=50)
+
+    assert result is reconcile_result
+    mock_movie_stats_repository.reconcile_movie_stats.assert_awaited_once_with(batch_size=50)
+    mock_movie_stats_cache_service.invalidate_movie_stats.assert_awaited_once_with(550, 551)
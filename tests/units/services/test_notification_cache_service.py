@@ -0,0 +1,109 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.services.notification_cache_service import NOTIFICATION_UNREAD_COUNT_TTL, NotificationCacheService
+
+
+@pytest.fixture
+def mock_cache():
+    cache = MagicMock()
+    cache.get_int = AsyncMock(return_value=None)
+    cache.set_int_if_absent = AsyncMock(return_value=True)
+    cache.incrby_if_exists = AsyncMock(return_value=None)
+    cache.incrby_if_exists_many = AsyncMock(return_value=[])
+    with patch(
+        "app.services.notification_cache_service.CacheService.get_instance",
+        return_value=cache,
+    ):
+        yield cache
+
+
+def test_build_unread_count_key():
+    recipient_id = uuid4()
+    assert NotificationCacheService.build_unread_count_key(recipient_id) == (
+        f"cinelog:notifications:unread:{recipient_id}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_unread_count_hit_and_miss(mock_cache):
+    recipient_id = uuid4()
+    service = NotificationCacheService()
+
+    assert await service.get_unread_count(recipient_id) is None
+
+    mock_cache.get_int.return_value = 3
+    assert await service.get_unread_count(recipient_id) == 3
+    mock_cache.get_int.assert_awaited_with(f"cinelog:notifications:unread:{recipient_id}")
+
+
+@pytest.mark.asyncio
+async def test_get_unread_count_treats_redis_errors_as_miss(mock_cache):
+    mock_cache.get_int.side_effect = ConnectionError("down")
+
+    assert await NotificationCacheService().get_unread_count(uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_seed_unread_count_never_overwrites_existing_counter(mock_cache):
+    recipient_id = uuid4()
+
+    await NotificationCacheService().seed_unread_count(recipient_id, 5)
+
+    mock_cache.set_int_if_absent.assert_awaited_once_with(
+        f"cinelog:notifications:unread:{recipient_id}",
+        5,
+        NOTIFICATION_UNREAD_COUNT_TTL,
+    )
+
+
+@pytest.mark.asyncio
+async def test_adjust_unread_count_only_touches_existing_counter(mock_cache):
+    recipient_id = uuid4()
+    mock_cache.incrby_if_exists.return_value = 2
+
+    assert await NotificationCacheService().adjust_unread_count(recipient_id, -1) == 2
+    mock_cache.incrby_if_exists.assert_awaited_once_with(f"cinelog:notifications:unread:{recipient_id}", -1)
+
+
+@pytest.mark.asyncio
+async def test_adjust_unread_count_by_zero_reads_counter(mock_cache):
+    mock_cache.get_int.return_value = 4
+
+    assert await NotificationCacheService().adjust_unread_count(uuid4(), 0) == 4
+    mock_cache.incrby_if_exists.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_adjust_unread_count_fails_open(mock_cache):
+    mock_cache.incrby_if_exists.side_effect = ConnectionError("down")
+
+    assert await NotificationCacheService().adjust_unread_count(uuid4(), 1) is None
+
+
+@pytest.mark.asyncio
+async def test_increment_unread_counts_pipelines_existing_counters(mock_cache):
+    cached, uncached = uuid4(), uuid4()
+    mock_cache.incrby_if_exists_many.return_value = [4, None]
+
+    counts = await NotificationCacheService().increment_unread_counts([cached, uncached])
+
+    assert counts == {cached: 4, uncached: None}
+    mock_cache.incrby_if_exists_many.assert_awaited_once_with(
+        [
+            NotificationCacheService.build_unread_count_key(cached),
+            NotificationCacheService.build_unread_count_key(uncached),
+        ],
+        1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_increment_unread_counts_fails_open(mock_cache):
+    recipient_id = uuid4()
+    mock_cache.incrby_if_exists_many.side_effect = ConnectionError("down")
+
+    assert await NotificationCacheService().increment_unread_counts([recipient_id]) == {recipient_id: None}
+    assert await NotificationCacheService().increment_unread_counts([]) == {}
@@ -0,0 +1,61 @@
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.notification_schemas import NotificationFanOutData
+from app.services.notification_fanout_queue import (
+    NOTIFICATION_FANOUT_QUEUE_KEY,
+    NotificationFanOutJob,
+    NotificationFanOutQueue,
+)
+from app.types import NotificationType
+
+
+@pytest.fixture
+def mock_cache():
+    cache = MagicMock()
+    cache.rpush = AsyncMock(return_value=1)
+    cache.blpop = AsyncMock(return_value=None)
+    with patch(
+        "app.services.notification_fanout_queue.CacheService.get_instance",
+        return_value=cache,
+    ):
+        yield cache
+
+
+def _data() -> NotificationFanOutData:
+    return NotificationFanOutData(
+        actor_id=uuid4(),
+        type=NotificationType.FOLLOW_STARTED,
+        title="Title",
+        body="Body",
+        deduplication_key="post:1",
+    )
+
+
+@pytest.mark.asyncio
+async def test_enqueue_then_dequeue_round_trips_the_job(mock_cache):
+    job = NotificationFanOutJob(data=_data(), attempt=2)
+    queue = NotificationFanOutQueue()
+
+    await queue.enqueue(job)
+    key, message = mock_cache.rpush.await_args.args
+    mock_cache.blpop.return_value = message
+
+    assert key == NOTIFICATION_FANOUT_QUEUE_KEY
+    assert json.loads(message)["data"]["deduplicationKey"] == "post:1"
+    assert await queue.dequeue(5) == job
+    mock_cache.blpop.assert_awaited_once_with(NOTIFICATION_FANOUT_QUEUE_KEY, 5)
+
+
+@pytest.mark.asyncio
+async def test_dequeue_returns_none_when_idle_or_malformed(mock_cache):
+    queue = NotificationFanOutQueue()
+
+    assert await queue.dequeue(1) is None
+    mock_cache.blpop.return_value = "not json"
+    assert await queue.dequeue(1) is None
+    mock_cache.blpop.return_value = json.dumps({"attempt": 1, "data": {"title": "missing fields"}})
+    assert await queue.dequeue(1) is None
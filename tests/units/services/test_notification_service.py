@@ -1,24 +1,32 @@
 """Unit tests for notification inbox business logic."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
-from app.config.notification_config import notification_list_cursor_scope
+from app.config.notification_config import (
+    notification_list_cursor_scope,
+    notification_stream_cursor_scope,
+)
 from app.repository.notification_repository_protocol import (
     MarkAllNotificationsReadResult,
+    MarkNotificationReadResult,
     NotificationCreateResult,
+    NotificationFanOutBatch,
     NotificationPage,
 )
 from app.schemas.notification_schemas import (
     NotificationCreateData,
+    NotificationFanOutData,
     NotificationListRequest,
 )
+from app.services.notification_fanout_queue import NotificationFanOutJob
 from app.services.notification_service import NotificationService
-from app.types import NotificationType, TimestampUUIDCursor
+from app.services.notification_stream_service import NotificationStreamEvent, NotificationSubscription
+from app.types import NotificationStreamEventType, NotificationType, TimestampUUIDCursor
 from app.utils.cursor_pagination_utils import (
     decode_timestamp_uuid_cursor,
     encode_timestamp_uuid_cursor,
@@ -27,9 +35,13 @@ from app.utils.error_codes_utils import ErrorCodes
 from app.utils.exceptions_utils import AppException
 
 
-def _notification(*, actor=None, read_at=None):
+def _notification(*, actor=None, read_at=None, recipient_id=None, sample_actors=()):
     return SimpleNamespace(
         id=uuid4(),
+        recipient_id=recipient_id or uuid4(),
+        actor_count=max(len(sample_actors), 1),
+        sample_actor_ids=[sample_actor.id for sample_actor in sample_actors],
+        sample_actors=list(reversed(sample_actors)),
         type=NotificationType.FOLLOW_STARTED.value,
         title="Title",
         body="Body",
@@ -45,14 +57,58 @@ def repository():
 
 
 @pytest.fixture
-def service(repository):
-    return NotificationService(repository=repository)
+def notification_cache_service():
+    cache_service = AsyncMock()
+    cache_service.get_unread_count.return_value = 0
+    cache_service.adjust_unread_count.return_value = None
+    return cache_service
+
+
+@pytest.fixture
+def subscription():
+    return NotificationSubscription(uuid4())
+
+
+@pytest.fixture
+def notification_stream_hub(subscription):
+    hub = MagicMock()
+    hub.publish = AsyncMock()
+    hub.publish_many = AsyncMock()
+    hub.subscribe = AsyncMock(return_value=subscription)
+    return hub
+
+
+@pytest.fixture
+def notification_fanout_queue():
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(repository, notification_cache_service, notification_stream_hub, notification_fanout_queue):
+    return NotificationService(
+        repository=repository,
+        notification_cache_service=notification_cache_service,
+        notification_stream_hub=notification_stream_hub,
+        notification_fanout_queue=notification_fanout_queue,
+    )
+
+
+async def _collect(frames, count: int) -> list[str]:
+    return [await anext(frames) for _ in range(count)]
+
+
+def _stream_id(recipient_id, notification) -> str:
+    return encode_timestamp_uuid_cursor(
+        TimestampUUIDCursor(timestamp=notification.created_at, id=notification.id),
+        scope=notification_stream_cursor_scope(recipient_id),
+    )
 
 
 @pytest.mark.asyncio
 async def test_list_notifications_decodes_cursor_assembles_page_and_encodes_next_cursor(
     service: NotificationService,
     repository: AsyncMock,
+    notification_cache_service: AsyncMock,
 ):
     recipient_id = uuid4()
     prior_cursor = TimestampUUIDCursor(timestamp=datetime(2026, 7, 18, 11, 0, tzinfo=UTC), id=uuid4())
@@ -64,8 +120,9 @@ async def test_list_notifications_decodes_cursor_assembles_page_and_encodes_next
     )
     first = _notification()
     second = _notification()
-    page = NotificationPage(items=[first, second], has_more=True, unread_count=9)
+    page = NotificationPage(items=[first, second], has_more=True)
     repository.list_notifications.return_value = page
+    notification_cache_service.get_unread_count.return_value = 9
 
     response = await service.list_notifications(recipient_id, request)
 
@@ -74,11 +131,13 @@ async def test_list_notifications_decodes_cursor_assembles_page_and_encodes_next
         unread_only=True,
         limit=2,
         cursor=prior_cursor,
+        count_unread=False,
     )
     assert [item.id for item in response.items] == [first.id, second.id]
     assert all(item.type is NotificationType.FOLLOW_STARTED for item in response.items)
     assert all(item.available_actions == [] for item in response.items)
     assert response.unread_count == 9
+    repository.count_unread_notifications.assert_not_awaited()
     assert response.next_cursor is not None
     assert decode_timestamp_uuid_cursor(
         response.next_cursor,
@@ -89,6 +148,24 @@ async def test_list_notifications_decodes_cursor_assembles_page_and_encodes_next
     )
 
 
+@pytest.mark.asyncio
+async def test_list_notifications_counts_unread_rows_in_the_page_query_on_a_cache_miss(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+):
+    recipient_id = uuid4()
+    notification_cache_service.get_unread_count.return_value = None
+    repository.list_notifications.return_value = NotificationPage(items=[], has_more=False, unread_count=4)
+
+    response = await service.list_notifications(recipient_id, NotificationListRequest())
+
+    assert repository.list_notifications.await_args.kwargs["count_unread"] is True
+    assert response.unread_count == 4
+    notification_cache_service.seed_unread_count.assert_awaited_once_with(recipient_id, 4)
+    repository.count_unread_notifications.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_list_notifications_omits_cursor_when_page_has_no_more_rows(
     service: NotificationService,
@@ -96,7 +173,7 @@ async def test_list_notifications_omits_cursor_when_page_has_no_more_rows(
 ):
     recipient_id = uuid4()
     item = _notification()
-    repository.list_notifications.return_value = NotificationPage(items=[item], has_more=False, unread_count=1)
+    repository.list_notifications.return_value = NotificationPage(items=[item], has_more=False)
 
     response = await service.list_notifications(recipient_id, NotificationListRequest())
 
@@ -115,7 +192,6 @@ async def test_list_notifications_maps_active_actor_and_hides_deleted_actor(
     repository.list_notifications.return_value = NotificationPage(
         items=[active_notification, deleted_notification],
         has_more=False,
-        unread_count=2,
     )
 
     response = await service.list_notifications(uuid4(), NotificationListRequest())
@@ -125,6 +201,24 @@ async def test_list_notifications_maps_active_actor_and_hides_deleted_actor(
     assert response.items[1].actor is None
 
 
+@pytest.mark.asyncio
+async def test_list_notifications_orders_sample_actors_most_recent_first_and_hides_deleted(
+    service: NotificationService,
+    repository: AsyncMock,
+):
+    newest, gone, oldest = (
+        SimpleNamespace(id=uuid4(), handle=handle, first_name="F", last_name="L", deleted=handle == "gone")
+        for handle in ("newest", "gone", "oldest")
+    )
+    aggregate = _notification(actor=newest, sample_actors=(newest, gone, oldest))
+    repository.list_notifications.return_value = NotificationPage(items=[aggregate], has_more=False)
+
+    response = await service.list_notifications(uuid4(), NotificationListRequest())
+
+    assert response.items[0].actor_count == 3
+    assert [summary.handle for summary in response.items[0].sample_actors] == ["newest", "oldest"]
+
+
 @pytest.mark.asyncio
 async def test_list_notifications_rejects_a_cursor_signed_for_another_recipient(
     service: NotificationService,
@@ -160,6 +254,7 @@ async def test_list_notifications_rejects_a_malformed_cursor_with_the_api_error_
 async def test_create_notification_delegates_typed_internal_input(
     service: NotificationService,
     repository: AsyncMock,
+    notification_cache_service: AsyncMock,
 ):
     data = NotificationCreateData(
         recipient_id=uuid4(),
@@ -172,16 +267,70 @@ async def test_create_notification_delegates_typed_internal_input(
 
     assert await service.create_notification(data) is expected
     repository.create_notification.assert_awaited_once_with(data)
+    notification_cache_service.adjust_unread_count.assert_awaited_once_with(data.recipient_id, 1)
+
+
+@pytest.mark.asyncio
+async def test_create_notification_leaves_counter_alone_for_duplicates(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+):
+    data = NotificationCreateData(
+        recipient_id=uuid4(),
+        type=NotificationType.FOLLOW_STARTED,
+        title="Title",
+        body="Body",
+        deduplication_key="follow:1",
+    )
+    repository.create_notification.return_value = NotificationCreateResult(notification=_notification(), created=False)
+
+    await service.create_notification(data)
+
+    notification_cache_service.adjust_unread_count.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_unread_count_serves_warm_counter_without_postgres(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+):
+    notification_cache_service.get_unread_count.return_value = 4
+
+    response = await service.get_unread_count(uuid4())
+
+    assert response.unread_count == 4
+    repository.count_unread_notifications.assert_not_awaited()
+    notification_cache_service.seed_unread_count.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_unread_count_rebuilds_counter_on_miss(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+):
+    recipient_id = uuid4()
+    notification_cache_service.get_unread_count.return_value = None
+    repository.count_unread_notifications.return_value = 6
+
+    response = await service.get_unread_count(recipient_id)
+
+    assert response.unread_count == 6
+    repository.count_unread_notifications.assert_awaited_once_with(recipient_id)
+    notification_cache_service.seed_unread_count.assert_awaited_once_with(recipient_id, 6)
 
 
 @pytest.mark.asyncio
 async def test_mark_notification_read_returns_mapped_response(
     service: NotificationService,
     repository: AsyncMock,
+    notification_cache_service: AsyncMock,
 ):
     recipient_id = uuid4()
     notification = _notification(read_at=datetime.now(UTC))
-    repository.mark_notification_read.return_value = notification
+    repository.mark_notification_read.return_value = MarkNotificationReadResult(notification=notification, updated=True)
 
     response = await service.mark_notification_read(notification.id, recipient_id)
 
@@ -189,6 +338,23 @@ async def test_mark_notification_read_returns_mapped_response(
     assert response.type is NotificationType.FOLLOW_STARTED
     assert response.read_at == notification.read_at
     assert response.available_actions == []
+    notification_cache_service.adjust_unread_count.assert_awaited_once_with(recipient_id, -1)
+
+
+@pytest.mark.asyncio
+async def test_mark_notification_read_repeat_leaves_counter_alone(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+):
+    notification = _notification(read_at=datetime.now(UTC))
+    repository.mark_notification_read.return_value = MarkNotificationReadResult(
+        notification=notification, updated=False
+    )
+
+    await service.mark_notification_read(notification.id, uuid4())
+
+    notification_cache_service.adjust_unread_count.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -196,7 +362,7 @@ async def test_mark_notification_read_hides_missing_or_foreign_rows(
     service: NotificationService,
     repository: AsyncMock,
 ):
-    repository.mark_notification_read.return_value = None
+    repository.mark_notification_read.return_value = MarkNotificationReadResult(notification=None, updated=False)
 
     with pytest.raises(AppException) as exc_info:
         await service.mark_notification_read(uuid4(), uuid4())
@@ -205,16 +371,344 @@ async def test_mark_notification_read_hides_missing_or_foreign_rows(
 
 
 @pytest.mark.asyncio
-async def test_mark_all_notifications_read_maps_repository_result(
+async def test_mark_all_notifications_read_decrements_cached_counter(
     service: NotificationService,
     repository: AsyncMock,
+    notification_cache_service: AsyncMock,
 ):
-    repository.mark_all_notifications_read.return_value = MarkAllNotificationsReadResult(
-        updated_count=4,
-        unread_count=1,
-    )
+    recipient_id = uuid4()
+    repository.mark_all_notifications_read.return_value = MarkAllNotificationsReadResult(updated_count=4)
+    notification_cache_service.adjust_unread_count.return_value = 1
 
-    response = await service.mark_all_notifications_read(uuid4())
+    response = await service.mark_all_notifications_read(recipient_id)
 
     assert response.updated_count == 4
     assert response.unread_count == 1
+    notification_cache_service.adjust_unread_count.assert_awaited_once_with(recipient_id, -4)
+    repository.count_unread_notifications.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_mark_all_notifications_read_rebuilds_missing_counter(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+):
+    recipient_id = uuid4()
+    repository.mark_all_notifications_read.return_value = MarkAllNotificationsReadResult(updated_count=2)
+    notification_cache_service.get_unread_count.return_value = None
+    repository.count_unread_notifications.return_value = 0
+
+    response = await service.mark_all_notifications_read(recipient_id)
+
+    assert response.unread_count == 0
+    notification_cache_service.seed_unread_count.assert_awaited_once_with(recipient_id, 0)
+
+
+@pytest.mark.asyncio
+async def test_create_notification_publishes_created_and_unread_count_events(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+    notification_stream_hub: MagicMock,
+):
+    recipient_id = uuid4()
+    notification = _notification()
+    repository.create_notification.return_value = NotificationCreateResult(notification=notification, created=True)
+    notification_cache_service.adjust_unread_count.return_value = 3
+
+    await service.create_notification(
+        NotificationCreateData(recipient_id=recipient_id, type=NotificationType.FOLLOW_STARTED, title="T", body="B")
+    )
+
+    published_recipient, created, unread = notification_stream_hub.publish.await_args.args
+    assert published_recipient == recipient_id
+    assert created.type is NotificationStreamEventType.CREATED
+    assert created.id == _stream_id(recipient_id, notification)
+    assert created.data["id"] == str(notification.id)
+    assert created.data["availableActions"] == []
+    assert unread == NotificationStreamEvent(
+        type=NotificationStreamEventType.UNREAD_COUNT,
+        data={"unreadCount": 3},
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_notification_publishes_update_when_an_aggregate_absorbs_the_event(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+    notification_stream_hub: MagicMock,
+):
+    recipient_id = uuid4()
+    notification = _notification()
+    repository.create_notification.return_value = NotificationCreateResult(
+        notification=notification,
+        created=False,
+        aggregated=True,
+    )
+
+    await service.create_notification(
+        NotificationCreateData(
+            recipient_id=recipient_id,
+            actor_id=uuid4(),
+            type=NotificationType.FOLLOW_STARTED,
+            title="T",
+            body="B",
+            aggregation_key="follow.started",
+        )
+    )
+
+    notification_cache_service.adjust_unread_count.assert_not_awaited()
+    published_recipient, updated = notification_stream_hub.publish.await_args.args
+    assert published_recipient == recipient_id
+    assert updated.type is NotificationStreamEventType.UPDATED
+    assert updated.id is None
+    assert updated.data["id"] == str(notification.id)
+    assert updated.data["actorCount"] == 1
+
+
+@pytest.mark.asyncio
+async def test_mark_notification_read_publishes_read_event_only_on_transition(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+    notification_stream_hub: MagicMock,
+):
+    recipient_id = uuid4()
+    notification = _notification(read_at=datetime(2026, 7, 18, 11, 0, tzinfo=UTC))
+    repository.mark_notification_read.return_value = MarkNotificationReadResult(notification=notification, updated=True)
+    notification_cache_service.adjust_unread_count.return_value = 0
+
+    await service.mark_notification_read(notification.id, recipient_id)
+
+    _, read, unread = notification_stream_hub.publish.await_args.args
+    assert read.type is NotificationStreamEventType.READ
+    assert read.data == {"id": str(notification.id), "readAt": "2026-07-18T11:00:00Z"}
+    assert unread.data == {"unreadCount": 0}
+
+    notification_stream_hub.publish.reset_mock()
+    repository.mark_notification_read.return_value = MarkNotificationReadResult(
+        notification=notification, updated=False
+    )
+    await service.mark_notification_read(notification.id, recipient_id)
+    notification_stream_hub.publish.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_mark_all_notifications_read_publishes_only_when_rows_changed(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+    notification_stream_hub: MagicMock,
+):
+    recipient_id = uuid4()
+    repository.mark_all_notifications_read.return_value = MarkAllNotificationsReadResult(updated_count=0)
+
+    await service.mark_all_notifications_read(recipient_id)
+    notification_stream_hub.publish.assert_not_awaited()
+
+    repository.mark_all_notifications_read.return_value = MarkAllNotificationsReadResult(updated_count=2)
+    notification_cache_service.adjust_unread_count.return_value = 0
+    await service.mark_all_notifications_read(recipient_id)
+
+    _, read_all, unread = notification_stream_hub.publish.await_args.args
+    assert read_all.type is NotificationStreamEventType.READ_ALL
+    assert read_all.data == {"updatedCount": 2}
+    assert unread.data == {"unreadCount": 0}
+
+
+@pytest.mark.asyncio
+async def test_open_notification_stream_sends_count_then_live_events_and_heartbeats(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+    notification_stream_hub: MagicMock,
+    subscription: NotificationSubscription,
+):
+    recipient_id = uuid4()
+    notification_cache_service.get_unread_count.return_value = 2
+
+    with patch("app.services.notification_service.NOTIFICATION_STREAM_HEARTBEAT_SECONDS", 0.01):
+        frames = await service.open_notification_stream(recipient_id)
+        opening = await _collect(frames, 2)
+        heartbeat = await anext(frames)
+        subscription.offer(
+            NotificationStreamEvent(type=NotificationStreamEventType.UNREAD_COUNT, data={"unreadCount": 3})
+        )
+        live = await anext(frames)
+
+    assert opening == [
+        "retry: 3000\n\n",
+        'event: notification.unread_count\ndata: {"unreadCount":2}\n\n',
+    ]
+    assert heartbeat == ": heartbeat\n\n"
+    assert live == 'event: notification.unread_count\ndata: {"unreadCount":3}\n\n'
+    notification_stream_hub.subscribe.assert_awaited_once_with(recipient_id)
+    repository.list_notifications_after.assert_not_awaited()
+    await frames.aclose()
+    notification_stream_hub.unsubscribe.assert_called_once_with(subscription)
+
+
+@pytest.mark.asyncio
+async def test_open_notification_stream_replays_after_last_event_id_and_skips_duplicates(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+    notification_stream_hub: MagicMock,
+    subscription: NotificationSubscription,
+):
+    recipient_id = uuid4()
+    seen = _notification()
+    missed = _notification()
+    repository.list_notifications_after.return_value = NotificationPage(items=[missed], has_more=True)
+
+    frames = await service.open_notification_stream(recipient_id, _stream_id(recipient_id, seen))
+    opening = await _collect(frames, 4)
+    subscription.offer(
+        NotificationStreamEvent(type=NotificationStreamEventType.CREATED, data={}, id=_stream_id(recipient_id, missed))
+    )
+    subscription.close()
+    remaining = [frame async for frame in frames]
+
+    repository.list_notifications_after.assert_awaited_once_with(
+        recipient_id,
+        cursor=TimestampUUIDCursor(timestamp=seen.created_at, id=seen.id),
+        limit=100,
+    )
+    assert opening[1].startswith(f"id: {_stream_id(recipient_id, missed)}\nevent: notification.created\n")
+    assert opening[2] == "event: notification.resync\ndata: {}\n\n"
+    assert opening[3] == 'event: notification.unread_count\ndata: {"unreadCount":0}\n\n'
+    assert remaining == []
+    notification_stream_hub.unsubscribe.assert_called_once_with(subscription)
+
+
+@pytest.mark.asyncio
+async def test_open_notification_stream_rejects_foreign_last_event_id_before_subscribing(
+    service: NotificationService,
+    notification_stream_hub: MagicMock,
+):
+    recipient_id = uuid4()
+    list_cursor = encode_timestamp_uuid_cursor(
+        TimestampUUIDCursor(timestamp=datetime(2026, 7, 18, 10, 0, tzinfo=UTC), id=uuid4()),
+        scope=notification_list_cursor_scope(recipient_id),
+    )
+
+    with pytest.raises(AppException) as exc_info:
+        await service.open_notification_stream(recipient_id, list_cursor)
+
+    assert exc_info.value.error is ErrorCodes.INVALID_PAGINATION_CURSOR
+    notification_stream_hub.subscribe.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_open_notification_stream_unsubscribes_when_setup_fails(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+    notification_stream_hub: MagicMock,
+    subscription: NotificationSubscription,
+):
+    notification_cache_service.get_unread_count.return_value = None
+    repository.count_unread_notifications.side_effect = RuntimeError("database down")
+
+    with pytest.raises(RuntimeError):
+        await service.open_notification_stream(uuid4())
+
+    notification_stream_hub.unsubscribe.assert_called_once_with(subscription)
+
+
+def _fan_out_data() -> NotificationFanOutData:
+    return NotificationFanOutData(
+        actor_id=uuid4(),
+        type=NotificationType.FOLLOW_STARTED,
+        title="Title",
+        body="Body",
+        deduplication_key="post:1",
+    )
+
+
+@pytest.mark.asyncio
+async def test_enqueue_follower_fan_out_queues_a_first_attempt(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_fanout_queue: AsyncMock,
+):
+    data = _fan_out_data()
+
+    await service.enqueue_follower_fan_out(data)
+
+    notification_fanout_queue.enqueue.assert_awaited_once_with(NotificationFanOutJob(data=data, attempt=1))
+    repository.create_follower_notifications_batch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_to_followers_walks_batches_and_announces_each_one(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+    notification_stream_hub: MagicMock,
+):
+    data = _fan_out_data()
+    cached = _notification()
+    uncached = _notification()
+    cursor = TimestampUUIDCursor(timestamp=datetime(2026, 7, 18, 10, 0, tzinfo=UTC), id=uuid4())
+    repository.create_follower_notifications_batch.side_effect = [
+        NotificationFanOutBatch(notifications=[cached, uncached], next_cursor=cursor),
+        NotificationFanOutBatch(notifications=[], next_cursor=None),
+    ]
+    notification_cache_service.increment_unread_counts.return_value = {
+        cached.recipient_id: 3,
+        uncached.recipient_id: None,
+    }
+
+    result = await service.fan_out_to_followers(data, batch_size=2)
+
+    assert (result.batches, result.created_count) == (2, 2)
+    assert repository.create_follower_notifications_batch.await_args_list == [
+        ((data,), {"after": None, "limit": 2}),
+        ((data,), {"after": cursor, "limit": 2}),
+    ]
+    notification_cache_service.increment_unread_counts.assert_awaited_once_with(
+        [cached.recipient_id, uncached.recipient_id]
+    )
+    (events_by_recipient,) = notification_stream_hub.publish_many.await_args.args
+    assert [(recipient_id, [event.type for event in events]) for recipient_id, events in events_by_recipient] == [
+        (cached.recipient_id, [NotificationStreamEventType.CREATED, NotificationStreamEventType.UNREAD_COUNT]),
+        (uncached.recipient_id, [NotificationStreamEventType.CREATED]),
+    ]
+    assert events_by_recipient[0][1][0].id == _stream_id(cached.recipient_id, cached)
+    notification_stream_hub.publish_many.assert_awaited_once()
+    repository.count_unread_notifications.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_to_followers_rejects_empty_batches(service: NotificationService):
+    with pytest.raises(ValueError):
+        await service.fan_out_to_followers(_fan_out_data(), batch_size=0)
+
+
+@pytest.mark.asyncio
+async def test_apply_retention_repeats_full_batches_then_purges(
+    service: NotificationService,
+    repository: AsyncMock,
+    notification_cache_service: AsyncMock,
+    notification_stream_hub: MagicMock,
+):
+    repository.archive_read_notifications.side_effect = [2, 2, 1]
+    repository.purge_deleted_notifications.side_effect = [0]
+
+    result = await service.apply_retention(archive_after=timedelta(days=30), batch_size=2)
+
+    assert (result.archived_count, result.purged_count) == (5, 0)
+    assert repository.archive_read_notifications.await_count == 3
+    repository.archive_read_notifications.assert_awaited_with(older_than=timedelta(days=30), limit=2)
+    repository.purge_deleted_notifications.assert_awaited_once_with(limit=2)
+    notification_cache_service.adjust_unread_count.assert_not_awaited()
+    notification_stream_hub.publish.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_apply_retention_rejects_empty_batches(service: NotificationService):
+    with pytest.raises(ValueError):
+        await service.apply_retention(batch_size=0)
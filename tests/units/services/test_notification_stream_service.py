@@ -0,0 +1,163 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.services.notification_stream_service import (
+    NOTIFICATION_STREAM_CHANNEL,
+    NotificationStreamEvent,
+    NotificationStreamHub,
+    NotificationSubscription,
+)
+from app.types import NotificationStreamEventType
+
+
+class FakePubSub:
+    def __init__(self):
+        self.messages: asyncio.Queue[dict] = asyncio.Queue()
+        self.subscribed: list[str] = []
+        self.closed = False
+
+    async def subscribe(self, channel: str) -> None:
+        self.subscribed.append(channel)
+
+    async def listen(self):
+        while True:
+            yield await self.messages.get()
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def mock_cache():
+    cache = MagicMock()
+    cache.publish = AsyncMock(return_value=1)
+    cache.publish_many = AsyncMock()
+    cache.pubsub = MagicMock(return_value=FakePubSub())
+    with patch(
+        "app.services.notification_stream_service.CacheService.get_instance",
+        return_value=cache,
+    ):
+        yield cache
+
+
+def _message(recipient_id, *events: NotificationStreamEvent) -> str:
+    return json.dumps(
+        {
+            "recipientId": str(recipient_id),
+            "events": [{"type": event.type.value, "data": event.data, "id": event.id} for event in events],
+        }
+    )
+
+
+def _count_event(count: int) -> NotificationStreamEvent:
+    return NotificationStreamEvent(type=NotificationStreamEventType.UNREAD_COUNT, data={"unreadCount": count})
+
+
+@pytest.mark.asyncio
+async def test_subscription_delivers_in_order_and_times_out_when_idle():
+    subscription = NotificationSubscription(uuid4(), maxsize=2)
+    subscription.offer(_count_event(1))
+    subscription.offer(_count_event(2))
+
+    assert await subscription.next_event(1) == _count_event(1)
+    assert await subscription.next_event(1) == _count_event(2)
+    with pytest.raises(TimeoutError):
+        await subscription.next_event(0.01)
+
+
+@pytest.mark.asyncio
+async def test_subscription_overflow_closes_instead_of_growing():
+    subscription = NotificationSubscription(uuid4(), maxsize=2)
+
+    for count in range(3):
+        subscription.offer(_count_event(count))
+
+    assert subscription.closed is True
+    assert await subscription.next_event(1) is None
+    subscription.offer(_count_event(9))
+    with pytest.raises(TimeoutError):
+        await subscription.next_event(0.01)
+
+
+@pytest.mark.asyncio
+async def test_publish_sends_one_message_per_recipient_batch(mock_cache):
+    recipient_id = uuid4()
+    event = NotificationStreamEvent(type=NotificationStreamEventType.CREATED, data={"title": "Hi"}, id="cursor")
+
+    await NotificationStreamHub().publish(recipient_id, event, _count_event(1))
+
+    mock_cache.publish.assert_awaited_once_with(
+        NOTIFICATION_STREAM_CHANNEL,
+        _message(recipient_id, event, _count_event(1)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_fails_open(mock_cache):
+    mock_cache.publish.side_effect = ConnectionError("down")
+
+    await NotificationStreamHub().publish(uuid4(), _count_event(1))
+
+
+@pytest.mark.asyncio
+async def test_publish_many_sends_one_message_per_recipient_and_fails_open(mock_cache):
+    first, second, silent = uuid4(), uuid4(), uuid4()
+
+    await NotificationStreamHub().publish_many([(first, [_count_event(1)]), (second, [_count_event(2)]), (silent, [])])
+
+    mock_cache.publish_many.assert_awaited_once_with(
+        NOTIFICATION_STREAM_CHANNEL,
+        [_message(first, _count_event(1)), _message(second, _count_event(2))],
+    )
+    mock_cache.publish_many.side_effect = ConnectionError("down")
+    await NotificationStreamHub().publish_many([(first, [_count_event(1)])])
+
+
+@pytest.mark.asyncio
+async def test_dispatch_routes_only_to_the_recipients_subscriptions(mock_cache):
+    hub = NotificationStreamHub()
+    recipient_id = uuid4()
+    mine = await hub.subscribe(recipient_id)
+    also_mine = await hub.subscribe(recipient_id)
+    theirs = await hub.subscribe(uuid4())
+
+    hub.dispatch(_message(recipient_id, _count_event(3)))
+    hub.dispatch("not json")
+
+    assert await mine.next_event(1) == _count_event(3)
+    assert await also_mine.next_event(1) == _count_event(3)
+    with pytest.raises(TimeoutError):
+        await theirs.next_event(0.01)
+    await hub.aclose()
+
+
+@pytest.mark.asyncio
+async def test_listener_forwards_published_messages(mock_cache):
+    hub = NotificationStreamHub()
+    recipient_id = uuid4()
+    subscription = await hub.subscribe(recipient_id)
+    pubsub = mock_cache.pubsub.return_value
+
+    await pubsub.messages.put({"type": "message", "data": _message(recipient_id, _count_event(5))})
+
+    assert pubsub.subscribed == [NOTIFICATION_STREAM_CHANNEL]
+    assert await subscription.next_event(1) == _count_event(5)
+    await hub.aclose()
+    assert pubsub.closed is True
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_and_close_release_subscriptions(mock_cache):
+    hub = NotificationStreamHub()
+    first = await hub.subscribe(uuid4())
+    second = await hub.subscribe(uuid4())
+    hub.unsubscribe(first)
+
+    assert hub.connection_count == 1
+    await hub.aclose()
+    assert hub.connection_count == 0
+    assert await second.next_event(1) is None
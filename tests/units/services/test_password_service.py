@@ -1,22 +1,191 @@
-from app.services.password_service import PasswordService
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from app.services.password_service import (
+    PASSWORD_HASH_MAX_ROUNDS,
+    PASSWORD_HASH_MIN_ROUNDS,
+    PasswordService,
+    choose_bcrypt_rounds,
+    get_bcrypt_rounds,
+)
+from app.utils.error_codes_utils import ErrorCodes
+from app.utils.exceptions_utils import AppException
 
 
 class TestPasswordService:
-    def test_hash_password(self):
+    @pytest.mark.asyncio
+    async def test_hash_password(self):
         password = "secure_password"
-        hashed = PasswordService.get_password_hash(password)
+        hashed = await PasswordService.get_password_hash(password)
 
         assert hashed != password
         assert len(hashed) > 0
 
-    def test_verify_password_correct(self):
+    @pytest.mark.asyncio
+    async def test_verify_password_correct(self):
         password = "secure_password"
-        hashed = PasswordService.get_password_hash(password)
+        hashed = await PasswordService.get_password_hash(password)
 
-        assert PasswordService.verify_password(password, hashed) is True
+        assert await PasswordService.verify_password(password, hashed) is True
 
-    def test_verify_password_incorrect(self):
+    @pytest.mark.asyncio
+    async def test_verify_password_incorrect(self):
         password = "secure_password"
-        hashed = PasswordService.get_password_hash(password)
+        hashed = await PasswordService.get_password_hash(password)
+
+        assert await PasswordService.verify_password("wrong_password", hashed) is False
+
+    @pytest.mark.asyncio
+    async def test_bcrypt_runs_on_pool_thread_not_event_loop(self):
+        loop_thread = threading.current_thread()
+        seen_threads: list[threading.Thread] = []
+
+        def fake_checkpw(password: bytes, hashed: bytes) -> bool:
+            seen_threads.append(threading.current_thread())
+            return True
+
+        with patch("app.services.password_service.bcrypt.checkpw", side_effect=fake_checkpw):
+            assert await PasswordService.verify_password("secret", "hash") is True
+
+        assert seen_threads[0] is not loop_thread
+        assert seen_threads[0].name.startswith("password-hash")
+
+    @pytest.mark.asyncio
+    async def test_stats_record_completed_jobs(self):
+        before = PasswordService.stats()
+
+        await PasswordService.get_password_hash("secure_password")
+
+        after = PasswordService.stats()
+        assert after.completed == before.completed + 1
+        assert after.in_flight == 0
+        assert after.run_seconds > before.run_seconds
+        assert after.peak_in_flight >= 1
+
+    @pytest.mark.asyncio
+    async def test_saturated_pool_rejects_with_service_unavailable(self):
+        before = PasswordService.stats()
+
+        with (
+            patch("app.services.password_service.PASSWORD_HASH_MAX_PENDING", 0),
+            patch("app.services.password_service.bcrypt.checkpw") as mock_checkpw,
+        ):
+            with pytest.raises(AppException) as exc_info:
+                await PasswordService.verify_password("secret", "hash")
+
+        assert exc_info.value.error == ErrorCodes.PASSWORD_HASHING_UNAVAILABLE
+        mock_checkpw.assert_not_called()
+        assert PasswordService.stats().rejected == before.rejected + 1
+
+    @pytest.mark.asyncio
+    async def test_worker_exception_propagates_and_releases_slot(self):
+        with patch("app.services.password_service.bcrypt.checkpw", side_effect=ValueError("Invalid salt")):
+            with pytest.raises(ValueError, match="Invalid salt"):
+                await PasswordService.verify_password("secret", "not-a-hash")
+
+        assert PasswordService.stats().in_flight == 0
+
+    def test_log_stats_reports_interval_activity(self):
+        previous = PasswordService.stats()
+        PasswordService._completed += 2
+        PasswordService._run_seconds += 0.5
+
+        try:
+            with patch("app.services.password_service.logger") as mock_logger:
+                current = PasswordService.log_stats(previous)
+        finally:
+            PasswordService._completed -= 2
+            PasswordService._run_seconds -= 0.5
+
+        assert current.completed == previous.completed + 2
+        mock_logger.warning.assert_not_called()
+        args = mock_logger.info.call_args.args
+        assert args[4:6] == (2, 0)
+        assert args[7] == pytest.approx(250.0)
+
+    def test_log_stats_warns_on_rejections_and_skips_idle_intervals(self):
+        previous = PasswordService.stats()
+
+        with patch("app.services.password_service.logger") as mock_logger:
+            PasswordService.log_stats(previous)
+            assert mock_logger.method_calls == []
+
+            PasswordService._rejected += 1
+            PasswordService.log_stats(previous)
+
+        mock_logger.info.assert_not_called()
+        assert mock_logger.warning.call_args.args[5] == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_log_task_stops_on_shutdown(self):
+        PasswordService.start_stats_log(interval_seconds=60)
+        task = PasswordService._stats_task
+
+        PasswordService.shutdown()
+
+        assert task is not None
+        assert PasswordService._stats_task is None
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+class TestPasswordHashCost:
+    @pytest.fixture(autouse=True)
+    def restore_rounds(self):
+        rounds = PasswordService.rounds()
+        yield
+        PasswordService._rounds = rounds
+
+    def test_choose_bcrypt_rounds_doubles_up_to_target(self):
+        assert choose_bcrypt_rounds(baseline_ms=60, target_ms=250) == PASSWORD_HASH_MIN_ROUNDS + 2
+
+    def test_choose_bcrypt_rounds_keeps_minimum_on_slow_hardware(self):
+        assert choose_bcrypt_rounds(baseline_ms=400, target_ms=250) == PASSWORD_HASH_MIN_ROUNDS
+
+    def test_choose_bcrypt_rounds_is_capped(self):
+        assert choose_bcrypt_rounds(baseline_ms=0.1, target_ms=250) == PASSWORD_HASH_MAX_ROUNDS
+
+    def test_get_bcrypt_rounds_parses_cost(self):
+        assert get_bcrypt_rounds("$2b$12$EixZaYVK1fsbw1ZfbX3OXePaWxn96p36WQoeG6Lruj3vjPGga31lW") == 12
+        assert get_bcrypt_rounds("not-a-bcrypt-hash") is None
+
+    def test_needs_rehash_only_for_lower_cost(self):
+        PasswordService._rounds = 13
+
+        assert PasswordService.needs_rehash("$2b$12$" + "a" * 53) is True
+        assert PasswordService.needs_rehash("$2b$13$" + "a" * 53) is False
+        assert PasswordService.needs_rehash("$2b$14$" + "a" * 53) is False
+        assert PasswordService.needs_rehash("legacy") is False
+
+    def test_calibrate_uses_explicit_rounds(self):
+        with patch("app.services.password_service.PASSWORD_HASH_ROUNDS", "10"):
+            assert PasswordService.calibrate() == 10
+
+        assert PasswordService.rounds() == 10
+
+    def test_calibrate_rejects_invalid_explicit_rounds(self):
+        with patch("app.services.password_service.PASSWORD_HASH_ROUNDS", "40"):
+            with pytest.raises(ValueError, match="PASSWORD_HASH_ROUNDS"):
+                PasswordService.calibrate()
+
+    def test_calibrate_benchmarks_against_target(self):
+        with (
+            patch("app.services.password_service.PASSWORD_HASH_ROUNDS", None),
+            patch("app.services.password_service.bcrypt.hashpw") as mock_hashpw,
+        ):
+            rounds = PasswordService.calibrate()
+
+        # A no-op hash is effectively instant, so calibration climbs to the cap.
+        assert rounds == PASSWORD_HASH_MAX_ROUNDS
+        mock_hashpw.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_password_hash_uses_calibrated_rounds(self):
+        PasswordService._rounds = 4
+
+        hashed = await PasswordService.get_password_hash("secure_password")
 
-        assert PasswordService.verify_password("wrong_password", hashed) is False
+        assert hashed.startswith("$2b$04$")
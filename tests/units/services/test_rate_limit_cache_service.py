@@ -14,34 +14,48 @@ class TestBuildSessionKey:
         assert RateLimitCacheService.build_session_key("session123") == "rl_session:session123"
 
 
-class TestGetSession:
+class TestRefreshSession:
     @pytest.mark.asyncio
-    async def test_returns_none_on_cache_miss(self):
+    async def test_returns_false_on_cache_miss(self):
         mock_cache = MagicMock()
-        mock_cache.get = AsyncMock(return_value=None)
+        mock_cache.get_and_expire = AsyncMock(return_value=None)
 
         with patch(
             "app.services.rate_limit_cache_service.CacheService.get_instance",
             return_value=mock_cache,
         ):
             service = RateLimitCacheService()
-            result = await service.get_session("missing-session")
-            assert result is None
-            mock_cache.get.assert_awaited_once_with("rl_session:missing-session")
+            assert await service.refresh_session("missing-session") is False
+            mock_cache.get_and_expire.assert_awaited_once_with(
+                "rl_session:missing-session", RATE_LIMIT_SESSION_TTL_SECONDS
+            )
+
+    @pytest.mark.asyncio
+    async def test_returns_true_and_extends_ttl_on_cache_hit(self):
+        mock_cache = MagicMock()
+        mock_cache.get_and_expire = AsyncMock(return_value=RATE_LIMIT_SESSION_CACHE_VALUE)
+
+        with patch(
+            "app.services.rate_limit_cache_service.CacheService.get_instance",
+            return_value=mock_cache,
+        ):
+            service = RateLimitCacheService()
+            assert await service.refresh_session("known-session") is True
+            mock_cache.get_and_expire.assert_awaited_once_with(
+                "rl_session:known-session", RATE_LIMIT_SESSION_TTL_SECONDS
+            )
 
     @pytest.mark.asyncio
-    async def test_returns_session_data_on_cache_hit(self):
+    async def test_returns_false_for_invalid_payload(self):
         mock_cache = MagicMock()
-        mock_cache.get = AsyncMock(return_value=RATE_LIMIT_SESSION_CACHE_VALUE)
+        mock_cache.get_and_expire = AsyncMock(return_value={"active": "yes"})
 
         with patch(
             "app.services.rate_limit_cache_service.CacheService.get_instance",
             return_value=mock_cache,
         ):
             service = RateLimitCacheService()
-            result = await service.get_session("known-session")
-            assert result == RATE_LIMIT_SESSION_CACHE_VALUE
-            mock_cache.get.assert_awaited_once_with("rl_session:known-session")
+            assert await service.refresh_session("bad-session") is False
 
 
 class TestUpsertSession:
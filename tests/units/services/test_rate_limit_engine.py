@@ -0,0 +1,285 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import Request, Response
+
+from app.services.rate_limit_engine import (
+    AsyncLimiter,
+    LocalRateLimitBuckets,
+    MemoryRateLimitStorage,
+    RateLimitBucket,
+    RedisRateLimitStorage,
+    gcra_check,
+)
+from app.utils.rate_limit_utils import RateLimitExceeded, RateLimitItem, parse_rate_limit
+
+FIVE_PER_MINUTE = RateLimitItem(amount=5, period_seconds=60)
+NOW_US = 1_700_000_000_000_000
+
+
+def make_request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": [], "client": ("10.0.0.1", 1234)})
+
+
+class TestParseRateLimit:
+    @pytest.mark.parametrize(
+        ("value", "amount", "period_seconds"),
+        [
+            ("60/minute", 60, 60),
+            ("5/15minute", 5, 900),
+            ("10/hour", 10, 3600),
+            ("300/30minutes", 300, 1800),
+            ("1/day", 1, 86400),
+        ],
+    )
+    def test_parses_amount_and_period(self, value, amount, period_seconds):
+        assert parse_rate_limit(value) == RateLimitItem(amount=amount, period_seconds=period_seconds)
+
+    @pytest.mark.parametrize("value", ["", "ten/minute", "0/minute", "5/fortnight", "5 per minute"])
+    def test_rejects_invalid_values(self, value):
+        with pytest.raises(ValueError):
+            parse_rate_limit(value)
+
+
+class TestGcraCheck:
+    def test_empty_bucket_allows_full_burst(self):
+        tat = None
+        remaining = []
+        for _ in range(5):
+            state, tat = gcra_check(tat, NOW_US, FIVE_PER_MINUTE)
+            assert state.allowed
+            remaining.append(state.remaining)
+
+        assert remaining == [4, 3, 2, 1, 0]
+        state, unchanged_tat = gcra_check(tat, NOW_US, FIVE_PER_MINUTE)
+        assert not state.allowed
+        assert unchanged_tat == tat
+        assert state.retry_after == pytest.approx(12)
+        assert state.reset_after == pytest.approx(60)
+
+    def test_credit_returns_one_emission_interval_at_a_time(self):
+        tat = NOW_US + 60_000_000
+
+        state, _ = gcra_check(tat, NOW_US + 11_000_000, FIVE_PER_MINUTE)
+        assert not state.allowed
+        assert state.retry_after == pytest.approx(1)
+
+        state, _ = gcra_check(tat, NOW_US + 12_000_000, FIVE_PER_MINUTE)
+        assert state.allowed
+        assert state.remaining == 0
+
+    def test_expired_tat_counts_as_empty_bucket(self):
+        state, new_tat = gcra_check(NOW_US - 1_000_000, NOW_US, FIVE_PER_MINUTE)
+
+        assert state.allowed
+        assert state.remaining == 4
+        assert new_tat == NOW_US + 12_000_000
+
+
+class TestMemoryRateLimitStorage:
+    @pytest.mark.asyncio
+    async def test_rejected_request_charges_no_bucket(self):
+        storage = MemoryRateLimitStorage()
+        tight = RateLimitBucket("tight", RateLimitItem(amount=1, period_seconds=60))
+        loose = RateLimitBucket("loose", FIVE_PER_MINUTE)
+
+        first = await storage.acquire([tight, loose], consume=True)
+        second = await storage.acquire([tight, loose], consume=True)
+
+        assert [state.allowed for state in first] == [True, True]
+        assert [state.allowed for state in second] == [False, True]
+        [loose_state] = await storage.acquire([loose], consume=False)
+        assert loose_state.remaining == 3
+
+    @pytest.mark.asyncio
+    async def test_peek_does_not_consume(self):
+        storage = MemoryRateLimitStorage()
+        bucket = RateLimitBucket("bucket", RateLimitItem(amount=1, period_seconds=60))
+
+        for _ in range(3):
+            [state] = await storage.acquire([bucket], consume=False)
+            assert state.allowed
+
+        await storage.clear("bucket")
+        [state] = await storage.acquire([bucket], consume=True)
+        assert state.allowed
+
+
+class TestLocalRateLimitBuckets:
+    @pytest.mark.asyncio
+    async def test_first_request_is_charged_globally_and_the_rest_locally(self):
+        storage = MemoryRateLimitStorage()
+        storage.acquire = AsyncMock(wraps=storage.acquire)
+        local = LocalRateLimitBuckets()
+        bucket = RateLimitBucket("bucket", FIVE_PER_MINUTE)
+
+        states = [(await local.acquire([bucket], storage))[0] for _ in range(6)]
+
+        assert storage.acquire.await_count == 1
+        assert [state.allowed for state in states] == [True] * 5 + [False]
+        assert [state.remaining for state in states[:5]] == [4, 3, 2, 1, 0]
+
+    @pytest.mark.asyncio
+    async def test_sync_reports_pending_requests_and_adopts_shared_state(self):
+        storage = MemoryRateLimitStorage()
+        first_worker = LocalRateLimitBuckets()
+        second_worker = LocalRateLimitBuckets()
+        bucket = RateLimitBucket("bucket", FIVE_PER_MINUTE)
+
+        for _ in range(2):
+            await first_worker.acquire([bucket], storage)
+            await second_worker.acquire([bucket], storage)
+
+        await first_worker.sync(storage)
+        await second_worker.sync(storage)
+        await first_worker.sync(storage)
+
+        [state] = await first_worker.acquire([bucket], storage)
+        assert state.allowed
+        assert state.remaining == 0
+        [state] = await first_worker.acquire([bucket], storage)
+        assert not state.allowed
+
+    @pytest.mark.asyncio
+    async def test_failed_sync_keeps_pending_counts(self):
+        storage = MemoryRateLimitStorage()
+        local = LocalRateLimitBuckets()
+        bucket = RateLimitBucket("bucket", FIVE_PER_MINUTE)
+        for _ in range(3):
+            await local.acquire([bucket], storage)
+
+        with (
+            patch.object(storage, "sync", AsyncMock(side_effect=RuntimeError("redis down"))),
+            pytest.raises(RuntimeError),
+        ):
+            await local.sync(storage)
+
+        sync = AsyncMock(return_value=[36_000_000])
+        with patch.object(storage, "sync", sync):
+            await local.sync(storage)
+
+        [(_, count)] = sync.await_args.args[0]
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_drops_drained_idle_buckets(self):
+        storage = MemoryRateLimitStorage()
+        local = LocalRateLimitBuckets()
+        await local.acquire([RateLimitBucket("bucket", RateLimitItem(amount=1, period_seconds=60))], storage)
+        await local.sync(storage)
+        assert len(local) == 1
+
+        with patch("app.services.rate_limit_engine._now_us", return_value=(NOW_US + 10**12) * 2):
+            await local.sync(storage)
+
+        assert len(local) == 0
+
+
+class TestRedisRateLimitStorage:
+    @pytest.mark.asyncio
+    async def test_maps_script_results_to_states(self):
+        mock_cache = MagicMock()
+        mock_cache.gcra_acquire = AsyncMock(return_value=[(1, 4, 12_000_000, 0), (0, 0, 30_000_000, 2_500_000)])
+        other_limit = RateLimitItem(amount=2, period_seconds=30)
+
+        with patch(
+            "app.services.rate_limit_engine.CacheService.get_instance",
+            return_value=mock_cache,
+        ):
+            states = await RedisRateLimitStorage().acquire(
+                [RateLimitBucket("a", FIVE_PER_MINUTE), RateLimitBucket("b", other_limit)],
+                consume=True,
+            )
+
+        mock_cache.gcra_acquire.assert_awaited_once_with(["a", "b"], [(12_000_000, 5), (15_000_000, 2)], True)
+        assert states[0].allowed
+        assert states[0].remaining == 4
+        assert states[0].reset_after == 12
+        assert not states[1].allowed
+        assert states[1].retry_after == 2.5
+        assert states[1].limit == other_limit
+
+
+class TestAsyncLimiter:
+    @pytest.mark.asyncio
+    async def test_stacked_limits_share_one_wrapper_and_set_headers(self):
+        limiter = AsyncLimiter(key_func=lambda request: "ip:test", storage=MemoryRateLimitStorage())
+        calls = 0
+
+        @limiter.limit("5/minute")
+        @limiter.limit("2/minute", key_func=lambda request: "session:test")
+        async def endpoint(request: Request, response: Response) -> str:
+            nonlocal calls
+            calls += 1
+            return "ok"
+
+        route = f"{endpoint.__module__}.{endpoint.__qualname__}"
+        assert [route_limit.limit.amount for route_limit in limiter._route_limits[route]] == [2, 5]
+
+        response = Response()
+        assert await endpoint(request=make_request(), response=response) == "ok"
+        assert response.headers["X-RateLimit-Limit"] == "2"
+        assert response.headers["X-RateLimit-Remaining"] == "1"
+
+        await endpoint(request=make_request(), response=Response())
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            await endpoint(request=make_request(), response=Response())
+
+        assert exc_info.value.state.limit.amount == 2
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_programmatic_hit_test_and_clear(self):
+        limiter = AsyncLimiter(key_func=lambda request: "unused", storage=MemoryRateLimitStorage())
+        limit = RateLimitItem(amount=1, period_seconds=60)
+
+        assert await limiter.hit(limit, "auth:login:account", "identifier:abc")
+        assert not await limiter.test(limit, "auth:login:account", "identifier:abc")
+        assert await limiter.test(limit, "auth:login:account", "identifier:other")
+
+        await limiter.clear(limit, "auth:login:account", "identifier:abc")
+        assert await limiter.test(limit, "auth:login:account", "identifier:abc")
+
+    @pytest.mark.asyncio
+    async def test_route_is_checked_locally_only_when_all_limits_are_hybrid(self):
+        storage = MemoryRateLimitStorage()
+        storage.acquire = AsyncMock(wraps=storage.acquire)
+        limiter = AsyncLimiter(key_func=lambda request: "user:test", storage=storage)
+
+        @limiter.limit("60/minute", hybrid=True)
+        async def hybrid_endpoint(request: Request) -> str:
+            return "ok"
+
+        @limiter.limit("60/minute", hybrid=True)
+        @limiter.limit("10/minute")
+        async def mixed_endpoint(request: Request) -> str:
+            return "ok"
+
+        for _ in range(3):
+            await hybrid_endpoint(request=make_request())
+            await mixed_endpoint(request=make_request())
+
+        assert storage.acquire.await_count == 4
+        assert len(limiter.local_buckets) == 1
+
+    @pytest.mark.asyncio
+    async def test_aclose_flushes_pending_counts(self):
+        storage = MemoryRateLimitStorage()
+        limiter = AsyncLimiter(key_func=lambda request: "user:test", storage=storage)
+
+        @limiter.limit("5/minute", hybrid=True)
+        async def endpoint(request: Request) -> str:
+            return "ok"
+
+        limiter.start_sync(interval_seconds=3600)
+        for _ in range(3):
+            await endpoint(request=make_request())
+        await limiter.aclose()
+
+        [state] = await storage.acquire([RateLimitBucket(next(iter(storage._tats)), FIVE_PER_MINUTE)], consume=False)
+        assert state.remaining == 1
+
+    def test_build_key_namespaces_scope_limit_and_identifier(self):
+        key = AsyncLimiter.build_key("auth:login:account", RateLimitItem(amount=5, period_seconds=900), "identifier:x")
+
+        assert key == "cinelog:ratelimit:auth:login:account:5/900s:identifier:x"
@@ -36,6 +36,20 @@ class FakeVerificationCache:
         self.hashes[key][field] = str(value)
         return value
 
+    async def check_code_attempt(self, key: str, candidate_hash: str, max_attempts: int) -> str:
+        # Mirrors CHECK_CODE_ATTEMPT_SCRIPT.
+        data = self.hashes.get(key, {})
+        attempts = data.get("attempts", "0")
+        if not data.get("code_hash") or not attempts.isdigit():
+            return "missing"
+        if int(attempts) >= max_attempts:
+            return "exceeded"
+        if data["code_hash"] == candidate_hash:
+            return "match"
+        if await self.hincrby(key, "attempts", 1) >= max_attempts:
+            return "exceeded"
+        return "mismatch"
+
     async def expire(self, key: str, ttl: int) -> bool:
         self.expires[key] = ttl
         return True
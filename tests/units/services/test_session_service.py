@@ -0,0 +1,132 @@
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.services.session_service import (
+    SESSION_TTL_SECONDS,
+    SessionRevocationCache,
+    SessionRevocations,
+    SessionService,
+    session_revocation_cache,
+)
+
+
+@pytest.fixture
+def cache():
+    mock_cache = MagicMock()
+    mock_cache.set = AsyncMock(return_value=True)
+    mock_cache.get_and_expire = AsyncMock(return_value=None)
+    mock_cache.hgetall = AsyncMock(return_value={})
+    mock_cache.replace_hash = AsyncMock()
+    mock_cache.revoke_session = AsyncMock()
+    with patch("app.services.session_service.CacheService.get_instance", return_value=mock_cache):
+        yield mock_cache
+
+
+def test_revocations_cover_earlier_tokens_and_listed_sessions():
+    revocations = SessionRevocations.from_hash({"before": "100.5", "session-2": "900"})
+
+    assert revocations.revokes("session-1", 100.0)
+    assert not revocations.revokes("session-1", 100.5)
+    assert revocations.revokes("session-2", 200.0)
+
+
+def test_revocation_cache_entries_expire_after_ttl():
+    user_id = uuid4()
+    fresh = SessionRevocationCache(ttl=60)
+    stale = SessionRevocationCache(ttl=-1)
+
+    fresh.put(user_id, SessionRevocations(revoked_before=1.0))
+    stale.put(user_id, SessionRevocations(revoked_before=1.0))
+
+    assert fresh.get(user_id) == SessionRevocations(revoked_before=1.0)
+    assert stale.get(user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_create_session_registers_the_user(cache):
+    user_id = uuid4()
+
+    session_id = await SessionService().create_session(user_id)
+
+    cache.set.assert_awaited_once_with(
+        f"cinelog:auth:session:{session_id}", {"user_id": str(user_id)}, ttl=SESSION_TTL_SECONDS
+    )
+
+
+@pytest.mark.asyncio
+async def test_is_revoked_reads_redis_once_then_the_local_cache(cache):
+    user_id = uuid4()
+    cache.hgetall.return_value = {"before": str(time.time())}
+    service = SessionService()
+
+    assert await service.is_revoked(user_id, "session-1", issued_at=1.0)
+    assert not await service.is_revoked(user_id, "session-1", issued_at=time.time() + 60)
+
+    cache.hgetall.assert_awaited_once_with(f"cinelog:auth:revocations:{user_id}")
+
+
+@pytest.mark.asyncio
+async def test_is_revoked_fails_open_when_redis_is_down(cache):
+    cache.hgetall.side_effect = ConnectionError("redis down")
+
+    assert not await SessionService().is_revoked(uuid4(), "session-1", issued_at=time.time())
+
+
+@pytest.mark.asyncio
+async def test_refresh_session_requires_the_session_record(cache):
+    user_id = uuid4()
+    service = SessionService()
+
+    assert not await service.refresh_session(user_id, "session-1", time.time())
+
+    cache.get_and_expire.return_value = {"user_id": str(uuid4())}
+    assert not await service.refresh_session(user_id, "session-1", time.time())
+
+    cache.get_and_expire.return_value = {"user_id": str(user_id)}
+    assert await service.refresh_session(user_id, "session-1", time.time())
+    cache.get_and_expire.assert_awaited_with("cinelog:auth:session:session-1", SESSION_TTL_SECONDS)
+
+
+@pytest.mark.asyncio
+async def test_refresh_session_ignores_a_stale_local_cache(cache):
+    user_id = uuid4()
+    session_revocation_cache.put(user_id, SessionRevocations())
+    cache.get_and_expire.return_value = {"user_id": str(user_id)}
+    cache.hgetall.return_value = {"before": str(time.time() + 60)}
+
+    assert not await SessionService().refresh_session(user_id, "session-1", time.time())
+
+
+@pytest.mark.asyncio
+async def test_revoke_all_sessions_sets_the_watermark_and_updates_the_local_cache(cache):
+    user_id = uuid4()
+    service = SessionService()
+    issued_before = time.time()
+
+    await service.revoke_all_sessions(user_id)
+
+    key, mapping, ttl = cache.replace_hash.await_args.args
+    assert key == f"cinelog:auth:revocations:{user_id}"
+    assert float(mapping["before"]) >= issued_before
+    assert ttl == SESSION_TTL_SECONDS
+    assert await service.is_revoked(user_id, "session-1", issued_before)
+    assert not await service.is_revoked(user_id, "session-1", time.time() + 1)
+    cache.hgetall.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_revoke_session_drops_the_local_cache_entry(cache):
+    user_id = uuid4()
+    session_revocation_cache.put(user_id, SessionRevocations())
+    cache.hgetall.return_value = {"session-1": str(time.time() + 900)}
+    service = SessionService()
+
+    await service.revoke_session(user_id, "session-1")
+
+    args = cache.revoke_session.await_args.args
+    assert args[:3] == ("cinelog:auth:session:session-1", f"cinelog:auth:revocations:{user_id}", "session-1")
+    assert await service.is_revoked(user_id, "session-1", time.time())
+    assert not await service.is_revoked(user_id, "session-2", time.time())
@@ -0,0 +1,153 @@
+import smtplib
+import socket
+import socketserver
+import threading
+
+import pytest
+
+from app.config.email_config import SMTPConfig
+from app.services.email_templates import RenderedEmail
+from app.services.smtp_sender import SMTPSender, SMTPUnavailableError, is_permanent_failure
+
+
+class FakeSMTPHandler(socketserver.StreamRequestHandler):
+    """Speaks just enough SMTP for ``smtplib``: EHLO, MAIL, RCPT, DATA, RSET, NOOP and QUIT."""
+
+    server: "FakeSMTPServer"
+
+    def handle(self) -> None:
+        self.server.register(self.connection)
+        self._reply("220 fake.smtp ESMTP")
+        while line := self.rfile.readline():
+            verb, _, argument = line.decode().strip().partition(" ")
+            verb = verb.upper()
+            if verb in {"EHLO", "HELO", "MAIL", "RSET", "NOOP"}:
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                recipient = argument.partition(":")[2].strip("<>")
+                self._reply("550 No such user" if recipient in self.server.rejected else "250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                while (data_line := self.rfile.readline()) not in (b".\r\n", b""):
+                    lines.append(data_line)
+                self.server.messages.append(b"".join(lines).decode())
+                self._reply("250 Queued")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Not implemented")
+
+    def _reply(self, text: str) -> None:
+        self.wfile.write(f"{text}\r\n".encode())
+
+
+class FakeSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), FakeSMTPHandler)
+        self.messages: list[str] = []
+        self.rejected: set[str] = set()
+        self.connections: list[socket.socket] = []
+
+    def register(self, connection: socket.socket) -> None:
+        self.connections.append(connection)
+
+    def drop_connections(self) -> None:
+        for connection in self.connections:
+            connection.shutdown(socket.SHUT_RDWR)
+
+
+@pytest.fixture
+def smtp_server():
+    server = FakeSMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _config(port: int) -> SMTPConfig:
+    return {
+        "server": "127.0.0.1",
+        "port": port,
+        "user": None,
+        "password": None,
+        "from_email": "noreply@cinelog.app",
+        "use_ssl": False,
+    }
+
+
+def _email(to_email: str = "user@example.com", subject: str = "Hello") -> RenderedEmail:
+    return RenderedEmail(to_email=to_email, subject=subject, text="plain body", html="<p>html body</p>")
+
+
+def test_send_batch_reuses_one_connection_across_batches(smtp_server):
+    sender = SMTPSender(_config(smtp_server.server_address[1]))
+
+    assert sender.send_batch([_email(subject="first"), _email(subject="second")]) == [None, None]
+    assert sender.send_batch([_email(subject="third")]) == [None]
+    sender.close()
+
+    assert len(smtp_server.connections) == 1
+    assert len(smtp_server.messages) == 3
+    assert "Subject: third" in smtp_server.messages[2]
+    assert "html body" in smtp_server.messages[2]
+
+
+def test_send_reconnects_once_when_server_dropped_the_connection(smtp_server):
+    sender = SMTPSender(_config(smtp_server.server_address[1]))
+    sender.send(_email(subject="before"))
+
+    smtp_server.drop_connections()
+    sender.send(_email(subject="after"))
+    sender.close()
+
+    assert len(smtp_server.connections) == 2
+    assert "Subject: after" in smtp_server.messages[-1]
+
+
+def test_send_reconnects_after_idle_timeout(smtp_server):
+    sender = SMTPSender(_config(smtp_server.server_address[1]), idle_timeout=-1)
+
+    assert sender.send_batch([_email(), _email()]) == [None, None]
+    sender.close()
+
+    assert len(smtp_server.connections) == 2
+
+
+def test_rejected_recipient_is_permanent_and_keeps_the_connection(smtp_server):
+    smtp_server.rejected.add("gone@example.com")
+    sender = SMTPSender(_config(smtp_server.server_address[1]))
+
+    rejected, delivered = sender.send_batch([_email(to_email="gone@example.com"), _email()])
+    sender.close()
+
+    assert isinstance(rejected, smtplib.SMTPRecipientsRefused)
+    assert is_permanent_failure(rejected)
+    assert delivered is None
+    assert len(smtp_server.connections) == 1
+    assert len(smtp_server.messages) == 1
+
+
+def test_unreachable_server_fails_the_whole_batch_as_retryable():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        unused_port = probe.getsockname()[1]
+    sender = SMTPSender(_config(unused_port), timeout=1)
+
+    results = sender.send_batch([_email(), _email(), _email()])
+
+    assert len(results) == 3
+    assert all(isinstance(error, SMTPUnavailableError) for error in results)
+    assert not any(is_permanent_failure(error) for error in results if error is not None)
+
+
+def test_is_permanent_failure_only_for_5xx_responses():
+    assert is_permanent_failure(smtplib.SMTPDataError(554, b"Rejected"))
+    assert not is_permanent_failure(smtplib.SMTPDataError(451, b"Try again later"))
+    assert not is_permanent_failure(smtplib.SMTPServerDisconnected())
@@ -1,9 +1,11 @@
+import time
 from datetime import timedelta
+from uuid import uuid4
 
 import jwt
 import pytest
 
-from app.services.token_service import TokenService
+from app.services.token_service import AccessTokenCache, TokenService, VerifiedAccessToken
 
 
 class TestTokenService:
@@ -25,6 +27,18 @@ class TestTokenService:
         assert decoded["type"] == "refresh"
         assert "exp" in decoded
 
+    def test_tokens_carry_fractional_issued_at(self):
+        before = time.time()
+        decoded = TokenService.decode_token(TokenService.create_access_token({"sub": "user_123"}))
+
+        assert isinstance(decoded["iat"], float)
+        assert before <= decoded["iat"] <= time.time()
+
+    def test_decode_without_expiry_check_accepts_expired_token(self):
+        token = TokenService.create_access_token({"sub": "user_123"}, expires_delta=timedelta(seconds=-1))
+
+        assert TokenService.decode_token(token, verify_expiry=False)["sub"] == "user_123"
+
     def test_token_expiration(self):
         data = {"sub": "user_123"}
         # Create token that expires immediately
@@ -32,3 +46,49 @@ class TestTokenService:
 
         with pytest.raises(jwt.ExpiredSignatureError):
             TokenService.decode_token(token)
+
+
+def _verified(expires_in: float = 60) -> VerifiedAccessToken:
+    user_id = uuid4()
+    return VerifiedAccessToken(
+        user_id=user_id,
+        subject=str(user_id),
+        session_id="session-1",
+        issued_at=time.time(),
+        locale=None,
+        expires_at=time.time() + expires_in,
+    )
+
+
+class TestAccessTokenCache:
+    def test_returns_cached_claims_until_expiry(self):
+        cache = AccessTokenCache(max_size=10)
+        verified = _verified()
+        cache.put("token", verified)
+
+        assert cache.get("token") is verified
+        assert cache.get("other-token") is None
+
+    def test_expired_entries_are_dropped(self):
+        cache = AccessTokenCache(max_size=10)
+        cache.put("token", _verified(expires_in=-1))
+
+        assert cache.get("token") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = AccessTokenCache(max_size=2)
+        cache.put("a", _verified())
+        cache.put("b", _verified())
+        cache.get("a")
+        cache.put("c", _verified())
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_zero_size_disables_caching(self):
+        cache = AccessTokenCache(max_size=0)
+        cache.put("token", _verified())
+
+        assert cache.get("token") is None
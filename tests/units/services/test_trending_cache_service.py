@@ -0,0 +1,113 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from freezegun import freeze_time
+
+from app.services.trending_cache_service import TRENDING_VIEW_CACHE_TTL, TrendingCacheService
+from app.types import TrendingWindow
+
+
+@pytest.fixture
+def mock_cache():
+    cache = MagicMock()
+    cache.exists = AsyncMock(return_value=False)
+    cache.zincrby_with_expireat = AsyncMock()
+    cache.zunionstore_with_ttl = AsyncMock(return_value=0)
+    cache.zrevrange_with_scores = AsyncMock(return_value=[])
+    with patch(
+        "app.services.trending_cache_service.CacheService.get_instance",
+        return_value=cache,
+    ):
+        yield cache
+
+
+def _timestamp(*args: int) -> int:
+    return int(datetime(*args, tzinfo=UTC).timestamp())
+
+
+class TestBuildKeys:
+    def test_bucket_keys_use_utc_hour_and_day(self):
+        moment = datetime(2026, 3, 9, 23, 45, tzinfo=UTC)
+        assert TrendingCacheService.build_hour_key(moment) == "cinelog:trending:hour:2026030923"
+        assert TrendingCacheService.build_day_key(moment) == "cinelog:trending:day:20260309"
+
+    def test_view_key(self):
+        assert TrendingCacheService.build_view_key(TrendingWindow.LAST_7_DAYS) == "cinelog:trending:view:7d"
+
+    def test_24h_window_covers_the_last_24_hourly_buckets(self):
+        keys = TrendingCacheService.window_bucket_keys(
+            TrendingWindow.LAST_24_HOURS,
+            datetime(2026, 3, 10, 5, 30, tzinfo=UTC),
+        )
+        assert len(keys) == 24
+        assert keys[0] == "cinelog:trending:hour:2026031005"
+        assert keys[-1] == "cinelog:trending:hour:2026030906"
+
+    def test_7d_window_covers_today_and_six_previous_days(self):
+        keys = TrendingCacheService.window_bucket_keys(
+            TrendingWindow.LAST_7_DAYS,
+            datetime(2026, 3, 10, 5, 30, tzinfo=UTC),
+        )
+        assert keys == [f"cinelog:trending:day:202603{day:02d}" for day in range(10, 3, -1)]
+
+
+class TestRecord:
+    @pytest.mark.asyncio
+    @freeze_time("2026-03-10 05:30:00")
+    async def test_record_log_created_increments_hour_and_day_buckets(self, mock_cache):
+        await TrendingCacheService().record_log_created(550, datetime(2026, 3, 10, 5, 10, tzinfo=UTC))
+
+        mock_cache.zincrby_with_expireat.assert_awaited_once_with(
+            "550",
+            1,
+            {
+                "cinelog:trending:hour:2026031005": _timestamp(2026, 3, 11, 6),
+                "cinelog:trending:day:20260310": _timestamp(2026, 3, 18),
+            },
+        )
+
+    @pytest.mark.asyncio
+    @freeze_time("2026-03-12 05:30:00")
+    async def test_record_log_deleted_skips_expired_buckets(self, mock_cache):
+        await TrendingCacheService().record_log_deleted(550, datetime(2026, 3, 10, 5, 10, tzinfo=UTC))
+
+        mock_cache.zincrby_with_expireat.assert_awaited_once_with(
+            "550",
+            -1,
+            {"cinelog:trending:day:20260310": _timestamp(2026, 3, 18)},
+        )
+
+    @pytest.mark.asyncio
+    async def test_record_fails_open_on_redis_error(self, mock_cache):
+        mock_cache.zincrby_with_expireat.side_effect = ConnectionError("down")
+
+        await TrendingCacheService().record_log_created(550, datetime.now(UTC))
+
+
+class TestGetTopMovies:
+    @pytest.mark.asyncio
+    @freeze_time("2026-03-10 05:30:00")
+    async def test_miss_rebuilds_view_from_window_buckets(self, mock_cache):
+        mock_cache.zrevrange_with_scores.return_value = [("550", 4.0), ("680", 2.0)]
+
+        result = await TrendingCacheService().get_top_movies(TrendingWindow.LAST_7_DAYS, 10)
+
+        assert result == [(550, 4), (680, 2)]
+        mock_cache.zunionstore_with_ttl.assert_awaited_once_with(
+            "cinelog:trending:view:7d",
+            TrendingCacheService.window_bucket_keys(TrendingWindow.LAST_7_DAYS, datetime.now(UTC)),
+            TRENDING_VIEW_CACHE_TTL,
+        )
+        mock_cache.zrevrange_with_scores.assert_awaited_once_with("cinelog:trending:view:7d", 0, 9)
+
+    @pytest.mark.asyncio
+    async def test_hit_reads_cached_view(self, mock_cache):
+        mock_cache.exists.return_value = True
+        mock_cache.zrevrange_with_scores.return_value = [("550", 1.0)]
+
+        result = await TrendingCacheService().get_top_movies(TrendingWindow.LAST_24_HOURS, 5)
+
+        assert result == [(550, 1)]
+        mock_cache.zunionstore_with_ttl.assert_not_called()
+        mock_cache.zrevrange_with_scores.assert_awaited_once_with("cinelog:trending:view:24h", 0, 4)
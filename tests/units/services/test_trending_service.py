@@ -0,0 +1,67 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.models.movie_model import Movie
+from app.services.trending_service import TrendingService
+from app.types import TrendingWindow
+
+
+@pytest.fixture
+def mock_movie_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_trending_cache_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def trending_service(mock_movie_repository, mock_trending_cache_service):
+    return TrendingService(
+        movie_repository=mock_movie_repository,
+        trending_cache_service=mock_trending_cache_service,
+    )
+
+
+def _movie(tmdb_id: int, title: str) -> Movie:
+    return Movie(id=uuid4(), tmdb_id=tmdb_id, title=title)
+
+
+@pytest.mark.asyncio
+async def test_get_trending_movies_hydrates_in_rank_order(
+    trending_service,
+    mock_movie_repository,
+    mock_trending_cache_service,
+):
+    mock_trending_cache_service.get_top_movies.return_value = [(680, 9), (550, 4), (999, 2)]
+    mock_movie_repository.find_movies_by_tmdb_ids.return_value = [
+        _movie(550, "Fight Club"),
+        _movie(680, "Pulp Fiction"),
+    ]
+
+    result = await trending_service.get_trending_movies(TrendingWindow.LAST_7_DAYS, 3)
+
+    assert result.window is TrendingWindow.LAST_7_DAYS
+    assert [(item.tmdb_id, item.log_count, item.movie.title) for item in result.movies] == [
+        (680, 9, "Pulp Fiction"),
+        (550, 4, "Fight Club"),
+    ]
+    mock_trending_cache_service.get_top_movies.assert_awaited_once_with(TrendingWindow.LAST_7_DAYS, 3)
+    mock_movie_repository.find_movies_by_tmdb_ids.assert_awaited_once_with([680, 550, 999])
+
+
+@pytest.mark.asyncio
+async def test_get_trending_movies_with_no_activity(
+    trending_service,
+    mock_movie_repository,
+    mock_trending_cache_service,
+):
+    mock_trending_cache_service.get_top_movies.return_value = []
+    mock_movie_repository.find_movies_by_tmdb_ids.return_value = []
+
+    result = await trending_service.get_trending_movies(TrendingWindow.LAST_24_HOURS, 20)
+
+    assert result.movies == []
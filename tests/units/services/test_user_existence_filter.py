@@ -0,0 +1,118 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.user_existence_filter import (
+    USER_EXISTENCE_FILTER_REBUILD_TTL,
+    BloomParameters,
+    UserExistenceFilter,
+)
+
+PARAMETERS = BloomParameters(size_bits=4096, hash_count=5)
+
+
+@pytest.fixture
+def cache():
+    bits: set[int] = set()
+
+    async def bloom_add(keys, offsets):
+        bits.update(offsets)
+        return len(keys)
+
+    async def bloom_check(key, offsets):
+        return all(offset in bits for offset in offsets)
+
+    mock_cache = MagicMock()
+    mock_cache.bloom_add = AsyncMock(side_effect=bloom_add)
+    mock_cache.bloom_check = AsyncMock(side_effect=bloom_check)
+    mock_cache.allocate_bitmap = AsyncMock()
+    mock_cache.rename_persistent = AsyncMock()
+    with patch("app.services.user_existence_filter.CacheService.get_instance", return_value=mock_cache):
+        yield mock_cache
+
+
+async def _batches(*batches):
+    for batch in batches:
+        yield batch
+
+
+def test_parameters_are_sized_for_capacity_and_error_rate():
+    parameters = BloomParameters.for_capacity(1_000_000, 0.01)
+
+    assert 9_500_000 < parameters.size_bits < 9_700_000
+    assert parameters.hash_count == 7
+
+
+def test_offsets_are_stable_distinct_per_item_and_in_range():
+    offsets = PARAMETERS.offsets("email:cinefan@example.com")
+
+    assert offsets == PARAMETERS.offsets("email:cinefan@example.com")
+    assert offsets != PARAMETERS.offsets("handle:cinefan@example.com")
+    assert len(offsets) == PARAMETERS.hash_count
+    assert all(0 <= offset < PARAMETERS.size_bits for offset in offsets)
+
+
+def test_key_names_the_filter_size():
+    assert UserExistenceFilter(PARAMETERS).key == "cinelog:users:exists:4096:5"
+    assert UserExistenceFilter(PARAMETERS).rebuild_key == "cinelog:users:exists:4096:5:rebuild"
+
+
+@pytest.mark.asyncio
+async def test_added_users_are_found_case_insensitively(cache):
+    existence_filter = UserExistenceFilter(PARAMETERS)
+
+    await existence_filter.add(" CineFan@Example.com ", "CineFan")
+
+    assert await existence_filter.might_contain_email("cinefan@example.com")
+    assert await existence_filter.might_contain_handle("CINEFAN")
+    assert not await existence_filter.might_contain_email("someone@example.com")
+    assert not await existence_filter.might_contain_handle("cinefan@example.com")
+    keys, _ = cache.bloom_add.await_args.args
+    assert keys == [existence_filter.key, existence_filter.rebuild_key]
+
+
+@pytest.mark.asyncio
+async def test_missing_filter_or_redis_error_fails_open(cache):
+    existence_filter = UserExistenceFilter(PARAMETERS)
+    cache.bloom_check.side_effect = [None, ConnectionError("redis down")]
+
+    assert await existence_filter.might_contain_email("someone@example.com")
+    assert await existence_filter.might_contain_handle("someone")
+
+
+@pytest.mark.asyncio
+async def test_add_propagates_redis_errors(cache):
+    cache.bloom_add.side_effect = ConnectionError("redis down")
+
+    with pytest.raises(ConnectionError):
+        await UserExistenceFilter(PARAMETERS).add("cinefan@example.com", "CineFan")
+
+
+@pytest.mark.asyncio
+async def test_rebuild_fills_a_scratch_bitmap_then_swaps_it_in(cache):
+    existence_filter = UserExistenceFilter(PARAMETERS)
+
+    user_count = await existence_filter.rebuild(
+        _batches([("a@example.com", "UserA"), ("b@example.com", "UserB")], [], [("c@example.com", "UserC")]),
+        settle_seconds=0,
+    )
+
+    assert user_count == 3
+    cache.allocate_bitmap.assert_awaited_once_with(
+        existence_filter.rebuild_key, PARAMETERS.size_bits, USER_EXISTENCE_FILTER_REBUILD_TTL
+    )
+    assert [call.args[0] for call in cache.bloom_add.await_args_list] == [[existence_filter.rebuild_key]] * 2
+    cache.rename_persistent.assert_awaited_once_with(existence_filter.rebuild_key, existence_filter.key)
+    assert await existence_filter.might_contain_email("C@example.com")
+    assert await existence_filter.might_contain_handle("usera")
+
+
+@pytest.mark.asyncio
+async def test_rebuild_aborts_when_the_scratch_bitmap_expired(cache):
+    cache.bloom_add.side_effect = None
+    cache.bloom_add.return_value = 0
+
+    with pytest.raises(RuntimeError):
+        await UserExistenceFilter(PARAMETERS).rebuild(_batches([("a@example.com", "UserA")]), settle_seconds=0)
+
+    cache.rename_persistent.assert_not_awaited()
@@ -27,10 +27,16 @@ def mock_follow_repository():
 
 
 @pytest.fixture
-def user_service(mock_user_repository, mock_follow_repository):
+def mock_feed_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def user_service(mock_user_repository, mock_follow_repository, mock_feed_service):
     return UserService(
         user_repository=mock_user_repository,
         follow_repository=mock_follow_repository,
+        feed_service=mock_feed_service,
     )
 
 
@@ -169,7 +175,7 @@ class TestGetVisibleProfile:
 
 class TestUpdateProfile:
     @pytest.mark.asyncio
-    async def test_update_profile_success(self, user_service, mock_user_repository):
+    async def test_update_profile_success(self, user_service, mock_user_repository, mock_feed_service):
         updated_user = create_mock_user(first_name="Jane", bio="New bio")
         mock_user_repository.update_user_profile.return_value = updated_user
 
@@ -181,9 +187,10 @@ class TestUpdateProfile:
         mock_user_repository.update_user_profile.assert_awaited_once_with(
             "user123", {"first_name": "Jane", "bio": "New bio"}
         )
+        mock_feed_service.invalidate_follower_timelines.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_update_profile_with_visibility(self, user_service, mock_user_repository):
+    async def test_update_profile_with_visibility(self, user_service, mock_user_repository, mock_feed_service):
         updated_user = create_mock_user(profile_visibility="public")
         mock_user_repository.update_user_profile.return_value = updated_user
 
@@ -192,6 +199,7 @@ class TestUpdateProfile:
 
         assert result.profile_visibility == "public"
         mock_user_repository.update_user_profile.assert_awaited_once_with("user123", {"profile_visibility": "public"})
+        mock_feed_service.invalidate_follower_timelines.assert_awaited_once_with("user123")
 
     @pytest.mark.asyncio
     async def test_update_profile_partial_fields(self, user_service, mock_user_repository):
@@ -265,8 +273,9 @@ class TestUpdateLocale:
 class TestChangePassword:
     @pytest.mark.asyncio
     async def test_change_password_success(self, user_service, mock_user_repository):
-        mock_user = create_mock_user(password_hash="$2b$12$hashed")
+        mock_user = create_mock_user()
         mock_user_repository.find_user_by_id.return_value = mock_user
+        mock_user_repository.find_password_hash.return_value = "$2b$12$hashed"
         mock_user_repository.update_password.return_value = mock_user
 
         with (
@@ -282,6 +291,7 @@ class TestChangePassword:
             result = await user_service.change_password("user123", "current_pass", "new_pass")
 
         assert result.message == "Password changed successfully"
+        mock_user_repository.find_password_hash.assert_awaited_once_with("user123")
         mock_user_repository.update_password.assert_awaited_once_with(mock_user, "$2b$12$new_hashed")
 
     @pytest.mark.asyncio
@@ -295,8 +305,9 @@ class TestChangePassword:
 
     @pytest.mark.asyncio
     async def test_change_password_no_password_hash(self, user_service, mock_user_repository):
-        mock_user = create_mock_user(password_hash=None)
+        mock_user = create_mock_user()
         mock_user_repository.find_user_by_id.return_value = mock_user
+        mock_user_repository.find_password_hash.return_value = None
 
         with pytest.raises(AppException) as exc_info:
             await user_service.change_password("user123", "current", "new")
@@ -305,8 +316,9 @@ class TestChangePassword:
 
     @pytest.mark.asyncio
     async def test_change_password_wrong_current_password(self, user_service, mock_user_repository):
-        mock_user = create_mock_user(password_hash="$2b$12$hashed")
+        mock_user = create_mock_user()
         mock_user_repository.find_user_by_id.return_value = mock_user
+        mock_user_repository.find_password_hash.return_value = "$2b$12$hashed"
 
         with patch(
             "app.services.user_service.PasswordService.verify_password",
@@ -319,8 +331,9 @@ class TestChangePassword:
 
     @pytest.mark.asyncio
     async def test_change_password_same_as_current(self, user_service, mock_user_repository):
-        mock_user = create_mock_user(password_hash="$2b$12$hashed")
+        mock_user = create_mock_user()
         mock_user_repository.find_user_by_id.return_value = mock_user
+        mock_user_repository.find_password_hash.return_value = "$2b$12$hashed"
 
         with patch(
             "app.services.user_service.PasswordService.verify_password",
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from app.types import NotificationAction, NotificationType
+from app.types import NotificationAction, NotificationStreamEventType, NotificationType
 
 
 def test_notification_type_contains_only_registered_values():
@@ -22,6 +22,17 @@ def test_notification_action_contains_only_registered_values():
     ]
 
 
+def test_notification_stream_event_type_contains_only_registered_values():
+    assert [event_type.value for event_type in NotificationStreamEventType] == [
+        "notification.created",
+        "notification.updated",
+        "notification.read",
+        "notification.read_all",
+        "notification.unread_count",
+        "notification.resync",
+    ]
+
+
 def test_notification_enums_reject_unknown_values():
     with pytest.raises(ValueError):
         NotificationType("unknown.event")
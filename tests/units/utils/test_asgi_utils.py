@@ -0,0 +1,44 @@
+from unittest.mock import patch
+
+from starlette.requests import Request, cookie_parser
+
+from app.utils.asgi_utils import get_cookies, get_header, get_scope_headers, set_scope_state
+
+
+def make_scope(headers: list[tuple[bytes, bytes]]) -> dict:
+    return {"type": "http", "method": "GET", "path": "/", "headers": headers}
+
+
+def test_get_header_returns_first_value_and_none_when_missing():
+    scope = make_scope([(b"x-csrf-token", b"first"), (b"x-csrf-token", b"second")])
+
+    assert get_header(scope, b"x-csrf-token") == "first"
+    assert get_header(scope, b"x-missing") is None
+
+
+def test_headers_are_scanned_once_per_scope():
+    scope = make_scope([(b"accept", b"*/*")])
+
+    assert get_scope_headers(scope) is get_scope_headers(scope)
+
+
+def test_get_cookies_parses_once_and_reuses_result():
+    scope = make_scope([(b"cookie", b"__Host-session_id=abc; __Host-csrf_token=xyz")])
+
+    with patch("app.utils.asgi_utils.cookie_parser", wraps=cookie_parser) as parser:
+        assert get_cookies(scope) == {"__Host-session_id": "abc", "__Host-csrf_token": "xyz"}
+        get_cookies(scope)
+
+    parser.assert_called_once()
+
+
+def test_get_cookies_without_cookie_header_is_empty():
+    assert get_cookies(make_scope([])) == {}
+
+
+def test_set_scope_state_is_visible_on_request_state():
+    scope = make_scope([])
+
+    set_scope_state(scope, "rate_limit_session_id", "abc")
+
+    assert Request(scope).state.rate_limit_session_id == "abc"
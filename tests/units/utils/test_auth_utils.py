@@ -1,5 +1,6 @@
 from fastapi import Response
 
+from app.services.token_service import TokenService
 from app.utils.auth_utils import (
     ACCESS_TOKEN_COOKIE,
     CSRF_TOKEN_COOKIE,
@@ -7,6 +8,8 @@ from app.utils.auth_utils import (
     clear_auth_cookies,
     normalize_email_identifier,
     normalize_verification_code,
+    set_access_token_cookie,
+    set_auth_cookies,
 )
 
 
@@ -40,3 +43,29 @@ def test_clear_auth_cookies():
     assert access_cookie_found, "access_token cookie should be cleared"
     assert refresh_cookie_found, "refresh_token cookie should be cleared"
     assert csrf_cookie_found, "csrf_token cookie should be cleared"
+
+
+def test_set_auth_cookies_puts_locale_claim_in_access_token_only():
+    response = Response()
+
+    access_token, refresh_token = set_auth_cookies(response, "user-1", "session-1", locale="fr-FR")
+
+    access_payload = TokenService.decode_token(access_token)
+    refresh_payload = TokenService.decode_token(refresh_token)
+    assert access_payload["locale"] == "fr-FR"
+    assert "locale" not in refresh_payload
+    assert access_payload["sid"] == "session-1"
+    assert refresh_payload["sid"] == "session-1"
+
+
+def test_set_access_token_cookie_without_locale_omits_claim():
+    response = Response()
+
+    access_token = set_access_token_cookie(response, "user-1", "session-1")
+
+    payload = TokenService.decode_token(access_token)
+    assert payload["sub"] == "user-1"
+    assert "locale" not in payload
+    cookies = response.headers.getlist("set-cookie")
+    assert len(cookies) == 1
+    assert cookies[0].startswith(f"{ACCESS_TOKEN_COOKIE}=")
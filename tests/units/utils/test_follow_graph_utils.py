@@ -0,0 +1,87 @@
+from uuid import UUID
+
+import pytest
+
+from app.utils.follow_graph_utils import FollowGraphBuilder, suggest_friends_of_friends
+
+
+def _ids(count: int) -> list[UUID]:
+    return [UUID(int=index + 1) for index in range(count)]
+
+
+def test_builder_produces_csr_offsets_and_follower_counts():
+    a, b, c, d = _ids(4)
+    builder = FollowGraphBuilder([(a, True), (b, True), (c, True), (d, False)])
+    builder.add_edges([(a, b), (a, c)])
+    builder.add_edges([(c, a), (d, a)])
+
+    graph = builder.build()
+
+    assert graph.size == 4
+    assert list(graph.offsets) == [0, 2, 2, 3, 4]
+    assert list(graph.following(0)) == [1, 2]
+    assert list(graph.following(1)) == []
+    assert list(graph.follower_counts) == [2, 1, 1, 0]
+    assert list(graph.suggestible) == [1, 1, 1, 0]
+
+
+def test_builder_skips_edges_to_unknown_users():
+    a, b, gone = _ids(3)
+    builder = FollowGraphBuilder([(a, True), (b, True)])
+    builder.add_edges([(a, gone), (a, b), (gone, b)])
+
+    graph = builder.build()
+
+    assert list(graph.following(0)) == [1]
+    assert len(graph.targets) == 1
+
+
+def test_builder_rejects_edges_out_of_follower_order():
+    a, b = _ids(2)
+    builder = FollowGraphBuilder([(a, True), (b, True)])
+    builder.add_edges([(b, a)])
+
+    with pytest.raises(ValueError):
+        builder.add_edges([(a, b)])
+
+
+def test_suggestions_rank_by_mutual_count_then_popularity():
+    viewer, first, second, shared, single, popular_single, fan = _ids(7)
+    builder = FollowGraphBuilder(
+        [(user_id, True) for user_id in (viewer, first, second, shared, single, popular_single, fan)]
+    )
+    builder.add_edges(
+        [
+            (viewer, first),
+            (viewer, second),
+            (first, viewer),
+            (first, second),
+            (first, shared),
+            (first, single),
+            (second, shared),
+            (second, popular_single),
+            (fan, popular_single),
+        ]
+    )
+    graph = builder.build()
+
+    assert suggest_friends_of_friends(graph, 0, 10) == [(3, 2), (5, 1), (4, 1)]
+    assert suggest_friends_of_friends(graph, 0, 1) == [(3, 2)]
+
+
+def test_suggestions_only_traverse_and_return_suggestible_users():
+    viewer, public_friend, private_friend, hidden, via_private = _ids(5)
+    builder = FollowGraphBuilder(
+        [(viewer, True), (public_friend, True), (private_friend, False), (hidden, False), (via_private, True)]
+    )
+    builder.add_edges(
+        [
+            (viewer, public_friend),
+            (viewer, private_friend),
+            (public_friend, hidden),
+            (private_friend, via_private),
+        ]
+    )
+    graph = builder.build()
+
+    assert suggest_friends_of_friends(graph, 0, 10) == []
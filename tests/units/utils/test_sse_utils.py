@@ -0,0 +1,18 @@
+"""Tests for Server-Sent Events formatting."""
+
+from app.utils.sse_utils import format_sse_comment, format_sse_event, format_sse_retry
+
+
+def test_format_sse_event_with_id_and_compact_json():
+    assert format_sse_event("notification.created", {"id": "a", "n": 1}, "cursor") == (
+        'id: cursor\nevent: notification.created\ndata: {"id":"a","n":1}\n\n'
+    )
+
+
+def test_format_sse_event_without_id():
+    assert format_sse_event("notification.resync", {}) == "event: notification.resync\ndata: {}\n\n"
+
+
+def test_format_sse_comment_and_retry():
+    assert format_sse_comment("heartbeat") == ": heartbeat\n\n"
+    assert format_sse_retry(3000) == "retry: 3000\n\n"